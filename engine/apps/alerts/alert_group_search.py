@@ -0,0 +1,106 @@
+import functools
+import typing
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+ALERT_GROUP_TABLE = "alerts_alertgroup"
+# FTS5 table keeping web_title_cache of alert groups, rowid is the alert group id
+SQLITE_SEARCH_TABLE = "alerts_alertgroup_search"
+SQLITE_SEARCH_INDEX_BATCH_SIZE = 500
+
+# terms shorter than this can't be looked up in trigram and MySQL full-text indexes (innodb_ft_min_token_size)
+MIN_INDEXED_TERM_LENGTH = 3
+
+
+class AlertGroupSearchBackend:
+    """
+    Search of alert groups by title (web_title_cache).
+
+    The base backend looks up titles with a case-insensitive substring match, which scans all alert groups in the
+    queryset. Backends may keep an index of titles, which must be updated whenever web_title_cache changes
+    (see update_index). Backend is set with the ALERT_GROUP_SEARCH_BACKEND setting.
+    """
+
+    def title_condition(self, term: str) -> Q:
+        """
+        Return condition matching alert groups with the search term in the title.
+        """
+        return Q(web_title_cache__icontains=term)
+
+    def update_index(self, alert_group_pks: typing.Iterable[int]) -> None:
+        """
+        Update index entries of the given alert groups from their current web_title_cache.
+        """
+
+
+class PostgreSQLSearchBackend(AlertGroupSearchBackend):
+    """
+    Substring search using a trigram GIN index over UPPER(web_title_cache), which is what icontains is compiled to
+    on PostgreSQL (see alerts migration 0076). The index is maintained by the database.
+    """
+
+
+class MySQLSearchBackend(AlertGroupSearchBackend):
+    """
+    Full-text search using a FULLTEXT index over web_title_cache (see alerts migration 0076), matching words starting
+    with the search term. The index is maintained by the database.
+    """
+
+    def title_condition(self, term: str) -> Q:
+        words = [word for word in _split_words(term) if len(word) >= MIN_INDEXED_TERM_LENGTH]
+        if not words:
+            return super().title_condition(term)
+        query = " ".join(f"+{word}*" for word in words)
+        return Q(
+            RawSQL(
+                f"MATCH ({ALERT_GROUP_TABLE}.web_title_cache) AGAINST (%s IN BOOLEAN MODE)",
+                (query,),
+                output_field=BooleanField(),
+            )
+        )
+
+
+class SQLiteSearchBackend(AlertGroupSearchBackend):
+    """
+    Substring search using an FTS5 table with the trigram tokenizer (created by alerts migration 0076), kept in sync
+    by update_index.
+    """
+
+    def title_condition(self, term: str) -> Q:
+        if len(term) < MIN_INDEXED_TERM_LENGTH:
+            return super().title_condition(term)
+        # search for the term as a phrase, quotes are escaped by doubling them
+        query = '"{}"'.format(term.replace('"', '""'))
+        return Q(
+            pk__in=RawSQL(f"SELECT rowid FROM {SQLITE_SEARCH_TABLE} WHERE {SQLITE_SEARCH_TABLE} MATCH %s", (query,))
+        )
+
+    def update_index(self, alert_group_pks: typing.Iterable[int]) -> None:
+        alert_group_pks = list(alert_group_pks)
+        if not alert_group_pks:
+            return
+        with connection.cursor() as cursor:
+            for i in range(0, len(alert_group_pks), SQLITE_SEARCH_INDEX_BATCH_SIZE):
+                batch = alert_group_pks[i : i + SQLITE_SEARCH_INDEX_BATCH_SIZE]
+                placeholders = ", ".join(["%s"] * len(batch))
+                cursor.execute(f"DELETE FROM {SQLITE_SEARCH_TABLE} WHERE rowid IN ({placeholders})", batch)
+                cursor.execute(
+                    f"INSERT INTO {SQLITE_SEARCH_TABLE} (rowid, web_title_cache) "
+                    f"SELECT id, web_title_cache FROM {ALERT_GROUP_TABLE} "
+                    f"WHERE id IN ({placeholders}) AND web_title_cache IS NOT NULL",
+                    batch,
+                )
+
+
+def _split_words(term: str) -> typing.List[str]:
+    # characters with a special meaning in MySQL boolean full-text search mode are treated as word separators
+    return "".join(char if char.isalnum() or char == "_" else " " for char in term).split()
+
+
+@functools.cache
+def get_alert_group_search_backend() -> AlertGroupSearchBackend:
+    return import_string(settings.ALERT_GROUP_SEARCH_BACKEND)()
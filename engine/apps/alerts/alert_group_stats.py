@@ -0,0 +1,283 @@
+import datetime
+import math
+import time
+import typing
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.alerts.constants import AlertGroupState
+from common.cache import ensure_cache_key_allocates_to_the_same_hash_slot
+from common.database import get_random_readonly_database_key_if_present_otherwise_default
+
+ALERT_GROUP_STATS_CACHE_KEY_PREFIX = "alert_group_stats"
+# alert groups started this close to the end of the counted range are counted even if they started after it, so
+# ranges ending "now" can be answered from today's counters
+ALERT_GROUP_STATS_END_TOLERANCE = datetime.timedelta(minutes=1)
+
+# {<integration id>: {<state>: <number of alert groups>}}
+DayCounters = typing.Dict[int, typing.Dict[str, int]]
+
+
+class CachedDay(typing.TypedDict):
+    # id of the counting of the day, counters and diffs of different countings are kept apart
+    generation: str
+    # timestamp when the day was counted by DB, changes made before it are already counted
+    counted_at: float
+    # timestamp when the day is due to be recounted by DB
+    expire_at: float
+
+
+def _get_state_filters() -> typing.Dict[str, Q]:
+    from apps.alerts.models import AlertGroup
+
+    return {
+        AlertGroupState.FIRING.value: AlertGroup.get_new_state_filter(),
+        AlertGroupState.SILENCED.value: AlertGroup.get_silenced_state_filter(),
+        AlertGroupState.ACKNOWLEDGED.value: AlertGroup.get_acknowledged_state_filter(),
+        AlertGroupState.RESOLVED.value: AlertGroup.get_resolved_state_filter(),
+    }
+
+
+def _get_cache_key(organization_id: int, name: str) -> str:
+    prefix = f"{ALERT_GROUP_STATS_CACHE_KEY_PREFIX}_{organization_id}"
+    return ensure_cache_key_allocates_to_the_same_hash_slot(f"{prefix}_{name}", prefix)
+
+
+def _get_day_cache_key(organization_id: int, day: datetime.date) -> str:
+    return _get_cache_key(organization_id, day.isoformat())
+
+
+def _get_counters_cache_key(organization_id: int, day: datetime.date, generation: str) -> str:
+    return _get_cache_key(organization_id, f"{day.isoformat()}_{generation}")
+
+
+def _get_diff_cache_key(
+    organization_id: int, day: datetime.date, generation: str, integration_id: int, state: str
+) -> str:
+    return _get_cache_key(organization_id, f"{day.isoformat()}_{generation}_{integration_id}_{state}")
+
+
+def _get_day(started_at: datetime.datetime) -> datetime.date:
+    return started_at.astimezone(datetime.timezone.utc).date()
+
+
+def _get_day_start(day: datetime.date) -> datetime.datetime:
+    return datetime.datetime.combine(day, datetime.time.min, tzinfo=datetime.timezone.utc)
+
+
+def _count_days_from_db(
+    organization_id: int, days: typing.List[datetime.date]
+) -> typing.Dict[datetime.date, DayCounters]:
+    from apps.alerts.models import AlertGroup, AlertReceiveChannel
+
+    # counted by the primary DB, so changes made before CachedDay.counted_at are surely counted
+    channel_ids = list(
+        AlertReceiveChannel.objects_with_deleted.filter(organization_id=organization_id).values_list("id", flat=True)
+    )
+    state_filters = _get_state_filters()
+    rows = (
+        AlertGroup.objects.filter(
+            channel_id__in=channel_ids,
+            started_at__gte=_get_day_start(min(days)),
+            started_at__lt=_get_day_start(max(days) + datetime.timedelta(days=1)),
+        )
+        .annotate(day=TruncDate("started_at", tzinfo=datetime.timezone.utc))
+        .values("channel_id", "day")
+        .annotate(**{state: Count("id", filter=state_filter) for state, state_filter in state_filters.items()})
+    )
+
+    counters: typing.Dict[datetime.date, DayCounters] = {day: {} for day in days}
+    for row in rows:
+        if row["day"] in counters:
+            counters[row["day"]][row["channel_id"]] = {state: row[state] for state in state_filters}
+    return counters
+
+
+def _get_day_counters(
+    organization_id: int, days: typing.List[datetime.date], channel_ids: typing.List[int], states: typing.List[str]
+) -> typing.List[DayCounters]:
+    day_cache_keys = [_get_day_cache_key(organization_id, day) for day in days]
+    cached_days: typing.Dict[str, CachedDay] = cache.get_many(day_cache_keys)
+
+    # days are marked as counted before counting them by DB, so changes made in the meantime are kept as diffs
+    timeout = settings.ALERT_GROUP_STATS_COUNTERS_CACHE_TIMEOUT
+    counted_at = time.time()
+    days_to_count = []
+    for day, cache_key in zip(days, day_cache_keys):
+        if cache_key in cached_days:
+            continue
+        cached_day: CachedDay = {
+            "generation": uuid.uuid4().hex,
+            "counted_at": counted_at,
+            "expire_at": counted_at + timeout,
+        }
+        if cache.add(cache_key, cached_day, timeout=timeout):
+            cached_days[cache_key] = cached_day
+            days_to_count.append(day)
+        elif concurrently_cached_day := cache.get(cache_key):
+            cached_days[cache_key] = concurrently_cached_day
+
+    counters_cache_keys = {
+        day: _get_counters_cache_key(organization_id, day, cached_days[cache_key]["generation"])
+        for day, cache_key in zip(days, day_cache_keys)
+        if cache_key in cached_days
+    }
+    if days_to_count:
+        counted = _count_days_from_db(organization_id, days_to_count)
+        cache.set_many({counters_cache_keys[day]: counters for day, counters in counted.items()}, timeout=timeout)
+
+    diff_cache_keys = {
+        (day, channel_id, state): _get_diff_cache_key(
+            organization_id, day, cached_days[day_cache_key]["generation"], channel_id, state
+        )
+        for day, day_cache_key in zip(days, day_cache_keys)
+        if day_cache_key in cached_days
+        for channel_id in channel_ids
+        for state in states
+    }
+    cached = cache.get_many([*counters_cache_keys.values(), *diff_cache_keys.values()])
+
+    # days being counted concurrently are counted by DB once more, without caching
+    uncached_days = [day for day in days if counters_cache_keys.get(day) not in cached]
+    uncached_counters = _count_days_from_db(organization_id, uncached_days) if uncached_days else {}
+
+    day_counters_list = []
+    for day in days:
+        if day in uncached_counters:
+            day_counters_list.append(uncached_counters[day])
+            continue
+        day_counters: DayCounters = cached[counters_cache_keys[day]]
+        day_counters_list.append(
+            {
+                channel_id: {
+                    state: max(
+                        day_counters.get(channel_id, {}).get(state, 0)
+                        + cached.get(diff_cache_keys[(day, channel_id, state)], 0),
+                        0,
+                    )
+                    for state in states
+                }
+                for channel_id in channel_ids
+            }
+        )
+    return day_counters_list
+
+
+def _count_from_db(
+    channel_ids: typing.List[int],
+    states: typing.List[str],
+    start: datetime.datetime,
+    end: datetime.datetime,
+    include_end: bool,
+) -> int:
+    from apps.alerts.models import AlertGroup
+
+    state_filters = _get_state_filters()
+    state_filter = Q()
+    for state in states:
+        state_filter |= state_filters[state]
+
+    end_lookup = "started_at__lte" if include_end else "started_at__lt"
+    db = get_random_readonly_database_key_if_present_otherwise_default()
+    return (
+        AlertGroup.objects.using(db)
+        .filter(state_filter, channel_id__in=channel_ids, started_at__gte=start, **{end_lookup: end})
+        .count()
+    )
+
+
+def count_alert_groups(
+    organization_id: int,
+    channel_ids: typing.List[int],
+    states: typing.List[str],
+    start: datetime.datetime,
+    end: typing.Optional[datetime.datetime] = None,
+) -> typing.Optional[int]:
+    """
+    Return number of alert groups of the integrations in the given states, started in the [start, end] range
+    (end defaults to now).
+
+    Whole days of the range are counted with per-day counters of the organization, which are counted by DB when
+    missing and then kept up to date with diffs as alert groups are created, change state and are deleted (see
+    update_alert_group_stats_counters). Parts of days at the edges of the range are counted by DB. Changes racing the
+    counting of a day may still be missed, so counters expire after ALERT_GROUP_STATS_COUNTERS_CACHE_TIMEOUT seconds.
+    Return None if the range spans too many days to count this way.
+    """
+    now = timezone.now()
+    ends_now = end is None or end >= now - ALERT_GROUP_STATS_END_TOLERANCE
+    if ends_now:
+        end = now
+
+    first_day = _get_day(start)
+    if start > _get_day_start(first_day):
+        first_day += datetime.timedelta(days=1)
+    last_day = _get_day(end)
+    if not ends_now:
+        last_day -= datetime.timedelta(days=1)
+
+    if first_day > last_day:
+        return _count_from_db(channel_ids, states, start, end, include_end=True)
+
+    days = [first_day + datetime.timedelta(days=i) for i in range((last_day - first_day).days + 1)]
+    if len(days) > settings.ALERT_GROUP_STATS_COUNTERS_MAX_DAYS:
+        return None
+
+    channel_ids_set = set(channel_ids)
+    count = sum(
+        state_counters.get(state, 0)
+        for day_counters in _get_day_counters(organization_id, days, channel_ids, states)
+        for channel_id, state_counters in day_counters.items()
+        if channel_id in channel_ids_set
+        for state in states
+    )
+    if start < _get_day_start(first_day):
+        count += _count_from_db(channel_ids, states, start, _get_day_start(first_day), include_end=False)
+    if not ends_now:
+        count += _count_from_db(
+            channel_ids, states, _get_day_start(last_day + datetime.timedelta(days=1)), end, include_end=True
+        )
+    return count
+
+
+def update_alert_group_stats_counters(
+    organization_id: int,
+    integration_id: int,
+    started_at: datetime.datetime,
+    previous_state: typing.Optional[str] = None,
+    new_state: typing.Optional[str] = None,
+    changed_at: typing.Optional[float] = None,
+) -> None:
+    """
+    Apply a state change of an alert group made at the changed_at timestamp to the counters of the day it started.
+    Changes made before the day was counted by DB are already counted, so they are skipped. Counters which are not
+    cached are left to be counted by DB when needed.
+    """
+    day = _get_day(started_at)
+    cached_day: typing.Optional[CachedDay] = cache.get(_get_day_cache_key(organization_id, day))
+    if not cached_day:
+        return
+    if changed_at is not None and changed_at <= cached_day["counted_at"]:
+        return
+    # diffs expire along with the day, they are dropped when the day is recounted anyway
+    timeout = math.ceil(cached_day["expire_at"] - time.time())
+    if timeout <= 0:
+        return
+
+    for state, delta in ((previous_state, -1), (new_state, 1)):
+        if not state:
+            continue
+        cache_key = _get_diff_cache_key(
+            organization_id, day, cached_day["generation"], integration_id, AlertGroupState(state).value
+        )
+        # diffs are updated atomically, so concurrent updates are not lost
+        cache.add(cache_key, 0, timeout=timeout)
+        try:
+            cache.incr(cache_key, delta)
+        except ValueError:
+            # the key was evicted in between, the change is lost until the day is recounted
+            pass
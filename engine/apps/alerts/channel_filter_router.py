@@ -0,0 +1,244 @@
+import json
+import logging
+import re
+import threading
+import time
+import typing
+import uuid
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from common.jinja_templater import apply_jinja_template_to_alert_payload_and_labels
+from common.jinja_templater.apply_jinja_template import (
+    JinjaTemplateError,
+    JinjaTemplateWarning,
+    templated_value_is_truthy,
+)
+
+if typing.TYPE_CHECKING:
+    from apps.alerts.models import Alert, AlertReceiveChannel, ChannelFilter
+    from apps.labels.types import AlertLabels
+
+logger = logging.getLogger(__name__)
+
+LabelPair = typing.Tuple[str, str]
+
+
+def _get_version_cache_key(alert_receive_channel_id: int) -> str:
+    return f"channel_filters_version_{alert_receive_channel_id}"
+
+
+def get_channel_filters_version(alert_receive_channel_id: int) -> str:
+    cache_key = _get_version_cache_key(alert_receive_channel_id)
+    version = cache.get(cache_key)
+    if version is None:
+        # Version must never go back to a previously seen value, so a missing (e.g. evicted) version is replaced with
+        # a new random one instead of falling back to some default value.
+        cache.add(cache_key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(cache_key)
+    return version
+
+
+def invalidate_channel_filter_router(alert_receive_channel_id: int) -> None:
+    def _invalidate():
+        cache.set(_get_version_cache_key(alert_receive_channel_id), uuid.uuid4().hex, timeout=None)
+
+    # Invalidate right away and once again when the transaction is committed, so routers rebuilt from uncommitted data
+    # by other processes in the meantime are not used.
+    _invalidate()
+    transaction.on_commit(_invalidate)
+
+
+@dataclass
+class RouteStats:
+    evaluations: int = 0
+    total_seconds: float = 0.0
+
+    @property
+    def average_seconds(self) -> float:
+        return self.total_seconds / self.evaluations if self.evaluations else 0.0
+
+
+@dataclass
+class CompiledRoute:
+    pk: int
+    filtering_term_type: int
+    is_default: bool
+    filtering_term: typing.Optional[str] = None
+    regex: typing.Optional[re.Pattern] = None
+    labels: typing.FrozenSet[LabelPair] = field(default_factory=frozenset)
+
+
+class ChannelFilterRouter:
+    """
+    Precompiled routes of a single integration.
+
+    Routes are evaluated in the same order and with the same semantics as ChannelFilter.is_satisfying, but:
+      - regular expressions are compiled once, and the payload is serialized once per alert
+      - label routes are matched via an index of (label key, label value) -> routes, built once per alert
+    Evaluation time is tracked per route.
+    """
+
+    def __init__(self, alert_receive_channel_id: int, channel_filters: typing.Iterable["ChannelFilter"]) -> None:
+        from apps.alerts.models import ChannelFilter
+
+        self.alert_receive_channel_id = alert_receive_channel_id
+        self.routes: typing.List[CompiledRoute] = []
+        self.route_stats: typing.Dict[int, RouteStats] = defaultdict(RouteStats)
+        self._label_index: typing.Dict[LabelPair, typing.List[int]] = defaultdict(list)
+
+        for channel_filter in channel_filters:
+            route = CompiledRoute(
+                pk=channel_filter.pk,
+                filtering_term_type=channel_filter.filtering_term_type,
+                is_default=channel_filter.is_default,
+                filtering_term=channel_filter.filtering_term,
+            )
+            if (
+                channel_filter.filtering_term is not None
+                and channel_filter.filtering_term_type == ChannelFilter.FILTERING_TERM_TYPE_REGEX
+            ):
+                try:
+                    route.regex = re.compile(channel_filter.filtering_term)
+                except re.error:
+                    logger.error(
+                        f"channel_filter={channel_filter.pk} failed to parse regex={channel_filter.filtering_term}"
+                    )
+            elif channel_filter.filtering_term_type == ChannelFilter.FILTERING_TERM_TYPE_LABELS:
+                route.labels = frozenset(
+                    (item["key"]["name"], item["value"]["name"]) for item in channel_filter.filtering_labels or []
+                )
+                for label in route.labels:
+                    self._label_index[label].append(route.pk)
+            self.routes.append(route)
+
+    def _get_matching_label_routes(self, alert_labels: typing.Optional["AlertLabels"]) -> typing.Set[int]:
+        if not alert_labels or not self._label_index:
+            return set()
+
+        matched_labels_count: typing.Dict[int, int] = defaultdict(int)
+        for label in alert_labels.items():
+            for route_pk in self._label_index.get(label, []):
+                matched_labels_count[route_pk] += 1
+
+        return {
+            route.pk
+            for route in self.routes
+            if route.labels and matched_labels_count.get(route.pk) == len(route.labels)
+        }
+
+    def select(
+        self, raw_request_data: "Alert.RawRequestData", alert_labels: typing.Optional["AlertLabels"] = None
+    ) -> typing.Optional[int]:
+        """
+        Return pk of the first route satisfying given payload and labels.
+        """
+        from apps.alerts.models import ChannelFilter
+
+        serialized_payload = None
+        matching_label_routes = None
+
+        for route in self.routes:
+            started_at = time.perf_counter()
+            if route.is_default:
+                is_satisfying = True
+            elif route.filtering_term_type == ChannelFilter.FILTERING_TERM_TYPE_JINJA2:
+                try:
+                    is_satisfying = templated_value_is_truthy(
+                        apply_jinja_template_to_alert_payload_and_labels(
+                            route.filtering_term, raw_request_data, alert_labels
+                        )
+                    )
+                except (JinjaTemplateError, JinjaTemplateWarning):
+                    logger.error(f"channel_filter={route.pk} failed to parse jinja2={route.filtering_term}")
+                    is_satisfying = False
+            elif route.filtering_term_type == ChannelFilter.FILTERING_TERM_TYPE_REGEX:
+                if route.regex is None:
+                    is_satisfying = False
+                else:
+                    if serialized_payload is None:
+                        serialized_payload = json.dumps(raw_request_data)
+                    is_satisfying = route.regex.search(serialized_payload) is not None
+            elif route.filtering_term_type == ChannelFilter.FILTERING_TERM_TYPE_LABELS:
+                if matching_label_routes is None:
+                    matching_label_routes = self._get_matching_label_routes(alert_labels)
+                is_satisfying = route.pk in matching_label_routes
+            else:
+                is_satisfying = False
+
+            route_stats = self.route_stats[route.pk]
+            route_stats.evaluations += 1
+            route_stats.total_seconds += time.perf_counter() - started_at
+
+            if is_satisfying:
+                return route.pk
+        return None
+
+    def log_route_stats(self) -> None:
+        for route_pk, route_stats in self.route_stats.items():
+            logger.debug(
+                f"channel_filter_router alert_receive_channel={self.alert_receive_channel_id} "
+                f"channel_filter={route_pk} evaluations={route_stats.evaluations} "
+                f"avg_evaluation_seconds={route_stats.average_seconds:.6f}"
+            )
+
+
+class _ChannelFilterRouterCache:
+    """
+    Per-process LRU cache of routers, validated against a version stored in the shared cache.
+    The version is changed every time routes of the integration change (see invalidate_channel_filter_router).
+    Routers are also rebuilt after a TTL, in case a version bump was lost (e.g. the shared cache was unavailable).
+    """
+
+    def __init__(self, max_size: int, ttl: int) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._routers: OrderedDict[int, typing.Tuple[str, float, ChannelFilterRouter]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, alert_receive_channel: "AlertReceiveChannel") -> ChannelFilterRouter:
+        from apps.alerts.models import ChannelFilter
+
+        alert_receive_channel_id = alert_receive_channel.pk
+        version = get_channel_filters_version(alert_receive_channel_id)
+
+        with self._lock:
+            cached = self._routers.get(alert_receive_channel_id)
+            if cached is not None and cached[0] == version and time.monotonic() - cached[1] < self._ttl:
+                self._routers.move_to_end(alert_receive_channel_id)
+                return cached[2]
+
+        router = ChannelFilterRouter(
+            alert_receive_channel_id,
+            ChannelFilter.objects.filter(alert_receive_channel_id=alert_receive_channel_id).only(
+                "pk", "filtering_term", "filtering_term_type", "filtering_labels", "is_default"
+            ),
+        )
+
+        replaced_routers = []
+        with self._lock:
+            if cached is not None:
+                replaced_routers.append(cached[2])
+            self._routers[alert_receive_channel_id] = (version, time.monotonic(), router)
+            self._routers.move_to_end(alert_receive_channel_id)
+            while len(self._routers) > self._max_size:
+                _, (_, _, evicted_router) = self._routers.popitem(last=False)
+                replaced_routers.append(evicted_router)
+
+        # report latency collected by routers which are not going to be used anymore
+        for replaced_router in replaced_routers:
+            replaced_router.log_route_stats()
+        return router
+
+    def clear(self) -> None:
+        with self._lock:
+            self._routers.clear()
+
+
+channel_filter_router_cache = _ChannelFilterRouterCache(
+    max_size=settings.CHANNEL_FILTER_ROUTER_CACHE_MAX_SIZE, ttl=settings.CHANNEL_FILTER_ROUTER_CACHE_TTL
+)
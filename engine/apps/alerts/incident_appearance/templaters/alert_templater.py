@@ -8,6 +8,8 @@ from apps.slack.slack_formatter import SlackFormatter
 from common.jinja_templater import apply_jinja_template
 from common.jinja_templater.apply_jinja_template import JinjaTemplateError, JinjaTemplateWarning
 
+from .rendering_context import AlertRenderingContext, get_alert_rendering_context
+
 
 class TemplateLoader:
     def get_attr_template(self, attr, alert_receive_channel, render_for=None):
@@ -78,6 +80,7 @@ class AlertTemplater(ABC):
         self.template_manager = TemplateLoader()
         self.alert_group_id = self.alert.group.inside_organization_number
         self.link = self.alert.group.web_link
+        self.rendering_context: AlertRenderingContext | None = None
 
     def render(self):
         """
@@ -91,6 +94,7 @@ class AlertTemplater(ABC):
             data = self._preformat_request_data(self.alert.raw_request_data)
         else:
             data = self.alert.raw_request_data
+        self.rendering_context = get_alert_rendering_context(self.alert)
         templated_alert = self._apply_templates(data)
         templated_alert = self._postformat(templated_alert)
         return templated_alert
@@ -177,25 +181,8 @@ class AlertTemplater(ABC):
             # Hardcoding, as AlertWebTemplater.RENDER_FOR_WEB cause circular import
             render_for_web = "web"
             # Propagate rendered web templates to the other templates
-            added_context = {}
             if self._render_for() != render_for_web:
-                for attr in ["title", "message", "image_url"]:
-                    added_attr_template = self.template_manager.get_attr_template(attr, channel, render_for_web)
-                    if added_attr_template is not None:
-                        result_length_limit = (
-                            settings.JINJA_RESULT_TITLE_MAX_LENGTH
-                            if attr == "title"
-                            else settings.JINJA_RESULT_MAX_LENGTH
-                        )
-                        try:
-                            added_context[f"web_{attr}"] = apply_jinja_template(
-                                added_attr_template, data, result_length_limit=result_length_limit, **context
-                            )
-                        except (JinjaTemplateError, JinjaTemplateWarning) as e:
-                            added_context[f"web_{attr}"] = e.fallback_message
-                    else:
-                        added_context[f"web_{attr}"] = f"web_{attr} is not set"
-                context = {**context, **added_context}
+                context = {**context, **self._get_web_context(data, channel, context, render_for_web)}
 
             try:
                 if attr == "title":
@@ -209,6 +196,43 @@ class AlertTemplater(ABC):
 
         return None
 
+    def _get_web_context(self, data, channel, context, render_for_web) -> dict[str, str]:
+        """
+        Render web templates to be used as web_title, web_message and web_image_url in the other templates.
+        Rendered values are shared through the rendering context, so they are rendered once per alert
+        instead of once per rendered attribute (and per templater, within a rendering pass).
+        """
+        web_attr_templates = {
+            attr: self.template_manager.get_attr_template(attr, channel, render_for_web)
+            for attr in ["title", "message", "image_url"]
+        }
+
+        def render() -> dict[str, str]:
+            web_context = {}
+            for attr, web_attr_template in web_attr_templates.items():
+                if web_attr_template is not None:
+                    result_length_limit = (
+                        settings.JINJA_RESULT_TITLE_MAX_LENGTH if attr == "title" else settings.JINJA_RESULT_MAX_LENGTH
+                    )
+                    try:
+                        web_context[f"web_{attr}"] = apply_jinja_template(
+                            web_attr_template, data, result_length_limit=result_length_limit, **context
+                        )
+                    except (JinjaTemplateError, JinjaTemplateWarning) as e:
+                        web_context[f"web_{attr}"] = e.fallback_message
+                else:
+                    web_context[f"web_{attr}"] = f"web_{attr} is not set"
+            return web_context
+
+        if self.rendering_context is None:
+            self.rendering_context = get_alert_rendering_context(self.alert)
+
+        # preformatted data is specific to the templater class, raw request data is shared by all templaters
+        data_key = type(self) if self._apply_preformatting() else None
+        key = (data_key, context["source_link"], *web_attr_templates.values())
+        renders_count = sum(1 for template in web_attr_templates.values() if template is not None)
+        return self.rendering_context.get_web_context(key, render, renders_count)
+
     @abstractmethod
     def _render_for(self) -> str:
         raise NotImplementedError
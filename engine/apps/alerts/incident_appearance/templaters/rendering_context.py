@@ -0,0 +1,87 @@
+import typing
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+if typing.TYPE_CHECKING:
+    from apps.alerts.models import Alert
+
+WebContextKey = typing.Tuple[typing.Hashable, ...]
+
+
+class AlertRenderingContext:
+    """
+    Holds values rendered for an alert which are shared between templaters.
+
+    Non-web templaters expose rendered web templates to their own templates as web_title, web_message and
+    web_image_url. These only depend on the alert payload (which can be preformatted by the templater)
+    and on the rendered source link, so they are computed once per combination of those and reused by every
+    templater rendering the same alert.
+    """
+
+    def __init__(self) -> None:
+        self._web_contexts: typing.Dict[WebContextKey, typing.Dict[str, str]] = {}
+        # number of jinja renders done / avoided when building web context
+        self.renders = 0
+        self.renders_saved = 0
+
+    def get_web_context(
+        self, key: WebContextKey, render: typing.Callable[[], typing.Dict[str, str]], renders_count: int
+    ) -> typing.Dict[str, str]:
+        web_context = self._web_contexts.get(key)
+        if web_context is None:
+            web_context = self._web_contexts[key] = render()
+            self.renders += renders_count
+        else:
+            self.renders_saved += renders_count
+        return web_context
+
+
+class AlertRenderingPass:
+    def __init__(self) -> None:
+        self.contexts: typing.Dict[int, AlertRenderingContext] = {}
+
+    @property
+    def renders(self) -> int:
+        return sum(rendering_context.renders for rendering_context in self.contexts.values())
+
+    @property
+    def renders_saved(self) -> int:
+        return sum(rendering_context.renders_saved for rendering_context in self.contexts.values())
+
+
+_rendering_pass: ContextVar[typing.Optional[AlertRenderingPass]] = ContextVar("alert_rendering_pass", default=None)
+
+
+@contextmanager
+def alert_rendering_pass() -> typing.Iterator[AlertRenderingPass]:
+    """
+    Share rendering contexts between all templaters used inside the block, even if they were given
+    different instances of the same alert (e.g. alert fetched from DB separately by each messaging backend).
+    Nested passes reuse the outermost one.
+    """
+    current_pass = _rendering_pass.get()
+    if current_pass is not None:
+        yield current_pass
+        return
+
+    current_pass = AlertRenderingPass()
+    token = _rendering_pass.set(current_pass)
+    try:
+        yield current_pass
+    finally:
+        _rendering_pass.reset(token)
+
+
+def get_alert_rendering_context(alert: "Alert") -> AlertRenderingContext:
+    """
+    Return rendering context shared within the current rendering pass.
+    Outside of a rendering pass a new context is returned, so values are only shared between attributes
+    rendered by a single templater.
+    """
+    current_pass = _rendering_pass.get()
+    if current_pass is None or alert.pk is None:
+        return AlertRenderingContext()
+
+    if alert.pk not in current_pass.contexts:
+        current_pass.contexts[alert.pk] = AlertRenderingContext()
+    return current_pass.contexts[alert.pk]
@@ -0,0 +1,65 @@
+import logging
+
+import django_migration_linter as linter
+from django.db import migrations
+
+logger = logging.getLogger(__name__)
+
+POSTGRESQL_INDEX_NAME = "alerts_alertgroup_web_title_trgm_idx"
+MYSQL_INDEX_NAME = "alerts_alertgroup_web_title_ft_idx"
+SQLITE_SEARCH_TABLE = "alerts_alertgroup_search"
+
+
+def create_search_index(apps, schema_editor):
+    """
+    Create the index used by apps.alerts.alert_group_search backends of the database.
+    """
+    vendor = schema_editor.connection.vendor
+    logger.info(f"Creating alert group title search index for {vendor}.")
+
+    with schema_editor.connection.cursor() as cursor:
+        if vendor == "postgresql":
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            # icontains lookups are compiled to UPPER(column::text) LIKE UPPER(%s)
+            cursor.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {POSTGRESQL_INDEX_NAME} ON alerts_alertgroup "
+                f"USING gin (UPPER(web_title_cache::text) gin_trgm_ops)"
+            )
+        elif vendor == "mysql":
+            cursor.execute(f"CREATE FULLTEXT INDEX {MYSQL_INDEX_NAME} ON alerts_alertgroup (web_title_cache)")
+        elif vendor == "sqlite":
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_SEARCH_TABLE} USING fts5(web_title_cache, tokenize='trigram')"
+            )
+            cursor.execute(
+                f"INSERT INTO {SQLITE_SEARCH_TABLE} (rowid, web_title_cache) "
+                f"SELECT id, web_title_cache FROM alerts_alertgroup WHERE web_title_cache IS NOT NULL"
+            )
+
+    logger.info("Finished creating alert group title search index.")
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    with schema_editor.connection.cursor() as cursor:
+        if vendor == "postgresql":
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {POSTGRESQL_INDEX_NAME}")
+        elif vendor == "mysql":
+            cursor.execute(f"DROP INDEX {MYSQL_INDEX_NAME} ON alerts_alertgroup")
+        elif vendor == "sqlite":
+            cursor.execute(f"DROP TABLE IF EXISTS {SQLITE_SEARCH_TABLE}")
+
+
+class Migration(migrations.Migration):
+    # indexes are created concurrently on PostgreSQL, which can't be done in a transaction
+    atomic = False
+
+    dependencies = [
+        ('alerts', '0075_alter_alertgrouplogrecord_action_source'),
+    ]
+
+    operations = [
+        # the index is not part of the model state, it is only used by raw SQL of the search backends
+        linter.IgnoreMigration(),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -27,12 +27,38 @@ from common.public_primary_keys import generate_public_primary_key, increase_pub
 if typing.TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
 
-    from apps.alerts.models import AlertGroup, AlertReceiveChannel, ChannelFilter
+    from apps.alerts.models import AlertGroup, AlertGroupLogRecord, AlertReceiveChannel, ChannelFilter
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 
+class AlertBatchGroup(typing.NamedTuple):
+    group: "AlertGroup"
+    group_created: bool
+    # labels of the first alert in the group
+    alert_labels: typing.Optional[AlertLabels]
+    is_acknowledge_signal: bool
+    is_resolve_signal: bool
+
+
+class AlertBatch(typing.NamedTuple):
+    """
+    Alerts inserted by Alert.insert_batch, to be processed by Alert.process_inserted_batch.
+    """
+
+    alerts: typing.List["Alert"]
+    # alert groups in the order they were looked up
+    groups: typing.List[AlertBatchGroup]
+    # payloads to create one by one after the batch
+    postponed: typing.List["Alert.RawRequestData"]
+    # payloads not processed due to ConcurrentUpdateError
+    not_processed: typing.List["Alert.RawRequestData"]
+    enable_autoresolve: bool
+    is_demo: bool
+    received_at: typing.Optional[str]
+
+
 def generate_public_primary_key_for_alert():
     prefix = "A"
     new_public_primary_key = generate_public_primary_key(prefix)
@@ -104,7 +130,7 @@ class Alert(models.Model):
         Creates an alert and a group if needed.
         """
         # This import is here to avoid circular imports
-        from apps.alerts.models import AlertGroup, AlertGroupLogRecord, AlertReceiveChannel, ChannelFilter
+        from apps.alerts.models import AlertGroup, AlertGroupLogRecord, ChannelFilter
 
         alert_labels = gather_alert_labels(alert_receive_channel, raw_request_data)
         group_data = Alert.render_group_data(alert_receive_channel, raw_request_data, alert_labels, is_demo)
@@ -140,24 +166,240 @@ class Alert(models.Model):
 
         if group_created:
             save_alert_group_labels(group, alert_receive_channel, alert_labels)
-            group.log_records.create(type=AlertGroupLogRecord.TYPE_REGISTERED)
-            group.log_records.create(type=AlertGroupLogRecord.TYPE_ROUTE_ASSIGNED)
+            AlertGroupLogRecord.objects.bulk_create(cls._build_alert_group_created_log_records(group))
+
+        cls._process_alert_group_after_alerts_created(
+            alert_receive_channel,
+            group,
+            group_created,
+            is_acknowledge_signal=group_data.is_acknowledge_signal,
+            is_resolve_signal=enable_autoresolve and group_data.is_resolve_signal,
+        )
+
+        return alert
 
-        if group_created or alert.group.pause_escalation:
+    @classmethod
+    def create_batch(
+        cls,
+        alert_receive_channel: "AlertReceiveChannel",
+        raw_request_data_list: typing.List[RawRequestData],
+        enable_autoresolve=True,
+        is_demo: bool = False,
+        received_at: typing.Optional[str] = None,
+    ) -> typing.Tuple[typing.List["Alert"], typing.List[RawRequestData]]:
+        """
+        Creates alerts for multiple payloads received by the integration at once (e.g. alerts from one
+        Alertmanager webhook). Alerts are grouped by route and distinction, so each alert group is looked up
+        (or created) once, then alerts and alert group log records are bulk inserted.
+
+        Alerts are processed in the same order as in Alert.create. If the integration allows source based resolving,
+        an alert group looked up for a resolve signal can be resolved (or be resolved by the signal), so alerts firing
+        after a resolve signal with the same distinction can't be added to the same group. Such alerts are created one
+        by one after the batch, so they are grouped again.
+
+        Returns created alerts and payloads which were not processed due to ConcurrentUpdateError and must be retried.
+        """
+        with transaction.atomic():
+            batch = cls.insert_batch(
+                alert_receive_channel, raw_request_data_list, enable_autoresolve, is_demo, received_at
+            )
+        return cls.process_inserted_batch(alert_receive_channel, batch)
+
+    @classmethod
+    def insert_batch(
+        cls,
+        alert_receive_channel: "AlertReceiveChannel",
+        raw_request_data_list: typing.List[RawRequestData],
+        enable_autoresolve=True,
+        is_demo: bool = False,
+        received_at: typing.Optional[str] = None,
+    ) -> AlertBatch:
+        """
+        First step of Alert.create_batch: looks up (or creates) alert groups and bulk inserts alerts, alert group labels
+        and log records. Must be called in a transaction, so the batch can be safely retried if it fails.
+        """
+        from apps.alerts.models import AlertGroup, AlertGroupLogRecord, ChannelFilter
+        from apps.alerts.models.alert_group_counter import ConcurrentUpdateError
+
+        # (channel_filter_pk, group_distinction) -> [(raw_request_data, alert_labels, group_data), ...]
+        buckets: typing.Dict[
+            typing.Tuple[typing.Optional[int], typing.Optional[str]],
+            typing.List[typing.Tuple["Alert.RawRequestData", typing.Optional[AlertLabels], "AlertGroup.GroupData"]],
+        ] = {}
+        channel_filters: typing.Dict[typing.Optional[int], typing.Optional["ChannelFilter"]] = {}
+        for raw_request_data in raw_request_data_list:
+            alert_labels = gather_alert_labels(alert_receive_channel, raw_request_data)
+            group_data = Alert.render_group_data(alert_receive_channel, raw_request_data, alert_labels, is_demo)
+            channel_filter = ChannelFilter.select_filter(alert_receive_channel, raw_request_data, alert_labels)
+            channel_filter_pk = channel_filter.pk if channel_filter else None
+            channel_filters.setdefault(channel_filter_pk, channel_filter)
+            buckets.setdefault((channel_filter_pk, group_data.group_distinction), []).append(
+                (raw_request_data, alert_labels, group_data)
+            )
+
+        alerts: typing.List["Alert"] = []
+        groups: typing.List[AlertBatchGroup] = []
+        # payloads to process one by one after the batch, see Alert.create_batch docstring
+        postponed: typing.List["Alert.RawRequestData"] = []
+        not_processed: typing.List["Alert.RawRequestData"] = []
+
+        buckets_list = list(buckets.items())
+        for bucket_index, ((channel_filter_pk, _), items) in enumerate(buckets_list):
+            try:
+                group, group_created = AlertGroup.objects.get_or_create_grouping(
+                    channel=alert_receive_channel,
+                    channel_filter=channel_filters[channel_filter_pk],
+                    group_data=items[0][2],
+                    received_at=received_at,
+                )
+            except ConcurrentUpdateError:
+                not_processed = [
+                    raw_request_data
+                    for _, remaining_items in buckets_list[bucket_index:]
+                    for raw_request_data, _, _ in remaining_items
+                ]
+                break
+            logger.debug(f"alert group {group.pk} created={group_created}")
+
+            is_acknowledge_signal = False
+            is_resolve_signal = False
+            resolve_signal_received = False
+            for item_index, (raw_request_data, _, group_data) in enumerate(items):
+                if resolve_signal_received and not group_data.is_resolve_signal:
+                    postponed.extend(raw_request_data for raw_request_data, _, _ in items[item_index:])
+                    break
+                alerts.append(
+                    cls(
+                        is_resolve_signal=group_data.is_resolve_signal,
+                        title=None,
+                        message=None,
+                        image_url=None,
+                        link_to_upstream_details=None,
+                        group=group,
+                        integration_unique_data=None,
+                        raw_request_data=raw_request_data,
+                        is_the_first_alert_in_group=group_created and item_index == 0,
+                    )
+                )
+                is_acknowledge_signal = is_acknowledge_signal or group_data.is_acknowledge_signal
+                if group_data.is_resolve_signal:
+                    is_resolve_signal = is_resolve_signal or enable_autoresolve
+                    resolve_signal_received = alert_receive_channel.allow_source_based_resolving
+            groups.append(AlertBatchGroup(group, group_created, items[0][1], is_acknowledge_signal, is_resolve_signal))
+
+        alerts = cls.objects.bulk_create(alerts, batch_size=5000)
+        if any(alert.pk is None for alert in alerts):
+            # some databases (e.g. MySQL) don't return primary keys of bulk inserted rows
+            pks = dict(
+                cls.objects.filter(public_primary_key__in=[alert.public_primary_key for alert in alerts]).values_list(
+                    "public_primary_key", "pk"
+                )
+            )
+            for alert in alerts:
+                alert.pk = pks[alert.public_primary_key]
+        for alert in alerts:
+            transaction.on_commit(partial(send_alert_create_signal.apply_async, (alert.pk,)))
+
+        log_records: typing.List[AlertGroupLogRecord] = []
+        for batch_group in groups:
+            if batch_group.group_created:
+                save_alert_group_labels(batch_group.group, alert_receive_channel, batch_group.alert_labels)
+                log_records.extend(cls._build_alert_group_created_log_records(batch_group.group))
+        AlertGroupLogRecord.objects.bulk_create(log_records, batch_size=5000)
+
+        return AlertBatch(
+            alerts=alerts,
+            groups=groups,
+            postponed=postponed,
+            not_processed=not_processed,
+            enable_autoresolve=enable_autoresolve,
+            is_demo=is_demo,
+            received_at=received_at,
+        )
+
+    @classmethod
+    def process_inserted_batch(
+        cls, alert_receive_channel: "AlertReceiveChannel", batch: AlertBatch
+    ) -> typing.Tuple[typing.List["Alert"], typing.List[RawRequestData]]:
+        """
+        Second step of Alert.create_batch, called once the inserted batch is committed: starts escalation and
+        acknowledges/resolves alert groups by source, then creates postponed alerts one by one.
+        """
+        from apps.alerts.models.alert_group_counter import ConcurrentUpdateError
+
+        for batch_group in batch.groups:
+            cls._process_alert_group_after_alerts_created(
+                alert_receive_channel,
+                batch_group.group,
+                batch_group.group_created,
+                is_acknowledge_signal=batch_group.is_acknowledge_signal,
+                is_resolve_signal=batch_group.is_resolve_signal,
+            )
+
+        alerts = list(batch.alerts)
+        not_processed = list(batch.not_processed)
+        for raw_request_data in batch.postponed:
+            try:
+                alert = cls.create(
+                    title=None,
+                    message=None,
+                    image_url=None,
+                    link_to_upstream_details=None,
+                    alert_receive_channel=alert_receive_channel,
+                    integration_unique_data=None,
+                    raw_request_data=raw_request_data,
+                    enable_autoresolve=batch.enable_autoresolve,
+                    is_demo=batch.is_demo,
+                    received_at=batch.received_at,
+                )
+            except ConcurrentUpdateError:
+                not_processed.append(raw_request_data)
+                continue
+            alerts.append(alert)
+
+        logger.debug(
+            f"created {len(alerts)} alerts in {len(batch.groups)} alert groups for channel={alert_receive_channel.pk}, "
+            f"not processed: {len(not_processed)}"
+        )
+        return alerts, not_processed
+
+    @staticmethod
+    def _build_alert_group_created_log_records(group: "AlertGroup") -> typing.List["AlertGroupLogRecord"]:
+        from apps.alerts.models import AlertGroupLogRecord
+
+        # these log record types don't trigger post_save signal handlers, so they can be bulk inserted
+        return [
+            AlertGroupLogRecord(alert_group=group, type=AlertGroupLogRecord.TYPE_REGISTERED),
+            AlertGroupLogRecord(alert_group=group, type=AlertGroupLogRecord.TYPE_ROUTE_ASSIGNED),
+        ]
+
+    @classmethod
+    def _process_alert_group_after_alerts_created(
+        cls,
+        alert_receive_channel: "AlertReceiveChannel",
+        group: "AlertGroup",
+        group_created: bool,
+        is_acknowledge_signal: bool,
+        is_resolve_signal: bool,
+    ) -> None:
+        """
+        Start escalation, acknowledge/resolve by source and attach to maintenance alert group if needed
+        after new alerts are added to the alert group.
+        """
+        from apps.alerts.models import AlertGroup, AlertGroupLogRecord, AlertReceiveChannel
+
+        if group_created or group.pause_escalation:
             # Build escalation snapshot if needed and start escalation
-            alert.group.start_escalation_if_needed(countdown=TASK_DELAY_SECONDS)
+            group.start_escalation_if_needed(countdown=TASK_DELAY_SECONDS)
 
         if group_created:
             # TODO: consider moving to start_escalation_if_needed
-            alert_group_escalation_snapshot_built.send(sender=cls.__class__, alert_group=alert.group)
+            alert_group_escalation_snapshot_built.send(sender=cls.__class__, alert_group=group)
 
-        mark_as_acknowledged = group_data.is_acknowledge_signal
-        if not group.acknowledged and mark_as_acknowledged:
+        if not group.acknowledged and is_acknowledge_signal:
             group.acknowledge_by_source()
 
-        mark_as_resolved = (
-            enable_autoresolve and group_data.is_resolve_signal and alert_receive_channel.allow_source_based_resolving
-        )
+        mark_as_resolved = is_resolve_signal and alert_receive_channel.allow_source_based_resolving
         if not group.resolved and mark_as_resolved:
             group.resolve_by_source()
 
@@ -185,8 +427,6 @@ class Alert(models.Model):
                 except AlertGroup.DoesNotExist:
                     pass
 
-        return alert
-
     def wipe(self, wiped_by, wiped_at):
         wiped_by_user_verbal = "by " + wiped_by.username
 
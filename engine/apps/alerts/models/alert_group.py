@@ -1,5 +1,6 @@
 import datetime
 import logging
+import time
 import typing
 import urllib
 from collections import namedtuple
@@ -10,9 +11,13 @@ from django.conf import settings
 from django.core.validators import MinLengthValidator
 from django.db import IntegrityError, models, transaction
 from django.db.models import JSONField, Q, QuerySet
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.functional import cached_property
 
+from apps.alerts.alert_group_search import get_alert_group_search_backend
+from apps.alerts.alert_group_stats import update_alert_group_stats_counters
 from apps.alerts.constants import ActionSource, AlertGroupState
 from apps.alerts.escalation_snapshot import EscalationSnapshotMixin
 from apps.alerts.escalation_snapshot.escalation_snapshot_mixin import START_ESCALATION_DELAY
@@ -108,7 +113,10 @@ class AlertGroupQuerySet(models.QuerySet):
         organization = kwargs["channel"].organization
 
         inside_organization_number = AlertGroupCounter.objects.get_value(organization=organization) + 1
-        return super().create(**kwargs, inside_organization_number=inside_organization_number)
+        # savepoint, so an IntegrityError on concurrent creation doesn't break the transaction of the caller
+        # (e.g. Alert.insert_batch), see get_or_create_grouping
+        with transaction.atomic():
+            return super().create(**kwargs, inside_organization_number=inside_organization_number)
 
     def get_or_create_grouping(self, channel, channel_filter, group_data, received_at=None):
         """
@@ -637,7 +645,7 @@ class AlertGroup(AlertGroupSlackRenderingMixin, EscalationSnapshotMixin, models.
 
     def _update_metrics(self, organization_id, previous_state, state):
         """Update metrics cache for response time and state as needed."""
-        update_metrics_for_alert_group.apply_async((self.id, organization_id, previous_state, state))
+        update_metrics_for_alert_group.apply_async((self.id, organization_id, previous_state, state, time.time()))
 
     def update_state_by_backsync(self, new_state: AlertGroupState, source_channel: "AlertReceiveChannel") -> None:
         if self.state == new_state:
@@ -1335,7 +1343,12 @@ class AlertGroup(AlertGroupSlackRenderingMixin, EscalationSnapshotMixin, models.
         resolution_notes = ResolutionNote.objects_with_deleted.filter(alert_group=self)
         resolution_notes.delete()
         self.resolution_note_slack_messages.all().delete()
+        state = self.state
         self.delete()
+        # deleted alert groups are not counted by alert group stats anymore
+        update_alert_group_stats_counters(
+            self.channel.organization_id, self.channel_id, self.started_at, previous_state=state, changed_at=time.time()
+        )
 
     @staticmethod
     def _bulk_acknowledge(user: User, alert_groups_to_acknowledge: "QuerySet[AlertGroup]") -> None:
@@ -2032,3 +2045,16 @@ class AlertGroup(AlertGroupSlackRenderingMixin, EscalationSnapshotMixin, models.
         """
         count = self.alerts.all()[: max_alerts + 1].count()
         return count > max_alerts
+
+
+@receiver(post_save, sender=AlertGroup)
+def listen_for_alertgroup_model_save(
+    sender: AlertGroup, instance: AlertGroup, created: bool, update_fields=None, *args, **kwargs
+) -> None:
+    # keep the title search index in sync, see apps.alerts.alert_group_search
+    if created:
+        title_changed = instance.web_title_cache is not None
+    else:
+        title_changed = update_fields is None or "web_title_cache" in update_fields
+    if title_changed:
+        get_alert_group_search_backend().update_index([instance.pk])
@@ -1,12 +1,29 @@
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Greatest
 
 
 class ConcurrentUpdateError(Exception):
     pass
 
 
+def _get_sequence_cache_key(organization_id: int) -> str:
+    return f"alert_group_counter_{organization_id}"
+
+
 class AlertGroupCounterQuerySet(models.QuerySet):
     def get_value(self, organization):
+        """
+        Return the last used value, so value + 1 can be used as a new inside_organization_number.
+        """
+        block_size = settings.ALERT_GROUP_COUNTER_BLOCK_SIZE
+        if block_size > 0:
+            return self.get_value_from_sequence(organization, block_size)
+        return self.get_value_optimistic(organization)
+
+    def get_value_optimistic(self, organization):
         counter, _ = self.get_or_create(organization=organization)
 
         num_updated_rows = self.filter(organization=organization, value=counter.value).update(value=counter.value + 1)
@@ -15,13 +32,48 @@ class AlertGroupCounterQuerySet(models.QuerySet):
 
         return counter.value
 
+    def get_value_from_sequence(self, organization, block_size):
+        cache_key = _get_sequence_cache_key(organization.pk)
+        try:
+            value = cache.incr(cache_key)
+        except ValueError:
+            # The sequence is not initialized yet or was evicted from the cache, so seed it with the DB value.
+            # The DB value is always ahead of the sequence (see reserve), so no value can be returned twice.
+            counter, _ = self.get_or_create(organization=organization)
+            if cache.add(cache_key, counter.value, timeout=None):
+                self.reserve(organization, counter.value + 2 * block_size)
+            try:
+                value = cache.incr(cache_key)
+            except ValueError:
+                # evicted again right after it was seeded, let the caller retry
+                raise ConcurrentUpdateError()
+
+        # Reserve values in blocks, so the DB row is updated once per block_size alert groups.
+        # The next block is reserved too, so values which are in use are always reserved in DB, even if reserve
+        # for the current block is executed a bit later than the sequence is incremented.
+        if value % block_size == 0:
+            self.reserve(organization, value + 2 * block_size)
+
+        return value - 1
+
+    def reserve(self, organization, value):
+        """
+        Move the DB value up to the given one. Never moves the value back and never fails on concurrent updates.
+        """
+        self.filter(organization=organization).update(value=Greatest(F("value"), value))
+
 
 class AlertGroupCounter(models.Model):
     """
     This model is used to assign unique, increasing inside_organization_number's for alert groups.
-    It uses optimistic locking to get values and raises ConcurrentUpdateError exception in case of concurrent updates.
-    This is used on alert group creation in order to not block Celery workers with select_for_update and give space
-    to other tasks to run in case of high load on alert group creation.
+
+    By default values are taken from a sequence stored in the cache (Redis INCR), which is atomic, so concurrent
+    alert group creation doesn't fail and doesn't block Celery workers. The DB value is a reservation, it is moved
+    ahead of the sequence in blocks of ALERT_GROUP_COUNTER_BLOCK_SIZE values and it is used to seed the sequence in
+    case it is lost from the cache. Note that it means the DB value can be ahead of the number of alert groups.
+
+    If ALERT_GROUP_COUNTER_BLOCK_SIZE is 0, values are taken from the DB using optimistic locking, which raises
+    ConcurrentUpdateError exception in case of concurrent updates.
     """
 
     objects = models.Manager.from_queryset(AlertGroupCounterQuerySet)()
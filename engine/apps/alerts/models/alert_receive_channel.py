@@ -37,7 +37,7 @@ from apps.slack.utils import post_message_to_channel
 from common.api_helpers.utils import create_engine_url
 from common.exceptions import TeamCanNotBeChangedError, UnableToSendDemoAlert
 from common.insight_log import EntityEvent, write_resource_insight_log
-from common.jinja_templater import jinja_template_env
+from common.jinja_templater import compiled_template_cache
 from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
 
 if typing.TYPE_CHECKING:
@@ -124,7 +124,12 @@ def number_to_smiles_translator(number):
 
 class AlertReceiveChannelQueryset(models.QuerySet):
     def delete(self):
+        from apps.integrations.mixins import AlertChannelDefiningMixin
+
+        alert_receive_channels = list(self.only("pk", "token"))
         self.update(deleted_at=timezone.now())
+        for alert_receive_channel in alert_receive_channels:
+            AlertChannelDefiningMixin.invalidate_alert_receive_channel_cache(alert_receive_channel)
 
 
 class AlertReceiveChannelManager(models.Manager):
@@ -429,7 +434,11 @@ class AlertReceiveChannel(IntegrationOptionsMixin, MaintainableObject):
         ):
             raise self.DuplicateDirectPagingError
 
-        return super().save(*args, **kwargs)
+        from apps.integrations.mixins import AlertChannelDefiningMixin
+
+        result = super().save(*args, **kwargs)
+        AlertChannelDefiningMixin.invalidate_alert_receive_channel_cache(self)
+        return result
 
     def change_team(self, team_id: int, user: "User") -> None:
         if team_id == self.team_id:
@@ -514,7 +523,7 @@ class AlertReceiveChannel(IntegrationOptionsMixin, MaintainableObject):
         # TODO: AMV2: Remove this check after legacy integrations are migrated.
         if self.integration == AlertReceiveChannel.INTEGRATION_LEGACY_GRAFANA_ALERTING:
             contact_points = self.contact_points.all()
-            rendered_description = jinja_template_env.from_string(self.config.description).render(
+            rendered_description = compiled_template_cache.get_template(self.config.description).render(
                 is_finished_alerting_setup=self.is_finished_alerting_setup,
                 grafana_alerting_entities=[
                     {
@@ -124,12 +124,50 @@ class ChannelFilter(OrderedModel):
         raw_request_data: "Alert.RawRequestData",
         alert_labels: typing.Optional[typing.Dict[str, str]] = None,
     ) -> typing.Optional["ChannelFilter"]:
+        from apps.alerts.channel_filter_router import channel_filter_router_cache, invalidate_channel_filter_router
+
+        router = channel_filter_router_cache.get(alert_receive_channel)
+        channel_filter_pk = router.select(raw_request_data, alert_labels)
+        if channel_filter_pk is None:
+            return None
+
+        try:
+            return cls.objects.get(pk=channel_filter_pk)
+        except cls.DoesNotExist:
+            # route was deleted after the router was built, evaluate routes from DB
+            invalidate_channel_filter_router(alert_receive_channel.pk)
+
         channel_filters = cls.objects.filter(alert_receive_channel=alert_receive_channel)
         for channel_filter in channel_filters:
             if channel_filter.is_satisfying(raw_request_data, alert_labels):
                 return channel_filter
         return None
 
+    def save(self, *args, **kwargs) -> None:
+        super().save(*args, **kwargs)
+        self._invalidate_router()
+
+    def delete(self, *args, **kwargs) -> None:
+        super().delete(*args, **kwargs)
+        self._invalidate_router()
+
+    def to(self, order: int) -> None:
+        super().to(order)
+        self._invalidate_router()
+
+    def to_index(self, index: int) -> None:
+        super().to_index(index)
+        self._invalidate_router()
+
+    def swap(self, order: int) -> None:
+        super().swap(order)
+        self._invalidate_router()
+
+    def _invalidate_router(self) -> None:
+        from apps.alerts.channel_filter_router import invalidate_channel_filter_router
+
+        invalidate_channel_filter_router(self.alert_receive_channel_id)
+
     def is_satisfying(
         self, raw_request_data: "Alert.RawRequestData", alert_labels: typing.Optional["AlertLabels"] = None
     ) -> bool:
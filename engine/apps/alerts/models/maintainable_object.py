@@ -1,4 +1,5 @@
 import datetime
+import time
 from uuid import uuid4
 
 import humanize
@@ -6,6 +7,8 @@ import pytz
 from django.db import models, transaction
 from django.utils import timezone
 
+from apps.alerts.alert_group_stats import update_alert_group_stats_counters
+from apps.alerts.constants import AlertGroupState
 from common.exceptions import MaintenanceCouldNotBeStartedError
 from common.insight_log import MaintenanceEvent, write_maintenance_insight_log
 
@@ -122,6 +125,17 @@ class MaintainableObject(models.Model):
                     channel_filter_id=maintenance_integration.default_channel_filter.pk,
                     channel=maintenance_integration,
                 )
+                # maintenance incidents are not sent with alert_group_created_signal, but alert group stats count
+                # them as the alert group list does
+                transaction.on_commit(
+                    lambda: update_alert_group_stats_counters(
+                        organization.id,
+                        group.channel_id,
+                        group.started_at,
+                        new_state=AlertGroupState.FIRING,
+                        changed_at=time.time(),
+                    )
+                )
                 title = f"Maintenance of {verbal} for {duration_verbal}"
                 message = (
                     f"Initiated by {user_verbal}."
@@ -1,5 +1,6 @@
 from django.db.models import Min
 
+from apps.alerts.alert_group_search import get_alert_group_search_backend
 from apps.alerts.incident_appearance.templaters import TemplateLoader
 from apps.alerts.tasks.task_logger import task_logger
 from common.custom_celery_tasks import shared_dedicated_queue_retry_task
@@ -85,3 +86,4 @@ def update_web_title_cache(alert_receive_channel_pk, alert_group_pks):
         alert_group.web_title_cache = web_title_cache
 
     AlertGroup.objects.bulk_update(alert_groups, ["web_title_cache"])
+    get_alert_group_search_backend().update_index(alert_group.pk for alert_group in alert_groups)
@@ -13,6 +13,7 @@ from telegram.error import RetryAfter
 from apps.alerts.constants import NEXT_ESCALATION_DELAY
 from apps.alerts.tasks.send_update_log_report_signal import send_update_log_report_signal
 from apps.base.messaging import get_messaging_backend_from_id
+from apps.base.notification_plan import get_notification_plan
 from apps.metrics_exporter.tasks import update_metrics_for_user
 from apps.phone_notifications.phone_backend import PhoneBackend
 from common.custom_celery_tasks import shared_dedicated_queue_retry_task
@@ -146,17 +147,17 @@ def notify_user_task(
         using_fallback_default_notification_policy_step = False
 
         if previous_notification_policy_pk is None:
-            (
-                using_fallback_default_notification_policy_step,
-                notification_policies,
-            ) = user.get_notification_policies_or_use_default_fallback(important=important)
-            if not notification_policies:
+            notification_plan = get_notification_plan(user, important)
+            using_fallback_default_notification_policy_step = (
+                notification_plan.using_fallback_default_notification_policy_step
+            )
+            if not notification_plan.steps:
                 task_logger.info(
                     f"notify_user_task: Failed to notify. No notification policies. user_id={user_pk} alert_group_id={alert_group_pk} important={important}"
                 )
                 return
-            reason = build_notification_reason_for_log_record(notification_policies, reason)
-            notification_policy = notification_policies[0]
+            reason = build_notification_reason_for_log_record(notification_plan.get_policies(user), reason)
+            notification_policy = notification_plan.get_policy(user, 0)
         else:
             if notify_user_task.request.id != user_has_notification.active_notification_policy_id:
                 task_logger.info(
@@ -166,18 +167,27 @@ def notify_user_task(
                 )
                 return
 
-            try:
-                notification_policy = UserNotificationPolicy.objects.get(pk=previous_notification_policy_pk)
-                if notification_policy.user != user:
-                    notification_policy = UserNotificationPolicy.objects.get(
-                        order=notification_policy.order, user=user, important=important
+            # next steps aren't scheduled with the importance of the policies, so look the step up in both plans
+            for plan_important in (important, not important):
+                notification_plan = get_notification_plan(user, plan_important)
+                previous_step_index = notification_plan.index_of(previous_notification_policy_pk)
+                if previous_step_index is not None:
+                    notification_policy = notification_plan.get_policy(user, previous_step_index + 1)
+                    break
+            else:
+                # the policy was deleted or it's not a policy of the user
+                try:
+                    notification_policy = UserNotificationPolicy.objects.get(pk=previous_notification_policy_pk)
+                    if notification_policy.user != user:
+                        notification_policy = UserNotificationPolicy.objects.get(
+                            order=notification_policy.order, user=user, important=important
+                        )
+                    notification_policy = notification_policy.next()
+                except UserNotificationPolicy.DoesNotExist:
+                    task_logger.info(
+                        f"notify_user_task: Notification policy {previous_notification_policy_pk} has been deleted"
                     )
-                notification_policy = notification_policy.next()
-            except UserNotificationPolicy.DoesNotExist:
-                task_logger.info(
-                    f"notify_user_task: Notification policy {previous_notification_policy_pk} has been deleted"
-                )
-                return
+                    return
             reason = None
 
         def _create_user_notification_policy_log_record(**kwargs):
@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from apps.alerts.models import AlertGroup, AlertGroupCounter
+from apps.alerts.models.alert_group_counter import (
+    AlertGroupCounterQuerySet,
+    ConcurrentUpdateError,
+    _get_sequence_cache_key,
+)
+
+
+@pytest.mark.django_db
+def test_alert_group_counter_sequence(make_organization, settings):
+    settings.ALERT_GROUP_COUNTER_BLOCK_SIZE = 3
+    organization = make_organization()
+
+    values = [AlertGroupCounter.objects.get_value(organization) + 1 for _ in range(10)]
+    assert values == list(range(1, 11))
+
+    # DB value is reserved ahead of the sequence
+    counter = AlertGroupCounter.objects.get(organization=organization)
+    assert counter.value >= 10 + 3
+
+
+@pytest.mark.django_db
+def test_alert_group_counter_sequence_lost(make_organization, settings):
+    settings.ALERT_GROUP_COUNTER_BLOCK_SIZE = 3
+    organization = make_organization()
+
+    values = [AlertGroupCounter.objects.get_value(organization) + 1 for _ in range(5)]
+    cache.delete(_get_sequence_cache_key(organization.pk))
+    values += [AlertGroupCounter.objects.get_value(organization) + 1 for _ in range(5)]
+
+    # values are unique and increasing, even though the sequence was reseeded from DB
+    assert len(set(values)) == len(values)
+    assert values == sorted(values)
+
+
+@pytest.mark.django_db
+def test_alert_group_counter_sequence_continues_optimistic_value(make_organization, settings):
+    organization = make_organization()
+    settings.ALERT_GROUP_COUNTER_BLOCK_SIZE = 0
+    assert AlertGroupCounter.objects.get_value(organization) + 1 == 1
+    assert AlertGroupCounter.objects.get_value(organization) + 1 == 2
+
+    settings.ALERT_GROUP_COUNTER_BLOCK_SIZE = 3
+    assert AlertGroupCounter.objects.get_value(organization) + 1 == 3
+
+
+@pytest.mark.django_db
+def test_alert_group_counter_optimistic_concurrent_update(make_organization, settings):
+    settings.ALERT_GROUP_COUNTER_BLOCK_SIZE = 0
+    organization = make_organization()
+    AlertGroupCounter.objects.get_value(organization)
+
+    # another worker updated the value after it was read
+    with patch.object(AlertGroupCounterQuerySet, "update", return_value=0):
+        with pytest.raises(ConcurrentUpdateError):
+            AlertGroupCounter.objects.get_value(organization)
+
+
+@pytest.mark.django_db
+def test_alert_group_inside_organization_number(
+    make_organization, make_alert_receive_channel, make_alert_group, settings
+):
+    settings.ALERT_GROUP_COUNTER_BLOCK_SIZE = 2
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+
+    alert_groups = [make_alert_group(alert_receive_channel) for _ in range(5)]
+    assert [alert_group.inside_organization_number for alert_group in alert_groups] == [1, 2, 3, 4, 5]
+    assert AlertGroup.objects.filter(channel__organization=organization).count() == 5
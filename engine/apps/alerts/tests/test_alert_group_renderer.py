@@ -1,8 +1,14 @@
 import pytest
 
 from apps.alerts.incident_appearance.renderers.sms_renderer import AlertGroupSMSBundleRenderer
-from apps.alerts.incident_appearance.templaters import AlertSlackTemplater, AlertWebTemplater
-from apps.alerts.models import AlertGroup
+from apps.alerts.incident_appearance.templaters import (
+    AlertSlackTemplater,
+    AlertSmsTemplater,
+    AlertTelegramTemplater,
+    AlertWebTemplater,
+    alert_rendering_pass,
+)
+from apps.alerts.models import Alert, AlertGroup
 from apps.base.models import UserNotificationPolicy
 from config_integrations import grafana
 
@@ -251,3 +257,67 @@ def test_alert_group_sms_bundle_renderer(
         f"from stack: {organization.stack_slug}, "
         f"integrations: {alert_receive_channel_1.short_name} and 1 more."
     )
+
+
+@pytest.mark.django_db
+def test_render_web_templates_once_per_templater(
+    make_organization,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert,
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(
+        organization,
+        web_title_template="web: {{ payload.title }}",
+        web_message_template="{{ payload.message }}",
+        slack_title_template="slack: {{ web_title }}",
+        slack_message_template="{{ web_message }}",
+    )
+    alert_group = make_alert_group(alert_receive_channel)
+    alert = make_alert(alert_group=alert_group, raw_request_data={"title": "title", "message": "message"})
+
+    templater = AlertSlackTemplater(alert)
+    templated_alert = templater.render()
+
+    assert templated_alert.title == "slack: web: title"
+    assert templated_alert.message == "message"
+    # web templates are rendered when rendering source_link and then once more after source_link is known
+    assert templater.rendering_context.renders == 6
+    assert templater.rendering_context.renders_saved == 6
+
+
+@pytest.mark.django_db
+def test_render_web_templates_shared_in_rendering_pass(
+    make_organization,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert,
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(
+        organization,
+        web_title_template="web: {{ payload.title }}",
+        slack_title_template="slack: {{ web_title }}",
+        sms_title_template="sms: {{ web_title }}",
+        telegram_title_template="{{ web_title }}",
+    )
+    alert_group = make_alert_group(alert_receive_channel)
+    alert = make_alert(alert_group=alert_group, raw_request_data={"title": "title"})
+
+    with alert_rendering_pass() as rendering_pass:
+        slack_templated_alert = AlertSlackTemplater(alert).render()
+        # a separate instance of the same alert shares the rendering context
+        sms_templated_alert = AlertSmsTemplater(Alert.objects.get(pk=alert.pk)).render()
+        telegram_templated_alert = AlertTelegramTemplater(alert).render()
+
+    assert slack_templated_alert.title == "slack: web: title"
+    assert sms_templated_alert.title == "sms: web: title"
+    assert telegram_templated_alert.title == "web: title"
+    assert len(rendering_pass.contexts) == 1
+    assert rendering_pass.renders_saved > rendering_pass.renders
+
+    # outside of a rendering pass nothing is shared between templaters
+    templater = AlertSmsTemplater(alert)
+    assert templater.render().title == "sms: web: title"
+    assert templater.rendering_context is not rendering_pass.contexts[alert.pk]
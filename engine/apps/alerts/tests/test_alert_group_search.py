@@ -0,0 +1,77 @@
+import pytest
+
+from apps.alerts.alert_group_search import AlertGroupSearchBackend, MySQLSearchBackend, SQLiteSearchBackend
+from apps.alerts.models import AlertGroup
+from apps.alerts.tasks.alert_group_web_title_cache import update_web_title_cache
+
+
+@pytest.fixture
+def search_titles():
+    backend = SQLiteSearchBackend()
+
+    def _search_titles(term):
+        return list(AlertGroup.objects.filter(backend.title_condition(term)).order_by("pk"))
+
+    return _search_titles
+
+
+@pytest.mark.django_db
+def test_sqlite_search_backend_index_is_updated_on_save(
+    make_organization, make_alert_receive_channel, make_alert_group, search_titles
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group_1 = make_alert_group(alert_receive_channel, web_title_cache="Disk usage is HIGH on db-1")
+    alert_group_2 = make_alert_group(alert_receive_channel, web_title_cache="CPU usage is high on web-1")
+    make_alert_group(alert_receive_channel)
+
+    assert search_titles("usage is high") == [alert_group_1, alert_group_2]
+    assert search_titles("db-1") == [alert_group_1]
+    assert search_titles('"db') == []
+
+    alert_group_1.web_title_cache = "Disk usage is back to normal on db-1"
+    alert_group_1.save(update_fields=["web_title_cache"])
+    assert search_titles("usage is high") == [alert_group_2]
+
+    alert_group_2.web_title_cache = None
+    alert_group_2.save()
+    assert search_titles("usage") == [alert_group_1]
+
+
+@pytest.mark.django_db
+def test_sqlite_search_backend_short_term(
+    make_organization, make_alert_receive_channel, make_alert_group, search_titles
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_alert_group(alert_receive_channel, web_title_cache="DB-1 is down")
+    make_alert_group(alert_receive_channel, web_title_cache="db-2 is down")
+
+    # terms shorter than trigrams are not looked up in the index
+    assert search_titles("-1") == [alert_group]
+
+
+@pytest.mark.django_db
+def test_update_web_title_cache_updates_search_index(
+    make_organization, make_alert_receive_channel, make_alert_group, make_alert, search_titles
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization, web_title_template="{{ payload.title }}")
+    alert_group = make_alert_group(alert_receive_channel, web_title_cache="old title")
+    make_alert(alert_group=alert_group, raw_request_data={"title": "new title"})
+
+    update_web_title_cache(alert_receive_channel.pk, [alert_group.pk])
+
+    assert search_titles("old title") == []
+    assert search_titles("new title") == [alert_group]
+
+
+def test_mysql_search_backend_title_condition():
+    backend = MySQLSearchBackend()
+
+    condition = backend.title_condition('disk "usage" db-1')
+    (expression,) = condition.children
+    assert expression.params == ("+disk* +usage*",)
+
+    # words shorter than the full-text index minimum token size fall back to a substring match
+    assert backend.title_condition("db") == AlertGroupSearchBackend().title_condition("db")
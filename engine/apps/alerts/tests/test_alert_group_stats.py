@@ -0,0 +1,197 @@
+import datetime
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.alerts.alert_group_stats import count_alert_groups, update_alert_group_stats_counters
+from apps.alerts.constants import AlertGroupState
+from apps.alerts.models import AlertGroup, AlertReceiveChannel
+
+NOW = datetime.datetime(2024, 5, 20, 12, 0, tzinfo=datetime.timezone.utc)
+ALL_STATES = [state.value for state in AlertGroupState]
+
+
+@pytest.fixture
+def make_alert_groups_started_at(make_alert_group):
+    def _make_alert_groups_started_at(alert_receive_channel, started_ats, **kwargs):
+        alert_groups = []
+        for started_at in started_ats:
+            alert_group = make_alert_group(alert_receive_channel, **kwargs)
+            AlertGroup.objects.filter(pk=alert_group.pk).update(started_at=started_at)
+            alert_group.started_at = started_at
+            alert_groups.append(alert_group)
+        return alert_groups
+
+    return _make_alert_groups_started_at
+
+
+@patch("apps.alerts.alert_group_stats.timezone.now", return_value=NOW)
+@pytest.mark.django_db
+def test_count_alert_groups(
+    _mock_now, make_organization, make_alert_receive_channel, make_alert_groups_started_at, django_assert_num_queries
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    other_alert_receive_channel = make_alert_receive_channel(organization)
+    started_ats = [
+        NOW - datetime.timedelta(days=40),
+        # partial first day of the range
+        NOW - datetime.timedelta(days=30, hours=1),
+        NOW - datetime.timedelta(days=29, hours=23),
+        NOW - datetime.timedelta(days=3),
+        NOW - datetime.timedelta(hours=1),
+    ]
+    make_alert_groups_started_at(alert_receive_channel, started_ats)
+    make_alert_groups_started_at(alert_receive_channel, started_ats[1:], resolved=True)
+    make_alert_groups_started_at(other_alert_receive_channel, started_ats[1:])
+
+    def _count(channel_ids, states, start=NOW - datetime.timedelta(days=30), end=None):
+        return count_alert_groups(organization.id, channel_ids, states, start, end)
+
+    # counters are counted by DB for all integrations at once, the partial first day is counted separately
+    with django_assert_num_queries(3):
+        assert _count([alert_receive_channel.id], [AlertGroupState.FIRING.value]) == 3
+    with django_assert_num_queries(1):
+        assert _count([alert_receive_channel.id], ALL_STATES) == 6
+    with django_assert_num_queries(1):
+        assert _count([alert_receive_channel.id, other_alert_receive_channel.id], [AlertGroupState.RESOLVED.value]) == 3
+
+    # ranges ending in the past count the partial last day by DB, days not counted yet are added to counters
+    start = NOW - datetime.timedelta(days=31)
+    end = NOW - datetime.timedelta(days=2, hours=12)
+    with django_assert_num_queries(4):
+        assert _count([alert_receive_channel.id], [AlertGroupState.FIRING.value], start, end) == 3
+
+    # ranges within a day are counted by DB
+    with django_assert_num_queries(1):
+        assert _count([alert_receive_channel.id], ALL_STATES, NOW - datetime.timedelta(hours=2), NOW) == 2
+
+
+@patch("apps.alerts.alert_group_stats.timezone.now", return_value=NOW)
+@pytest.mark.django_db
+def test_update_alert_group_stats_counters(
+    _mock_now, make_organization, make_alert_receive_channel, make_alert_groups_started_at
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    start = NOW - datetime.timedelta(days=1)
+    make_alert_groups_started_at(alert_receive_channel, [NOW - datetime.timedelta(hours=1)])
+
+    def _count(states):
+        return count_alert_groups(organization.id, [alert_receive_channel.id], states, start)
+
+    assert _count([AlertGroupState.FIRING.value]) == 1
+
+    # counters are updated without counting them by DB again
+    make_alert_groups_started_at(alert_receive_channel, [NOW - datetime.timedelta(hours=2)])
+    update_alert_group_stats_counters(organization.id, alert_receive_channel.id, NOW, new_state=AlertGroupState.FIRING)
+    update_alert_group_stats_counters(
+        organization.id,
+        alert_receive_channel.id,
+        NOW,
+        previous_state=AlertGroupState.FIRING,
+        new_state=AlertGroupState.ACKNOWLEDGED,
+    )
+    assert _count([AlertGroupState.FIRING.value]) == 1
+    assert _count([AlertGroupState.ACKNOWLEDGED.value]) == 1
+
+    # counters of days which are not cached are not created
+    update_alert_group_stats_counters(
+        organization.id,
+        alert_receive_channel.id,
+        NOW - datetime.timedelta(days=10),
+        new_state=AlertGroupState.FIRING,
+    )
+    start -= datetime.timedelta(days=10)
+    assert _count(ALL_STATES) == 2
+
+
+@patch("apps.alerts.alert_group_stats.timezone.now", return_value=NOW)
+@pytest.mark.django_db
+def test_update_alert_group_stats_counters_skips_counted_changes(
+    _mock_now, make_organization, make_alert_receive_channel, make_alert_groups_started_at
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    start = NOW - datetime.timedelta(days=1)
+
+    def _count(states):
+        return count_alert_groups(organization.id, [alert_receive_channel.id], states, start)
+
+    with patch("apps.alerts.alert_group_stats.time.time", return_value=NOW.timestamp()):
+        make_alert_groups_started_at(alert_receive_channel, [NOW - datetime.timedelta(hours=1)])
+        assert _count(ALL_STATES) == 1
+
+        # the alert group created before the day was counted is counted by DB already
+        update_alert_group_stats_counters(
+            organization.id,
+            alert_receive_channel.id,
+            NOW,
+            new_state=AlertGroupState.FIRING,
+            changed_at=NOW.timestamp() - 1,
+        )
+        assert _count(ALL_STATES) == 1
+
+        # changes made after the day was counted are applied
+        for _ in range(2):
+            update_alert_group_stats_counters(
+                organization.id,
+                alert_receive_channel.id,
+                NOW,
+                previous_state=AlertGroupState.FIRING,
+                new_state=AlertGroupState.RESOLVED,
+                changed_at=NOW.timestamp() + 1,
+            )
+        assert _count([AlertGroupState.FIRING.value]) == 0
+        assert _count([AlertGroupState.RESOLVED.value]) == 2
+
+
+@pytest.mark.django_db
+def test_alert_group_stats_counters_deleted_alert_group(
+    make_organization, make_alert_receive_channel, make_alert_groups_started_at
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    now = timezone.now()
+    alert_groups = make_alert_groups_started_at(
+        alert_receive_channel, [now - datetime.timedelta(days=1), now - datetime.timedelta(days=2)]
+    )
+
+    def _count():
+        return count_alert_groups(
+            organization.id, [alert_receive_channel.id], ALL_STATES, now - datetime.timedelta(days=3)
+        )
+
+    assert _count() == 2
+
+    # deleted alert groups are subtracted from cached counters
+    alert_groups[0].hard_delete()
+    assert _count() == 1
+    cache.clear()
+    assert _count() == 1
+
+
+@pytest.mark.django_db
+def test_alert_group_stats_counters_maintenance_incident(
+    make_organization_and_user, make_alert_receive_channel, django_capture_on_commit_callbacks
+):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    start = timezone.now() - datetime.timedelta(days=1)
+    assert count_alert_groups(organization.id, [alert_receive_channel.id], ALL_STATES, start) == 0
+
+    # maintenance incidents are counted by cached counters the same way they are counted by DB
+    with django_capture_on_commit_callbacks(execute=True):
+        alert_receive_channel.start_maintenance(
+            AlertReceiveChannel.MAINTENANCE, AlertReceiveChannel.DURATION_ONE_HOUR.seconds, user
+        )
+    maintenance_incident = AlertGroup.objects.get(maintenance_uuid__isnull=False)
+
+    def _count():
+        return count_alert_groups(organization.id, [maintenance_incident.channel_id], ALL_STATES, start)
+
+    assert _count() == 1
+    cache.clear()
+    assert _count() == 1
@@ -1,5 +1,6 @@
 import pytest
 
+from apps.alerts.channel_filter_router import channel_filter_router_cache
 from apps.alerts.models import ChannelFilter
 
 
@@ -154,6 +155,79 @@ def test_channel_filter_using_filter_labels(
     )
 
 
+@pytest.mark.django_db
+def test_channel_filter_select_filter_router_is_cached(
+    make_organization, make_alert_receive_channel, make_channel_filter, django_assert_num_queries
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    make_channel_filter(alert_receive_channel, is_default=True)
+    channel_filter = make_channel_filter(alert_receive_channel, filtering_term="foo", is_default=False)
+
+    assert ChannelFilter.select_filter(alert_receive_channel, {"title": "foo"}) == channel_filter
+
+    # routes are not loaded again, only the selected route is fetched
+    with django_assert_num_queries(1):
+        assert ChannelFilter.select_filter(alert_receive_channel, {"title": "foo"}) == channel_filter
+
+
+@pytest.mark.django_db
+def test_channel_filter_select_filter_router_invalidated_on_route_change(
+    make_organization, make_alert_receive_channel, make_channel_filter
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    default_channel_filter = make_channel_filter(alert_receive_channel, is_default=True)
+    channel_filter = make_channel_filter(alert_receive_channel, filtering_term="foo", is_default=False)
+    other_channel_filter = make_channel_filter(alert_receive_channel, filtering_term="bar", is_default=False)
+    raw_request_data = {"title": "foo bar"}
+
+    assert ChannelFilter.select_filter(alert_receive_channel, raw_request_data) == channel_filter
+
+    # reorder routes
+    other_channel_filter.to_index(0)
+    assert ChannelFilter.select_filter(alert_receive_channel, raw_request_data) == other_channel_filter
+
+    # update route
+    other_channel_filter.filtering_term = "baz"
+    other_channel_filter.save()
+    assert ChannelFilter.select_filter(alert_receive_channel, raw_request_data) == channel_filter
+
+    # delete route
+    channel_filter.delete()
+    assert ChannelFilter.select_filter(alert_receive_channel, raw_request_data) == default_channel_filter
+
+
+@pytest.mark.django_db
+def test_channel_filter_select_filter_router_invalidated_on_commit(
+    make_organization, make_alert_receive_channel, make_channel_filter, django_capture_on_commit_callbacks
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    make_channel_filter(alert_receive_channel, is_default=True)
+    channel_filter = make_channel_filter(alert_receive_channel, filtering_term="foo", is_default=False)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        channel_filter.filtering_term = "bar"
+        channel_filter.save()
+        # router rebuilt before the transaction is committed (e.g. by another process)
+        uncommitted_router = channel_filter_router_cache.get(alert_receive_channel)
+        assert channel_filter_router_cache.get(alert_receive_channel) is uncommitted_router
+
+    # the router is rebuilt once the transaction is committed
+    assert channel_filter_router_cache.get(alert_receive_channel) is not uncommitted_router
+
+
+@pytest.mark.django_db
+def test_channel_filter_select_filter_invalid_regex(make_organization, make_alert_receive_channel, make_channel_filter):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    default_channel_filter = make_channel_filter(alert_receive_channel, is_default=True)
+    make_channel_filter(alert_receive_channel, filtering_term="foo(", is_default=False)
+
+    assert ChannelFilter.select_filter(alert_receive_channel, {"title": "foo("}) == default_channel_filter
+
+
 class TestChannelFilterSlackChannelOrOrgDefault:
     @pytest.mark.django_db
     def test_slack_channel_or_org_default_with_slack_channel(
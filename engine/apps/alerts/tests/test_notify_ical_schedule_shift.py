@@ -11,6 +11,10 @@ from apps.alerts.tasks.notify_ical_schedule_shift import (
     notify_ical_schedule_shift,
 )
 from apps.schedules.models import CustomOnCallShift, OnCallScheduleCalendar, OnCallScheduleICal, OnCallScheduleWeb
+from apps.slack.client import SlackClient
+
+# SlackClient.api_call as it is before engine.conftest.mock_slack_api_call mocks it
+SLACK_API_CALL = SlackClient.api_call
 
 ICAL_DATA = """
 BEGIN:VCALENDAR
@@ -319,6 +323,61 @@ def test_current_shift_changes_trigger_notification(
     assert mock_slack_api_call.called
 
 
+@pytest.mark.django_db
+def test_current_shift_changes_notification_waits_for_rate_scheduler(
+    make_slack_team_identity,
+    make_slack_channel,
+    make_organization,
+    make_user,
+    make_schedule,
+    make_on_call_shift,
+):
+    slack_team_identity = make_slack_team_identity()
+    slack_channel = make_slack_channel(slack_team_identity)
+    organization = make_organization(slack_team_identity=slack_team_identity)
+    user1 = make_user(organization=organization, username="user1")
+
+    schedule = make_schedule(
+        organization,
+        schedule_class=OnCallScheduleCalendar,
+        name="test_schedule",
+        slack_channel=slack_channel,
+        prev_ical_file_overrides=None,
+        cached_ical_file_overrides=None,
+    )
+
+    now = timezone.now().replace(microsecond=0)
+    start_date = now - datetime.timedelta(days=7)
+    on_call_shift = make_on_call_shift(
+        organization=organization,
+        shift_type=CustomOnCallShift.TYPE_ROLLING_USERS_EVENT,
+        start=start_date,
+        rotation_start=start_date,
+        duration=datetime.timedelta(seconds=3600 * 24),
+        priority_level=1,
+        frequency=CustomOnCallShift.FREQUENCY_DAILY,
+    )
+    on_call_shift.add_rolling_users([[user1]])
+    on_call_shift.schedules.add(schedule)
+    schedule.refresh_ical_file()
+
+    schedule.current_shifts = json.dumps({}, default=str)
+    schedule.empty_oncall = False
+    schedule.save()
+
+    # call the actual SlackClient.api_call, so the rate scheduler is used
+    with patch.object(SlackClient, "api_call", SLACK_API_CALL), patch(
+        "apps.slack.client.slack_rate_scheduler.acquire", side_effect=[30, 0]
+    ):
+        with patch("apps.slack.client.time.sleep") as mock_sleep:
+            with patch("slack_sdk.web.WebClient.api_call") as mock_api_call:
+                notify_ical_schedule_shift(schedule.pk)
+
+    # the notification is sent once the rate budget allows it
+    mock_sleep.assert_called_once_with(30)
+    assert mock_api_call.call_args.args[0] == "chat.postMessage"
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize("swap_taken", [False, True])
 def test_current_shift_changes_swap_split(
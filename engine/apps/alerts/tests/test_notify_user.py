@@ -4,7 +4,7 @@ import pytest
 from django.utils import timezone
 from telegram.error import RetryAfter
 
-from apps.alerts.models import AlertGroup
+from apps.alerts.models import AlertGroup, UserHasNotification
 from apps.alerts.paging import direct_paging
 from apps.alerts.tasks.notify_user import notify_user_task, perform_notification, send_bundled_notification
 from apps.api.permissions import LegacyAccessControlRole
@@ -705,3 +705,51 @@ def test_notify_user_task_direct_paging_acknowledged(
         notify_user_task(user2.pk, alert_group.pk, notify_even_acknowledged=True)
 
     mock_perform_notification_apply_async.assert_called_once()
+
+
+@pytest.mark.parametrize("important", [False, True])
+@pytest.mark.django_db
+def test_notify_user_task_next_step_from_notification_plan(
+    make_organization,
+    make_user,
+    make_user_notification_policy,
+    make_alert_receive_channel,
+    make_alert_group,
+    important,
+):
+    organization = make_organization()
+    user = make_user(organization=organization)
+    wait_policy = make_user_notification_policy(
+        user=user,
+        step=UserNotificationPolicy.Step.WAIT,
+        wait_delay=UserNotificationPolicy.ONE_MINUTE,
+        important=important,
+    )
+    notify_policy = make_user_notification_policy(
+        user=user,
+        step=UserNotificationPolicy.Step.NOTIFY,
+        notify_by=UserNotificationPolicy.NotificationChannel.TESTONLY,
+        important=important,
+    )
+    alert_receive_channel = make_alert_receive_channel(organization=organization)
+    alert_group = make_alert_group(alert_receive_channel=alert_receive_channel)
+
+    def _notify_user(**kwargs):
+        notify_user_task(user.pk, alert_group.pk, **kwargs)
+        # next steps are run by the scheduled tasks only
+        UserHasNotification.objects.filter(user=user).update(active_notification_policy_id=None)
+
+    _notify_user(important=important)
+    # next steps are scheduled without the importance of the policies
+    with patch.object(UserNotificationPolicy, "next") as mock_next:
+        _notify_user(previous_notification_policy_pk=wait_policy.pk)
+        _notify_user(previous_notification_policy_pk=notify_policy.pk)
+
+    # the next steps are taken from the cached notification plan
+    mock_next.assert_not_called()
+    log_records = UserNotificationPolicyLogRecord.objects.filter(author=user, alert_group=alert_group).order_by("pk")
+    assert [(log_record.type, log_record.notification_policy_id) for log_record in log_records] == [
+        (UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_TRIGGERED, wait_policy.pk),
+        (UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_TRIGGERED, notify_policy.pk),
+        (UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_FINISHED, None),
+    ]
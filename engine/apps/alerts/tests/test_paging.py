@@ -75,8 +75,8 @@ def test_direct_paging_user(make_organization, make_user_for_organization, djang
     assert alert.title == f"{from_user.username} is paging {user.username} and {other_user.username} to join escalation"
     assert alert.message == msg
 
-    # callbacks: distribute_alert + 2 notify_user tasks
-    assert len(callbacks) == 3
+    # callbacks: direct paging route invalidation + distribute_alert + 2 notify_user tasks
+    assert len(callbacks) == 4
     # notifications sent
     for u, important in ((user, False), (other_user, True)):
         notify_task.apply_async.assert_any_call(
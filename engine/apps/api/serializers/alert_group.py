@@ -3,6 +3,7 @@ import logging
 import typing
 
 from django.core.cache import cache
+from django.db import models
 from django.db.models import Prefetch
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema_field
@@ -45,6 +46,22 @@ class EmptyRenderForWeb(typing.TypedDict):
 
 class AlertGroupFieldsCacheSerializerMixin(AlertsFieldCacheBusterMixin):
     CACHE_KEY_FORMAT_TEMPLATE = "{field_name}_alert_group_{object_id}"
+    PREFETCHED_FIELDS_ATTR = "prefetched_web_template_fields"
+
+    @staticmethod
+    def _is_cached_field_valid(cached_field, obj, last_alert) -> bool:
+        web_templates_modified_at = obj.channel.web_templates_modified_at
+        last_alert_created_at = last_alert.created_at
+
+        # use cache only if cache exists
+        # and cache was created after the last alert created
+        # and either web templates never modified
+        # or cache was created after templates were modified
+        return (
+            cached_field is not None
+            and cached_field.get("cache_created_at") > last_alert_created_at
+            and (web_templates_modified_at is None or cached_field.get("cache_created_at") > web_templates_modified_at)
+        )
 
     @classmethod
     def get_or_set_web_template_field(
@@ -55,21 +72,14 @@ class AlertGroupFieldsCacheSerializerMixin(AlertsFieldCacheBusterMixin):
         renderer_class,
         cache_lifetime=60 * 60 * 24,
     ):
+        prefetched_fields = getattr(obj, cls.PREFETCHED_FIELDS_ATTR, {})
+        if field_name in prefetched_fields:
+            return prefetched_fields[field_name]
+
         CACHE_KEY = cls.calculate_cache_key(field_name, obj)
         cached_field = cache.get(CACHE_KEY, None)
 
-        web_templates_modified_at = obj.channel.web_templates_modified_at
-        last_alert_created_at = last_alert.created_at
-
-        # use cache only if cache exists
-        # and cache was created after the last alert created
-        # and either web templates never modified
-        # or cache was created after templates were modified
-        if (
-            cached_field is not None
-            and cached_field.get("cache_created_at") > last_alert_created_at
-            and (web_templates_modified_at is None or cached_field.get("cache_created_at") > web_templates_modified_at)
-        ):
+        if cls._is_cached_field_valid(cached_field, obj, last_alert):
             field = cached_field.get(field_name)
         else:
             field = renderer_class(obj, last_alert).render()
@@ -77,6 +87,59 @@ class AlertGroupFieldsCacheSerializerMixin(AlertsFieldCacheBusterMixin):
 
         return field
 
+    @classmethod
+    def prefetch_web_template_fields(
+        cls,
+        alert_groups: typing.Iterable["AlertGroup"],
+        field_name,
+        renderer_class,
+        cache_lifetime=60 * 60 * 24,
+    ) -> None:
+        """
+        Same as get_or_set_web_template_field, but for a page of enriched alert groups (see EagerLoadingMixin.enrich).
+        Cached fields are fetched with a single get_many and fields rendered on cache miss are stored with a single
+        set_many, instead of a round trip to the cache per alert group. Results are attached to alert groups, so
+        get_or_set_web_template_field returns them without hitting the cache again.
+        """
+        alert_groups = [
+            alert_group for alert_group in alert_groups if getattr(alert_group, "last_alert", None) is not None
+        ]
+        cache_keys = {alert_group.pk: cls.calculate_cache_key(field_name, alert_group) for alert_group in alert_groups}
+        cached_fields = cache.get_many(list(cache_keys.values()))
+
+        fields_to_cache = {}
+        for alert_group in alert_groups:
+            cache_key = cache_keys[alert_group.pk]
+            cached_field = cached_fields.get(cache_key)
+            if cls._is_cached_field_valid(cached_field, alert_group, alert_group.last_alert):
+                field = cached_field.get(field_name)
+            else:
+                field = renderer_class(alert_group, alert_group.last_alert).render()
+                fields_to_cache[cache_key] = {"cache_created_at": timezone.now(), field_name: field}
+
+            prefetched_fields = getattr(alert_group, cls.PREFETCHED_FIELDS_ATTR, {})
+            prefetched_fields[field_name] = field
+            setattr(alert_group, cls.PREFETCHED_FIELDS_ATTR, prefetched_fields)
+
+        if fields_to_cache:
+            cache.set_many(fields_to_cache, cache_lifetime)
+
+
+class AlertGroupFieldsCacheListSerializer(serializers.ListSerializer):
+    """
+    Prefetch render_for_web for all alert groups being serialized at once, see prefetch_web_template_fields.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        alert_groups = list(iterable)
+        AlertGroupFieldsCacheSerializerMixin.prefetch_web_template_fields(
+            alert_groups,
+            AlertGroupFieldsCacheSerializerMixin.RENDER_FOR_WEB_FIELD_NAME,
+            AlertGroupWebRenderer,
+        )
+        return super().to_representation(alert_groups)
+
 
 class AlertGroupLabelSerializer(serializers.Serializer):
     class KeySerializer(serializers.Serializer):
@@ -161,6 +224,7 @@ class AlertGroupListSerializer(
 
     class Meta:
         model = AlertGroup
+        list_serializer_class = AlertGroupFieldsCacheListSerializer
         fields = [
             "pk",
             "alerts_count",
@@ -11,7 +11,6 @@ from apps.base.models import UserNotificationPolicy
 from apps.base.utils import live_settings
 from apps.oss_installation.constants import CloudSyncStatus
 from apps.oss_installation.utils import cloud_user_identity_status
-from apps.schedules.ical_utils import SchedulesOnCallUsers
 from apps.user_management.models import User
 from common.api_helpers.custom_fields import TeamPrimaryKeyRelatedField, TimeZoneField
 from common.api_helpers.mixins import EagerLoadingMixin
@@ -24,7 +23,7 @@ from .team import FastTeamSerializer
 
 
 class UserSerializerContext(typing.TypedDict):
-    schedules_with_oncall_users: SchedulesOnCallUsers
+    oncall_user_ids: typing.Set[int]
 
 
 class UserPermissionSerializer(serializers.Serializer):
@@ -221,7 +220,7 @@ class UserSerializer(ListUserSerializer):
 
     def get_is_currently_oncall(self, obj: User) -> bool:
         # Serializer context is set here: apps.api.views.user.UserView.get_serializer_context.
-        return any(obj in users for users in self.context.get("schedules_with_oncall_users", {}).values())
+        return obj.pk in self.context.get("oncall_user_ids", set())
 
 
 class CurrentUserSerializer(UserSerializer):
@@ -353,7 +352,7 @@ class UserIsCurrentlyOnCallSerializer(UserShortSerializer, EagerLoadingMixin):
 
     def get_is_currently_oncall(self, obj: User) -> bool:
         # Serializer context is set here: apps.api.views.user.UserView.get_serializer_context.
-        return any(obj in users for users in self.context.get("schedules_with_oncall_users", {}).values())
+        return obj.pk in self.context.get("oncall_user_ids", set())
 
 
 class PagedUserSerializer(serializers.Serializer):
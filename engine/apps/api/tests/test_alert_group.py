@@ -8,6 +8,7 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.test import APIClient
 
+from apps.alerts.alert_group_stats import count_alert_groups
 from apps.alerts.constants import ActionSource
 from apps.alerts.models import (
     AlertGroup,
@@ -22,6 +23,7 @@ from apps.api.errors import AlertGroupAPIError
 from apps.api.permissions import LegacyAccessControlRole
 from apps.api.serializers.alert import AlertFieldsCacheSerializerMixin
 from apps.api.serializers.alert_group import AlertGroupFieldsCacheSerializerMixin
+from apps.api.views.alert_group import AlertGroupView
 from apps.base.models import UserNotificationPolicyLogRecord
 from common.api_helpers.filters import DateRangeFilterMixin
 
@@ -1413,6 +1415,70 @@ def test_alert_group_stats_permissions(
     assert response.status_code == expected_status
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "query,expected_count",
+    [
+        ("", 5),
+        ("?status=0", 1),
+        ("?status=0&status=1&mine=false", 2),
+        ("?status=2&integration={integration}", 1),
+        ("?status=2&team=null", 2),
+        ("?status=3&started_at={started_at}", 1),
+    ],
+)
+def test_alert_group_stats_counters(
+    alert_group_internal_api_setup,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_user_auth_headers,
+    query,
+    expected_count,
+):
+    user, token, alert_groups = alert_group_internal_api_setup
+    make_alert_group(make_alert_receive_channel(user.organization), resolved=True)
+
+    started_at = "{}_{}".format(
+        (timezone.now() - timezone.timedelta(days=1)).strftime(DateRangeFilterMixin.DATE_FORMAT),
+        timezone.now().strftime(DateRangeFilterMixin.DATE_FORMAT),
+    )
+    query = query.format(integration=alert_groups[0].channel.public_primary_key, started_at=started_at)
+
+    client = APIClient()
+    url = reverse("api-internal:alertgroup-stats")
+    with patch(
+        "apps.api.views.alert_group.count_alert_groups", wraps=count_alert_groups
+    ) as mock_count_alert_groups, patch.object(AlertGroupView, "filter_queryset") as mock_filter_queryset:
+        response = client.get(url + query, format="json", **make_user_auth_headers(user, token))
+
+    # filters used by the UI are counted with counters, without filtering alert groups
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"count": str(expected_count)}
+    mock_count_alert_groups.assert_called_once()
+    mock_filter_queryset.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_alert_group_stats_cached(alert_group_internal_api_setup, make_alert_group, make_user_auth_headers):
+    user, token, alert_groups = alert_group_internal_api_setup
+    alert_receive_channel = alert_groups[0].channel
+
+    client = APIClient()
+    url = reverse("api-internal:alertgroup-stats") + "?status=0&is_root=true"
+
+    # filters which are not kept in counters are counted by DB, responses are cached for a while
+    response = client.get(url, format="json", **make_user_auth_headers(user, token))
+    assert response.json() == {"count": "1"}
+
+    make_alert_group(alert_receive_channel)
+    response = client.get(url, format="json", **make_user_auth_headers(user, token))
+    assert response.json() == {"count": "1"}
+
+    cache.clear()
+    response = client.get(url, format="json", **make_user_auth_headers(user, token))
+    assert response.json() == {"count": "2"}
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "role,expected_status",
@@ -2294,6 +2360,35 @@ def test_wipe_clears_cache(
     assert not any([cache.get(key) for key in alert_cache_keys])
 
 
+@pytest.mark.django_db
+def test_list_render_for_web_cache_is_batched(alert_group_internal_api_setup, make_user_auth_headers):
+    user, token, alert_groups = alert_group_internal_api_setup
+    client = APIClient()
+    url = reverse("api-internal:alertgroup-list")
+
+    with patch(
+        "apps.api.serializers.alert_group.AlertGroupWebRenderer.render", return_value={"title": "title"}
+    ) as mock_render:
+        with patch("apps.api.serializers.alert_group.cache.get_many", wraps=cache.get_many) as mock_get_many:
+            with patch("apps.api.serializers.alert_group.cache.set_many", wraps=cache.set_many) as mock_set_many:
+                response = client.get(url, format="json", **make_user_auth_headers(user, token))
+                assert response.status_code == status.HTTP_200_OK
+                assert len(response.json()["results"]) == len(alert_groups)
+                assert all(result["render_for_web"] == {"title": "title"} for result in response.json()["results"])
+
+                # all fields are looked up and cached at once, instead of a cache round trip per alert group
+                mock_get_many.assert_called_once()
+                assert mock_render.call_count == len(alert_groups)
+                mock_set_many.assert_called_once()
+                assert len(mock_set_many.call_args.args[0]) == len(alert_groups)
+
+                # fields are taken from the cache on the next request
+                response = client.get(url, format="json", **make_user_auth_headers(user, token))
+                assert response.status_code == status.HTTP_200_OK
+                assert mock_render.call_count == len(alert_groups)
+                assert mock_set_many.call_count == 1
+
+
 @patch("apps.api.views.alert_group.delete_alert_group.apply_async")
 @pytest.mark.django_db
 def test_delete(mock_delete_alert_group, make_user_auth_headers, alert_group_internal_api_setup):
@@ -2458,6 +2553,43 @@ def test_alert_group_affected_services(
     assert response.json() == expected
 
 
+@pytest.mark.django_db
+def test_alert_group_affected_services_batched(
+    alert_group_internal_api_setup,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_user_for_organization,
+    make_user_auth_headers,
+    make_alert_group_label_association,
+    django_assert_max_num_queries,
+    settings,
+):
+    settings.FEATURE_SERVICE_DEPENDENCIES_ENABLED = True
+    _, token, alert_groups = alert_group_internal_api_setup
+    _, _, new_ag, _ = alert_groups
+    organization = new_ag.channel.organization
+    user = make_user_for_organization(organization)
+
+    make_alert_group_label_association(organization, new_ag, key_name="service_name", value_name="service-0")
+    # alert groups started before the checked window are ignored
+    old_ag = make_alert_group(new_ag.channel)
+    AlertGroup.objects.filter(pk=old_ag.pk).update(started_at=timezone.now() - timezone.timedelta(days=8))
+    make_alert_group_label_association(organization, old_ag, key_name="service_name", value_name="service-1")
+    # resolved alert groups of other integrations are ignored
+    resolved_ag = make_alert_group(make_alert_receive_channel(organization), resolved=True)
+    make_alert_group_label_association(organization, resolved_ag, key_name="service_name", value_name="service-2")
+
+    client = APIClient()
+    url = reverse("api-internal:alertgroup-filter-affected-services")
+    url += "?" + "&".join(f"service=service-{i}" for i in range(30))
+
+    # the number of queries doesn't depend on the number of services
+    with django_assert_max_num_queries(10):
+        response = client.get(url, format="json", **make_user_auth_headers(user, token))
+    assert response.status_code == status.HTTP_200_OK
+    assert [service["name"] for service in response.json()] == ["service-0"]
+
+
 @pytest.mark.django_db
 def test_alert_group_service_dependencies_feature_not_enabled(
     alert_group_internal_api_setup,
@@ -1,6 +1,8 @@
+import hashlib
 from datetime import timedelta
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import Q
 from django.utils import timezone
@@ -13,7 +15,9 @@ from rest_framework.filters import SearchFilter
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from apps.alerts.constants import ActionSource
+from apps.alerts.alert_group_search import get_alert_group_search_backend
+from apps.alerts.alert_group_stats import count_alert_groups
+from apps.alerts.constants import ActionSource, AlertGroupState
 from apps.alerts.models import AlertGroup, AlertReceiveChannel, ResolutionNote
 from apps.alerts.paging import unpage_user
 from apps.alerts.tasks import delete_alert_group, send_update_resolution_note_signal
@@ -27,6 +31,7 @@ from apps.api.serializers.team import TeamSerializer
 from apps.auth_token.auth import PluginAuthentication
 from apps.base.models.user_notification_policy_log_record import UserNotificationPolicyLogRecord
 from apps.grafana_plugin.ui_url_builder import UIURLBuilder
+from apps.labels.alert_group_labels import get_affected_services
 from apps.labels.utils import is_labels_feature_enabled
 from apps.mobile_app.auth import MobileAppAuthTokenAuthentication
 from apps.user_management.models import Team, User
@@ -233,7 +238,17 @@ class AlertGroupSearchFilter(SearchFilter):
                 started_at__gte=end - timedelta(days=settings.FEATURE_ALERT_GROUP_SEARCH_CUTOFF_DAYS)
             )
 
-        return super().filter_queryset(request, queryset, view)
+        # same as SearchFilter: every term must match the ID, the number or the title, the title is looked up with
+        # the search backend (see apps.alerts.alert_group_search)
+        search_backend = get_alert_group_search_backend()
+        return queryset.filter(
+            *(
+                Q(public_primary_key__iexact=term)
+                | Q(inside_organization_number__iexact=term)
+                | search_backend.title_condition(term)
+                for term in search_terms
+            )
+        )
 
     def get_search_fields(self, view, request):
         return (
@@ -295,6 +310,15 @@ class AlertGroupView(
     filter_backends = [AlertGroupSearchFilter, filters.DjangoFilterBackend]
     filterset_class = AlertGroupFilter
 
+    # filters stats can be counted for with apps.alerts.alert_group_stats counters
+    STATS_COUNTERS_FILTERS = {"status", "integration", "team", "started_at", "mine"}
+    STATS_COUNTERS_STATES = {
+        AlertGroup.NEW: AlertGroupState.FIRING.value,
+        AlertGroup.ACKNOWLEDGED: AlertGroupState.ACKNOWLEDGED.value,
+        AlertGroup.RESOLVED: AlertGroupState.RESOLVED.value,
+        AlertGroup.SILENCED: AlertGroupState.SILENCED.value,
+    }
+
     def get_serializer_class(self):
         if self.action == "list":
             return AlertGroupListSerializer
@@ -313,22 +337,9 @@ class AlertGroupView(
         if action is None:
             # assume stats by default
             action = "stats"
-        alert_receive_channels_qs = AlertReceiveChannel.objects_with_deleted.filter(
-            organization_id=self.request.auth.organization.id
+        alert_receive_channels_ids = self._get_alert_receive_channels_ids(
+            ignore_filtering_by_available_teams=ignore_filtering_by_available_teams, team_values=team_values
         )
-        if not ignore_filtering_by_available_teams:
-            alert_receive_channels_qs = alert_receive_channels_qs.filter(*self.available_teams_lookup_args)
-
-        # Filter by team(s). Since we really filter teams from integrations, this is not an AlertGroup model filter.
-        # This is based on the common.api_helpers.ByTeamModelFieldFilterMixin implementation
-        if team_values:
-            null_team_lookup = Q(team__isnull=True) if NO_TEAM_VALUE in team_values else None
-            teams_lookup = Q(team__public_primary_key__in=[ppk for ppk in team_values if ppk != NO_TEAM_VALUE])
-            if null_team_lookup:
-                teams_lookup = teams_lookup | null_team_lookup
-            alert_receive_channels_qs = alert_receive_channels_qs.filter(teams_lookup)
-
-        alert_receive_channels_ids = list(alert_receive_channels_qs.values_list("id", flat=True))
         queryset = AlertGroup.objects.filter(channel__in=alert_receive_channels_ids)
 
         if action in ("list", "stats") and not started_at:
@@ -355,6 +366,24 @@ class AlertGroupView(
 
         return queryset
 
+    def _get_alert_receive_channels_ids(self, ignore_filtering_by_available_teams=False, team_values=None):
+        alert_receive_channels_qs = AlertReceiveChannel.objects_with_deleted.filter(
+            organization_id=self.request.auth.organization.id
+        )
+        if not ignore_filtering_by_available_teams:
+            alert_receive_channels_qs = alert_receive_channels_qs.filter(*self.available_teams_lookup_args)
+
+        # Filter by team(s). Since we really filter teams from integrations, this is not an AlertGroup model filter.
+        # This is based on the common.api_helpers.ByTeamModelFieldFilterMixin implementation
+        if team_values:
+            null_team_lookup = Q(team__isnull=True) if NO_TEAM_VALUE in team_values else None
+            teams_lookup = Q(team__public_primary_key__in=[ppk for ppk in team_values if ppk != NO_TEAM_VALUE])
+            if null_team_lookup:
+                teams_lookup = teams_lookup | null_team_lookup
+            alert_receive_channels_qs = alert_receive_channels_qs.filter(teams_lookup)
+
+        return list(alert_receive_channels_qs.values_list("id", flat=True))
+
     def get_queryset(self, ignore_filtering_by_available_teams=False):
         # no select_related or prefetch_related is used at this point, it will be done on paginate_queryset.
         return self._get_queryset(
@@ -445,11 +474,66 @@ class AlertGroupView(
         Return number of alert groups capped at 100001
         """
         MAX_COUNT = 100001
-        alert_groups = self.filter_queryset(self.get_queryset())[:MAX_COUNT]
-        count = alert_groups.count()
-        count = f"{MAX_COUNT-1}+" if count == MAX_COUNT else str(count)
+        cache_key = self._get_stats_cache_key()
+        count = cache.get(cache_key)
+        if count is None:
+            count = self._count_from_stats_counters()
+            if count is None:
+                alert_groups = self.filter_queryset(self.get_queryset())[:MAX_COUNT]
+                count = alert_groups.count()
+            cache.set(cache_key, count, timeout=settings.ALERT_GROUP_STATS_CACHE_TIMEOUT)
+        count = f"{MAX_COUNT-1}+" if count >= MAX_COUNT else str(count)
         return Response({"count": count})
 
+    def _get_stats_cache_key(self):
+        # the response depends on the user through team permissions and the "mine" filter. Range timestamps are
+        # rounded to minutes, as the UI sends ranges ending "now".
+        params = []
+        for name, values in sorted(self.request.query_params.lists()):
+            if name == "started_at":
+                values = ["_".join(timestamp[:16] for timestamp in value.split("_")) for value in values]
+            params.append((name, sorted(values)))
+        params_hash = hashlib.sha1(repr(params).encode()).hexdigest()
+        return f"alert_group_stats_{self.request.auth.organization.id}_{self.request.user.pk}_{params_hash}"
+
+    def _count_from_stats_counters(self):
+        """
+        Count alert groups with apps.alerts.alert_group_stats counters for the filters used by the UI stats polls
+        (status, integration, team and started_at). Return None for other filters, to count them by DB.
+        """
+        query_params = self.request.query_params
+        if not set(query_params) <= self.STATS_COUNTERS_FILTERS:
+            return None
+        if any(value not in ("false", "False") for value in query_params.getlist("mine")):
+            return None
+
+        try:
+            statuses = {int(value) for value in query_params.getlist("status")}
+        except ValueError:
+            return None
+        if not statuses <= self.STATS_COUNTERS_STATES.keys():
+            return None
+        states = [self.STATS_COUNTERS_STATES[status] for status in statuses or self.STATS_COUNTERS_STATES]
+
+        channel_ids = self._get_alert_receive_channels_ids(team_values=query_params.getlist("team"))
+        integrations = set(query_params.getlist("integration"))
+        if integrations:
+            channel_ids = list(
+                AlertReceiveChannel.objects_with_deleted.filter(
+                    id__in=channel_ids, public_primary_key__in=integrations
+                ).values_list("id", flat=True)
+            )
+            if len(channel_ids) != len(integrations):
+                # let the filter report integrations which are not available
+                return None
+
+        started_at = query_params.get("started_at")
+        if started_at:
+            start, end = DateRangeFilterMixin.parse_custom_datetime_range(started_at)
+        else:
+            start, end = timezone.now() - timezone.timedelta(days=30), None
+        return count_alert_groups(self.request.auth.organization.id, channel_ids, states, start, end)
+
     @extend_schema(responses=AlertGroupSerializer)
     @action(methods=["post"], detail=True)
     def acknowledge(self, request, pk):
@@ -923,18 +1007,14 @@ class AlertGroupView(
         url_builder = UIURLBuilder(organization)
         affected_services = []
         days_to_check = 7
+        if not services:
+            return Response(affected_services)
+
+        # all requested services are checked against the integrations available to the user at once
+        alert_receive_channels_ids = set(self._get_alert_receive_channels_ids())
+        services_integrations = get_affected_services(organization.id, days_to_check)
         for service_name in services:
-            is_affected = (
-                self._get_queryset(
-                    started_at=timezone.now() - timezone.timedelta(days=days_to_check),
-                    label_query=[f"service_name:{service_name}"],
-                )
-                .filter(
-                    resolved=False,
-                    silenced=False,
-                )
-                .exists()
-            )
+            is_affected = not alert_receive_channels_ids.isdisjoint(services_integrations.get(service_name, ()))
             if is_affected:
                 affected_services.append(
                     {
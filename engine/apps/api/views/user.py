@@ -63,9 +63,9 @@ from apps.phone_notifications.exceptions import (
     ProviderNotSupports,
 )
 from apps.phone_notifications.phone_backend import PhoneBackend
-from apps.schedules.ical_utils import get_cached_oncall_users_for_multiple_schedules
 from apps.schedules.models import OnCallSchedule
 from apps.schedules.models.on_call_schedule import ScheduleEvent
+from apps.schedules.oncall_now_index import OrganizationOnCallNow, get_organization_oncall_now
 from apps.telegram.client import TelegramClient
 from apps.telegram.models import TelegramVerificationCode
 from apps.user_management.models import Team, User
@@ -105,12 +105,12 @@ UpcomingShifts = list[UpcomingShift]
 
 class CachedSchedulesContextMixin:
     @cached_property
-    def schedules_with_oncall_users(self):
+    def oncall_now(self) -> OrganizationOnCallNow:
         """
         The result of this method is cached and is reused for the whole lifetime of a request,
         since self.get_serializer_context() is called multiple times for every instance in the queryset.
         """
-        return get_cached_oncall_users_for_multiple_schedules(self.request.user.organization.oncall_schedules.all())
+        return get_organization_oncall_now(self.request.user.organization)
 
     def _populate_schedules_oncall_cache(self):
         return False
@@ -118,11 +118,7 @@ class CachedSchedulesContextMixin:
     def get_serializer_context(self):
         context = getattr(super(), "get_serializer_context", lambda: {})()
         context.update(
-            {
-                "schedules_with_oncall_users": self.schedules_with_oncall_users
-                if self._populate_schedules_oncall_cache()
-                else {}
-            }
+            {"oncall_user_ids": self.oncall_now.user_ids if self._populate_schedules_oncall_cache() else set()}
         )
         return context
 
@@ -358,7 +354,7 @@ class UserView(
         queryset = self.filter_queryset(self.get_queryset())
 
         def _get_oncall_user_ids():
-            return {user.pk for _, users in self.schedules_with_oncall_users.items() for user in users}
+            return self.oncall_now.user_ids
 
         paginate_results = True
 
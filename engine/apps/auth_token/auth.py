@@ -37,6 +37,7 @@ from .models import (
     SlackAuthToken,
     UserScheduleExportAuthToken,
 )
+from .verified_token_cache import verified_token_cache
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -70,7 +71,7 @@ class ApiTokenAuthentication(BaseAuthentication):
         each auth_token individually to find the correct one.
         """
         try:
-            auth_token = self.model.validate_token_string(token)
+            auth_token = verified_token_cache.validate_token_string(self.model, token)
         except InvalidToken:
             raise exceptions.AuthenticationFailed("Invalid token.")
 
@@ -304,7 +305,7 @@ class ScheduleExportAuthentication(BaseAuthentication):
         self, token_string: str, public_primary_key: str
     ) -> typing.Tuple[User, ScheduleExportAuthToken]:
         try:
-            auth_token = self.model.validate_token_string(token_string)
+            auth_token = verified_token_cache.validate_token_string(self.model, token_string)
         except InvalidToken:
             raise exceptions.AuthenticationFailed("Invalid token.")
 
@@ -339,7 +340,7 @@ class UserScheduleExportAuthentication(BaseAuthentication):
         self, token_string: str, public_primary_key: str
     ) -> typing.Tuple[User, UserScheduleExportAuthToken]:
         try:
-            auth_token = self.model.validate_token_string(token_string)
+            auth_token = verified_token_cache.validate_token_string(self.model, token_string)
         except InvalidToken:
             raise exceptions.AuthenticationFailed("Invalid token")
 
@@ -429,7 +430,7 @@ class IntegrationBacksyncAuthentication(BaseAuthentication):
 
     def authenticate_credentials(self, token_string: str) -> typing.Tuple[ServerUser, IntegrationBacksyncAuthToken]:
         try:
-            auth_token = self.model.validate_token_string(token_string)
+            auth_token = verified_token_cache.validate_token_string(self.model, token_string)
         except InvalidToken:
             raise exceptions.AuthenticationFailed("Invalid token")
 
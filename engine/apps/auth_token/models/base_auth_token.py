@@ -1,6 +1,6 @@
 import binascii
 from hmac import compare_digest
-from typing import Optional
+from typing import Optional, Type
 
 from django.db import models
 from django.utils import timezone
@@ -8,6 +8,11 @@ from django.utils import timezone
 from apps.auth_token import constants
 from apps.auth_token.crypto import hash_token_string
 from apps.auth_token.exceptions import InvalidToken
+from apps.auth_token.verified_token_cache import invalidate_verified_tokens
+
+
+def _has_organization_field(model: Type[models.Model]) -> bool:
+    return any(field.name == "organization" for field in model._meta.fields)
 
 
 class AuthTokenQueryset(models.QuerySet):
@@ -15,7 +20,11 @@ class AuthTokenQueryset(models.QuerySet):
         return super().filter(*args, **kwargs, revoked_at=None)
 
     def delete(self):
+        organization_ids = (
+            list(self.values_list("organization_id", flat=True)) if _has_organization_field(self.model) else []
+        )
         self.update(revoked_at=timezone.now())
+        invalidate_verified_tokens(organization_ids)
 
 
 class BaseAuthToken(models.Model):
@@ -31,6 +40,19 @@ class BaseAuthToken(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     revoked_at = models.DateTimeField(null=True)
 
+    def save(self, *args, **kwargs):
+        created = self._state.adding
+        super().save(*args, **kwargs)
+        if not created:
+            # drop verified copies of the token (e.g. it was revoked by setting revoked_at)
+            invalidate_verified_tokens([getattr(self, "organization_id", None)])
+
+    def delete(self, *args, **kwargs):
+        organization_id = getattr(self, "organization_id", None)
+        result = super().delete(*args, **kwargs)
+        invalidate_verified_tokens([organization_id])
+        return result
+
     @classmethod
     def validate_token_string(cls, token: str, *args, **kwargs) -> Optional["BaseAuthToken"]:
         for auth_token in cls.objects.filter(token_key=token[: constants.TOKEN_KEY_LENGTH]):
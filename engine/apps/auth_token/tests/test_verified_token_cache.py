@@ -0,0 +1,154 @@
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+
+from apps.auth_token.auth import ApiTokenAuthentication, PluginAuthentication
+from apps.auth_token.exceptions import InvalidToken
+from apps.auth_token.models import ApiAuthToken
+from apps.auth_token.verified_token_cache import (
+    get_organization_version,
+    invalidate_verified_tokens,
+    verified_token_cache,
+)
+from apps.user_management.exceptions import OrganizationDeletedException
+from apps.user_management.models import User
+
+
+@pytest.fixture
+def check_version_on_every_lookup():
+    # versions are checked once per AUTH_TOKEN_CACHE_VERSION_CHECK_INTERVAL by default
+    with patch.object(verified_token_cache, "_version_check_interval", 0):
+        yield
+
+
+@pytest.mark.django_db
+def test_verified_token_cache_hit(make_organization_and_user, make_public_api_token, django_assert_num_queries):
+    organization, user = make_organization_and_user()
+    token, token_string = make_public_api_token(user, organization)
+
+    user_1, token_1 = ApiTokenAuthentication().authenticate_credentials(token_string)
+    with django_assert_num_queries(0):
+        user_2, token_2 = ApiTokenAuthentication().authenticate_credentials(token_string)
+        assert token_2.organization == organization
+
+    assert (user_1, token_1) == (user_2, token_2) == (user, token)
+    # cached instances are never shared between requests
+    assert token_2 is not token_1
+    assert token_2.user is not token_1.user
+
+
+@pytest.mark.django_db
+def test_verified_token_cache_invalid_token(make_organization_and_user, make_public_api_token):
+    organization, user = make_organization_and_user()
+    make_public_api_token(user, organization)
+
+    for token_string in ("not-hex", "00" * 32, None):
+        with pytest.raises(InvalidToken):
+            verified_token_cache.validate_token_string(ApiAuthToken, token_string)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("revoke", ["instance", "queryset"])
+def test_verified_token_cache_invalidated_on_revoke(
+    make_organization_and_user, make_public_api_token, check_version_on_every_lookup, revoke
+):
+    organization, user = make_organization_and_user()
+    token, token_string = make_public_api_token(user, organization)
+    ApiTokenAuthentication().authenticate_credentials(token_string)
+
+    if revoke == "instance":
+        token.delete()
+    else:
+        ApiAuthToken.objects.filter(pk=token.pk).delete()
+
+    with pytest.raises(AuthenticationFailed):
+        ApiTokenAuthentication().authenticate_credentials(token_string)
+
+
+@pytest.mark.django_db
+def test_verified_token_cache_invalidated_on_user_and_organization_changes(
+    make_organization_and_user, make_public_api_token, check_version_on_every_lookup
+):
+    organization, user = make_organization_and_user()
+    _, token_string = make_public_api_token(user, organization)
+    request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=token_string)
+    ApiTokenAuthentication().authenticate(request)
+
+    user.username = "updated"
+    user.save(update_fields=["username"])
+    authenticated_user, _ = ApiTokenAuthentication().authenticate(request)
+    assert authenticated_user.username == "updated"
+
+    User.objects.filter(pk=user.pk).delete()
+    with pytest.raises(AuthenticationFailed, match="Only active users"):
+        ApiTokenAuthentication().authenticate(request)
+
+    organization.delete()
+    with pytest.raises(OrganizationDeletedException):
+        ApiTokenAuthentication().authenticate_credentials(token_string)
+
+
+@pytest.mark.django_db
+def test_verified_token_cache_kept_on_organization_saves_without_changes(
+    make_organization_and_user, make_public_api_token, check_version_on_every_lookup, django_assert_num_queries
+):
+    organization, user = make_organization_and_user()
+    _, token_string = make_public_api_token(user, organization)
+    ApiTokenAuthentication().authenticate_credentials(token_string)
+
+    # saves not changing anything but sync timestamps don't drop cached tokens
+    organization.save()
+    organization.last_time_synced = timezone.now()
+    organization.save(update_fields=["org_title", "last_time_synced"])
+    with django_assert_num_queries(0):
+        ApiTokenAuthentication().authenticate_credentials(token_string)
+
+    organization.org_title = "updated"
+    organization.save(update_fields=["org_title", "last_time_synced"])
+    _, token = ApiTokenAuthentication().authenticate_credentials(token_string)
+    assert token.organization.org_title == "updated"
+
+
+@pytest.mark.django_db
+def test_verified_token_cache_invalidated_on_commit(
+    make_organization_and_user, make_public_api_token, django_capture_on_commit_callbacks
+):
+    organization, user = make_organization_and_user()
+    _, token_string = make_public_api_token(user, organization)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate_verified_tokens([organization.pk])
+        # tokens verified before the transaction is committed may be verified against uncommitted data
+        ApiTokenAuthentication().authenticate_credentials(token_string)
+        version = get_organization_version(organization.pk)
+
+    assert get_organization_version(organization.pk) != version
+
+
+@pytest.mark.django_db
+def test_verified_token_cache_plugin_token_context(
+    make_organization, make_user, make_token_for_organization, django_assert_num_queries
+):
+    organization = make_organization(stack_id=42, org_id=24)
+    user = make_user(organization=organization, user_id=12)
+    token, token_string = make_token_for_organization(organization)
+
+    def get_request(instance_context):
+        return APIRequestFactory().get(
+            "/",
+            HTTP_AUTHORIZATION=token_string,
+            **{"HTTP_X-Instance-Context": instance_context, "HTTP_X-Grafana-Context": '{"UserId": 12}'},
+        )
+
+    context = '{"stack_id": 42, "org_id": 24, "grafana_token": "abc"}'
+    assert PluginAuthentication().authenticate(get_request(context)) == (user, token)
+    # only the user is fetched once the token is verified
+    with django_assert_num_queries(1):
+        assert PluginAuthentication().authenticate(get_request(context)) == (user, token)
+
+    # token verified for an instance is not valid for the others
+    with pytest.raises(AuthenticationFailed):
+        PluginAuthentication().authenticate(get_request('{"stack_id": 42, "org_id": 25, "grafana_token": "abc"}'))
@@ -0,0 +1,272 @@
+import binascii
+import copy
+import threading
+import time
+import typing
+import uuid
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db import transaction
+
+from apps.auth_token.crypto import hash_token_string
+from apps.auth_token.exceptions import InvalidToken
+
+if typing.TYPE_CHECKING:
+    from apps.auth_token.models import BaseAuthToken
+
+    AuthToken = typing.TypeVar("AuthToken", bound=BaseAuthToken)
+
+# upper bounds of the token validation latency histogram, in seconds
+AUTH_TOKEN_VALIDATION_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+AUTH_TOKEN_CACHE_RESULTS = ("hit", "miss")
+AUTH_TOKEN_CACHE_STATS_KEY_PREFIX = "auth_token_cache_stats_"
+
+# related objects resolved along with the token and kept in the cache
+CACHED_RELATED_FIELDS = ("user", "organization")
+
+VerifiedTokenCacheKey = typing.Tuple[str, str, typing.Tuple[typing.Any, ...]]
+
+
+def _get_organization_version_cache_key(organization_id: int) -> str:
+    return f"auth_token_organization_version_{organization_id}"
+
+
+def get_organization_version(organization_id: int) -> str:
+    cache_key = _get_organization_version_cache_key(organization_id)
+    version = cache.get(cache_key)
+    if version is None:
+        # A missing version is replaced with a new random one, so it never goes back to a previously seen value
+        cache.add(cache_key, str(uuid.uuid4()), timeout=None)
+        version = cache.get(cache_key)
+    return version
+
+
+def invalidate_verified_tokens(organization_ids: typing.Iterable[typing.Optional[int]]) -> None:
+    """
+    Drop tokens of the given organizations verified by any process. Must be called when tokens are revoked, or their
+    users or organizations change. Tokens are dropped right away in the current process, other processes notice the
+    change within AUTH_TOKEN_CACHE_VERSION_CHECK_INTERVAL.
+    """
+    organization_ids = {organization_id for organization_id in organization_ids if organization_id is not None}
+    if not organization_ids:
+        return
+
+    def _invalidate():
+        cache.set_many(
+            {
+                _get_organization_version_cache_key(organization_id): str(uuid.uuid4())
+                for organization_id in organization_ids
+            },
+            timeout=None,
+        )
+        verified_token_cache.drop_organizations(organization_ids)
+
+    # Invalidate right away and once again when the transaction is committed, so tokens verified against uncommitted
+    # data by any process in the meantime are not used.
+    _invalidate()
+    transaction.on_commit(_invalidate)
+
+
+def get_stats_cache_key(name: str) -> str:
+    return f"{AUTH_TOKEN_CACHE_STATS_KEY_PREFIX}{name}"
+
+
+def get_latency_bucket_stat_name(result: str, bucket: float) -> str:
+    return f"latency_{result}_le_{bucket}"
+
+
+def get_latency_sum_stat_name(result: str) -> str:
+    # sums are stored in microseconds, so they can be incremented atomically as integers
+    return f"latency_{result}_sum_us"
+
+
+@dataclass
+class _VerifiedTokenEntry:
+    auth_token: "BaseAuthToken"
+    version: str
+    cached_at: float
+    checked_at: float
+
+
+@dataclass
+class VerifiedTokenCacheStats:
+    """
+    Lookup counters and non-cumulative latency bucket counts collected since the last flush.
+    """
+
+    counts: typing.Dict[str, int] = field(default_factory=dict)
+
+    def add(self, name: str, value: int = 1) -> None:
+        self.counts[name] = self.counts.get(name, 0) + value
+
+
+class _VerifiedTokenCache:
+    """
+    Per-process LRU cache of auth tokens verified by their token string, along with their user and organization.
+
+    Entries are keyed by the SHA-512 digest of the token string (the raw token is never kept in memory), so a hit
+    skips the token_key lookup and the user and organization queries. Entries are validated against a version of
+    the token organization stored in the shared cache, which is reset when tokens are revoked or users and
+    organizations change (see invalidate_verified_tokens). The version is checked at most once per
+    version_check_interval, entries expire after ttl seconds in any case.
+
+    Cached tokens are copied on every hit, so requests never share model instances.
+    Hit/miss counters and validation latency are accumulated per process and flushed to the shared cache at most
+    once per stats_flush_interval, so they can be exported by any process (see AuthTokenCacheMetricsCollector).
+    """
+
+    def __init__(self, max_size: int, ttl: int, version_check_interval: float, stats_flush_interval: float) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._version_check_interval = version_check_interval
+        self._stats_flush_interval = stats_flush_interval
+        self._entries: OrderedDict[VerifiedTokenCacheKey, _VerifiedTokenEntry] = OrderedDict()
+        self._keys_by_organization: typing.Dict[int, typing.Set[VerifiedTokenCacheKey]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self._stats = VerifiedTokenCacheStats()
+        self._stats_flushed_at = time.monotonic()
+
+    def validate_token_string(self, model: typing.Type["AuthToken"], token: str, **kwargs) -> "AuthToken":
+        """
+        Same as model.validate_token_string, but served from the cache if the token was recently verified.
+        Context passed to model.validate_token_string (e.g. plugin instance context) is made part of the cache key.
+        """
+        started_at = time.perf_counter()
+        try:
+            digest = hash_token_string(token)
+        except (TypeError, binascii.Error):
+            raise InvalidToken
+
+        key = (model._meta.label, digest, self._get_context_key(kwargs))
+        auth_token = self._get(key)
+        if auth_token is not None:
+            self._record("hit", started_at)
+            return auth_token
+
+        auth_token = model.validate_token_string(token, **kwargs)
+        for field_name in CACHED_RELATED_FIELDS:
+            if self._has_field(model, field_name):
+                # load related objects, so they are cached along with the token
+                getattr(auth_token, field_name)
+        self._set(key, auth_token)
+        self._record("miss", started_at)
+        return auth_token
+
+    @staticmethod
+    def _get_context_key(kwargs: typing.Dict[str, typing.Any]) -> typing.Tuple[typing.Any, ...]:
+        return tuple(
+            (name, tuple(sorted(value.items())) if isinstance(value, dict) else value)
+            for name, value in sorted(kwargs.items())
+        )
+
+    @staticmethod
+    def _has_field(model: typing.Type["BaseAuthToken"], field_name: str) -> bool:
+        try:
+            model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return False
+        return True
+
+    def _get(self, key: VerifiedTokenCacheKey) -> typing.Optional["BaseAuthToken"]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+
+        now = time.monotonic()
+        if now - entry.cached_at >= self._ttl:
+            self._pop(key)
+            return None
+
+        if now - entry.checked_at >= self._version_check_interval:
+            if get_organization_version(entry.auth_token.organization_id) != entry.version:
+                self._pop(key)
+                return None
+            entry.checked_at = now
+
+        return copy.deepcopy(entry.auth_token)
+
+    def _set(self, key: VerifiedTokenCacheKey, auth_token: "BaseAuthToken") -> None:
+        if self._max_size <= 0:
+            return
+
+        version = get_organization_version(auth_token.organization_id)
+        now = time.monotonic()
+        entry = _VerifiedTokenEntry(copy.deepcopy(auth_token), version, now, now)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._keys_by_organization[auth_token.organization_id].add(key)
+            while len(self._entries) > self._max_size:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: VerifiedTokenCacheKey) -> None:
+        # must be called with the lock held
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        organization_id = entry.auth_token.organization_id
+        organization_keys = self._keys_by_organization[organization_id]
+        organization_keys.discard(key)
+        if not organization_keys:
+            del self._keys_by_organization[organization_id]
+
+    def _pop(self, key: VerifiedTokenCacheKey) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def drop_organizations(self, organization_ids: typing.Iterable[int]) -> None:
+        with self._lock:
+            for organization_id in organization_ids:
+                for key in self._keys_by_organization.pop(organization_id, ()):
+                    self._entries.pop(key, None)
+
+    def _record(self, result: str, started_at: float) -> None:
+        latency = time.perf_counter() - started_at
+        bucket = next((b for b in AUTH_TOKEN_VALIDATION_LATENCY_BUCKETS if latency <= b), "+Inf")
+        with self._lock:
+            self._stats.add(result)
+            self._stats.add(get_latency_bucket_stat_name(result, bucket))
+            self._stats.add(get_latency_sum_stat_name(result), int(latency * 1_000_000))
+            if time.monotonic() - self._stats_flushed_at < self._stats_flush_interval:
+                return
+            stats, self._stats = self._stats, VerifiedTokenCacheStats()
+            self._stats_flushed_at = time.monotonic()
+        self._flush_stats(stats)
+
+    @staticmethod
+    def _flush_stats(stats: VerifiedTokenCacheStats) -> None:
+        for name, value in stats.counts.items():
+            cache_key = get_stats_cache_key(name)
+            cache.add(cache_key, 0, timeout=None)
+            try:
+                cache.incr(cache_key, value)
+            except ValueError:
+                # the key was evicted in between, the sample is lost
+                pass
+
+    def flush_stats(self) -> None:
+        with self._lock:
+            stats, self._stats = self._stats, VerifiedTokenCacheStats()
+            self._stats_flushed_at = time.monotonic()
+        self._flush_stats(stats)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_organization.clear()
+            self._stats = VerifiedTokenCacheStats()
+            self._stats_flushed_at = time.monotonic()
+
+
+verified_token_cache = _VerifiedTokenCache(
+    max_size=settings.AUTH_TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.AUTH_TOKEN_CACHE_TTL,
+    version_check_interval=settings.AUTH_TOKEN_CACHE_VERSION_CHECK_INTERVAL,
+    stats_flush_interval=settings.AUTH_TOKEN_CACHE_STATS_FLUSH_INTERVAL,
+)
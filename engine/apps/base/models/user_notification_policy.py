@@ -7,8 +7,11 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import MinLengthValidator
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from apps.base.messaging import get_messaging_backends
+from apps.base.notification_plan import invalidate_notification_plans
 from apps.user_management.models import User
 from common.ordered_model.ordered_model import OrderedModel
 from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
@@ -125,6 +128,19 @@ class UserNotificationPolicy(OrderedModel):
     def __str__(self):
         return f"{self.pk}: {self.short_verbal}"
 
+    # orders are changed with queryset updates, which don't send post_save signals
+    def to(self, order: int) -> None:
+        super().to(order)
+        invalidate_notification_plans(self.user_id)
+
+    def to_index(self, index: int) -> None:
+        super().to_index(index)
+        invalidate_notification_plans(self.user_id)
+
+    def swap(self, order: int) -> None:
+        super().swap(order)
+        invalidate_notification_plans(self.user_id)
+
     @classmethod
     def get_short_verbals_for_user(cls, user: User) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
         policies = user.notification_policies.all()
@@ -172,6 +188,12 @@ class UserNotificationPolicy(OrderedModel):
             return "Not set"
 
 
+@receiver(post_save, sender=UserNotificationPolicy)
+@receiver(post_delete, sender=UserNotificationPolicy)
+def user_notification_policy_post_save_or_delete(sender, instance, *args, **kwargs):
+    invalidate_notification_plans(instance.user_id)
+
+
 class NotificationChannelOptions:
     """
     NotificationChannelOptions encapsulates logic of notification channel representation for API and public API,
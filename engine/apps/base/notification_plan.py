@@ -0,0 +1,102 @@
+import datetime
+import typing
+
+from django.conf import settings
+from django.core.cache import cache
+
+if typing.TYPE_CHECKING:
+    from apps.base.models import UserNotificationPolicy
+    from apps.user_management.models import User
+
+NOTIFICATION_PLAN_CACHE_KEY_PREFIX = "user_notification_plan"
+
+
+class NotificationPlanStep(typing.NamedTuple):
+    # None for the default fallback step
+    policy_id: typing.Optional[int]
+    public_primary_key: typing.Optional[str]
+    order: int
+    step: typing.Optional[int]
+    notify_by: int
+    wait_delay: typing.Optional[datetime.timedelta]
+
+
+class NotificationPlan(typing.NamedTuple):
+    """
+    Notification policy steps of a user (default or important ones) compiled once and cached, so escalating the
+    personal notifications of a user doesn't need to query the policies on every step.
+    """
+
+    important: bool
+    using_fallback_default_notification_policy_step: bool
+    steps: typing.Tuple[NotificationPlanStep, ...]
+
+    def index_of(self, policy_id: int) -> typing.Optional[int]:
+        for index, step in enumerate(self.steps):
+            if step.policy_id == policy_id:
+                return index
+        return None
+
+    def get_policy(self, user: "User", index: int) -> typing.Optional["UserNotificationPolicy"]:
+        """
+        Return the policy of the step as a model instance not fetched from DB, or None if there's no such step.
+        """
+        from apps.base.models import UserNotificationPolicy
+
+        if index >= len(self.steps):
+            return None
+        step = self.steps[index]
+        if step.policy_id is None:
+            return UserNotificationPolicy.get_default_fallback_policy(user)
+        return UserNotificationPolicy(
+            pk=step.policy_id,
+            public_primary_key=step.public_primary_key,
+            user=user,
+            important=self.important,
+            order=step.order,
+            step=step.step,
+            notify_by=step.notify_by,
+            wait_delay=step.wait_delay,
+        )
+
+    def get_policies(self, user: "User") -> typing.List["UserNotificationPolicy"]:
+        return [self.get_policy(user, index) for index in range(len(self.steps))]
+
+
+def _get_cache_key(user_id: int, important: bool) -> str:
+    return f"{NOTIFICATION_PLAN_CACHE_KEY_PREFIX}_{user_id}_{int(important)}"
+
+
+def compile_notification_plan(user: "User", important: bool) -> NotificationPlan:
+    using_fallback, policies = user.get_notification_policies_or_use_default_fallback(important=important)
+    steps = tuple(
+        NotificationPlanStep(
+            policy_id=None if using_fallback else policy.pk,
+            public_primary_key=None if using_fallback else policy.public_primary_key,
+            order=policy.order,
+            step=policy.step,
+            notify_by=policy.notify_by,
+            wait_delay=policy.wait_delay,
+        )
+        for policy in policies
+    )
+    return NotificationPlan(
+        important=important, using_fallback_default_notification_policy_step=using_fallback, steps=steps
+    )
+
+
+def get_notification_plan(user: "User", important: bool) -> NotificationPlan:
+    """
+    Return the cached notification plan of the user, the plan is invalidated when the user's policies change (see
+    invalidate_notification_plans).
+    """
+    cache_key = _get_cache_key(user.pk, important)
+    plan = cache.get(cache_key)
+    if not plan:
+        plan = compile_notification_plan(user, important)
+        cache.set(cache_key, plan, timeout=settings.USER_NOTIFICATION_PLAN_CACHE_TIMEOUT)
+    return plan
+
+
+def invalidate_notification_plans(user_id: int) -> None:
+    cache.delete_many([_get_cache_key(user_id, important) for important in (False, True)])
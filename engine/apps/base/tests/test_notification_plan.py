@@ -0,0 +1,94 @@
+import datetime
+
+import pytest
+from django.conf import settings
+
+from apps.base.models import UserNotificationPolicy
+from apps.base.notification_plan import get_notification_plan
+
+
+@pytest.mark.django_db
+def test_get_notification_plan(
+    make_organization, make_user_for_organization, make_user_notification_policy, django_assert_num_queries
+):
+    organization = make_organization()
+    user = make_user_for_organization(organization)
+    wait_policy = make_user_notification_policy(
+        user, UserNotificationPolicy.Step.WAIT, wait_delay=UserNotificationPolicy.FIVE_MINUTES
+    )
+    notify_policy = make_user_notification_policy(
+        user, UserNotificationPolicy.Step.NOTIFY, notify_by=UserNotificationPolicy.NotificationChannel.SMS
+    )
+    important_policy = make_user_notification_policy(
+        user,
+        UserNotificationPolicy.Step.NOTIFY,
+        notify_by=UserNotificationPolicy.NotificationChannel.PHONE_CALL,
+        important=True,
+    )
+
+    plan = get_notification_plan(user, important=False)
+    assert not plan.using_fallback_default_notification_policy_step
+    assert [step.policy_id for step in plan.steps] == [wait_policy.id, notify_policy.id]
+    assert plan.index_of(notify_policy.id) == 1
+    assert plan.index_of(important_policy.id) is None
+
+    policy = plan.get_policy(user, 0)
+    assert (policy.pk, policy.public_primary_key, policy.step, policy.wait_delay, policy.important) == (
+        wait_policy.pk,
+        wait_policy.public_primary_key,
+        UserNotificationPolicy.Step.WAIT,
+        datetime.timedelta(minutes=5),
+        False,
+    )
+    assert plan.get_policy(user, 2) is None
+
+    # the plan is cached
+    with django_assert_num_queries(0):
+        assert get_notification_plan(user, important=False) == plan
+
+    important_plan = get_notification_plan(user, important=True)
+    assert [step.policy_id for step in important_plan.steps] == [important_policy.id]
+    assert important_plan.get_policy(user, 0).important
+
+
+@pytest.mark.django_db
+def test_get_notification_plan_default_fallback(make_organization, make_user_for_organization):
+    organization = make_organization()
+    user = make_user_for_organization(organization)
+
+    plan = get_notification_plan(user, important=False)
+    assert plan.using_fallback_default_notification_policy_step
+    (policy,) = plan.get_policies(user)
+    assert policy.pk is None
+    assert policy.step == UserNotificationPolicy.Step.NOTIFY
+    assert policy.notify_by == settings.EMAIL_BACKEND_INTERNAL_ID
+
+
+@pytest.mark.django_db
+def test_notification_plan_invalidated(make_organization, make_user_for_organization, make_user_notification_policy):
+    organization = make_organization()
+    user = make_user_for_organization(organization)
+
+    def _get_plan_policy_ids():
+        return [step.policy_id for step in get_notification_plan(user, important=False).steps]
+
+    assert _get_plan_policy_ids() == [None]
+
+    policy_1 = make_user_notification_policy(user, UserNotificationPolicy.Step.NOTIFY)
+    assert _get_plan_policy_ids() == [policy_1.id]
+
+    policy_2 = make_user_notification_policy(user, UserNotificationPolicy.Step.WAIT)
+    assert _get_plan_policy_ids() == [policy_1.id, policy_2.id]
+
+    policy_2.to_index(0)
+    assert _get_plan_policy_ids() == [policy_2.id, policy_1.id]
+
+    policy_1.swap(policy_2.order)
+    assert _get_plan_policy_ids() == [policy_1.id, policy_2.id]
+
+    policy_1.notify_by = UserNotificationPolicy.NotificationChannel.SMS
+    policy_1.save()
+    assert get_notification_plan(user, important=False).steps[0].notify_by == policy_1.notify_by
+
+    policy_1.delete()
+    assert _get_plan_policy_ids() == [policy_2.id]
@@ -6,6 +6,7 @@ from django.utils import timezone
 
 from apps.auth_token.exceptions import InvalidToken
 from apps.auth_token.models import PluginAuthToken
+from apps.auth_token.verified_token_cache import verified_token_cache
 from apps.grafana_plugin.helpers import GcomAPIClient, GrafanaAPIClient
 from apps.user_management.models import Organization
 
@@ -118,7 +119,9 @@ def check_token(token_string: str, context: dict) -> GcomToken | PluginAuthToken
     if len(token_parts) > 1 and token_parts[0] == "gcom":
         return check_gcom_permission(token_parts[1], context)
     else:
-        return PluginAuthToken.validate_token_string(token_string, context=context)
+        # only stack and org ids are used to validate the token, so other context values are not part of the cache key
+        plugin_context = {"stack_id": context["stack_id"], "org_id": context["org_id"]}
+        return verified_token_cache.validate_token_string(PluginAuthToken, token_string, context=plugin_context)
 
 
 def get_instance_ids(query: str) -> Tuple[Optional[set], bool]:
@@ -1,7 +1,14 @@
+import hashlib
 import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
 from time import perf_counter
 from typing import Optional
 
+from django.conf import settings
 from django.core import serializers
 from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
@@ -17,13 +24,101 @@ CHANNEL_DOES_NOT_EXIST_PLACEHOLDER = "DOES_NOT_EXIST"
 logger = logging.getLogger(__name__)
 
 
+def _get_version_cache_key(alert_receive_channel_id: int) -> str:
+    return f"alert_receive_channel_version_{alert_receive_channel_id}"
+
+
+def get_alert_receive_channel_version(alert_receive_channel_id: int) -> str:
+    cache_key = _get_version_cache_key(alert_receive_channel_id)
+    version = cache.get(cache_key)
+    if version is None:
+        # A missing version is replaced with a new random one, so it never goes back to a previously seen value
+        cache.add(cache_key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(cache_key)
+    return version
+
+
+@dataclass
+class _LocalCacheEntry:
+    alert_receive_channel: AlertReceiveChannel
+    version: str
+    cached_at: float
+    checked_at: float
+
+
+class _AlertReceiveChannelLocalCache:
+    """
+    Per-process LRU cache of channels resolved by token, used in front of the short-term cache.
+
+    Cached channels are shared between requests, so related objects (e.g. organization) are only loaded once per
+    process. Entries are validated against a version stored in the shared cache, which is reset every time the channel
+    is saved (see AlertChannelDefiningMixin.invalidate_alert_receive_channel_cache). The version is checked at most
+    once per version_check_interval, so most requests don't access the shared cache at all.
+    """
+
+    def __init__(self, max_size: int, ttl: int, version_check_interval: float) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._version_check_interval = version_check_interval
+        self._entries: OrderedDict[str, _LocalCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[AlertReceiveChannel]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            self._entries.move_to_end(token)
+
+        now = time.monotonic()
+        if now - entry.cached_at >= self._ttl:
+            self.pop(token)
+            return None
+
+        if now - entry.checked_at >= self._version_check_interval:
+            if get_alert_receive_channel_version(entry.alert_receive_channel.pk) != entry.version:
+                self.pop(token)
+                return None
+            entry.checked_at = now
+
+        return entry.alert_receive_channel
+
+    def set(self, alert_receive_channel: AlertReceiveChannel) -> None:
+        if self._max_size <= 0:
+            return
+
+        version = get_alert_receive_channel_version(alert_receive_channel.pk)
+        now = time.monotonic()
+        with self._lock:
+            self._entries[alert_receive_channel.token] = _LocalCacheEntry(alert_receive_channel, version, now, now)
+            self._entries.move_to_end(alert_receive_channel.token)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, token: str) -> None:
+        with self._lock:
+            self._entries.pop(token, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+alert_receive_channel_local_cache = _AlertReceiveChannelLocalCache(
+    max_size=settings.ALERT_RECEIVE_CHANNEL_LOCAL_CACHE_MAX_SIZE,
+    ttl=settings.ALERT_RECEIVE_CHANNEL_LOCAL_CACHE_TTL,
+    version_check_interval=settings.ALERT_RECEIVE_CHANNEL_LOCAL_CACHE_VERSION_CHECK_INTERVAL,
+)
+
+
 class AlertChannelDefiningMixin(object):
     """
     Mixin is defining "alert channel" used for this request, gathers Slack Team and Chanel to fulfill "request".
     To make it easy to access them in ViewSets.
     """
 
-    CACHE_KEY_DB_FALLBACK = "cached_alert_receive_channels_db_fallback"  # Key for caching channels as a DB fallback
+    # Key for caching channels as a DB fallback, channels are cached per token (see _get_fallback_cache_key)
+    CACHE_KEY_DB_FALLBACK = "cached_alert_receive_channels_db_fallback"
     CACHE_DB_FALLBACK_OBSOLETE_KEY = CACHE_KEY_DB_FALLBACK + "_obsolete_key"  # Used as a timer for re-caching
     CACHE_DB_FALLBACK_REFRESH_INTERVAL = 180
 
@@ -50,6 +145,11 @@ class AlertChannelDefiningMixin(object):
     def get_alert_receive_channel_from_short_term_cache(
         self, token: str
     ) -> tuple[Optional[AlertReceiveChannel], Optional[str]]:
+        # Trying to define from local cache
+        alert_receive_channel = alert_receive_channel_local_cache.get(token)
+        if alert_receive_channel is not None:
+            return alert_receive_channel, None
+
         # Trying to define from short-term cache
         cache_key_short_term = self.CACHE_KEY_SHORT_TERM + "_" + token
         cached_alert_receive_channel_raw = cache.get(cache_key_short_term)
@@ -60,10 +160,12 @@ class AlertChannelDefiningMixin(object):
         if cached_alert_receive_channel_raw:
             try:
                 alert_receive_channel = next(serializers.deserialize("json", cached_alert_receive_channel_raw)).object
-                return alert_receive_channel, None
             except serializers.base.DeserializationError:
                 # cached object model is outdated
                 pass
+            else:
+                alert_receive_channel_local_cache.set(alert_receive_channel)
+                return alert_receive_channel, None
 
         alert_receive_channel, db_ok = self.get_alert_receive_channel_from_db(token)
         if not alert_receive_channel:
@@ -82,6 +184,7 @@ class AlertChannelDefiningMixin(object):
             # Update short term cache
             serialized = serializers.serialize("json", [alert_receive_channel])
             cache.set(cache_key_short_term, serialized, self.CACHE_SHORT_TERM_TIMEOUT)
+            alert_receive_channel_local_cache.set(alert_receive_channel)
 
             # Update cached channels
             if cache.get(self.CACHE_DB_FALLBACK_OBSOLETE_KEY) is None:
@@ -109,22 +212,71 @@ class AlertChannelDefiningMixin(object):
             logger.info("Cannot connect to database, using cache to consume alerts!")
             return self.get_alert_receive_channel_from_fallback_cache(token), False
 
+    @classmethod
+    def invalidate_alert_receive_channel_cache(cls, alert_receive_channel: AlertReceiveChannel) -> None:
+        """
+        Make sure changes of the channel are picked up by local and short-term caches.
+        Deleting the version makes local caches of other processes drop the channel on their next version check.
+        """
+        alert_receive_channel_local_cache.pop(alert_receive_channel.token)
+        cache.delete_many(
+            [
+                _get_version_cache_key(alert_receive_channel.pk),
+                cls.CACHE_KEY_SHORT_TERM + "_" + alert_receive_channel.token,
+            ]
+        )
+
+    @classmethod
+    def _get_fallback_cache_key(cls, token: str) -> str:
+        return cls.CACHE_KEY_DB_FALLBACK + "_token_" + token
+
     def get_alert_receive_channel_from_fallback_cache(self, token: str) -> Optional[AlertReceiveChannel]:
-        fallback_channels = cache.get(self.CACHE_KEY_DB_FALLBACK)
-        if fallback_channels:
-            for obj in serializers.deserialize("json", fallback_channels):
-                if obj.object.token == token:
-                    return obj.object
-        else:
+        cached_alert_receive_channel_raw = cache.get(self._get_fallback_cache_key(token))
+        if cached_alert_receive_channel_raw:
+            try:
+                return next(serializers.deserialize("json", cached_alert_receive_channel_raw)).object
+            except serializers.base.DeserializationError:
+                # cached object model is outdated
+                pass
+
+        if not isinstance(cache.get(self.CACHE_KEY_DB_FALLBACK), dict):
             logger.info("Cache is empty!")
             raise
         logger.info(f"Integration {token} not found in fallback cache")
         return None
 
     def update_alert_receive_channel_fallback_cache(self):
+        """
+        Cache every channel under its own token key, so a single channel can be looked up when DB is down.
+        CACHE_KEY_DB_FALLBACK holds an index of token -> digest of the cached channel, which is used to only write
+        channels which changed since the previous update and to remove channels which don't exist anymore.
+        """
         from apps.alerts.models import AlertReceiveChannel
 
         logger.info("Caching alert receive channels from database.")
-        serialized = serializers.serialize("json", AlertReceiveChannel.objects.all())
+        cached_index = cache.get(self.CACHE_KEY_DB_FALLBACK)
+        if not isinstance(cached_index, dict):
+            # not populated yet or populated by an older version of this method
+            cached_index = {}
+
+        index = {}
+        changed = {}
+        for alert_receive_channel in AlertReceiveChannel.objects.all().iterator():
+            token = alert_receive_channel.token
+            serialized = serializers.serialize("json", [alert_receive_channel])
+            digest = hashlib.sha1(serialized.encode()).hexdigest()
+            index[token] = digest
+            if cached_index.get(token) != digest:
+                changed[self._get_fallback_cache_key(token)] = serialized
+        removed = [self._get_fallback_cache_key(token) for token in cached_index.keys() - index.keys()]
+
         # Caching forever, re-caching is managed by "obsolete key"
-        cache.set(self.CACHE_KEY_DB_FALLBACK, serialized, timeout=None)
+        if changed:
+            cache.set_many(changed, timeout=None)
+        cache.set(self.CACHE_KEY_DB_FALLBACK, index, timeout=None)
+        if removed:
+            cache.delete_many(removed)
+        logger.info(
+            f"Cached alert receive channels from database: total={len(index)} "
+            f"changed={len(changed)} removed={len(removed)}"
+        )
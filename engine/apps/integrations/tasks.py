@@ -4,8 +4,10 @@ import typing
 
 from celery import shared_task
 from celery.utils.log import get_task_logger
+from celery.utils.time import get_exponential_backoff_interval
 from django.conf import settings
 from django.core.cache import cache
+from django.db import transaction
 
 from apps.alerts.models.alert_group_counter import ConcurrentUpdateError
 from apps.alerts.tasks import resolve_alert_group_by_source_if_needed
@@ -68,6 +70,68 @@ def create_alertmanager_alerts(alert_receive_channel_pk, alert, is_demo=False, r
     )
 
 
+@shared_task(
+    base=CreateAlertBaseTask,
+    bind=True,
+    max_retries=1 if settings.DEBUG else None,
+)
+def create_alertmanager_alerts_batch(self, alert_receive_channel_pk, alerts, is_demo=False, received_at=None):
+    """
+    Batch version of create_alertmanager_alerts, creates alerts for all alerts from one Alertmanager payload.
+
+    The task is retried only if it fails before alerts are committed, as retrying the whole payload after that would
+    create duplicate alerts.
+    """
+    from apps.alerts.models import Alert, AlertReceiveChannel
+
+    try:
+        alert_receive_channel = AlertReceiveChannel.objects_with_deleted.get(pk=alert_receive_channel_pk)
+        if alert_receive_channel.deleted_at is not None or alert_receive_channel.is_maintenace_integration:
+            logger.info("AlertReceiveChannel alert ignored if deleted/maintenance")
+            return
+
+        with transaction.atomic():
+            batch = Alert.insert_batch(
+                alert_receive_channel,
+                alerts,
+                enable_autoresolve=False,
+                is_demo=is_demo,
+                received_at=received_at,
+            )
+    except Exception as e:
+        # same backoff as for tasks with autoretry_for and retry_backoff=True
+        countdown = get_exponential_backoff_interval(
+            factor=1, retries=self.request.retries, maximum=600, full_jitter=True
+        )
+        raise self.retry(exc=e, countdown=countdown)
+
+    created_alerts, not_processed = Alert.process_inserted_batch(alert_receive_channel, batch)
+
+    if not_processed:
+        # Some alerts were not created due to ConcurrentUpdateError, retry only them.
+        countdown = random.randint(1, 10)
+        create_alertmanager_alerts_batch.apply_async(
+            (alert_receive_channel_pk, not_processed),
+            kwargs={"is_demo": is_demo, "received_at": received_at},
+            countdown=countdown,
+        )
+        logger.warning(
+            f"Retrying {len(not_processed)} alerts gracefully in {countdown} seconds due to ConcurrentUpdateError"
+        )
+
+    if alert_receive_channel.allow_source_based_resolving:
+        alert_groups = {alert.group_id: alert.group for alert in created_alerts}
+        for alert_group in alert_groups.values():
+            if alert_group.resolved_by != alert_group.NOT_YET_STOP_AUTORESOLVE:
+                task = resolve_alert_group_by_source_if_needed.apply_async((alert_group.pk,), countdown=5)
+                alert_group.active_resolve_calculation_id = task.id
+                alert_group.save(update_fields=["active_resolve_calculation_id"])
+
+    logger.debug(
+        f"Created {len(created_alerts)} alertmanager alerts in batch for channel_id={alert_receive_channel.pk}"
+    )
+
+
 @shared_task(
     base=CreateAlertBaseTask,
     autoretry_for=(Exception,),
@@ -1,7 +1,11 @@
+from unittest.mock import patch
+
 import pytest
+from celery.exceptions import Retry
 
-from apps.alerts.models import Alert, AlertReceiveChannel
-from apps.integrations.tasks import create_alertmanager_alerts
+from apps.alerts.models import Alert, AlertGroup, AlertGroupCounter, AlertGroupLogRecord, AlertReceiveChannel
+from apps.alerts.models.alert_group_counter import ConcurrentUpdateError
+from apps.integrations.tasks import create_alertmanager_alerts, create_alertmanager_alerts_batch
 
 
 @pytest.mark.django_db
@@ -29,3 +33,157 @@ def test_create_alertmanager_alert_maintanance_task_no_alert_no_retry(
     create_alertmanager_alerts(integration.pk, {})
 
     assert Alert.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_create_alertmanager_alerts_batch(
+    make_organization,
+    make_alert_receive_channel,
+    make_channel_filter,
+    django_capture_on_commit_callbacks,
+):
+    organization = make_organization()
+    integration = make_alert_receive_channel(
+        organization, integration=AlertReceiveChannel.INTEGRATION_LEGACY_ALERTMANAGER
+    )
+    make_channel_filter(integration, is_default=True)
+    alerts = [
+        {"labels": {"alertname": "foo"}, "status": "firing"},
+        {"labels": {"alertname": "bar"}, "status": "firing"},
+        {"labels": {"alertname": "foo"}, "status": "firing"},
+        {"labels": {"alertname": "bar"}, "status": "firing"},
+    ]
+
+    with patch("apps.integrations.tasks.resolve_alert_group_by_source_if_needed") as mock_resolve:
+        mock_resolve.apply_async.return_value.id = "task_id"
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            create_alertmanager_alerts_batch(integration.pk, alerts)
+
+    assert Alert.objects.count() == 4
+    assert AlertGroup.objects.count() == 2
+    for alert_group in AlertGroup.objects.all():
+        assert alert_group.alerts.count() == 2
+        assert alert_group.alerts.filter(is_the_first_alert_in_group=True).count() == 1
+        assert list(alert_group.log_records.values_list("type", flat=True)) == [
+            AlertGroupLogRecord.TYPE_REGISTERED,
+            AlertGroupLogRecord.TYPE_ROUTE_ASSIGNED,
+        ]
+
+    # send_alert_create_signal is scheduled for every alert
+    assert len(callbacks) == 4
+    # resolve by source check is scheduled once per alert group
+    assert mock_resolve.apply_async.call_count == 2
+
+
+@pytest.mark.django_db
+def test_create_alertmanager_alerts_batch_resolve_then_fire(make_organization, make_alert_receive_channel):
+    organization = make_organization()
+    integration = make_alert_receive_channel(
+        organization, integration=AlertReceiveChannel.INTEGRATION_LEGACY_ALERTMANAGER
+    )
+    alerts = [
+        {"labels": {"alertname": "foo"}, "status": "firing"},
+        {"labels": {"alertname": "foo"}, "status": "resolved"},
+        {"labels": {"alertname": "foo"}, "status": "firing"},
+    ]
+
+    created_alerts, not_processed = Alert.create_batch(integration, alerts)
+
+    assert not_processed == []
+    assert len(created_alerts) == 3
+    # alert fired after resolve signal starts a new alert group, same as when alerts are created one by one
+    first_group, second_group = AlertGroup.objects.order_by("pk")
+    assert first_group.resolved is True
+    assert first_group.alerts.count() == 2
+    assert second_group.resolved is False
+    assert second_group.alerts.count() == 1
+
+
+@pytest.mark.django_db
+def test_create_alertmanager_alerts_batch_fire_after_resolve_signal(make_organization, make_alert_receive_channel):
+    organization = make_organization()
+    integration = make_alert_receive_channel(
+        organization, integration=AlertReceiveChannel.INTEGRATION_LEGACY_ALERTMANAGER
+    )
+    with patch("apps.integrations.tasks.resolve_alert_group_by_source_if_needed") as mock_resolve:
+        mock_resolve.apply_async.return_value.id = "task_id"
+        create_alertmanager_alerts_batch(integration.pk, [{"labels": {"alertname": "foo"}, "status": "firing"}])
+        resolved_alert_group = AlertGroup.objects.get()
+        resolved_alert_group.resolve_by_source()
+
+        create_alertmanager_alerts_batch(
+            integration.pk,
+            [
+                {"labels": {"alertname": "foo"}, "status": "resolved"},
+                {"labels": {"alertname": "foo"}, "status": "firing"},
+            ],
+        )
+
+    # resolve signal is added to the resolved alert group, alert fired after it starts a new alert group
+    resolved_alert_group, alert_group = AlertGroup.objects.order_by("pk")
+    assert resolved_alert_group.resolved is True
+    assert resolved_alert_group.alerts.count() == 2
+    assert alert_group.resolved is False
+    assert list(alert_group.alerts.values_list("raw_request_data__status", flat=True)) == ["firing"]
+    assert alert_group.alerts.get().is_the_first_alert_in_group is True
+
+
+@pytest.mark.django_db
+def test_create_alertmanager_alerts_batch_concurrent_update_error(make_organization, make_alert_receive_channel):
+    organization = make_organization()
+    integration = make_alert_receive_channel(
+        organization, integration=AlertReceiveChannel.INTEGRATION_LEGACY_ALERTMANAGER
+    )
+    alerts = [{"labels": {"alertname": "foo"}}, {"labels": {"alertname": "bar"}}]
+
+    original_get_value = AlertGroupCounter.objects.get_value
+    with patch.object(
+        AlertGroupCounter.objects,
+        "get_value",
+        side_effect=[original_get_value(organization), ConcurrentUpdateError()],
+    ):
+        with patch.object(create_alertmanager_alerts_batch, "apply_async") as mock_apply_async:
+            with patch("apps.integrations.tasks.resolve_alert_group_by_source_if_needed") as mock_resolve:
+                mock_resolve.apply_async.return_value.id = "task_id"
+                create_alertmanager_alerts_batch(integration.pk, alerts)
+
+    # only the alert which was not created is retried
+    assert Alert.objects.count() == 1
+    assert mock_apply_async.call_args.args[0] == (integration.pk, [alerts[1]])
+
+
+@pytest.mark.django_db
+def test_create_alertmanager_alerts_batch_retried_if_not_committed(make_organization, make_alert_receive_channel):
+    organization = make_organization()
+    integration = make_alert_receive_channel(
+        organization, integration=AlertReceiveChannel.INTEGRATION_LEGACY_ALERTMANAGER
+    )
+    alerts = [{"labels": {"alertname": "foo"}}, {"labels": {"alertname": "bar"}}]
+
+    with patch("apps.alerts.models.alert.save_alert_group_labels", side_effect=Exception("boom")):
+        with patch.object(create_alertmanager_alerts_batch, "retry", return_value=Retry()) as mock_retry:
+            with pytest.raises(Retry):
+                create_alertmanager_alerts_batch(integration.pk, alerts)
+
+    # inserted alerts are rolled back, so the whole payload can be retried
+    mock_retry.assert_called_once()
+    assert Alert.objects.count() == 0
+    assert AlertGroup.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_create_alertmanager_alerts_batch_not_retried_if_committed(make_organization, make_alert_receive_channel):
+    organization = make_organization()
+    integration = make_alert_receive_channel(
+        organization, integration=AlertReceiveChannel.INTEGRATION_LEGACY_ALERTMANAGER
+    )
+    alerts = [{"labels": {"alertname": "foo"}}, {"labels": {"alertname": "bar"}}]
+
+    with patch.object(Alert, "_process_alert_group_after_alerts_created", side_effect=Exception("boom")):
+        with patch.object(create_alertmanager_alerts_batch, "retry") as mock_retry:
+            with pytest.raises(Exception, match="boom"):
+                create_alertmanager_alerts_batch(integration.pk, alerts)
+
+    # retrying the payload would duplicate committed alerts
+    mock_retry.assert_not_called()
+    assert Alert.objects.count() == 2
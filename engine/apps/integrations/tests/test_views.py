@@ -14,7 +14,10 @@ from rest_framework.test import APIClient
 from apps.alerts.models import AlertReceiveChannel
 from apps.alerts.models.alert_receive_channel import random_token_generator
 from apps.integrations.mixins import AlertChannelDefiningMixin
-from apps.integrations.mixins.alert_channel_defining_mixin import CHANNEL_DOES_NOT_EXIST_PLACEHOLDER
+from apps.integrations.mixins.alert_channel_defining_mixin import (
+    CHANNEL_DOES_NOT_EXIST_PLACEHOLDER,
+    alert_receive_channel_local_cache,
+)
 from apps.integrations.views import UniversalAPIView
 
 # https://github.com/pytest-dev/pytest-xdist/issues/432#issuecomment-528510433
@@ -200,6 +203,45 @@ def test_integration_grafana_endpoint_has_alerts(
     )
 
 
+@patch("apps.integrations.views.create_alertmanager_alerts_batch")
+@patch("apps.integrations.views.create_alertmanager_alerts")
+@pytest.mark.django_db
+@pytest.mark.parametrize("integration_type", ["grafana", "legacy_alertmanager"])
+def test_integration_alertmanager_endpoint_batch_ingestion(
+    mock_create_alertmanager_alerts,
+    mock_create_alertmanager_alerts_batch,
+    settings,
+    make_organization_and_user,
+    make_alert_receive_channel,
+    integration_type,
+):
+    settings.DEBUG = False
+    settings.FEATURE_ALERTMANAGER_BATCH_INGESTION_ENABLED = True
+
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(
+        organization=organization,
+        author=user,
+        integration=integration_type,
+    )
+
+    client = APIClient()
+    url_name = "grafana" if integration_type == "grafana" else "alertmanager"
+    url = reverse(f"integrations:{url_name}", kwargs={"alert_channel_key": alert_receive_channel.token})
+
+    data = {"alerts": [{"foo": 123}, {"foo": 456}]}
+    now = timezone.now()
+    with patch("django.utils.timezone.now") as mock_now:
+        mock_now.return_value = now
+        response = client.post(url, data, format="json")
+    assert response.status_code == status.HTTP_200_OK
+
+    mock_create_alertmanager_alerts.apply_async.assert_not_called()
+    mock_create_alertmanager_alerts_batch.apply_async.assert_called_once_with(
+        (alert_receive_channel.pk, data["alerts"]), kwargs={"received_at": now.isoformat()}
+    )
+
+
 @patch("apps.integrations.views.create_alert")
 @pytest.mark.django_db
 def test_integration_old_grafana_endpoint(
@@ -377,6 +419,39 @@ def test_integration_grafana_endpoint_without_db_has_alerts(
     )
 
 
+@pytest.mark.django_db
+def test_integration_fallback_cache_update_is_incremental(make_organization, make_alert_receive_channel):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    changed_alert_receive_channel = make_alert_receive_channel(organization)
+    deleted_alert_receive_channel = make_alert_receive_channel(organization)
+
+    mixin = AlertChannelDefiningMixin()
+    mixin.update_alert_receive_channel_fallback_cache()
+
+    changed_alert_receive_channel.verbal_name = "changed"
+    changed_alert_receive_channel.save()
+    deleted_alert_receive_channel.delete()
+
+    with patch.object(cache, "set_many", wraps=cache.set_many) as mock_set_many:
+        mixin.update_alert_receive_channel_fallback_cache()
+
+    # only the changed channel is written to cache
+    assert list(mock_set_many.call_args.args[0].keys()) == [
+        mixin._get_fallback_cache_key(changed_alert_receive_channel.token)
+    ]
+
+    with DatabaseBlocker().block():
+        cached_alert_receive_channel = mixin.get_alert_receive_channel_from_fallback_cache(alert_receive_channel.token)
+        cached_changed_alert_receive_channel = mixin.get_alert_receive_channel_from_fallback_cache(
+            changed_alert_receive_channel.token
+        )
+        assert mixin.get_alert_receive_channel_from_fallback_cache(deleted_alert_receive_channel.token) is None
+
+    assert cached_alert_receive_channel.pk == alert_receive_channel.pk
+    assert cached_changed_alert_receive_channel.verbal_name == "changed"
+
+
 @patch("apps.integrations.views.create_alert")
 @pytest.mark.parametrize(
     "integration_type",
@@ -616,3 +691,63 @@ def test_deleted_integration_does_not_repeat_access_db(
         cache_key, CHANNEL_DOES_NOT_EXIST_PLACEHOLDER, AlertChannelDefiningMixin.CACHE_SHORT_TERM_TIMEOUT
     )
     mock_db_get.assert_called_once_with(token=alert_receive_channel.token)
+
+
+@pytest.mark.django_db
+def test_integration_local_cache(make_organization_and_user, make_alert_receive_channel, django_assert_num_queries):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization=organization, author=user)
+    mixin = AlertChannelDefiningMixin()
+
+    cached_alert_receive_channel, _ = mixin.get_alert_receive_channel_from_short_term_cache(alert_receive_channel.token)
+    assert cached_alert_receive_channel.organization == organization
+
+    # channel and its organization are taken from the local cache, without accessing the shared cache or DB
+    with patch.object(cache, "get") as mock_cache_get:
+        with django_assert_num_queries(0):
+            for _ in range(3):
+                alert_receive_channel_from_cache, status = mixin.get_alert_receive_channel_from_short_term_cache(
+                    alert_receive_channel.token
+                )
+                assert alert_receive_channel_from_cache.organization == organization
+    assert alert_receive_channel_from_cache is cached_alert_receive_channel
+    assert status is None
+    mock_cache_get.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_integration_local_cache_invalidated_on_save(make_organization_and_user, make_alert_receive_channel, settings):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization=organization, author=user)
+    mixin = AlertChannelDefiningMixin()
+    mixin.get_alert_receive_channel_from_short_term_cache(alert_receive_channel.token)
+
+    # change the channel in "another process", so the local cache is only invalidated via the version
+    with patch.object(alert_receive_channel_local_cache, "pop"):
+        alert_receive_channel.verbal_name = "changed"
+        alert_receive_channel.save()
+
+    cached_alert_receive_channel, _ = mixin.get_alert_receive_channel_from_short_term_cache(alert_receive_channel.token)
+    # version is not checked yet
+    assert cached_alert_receive_channel.verbal_name != "changed"
+
+    with patch.object(alert_receive_channel_local_cache, "_version_check_interval", 0):
+        cached_alert_receive_channel, _ = mixin.get_alert_receive_channel_from_short_term_cache(
+            alert_receive_channel.token
+        )
+    assert cached_alert_receive_channel.verbal_name == "changed"
+
+
+@pytest.mark.django_db
+def test_integration_local_cache_deleted(make_organization_and_user, make_alert_receive_channel):
+    organization, user = make_organization_and_user()
+    alert_receive_channel = make_alert_receive_channel(organization=organization, author=user)
+    mixin = AlertChannelDefiningMixin()
+    mixin.get_alert_receive_channel_from_short_term_cache(alert_receive_channel.token)
+
+    AlertReceiveChannel.objects.filter(pk=alert_receive_channel.pk).delete()
+
+    assert mixin.get_alert_receive_channel_from_short_term_cache(alert_receive_channel.token) == (
+        None,
+        CHANNEL_DOES_NOT_EXIST_PLACEHOLDER,
+    )
@@ -23,7 +23,7 @@ from apps.integrations.mixins import (
     IntegrationRateLimitMixin,
     is_ratelimit_ignored,
 )
-from apps.integrations.tasks import create_alert, create_alertmanager_alerts
+from apps.integrations.tasks import create_alert, create_alertmanager_alerts, create_alertmanager_alerts_batch
 from apps.integrations.throttlers.integration_backsync_throttler import BacksyncRateThrottle
 from apps.user_management.exceptions import OrganizationDeletedException, OrganizationMovedException
 from common.api_helpers.utils import create_engine_url
@@ -95,10 +95,47 @@ class AmazonSNS(BrowsableInstructionMixin, AlertChannelDefiningMixin, Integratio
         )
 
 
+class AlertManagerAlertsMixin:
+    def create_alertmanager_alerts(self, alert_receive_channel, alerts):
+        """
+        Creates alerts from each alert in incoming AlertManager payload.
+        Returns rate limit response if the integration is rate limited.
+        With FEATURE_ALERTMANAGER_BATCH_INGESTION_ENABLED all accepted alerts are created in a single task.
+        """
+        now = timezone.now()
+        if settings.DEBUG:
+            for alert in alerts:
+                create_alertmanager_alerts(alert_receive_channel.pk, alert, received_at=now.isoformat())
+            return None
+
+        ratelimit_response = None
+        accepted_alerts = []
+        for alert in alerts:
+            self.execute_rate_limit_with_notification_logic()
+
+            if self.request.limited and not is_ratelimit_ignored(alert_receive_channel):
+                ratelimit_response = self.get_ratelimit_http_response()
+                break
+
+            if settings.FEATURE_ALERTMANAGER_BATCH_INGESTION_ENABLED:
+                accepted_alerts.append(alert)
+            else:
+                create_alertmanager_alerts.apply_async(
+                    (alert_receive_channel.pk, alert), kwargs={"received_at": now.isoformat()}
+                )
+
+        if accepted_alerts:
+            create_alertmanager_alerts_batch.apply_async(
+                (alert_receive_channel.pk, accepted_alerts), kwargs={"received_at": now.isoformat()}
+            )
+        return ratelimit_response
+
+
 class AlertManagerAPIView(
     BrowsableInstructionMixin,
     AlertChannelDefiningMixin,
     IntegrationRateLimitMixin,
+    AlertManagerAlertsMixin,
     APIView,
 ):
     def post(self, request):
@@ -125,19 +162,7 @@ class AlertManagerAPIView(
         """
         process_v1 creates alerts from each alert in incoming AlertManager payload.
         """
-        now = timezone.now()
-        for alert in request.data.get("alerts", []):
-            if settings.DEBUG:
-                create_alertmanager_alerts(alert_receive_channel.pk, alert, received_at=now.isoformat())
-            else:
-                self.execute_rate_limit_with_notification_logic()
-
-                if self.request.limited and not is_ratelimit_ignored(alert_receive_channel):
-                    return self.get_ratelimit_http_response()
-
-                create_alertmanager_alerts.apply_async(
-                    (alert_receive_channel.pk, alert), kwargs={"received_at": now.isoformat()}
-                )
+        return self.create_alertmanager_alerts(alert_receive_channel, request.data.get("alerts", []))
 
     def process_v2(self, request, alert_receive_channel):
         """
@@ -188,6 +213,7 @@ class GrafanaAPIView(
     BrowsableInstructionMixin,
     AlertChannelDefiningMixin,
     IntegrationRateLimitMixin,
+    AlertManagerAlertsMixin,
     APIView,
 ):
     """Support both new and old versions of Grafana Alerting"""
@@ -202,20 +228,8 @@ class GrafanaAPIView(
 
         # Grafana Alerting 9 has the same payload structure as AlertManager
         if "alerts" in request.data:
-            now = timezone.now()
-            for alert in request.data.get("alerts", []):
-                if settings.DEBUG:
-                    create_alertmanager_alerts(alert_receive_channel.pk, alert, received_at=now.isoformat())
-                else:
-                    self.execute_rate_limit_with_notification_logic()
-
-                    if self.request.limited and not is_ratelimit_ignored(alert_receive_channel):
-                        return self.get_ratelimit_http_response()
-
-                    create_alertmanager_alerts.apply_async(
-                        (alert_receive_channel.pk, alert), kwargs={"received_at": now.isoformat()}
-                    )
-            return Response("Ok.")
+            ratelimit_response = self.create_alertmanager_alerts(alert_receive_channel, request.data.get("alerts", []))
+            return ratelimit_response or Response("Ok.")
 
         """
         Example of request.data from old Grafana:
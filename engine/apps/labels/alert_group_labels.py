@@ -2,6 +2,10 @@ import json
 import logging
 import typing
 
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.alerts.constants import SERVICE_LABEL
 from apps.labels import types
 from apps.labels.utils import is_labels_feature_enabled
 from common.jinja_templater import apply_jinja_template
@@ -18,6 +22,8 @@ LABEL_VALUE_TYPES = (str, int, float, bool)
 # Maximum number of labels per alert group, excess labels will be dropped
 MAX_LABELS_PER_ALERT_GROUP = 15
 
+AFFECTED_SERVICES_CACHE_TIMEOUT = 60
+
 
 def gather_alert_labels(
     alert_receive_channel: "AlertReceiveChannel", raw_request_data: "Alert.RawRequestData"
@@ -76,6 +82,38 @@ def save_alert_group_labels(
     AlertGroupAssociatedLabel.objects.bulk_create(alert_group_labels)
 
 
+def get_affected_services(organization_id: int, days: int) -> typing.Dict[str, typing.Set[int]]:
+    """
+    get_affected_services returns integration IDs of unresolved and unsilenced alert groups started in the last days,
+    by the service_name label value of the alert groups. All services of the organization are looked up in a single
+    query, which is cached for AFFECTED_SERVICES_CACHE_TIMEOUT seconds.
+    """
+    from apps.labels.models import AlertGroupAssociatedLabel
+
+    cache_key = f"affected_services_{organization_id}_{days}"
+    affected_services = cache.get(cache_key)
+    if affected_services is not None:
+        return affected_services
+
+    rows = (
+        AlertGroupAssociatedLabel.objects.filter(
+            organization_id=organization_id,
+            key_name=SERVICE_LABEL,
+            alert_group__started_at__gte=timezone.now() - timezone.timedelta(days=days),
+            alert_group__resolved=False,
+            alert_group__silenced=False,
+        )
+        .values_list("value_name", "alert_group__channel_id")
+        .distinct()
+    )
+    affected_services = {}
+    for service_name, channel_id in rows:
+        affected_services.setdefault(service_name, set()).add(channel_id)
+
+    cache.set(cache_key, affected_services, timeout=AFFECTED_SERVICES_CACHE_TIMEOUT)
+    return affected_services
+
+
 def _apply_dynamic_labels(
     alert_receive_channel: "AlertReceiveChannel", raw_request_data: "Alert.RawRequestData"
 ) -> types.AlertLabels:
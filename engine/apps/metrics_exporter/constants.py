@@ -21,6 +21,16 @@ class AlertGroupsTotalMetricsDict(typing.TypedDict):
     services: typing.Dict[str, AlertGroupStateDict]
 
 
+class ResponseTimeHistogramSlotDict(typing.TypedDict):
+    buckets: typing.List[int]  # cumulative counts of response times <= each of METRICS_RESPONSE_TIME_BUCKETS
+    sum: float
+    count: int
+
+
+# Histogram of response times split into slots by alert group start date (see get_response_time_slot)
+ResponseTimeHistogram = typing.Dict[int, ResponseTimeHistogramSlotDict]
+
+
 class AlertGroupsResponseTimeMetricsDict(typing.TypedDict):
     integration_name: str
     team_name: str
@@ -28,7 +38,7 @@ class AlertGroupsResponseTimeMetricsDict(typing.TypedDict):
     org_id: int
     slug: str
     id: int
-    services: typing.Dict[str, list]
+    services: typing.Dict[str, ResponseTimeHistogram]
 
 
 class UserWasNotifiedOfAlertGroupsMetricsDict(typing.TypedDict):
@@ -54,8 +64,13 @@ USER_WAS_NOTIFIED_OF_ALERT_GROUPS = METRICS_PREFIX + "user_was_notified_of_alert
 
 ALERT_GROUPS_TOTAL = "oncall_alert_groups_total"
 ALERT_GROUPS_RESPONSE_TIME = "oncall_alert_groups_response_time_seconds"
+AUTH_TOKEN_CACHE_LOOKUPS = METRICS_PREFIX + "auth_token_cache_lookups"
+AUTH_TOKEN_VALIDATION_DURATION = METRICS_PREFIX + "auth_token_validation_duration_seconds"
+SLACK_API_CALLS_QUEUED = METRICS_PREFIX + "slack_api_calls_queued"
+SLACK_API_CALL_WAIT_TIME = METRICS_PREFIX + "slack_api_call_wait_time_seconds"
 
 METRICS_RESPONSE_TIME_CALCULATION_PERIOD = datetime.timedelta(days=7)
+METRICS_RESPONSE_TIME_BUCKETS = (60, 300, 600, 3600)  # seconds, "+Inf" bucket is added by the collector
 
 METRICS_CACHE_LIFETIME = 93600  # 26 hours. Should be higher than METRICS_RECALCULATE_CACHE_TIMEOUT
 
@@ -16,6 +16,7 @@ from apps.metrics_exporter.constants import (
     METRICS_ORGANIZATIONS_IDS_CACHE_TIMEOUT,
     METRICS_RECALCULATION_CACHE_TIMEOUT,
     METRICS_RECALCULATION_CACHE_TIMEOUT_DISPERSE,
+    METRICS_RESPONSE_TIME_BUCKETS,
     METRICS_RESPONSE_TIME_CALCULATION_PERIOD,
     NO_SERVICE_VALUE,
     USER_WAS_NOTIFIED_OF_ALERT_GROUPS,
@@ -23,6 +24,8 @@ from apps.metrics_exporter.constants import (
     AlertGroupStateDict,
     AlertGroupsTotalMetricsDict,
     RecalculateMetricsTimer,
+    ResponseTimeHistogram,
+    ResponseTimeHistogramSlotDict,
     UserWasNotifiedOfAlertGroupsMetricsDict,
 )
 from common.cache import ensure_cache_key_allocates_to_the_same_hash_slot
@@ -85,6 +88,68 @@ def get_response_time_period() -> datetime.datetime:
     return timezone.now() - METRICS_RESPONSE_TIME_CALCULATION_PERIOD
 
 
+def get_response_time_slot(started_at: datetime.datetime | datetime.date) -> int:
+    """
+    Response time histograms are split into daily slots by alert group start date, so values older than the response
+    time period can be dropped from a histogram without knowing the values themselves.
+    """
+    if isinstance(started_at, datetime.datetime):
+        started_at = started_at.date()
+    return started_at.toordinal()
+
+
+def get_default_response_time_histogram_slot() -> ResponseTimeHistogramSlotDict:
+    return {
+        "buckets": [0] * len(METRICS_RESPONSE_TIME_BUCKETS),
+        "sum": 0,
+        "count": 0,
+    }
+
+
+def remove_expired_response_time_slots(histogram: ResponseTimeHistogram) -> ResponseTimeHistogram:
+    first_slot = get_response_time_slot(get_response_time_period())
+    for slot in [slot for slot in histogram if slot < first_slot]:
+        del histogram[slot]
+    return histogram
+
+
+def add_response_time_to_histogram(
+    histogram: ResponseTimeHistogram, slot: int, response_time_seconds: float
+) -> ResponseTimeHistogram:
+    histogram_slot = histogram.setdefault(slot, get_default_response_time_histogram_slot())
+    for i, bucket in enumerate(METRICS_RESPONSE_TIME_BUCKETS):
+        if response_time_seconds <= bucket:
+            histogram_slot["buckets"][i] += 1
+    histogram_slot["sum"] += response_time_seconds
+    histogram_slot["count"] += 1
+    return histogram
+
+
+def merge_response_time_histograms(
+    histogram: ResponseTimeHistogram, other: ResponseTimeHistogram
+) -> ResponseTimeHistogram:
+    """Add values from `other` histogram to `histogram` and drop slots which are out of the response time period"""
+    for slot, other_slot in other.items():
+        histogram_slot = histogram.setdefault(slot, get_default_response_time_histogram_slot())
+        histogram_slot["buckets"] = [a + b for a, b in zip(histogram_slot["buckets"], other_slot["buckets"])]
+        histogram_slot["sum"] += other_slot["sum"]
+        histogram_slot["count"] += other_slot["count"]
+    return remove_expired_response_time_slots(histogram)
+
+
+def get_response_time_histogram_totals(histogram: ResponseTimeHistogram) -> ResponseTimeHistogramSlotDict:
+    """Sum up slots of the histogram which are in the response time period"""
+    first_slot = get_response_time_slot(get_response_time_period())
+    totals = get_default_response_time_histogram_slot()
+    for slot, histogram_slot in histogram.items():
+        if slot < first_slot:
+            continue
+        totals["buckets"] = [a + b for a, b in zip(totals["buckets"], histogram_slot["buckets"])]
+        totals["sum"] += histogram_slot["sum"]
+        totals["count"] += histogram_slot["count"]
+    return totals
+
+
 def get_metrics_recalculation_timeout() -> int:
     """
     Returns timeout when metrics should be recalculated.
@@ -220,7 +285,7 @@ def metrics_add_integrations_to_cache(integrations: list["AlertReceiveChannel"],
                 "org_id": grafana_org_id,
                 "slug": instance_slug,
                 "id": instance_id,
-                "services": {NO_SERVICE_VALUE: []},
+                "services": {NO_SERVICE_VALUE: {}},
             },
         )
     cache.set(metric_alert_groups_response_time_key, metric_alert_groups_response_time, timeout=metrics_cache_timeout)
@@ -309,7 +374,7 @@ def metrics_update_alert_groups_response_time_cache(integrations_response_time:
     integrations_response_time dict example:
     {
         <integration_id>: {
-            <service name>: [10],
+            <service name>: <response time histogram to add>,
         }
     }
     """
@@ -325,9 +390,12 @@ def metrics_update_alert_groups_response_time_cache(integrations_response_time:
         integration_response_time_metrics = metric_alert_groups_response_time.get(int(integration_id))
         if not integration_response_time_metrics:
             continue
-        for service_name, response_time_values in service_data.items():
-            integration_response_time_metrics["services"].setdefault(service_name, [])
-            integration_response_time_metrics["services"][service_name].extend(response_time_values)
+        for service_name, response_time_histogram in service_data.items():
+            service_histogram = integration_response_time_metrics["services"].setdefault(service_name, {})
+            if not isinstance(service_histogram, dict):
+                # response times cached as a list of values by an older version, cache is going to be recalculated
+                continue
+            merge_response_time_histograms(service_histogram, response_time_histogram)
     cache.set(metric_alert_groups_response_time_key, metric_alert_groups_response_time, timeout=metrics_cache_timeout)
 
 
@@ -1,8 +1,12 @@
 import typing
 
+from apps.alerts.alert_group_stats import update_alert_group_stats_counters
 from apps.alerts.constants import AlertGroupState
+from apps.metrics_exporter.constants import ResponseTimeHistogram
 from apps.metrics_exporter.helpers import (
+    add_response_time_to_histogram,
     get_response_time_period,
+    get_response_time_slot,
     metrics_update_alert_groups_response_time_cache,
     metrics_update_alert_groups_state_cache,
 )
@@ -66,13 +70,16 @@ class MetricsCacheManager:
 
     @staticmethod
     def metrics_update_response_time_cache_for_alert_group(
-        integration_id, organization_id, response_time_seconds, service_name
+        integration_id, organization_id, response_time_seconds, service_name, started_at
     ):
         """
         Update response time metric cache for one alert group.
         """
-        metrics_response_time: typing.Dict[int, typing.Dict[str, typing.List[int]]] = {
-            integration_id: {service_name: [response_time_seconds]}
+        response_time_histogram = add_response_time_to_histogram(
+            {}, get_response_time_slot(started_at), response_time_seconds
+        )
+        metrics_response_time: typing.Dict[int, typing.Dict[str, ResponseTimeHistogram]] = {
+            integration_id: {service_name: response_time_histogram}
         }
         metrics_update_alert_groups_response_time_cache(metrics_response_time, organization_id)
 
@@ -85,15 +92,24 @@ class MetricsCacheManager:
         response_time=None,
         started_at=None,
         service_name=None,
+        changed_at=None,
     ):
-        """Call methods to update state and response time metrics cache for one alert group."""
+        """
+        Call methods to update state and response time metrics cache for one alert group, and alert group stats
+        counters.
+        """
 
         if response_time and old_state == AlertGroupState.FIRING and started_at > get_response_time_period():
             response_time_seconds = int(response_time.total_seconds())
             MetricsCacheManager.metrics_update_response_time_cache_for_alert_group(
-                integration_id, organization_id, response_time_seconds, service_name
+                integration_id, organization_id, response_time_seconds, service_name, started_at
             )
         if old_state or new_state:
             MetricsCacheManager.metrics_update_state_cache_for_alert_group(
                 integration_id, organization_id, service_name, old_state, new_state
             )
+            if started_at:
+                # the same state diff keeps alert group stats counters up to date
+                update_alert_group_stats_counters(
+                    organization_id, integration_id, started_at, old_state, new_state, changed_at
+                )
@@ -8,10 +8,22 @@ from prometheus_client import CollectorRegistry
 from prometheus_client.metrics_core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily, Metric
 
 from apps.alerts.constants import AlertGroupState
+from apps.auth_token.verified_token_cache import (
+    AUTH_TOKEN_CACHE_RESULTS,
+    AUTH_TOKEN_VALIDATION_LATENCY_BUCKETS,
+    get_latency_bucket_stat_name,
+    get_latency_sum_stat_name,
+    get_stats_cache_key,
+)
 from apps.metrics_exporter.constants import (
     ALERT_GROUPS_RESPONSE_TIME,
     ALERT_GROUPS_TOTAL,
+    AUTH_TOKEN_CACHE_LOOKUPS,
+    AUTH_TOKEN_VALIDATION_DURATION,
+    METRICS_RESPONSE_TIME_BUCKETS,
     SERVICE_LABEL,
+    SLACK_API_CALL_WAIT_TIME,
+    SLACK_API_CALLS_QUEUED,
     USER_WAS_NOTIFIED_OF_ALERT_GROUPS,
     AlertGroupsResponseTimeMetricsDict,
     AlertGroupsTotalMetricsDict,
@@ -25,8 +37,19 @@ from apps.metrics_exporter.helpers import (
     get_metric_user_was_notified_of_alert_groups_key,
     get_metrics_cache_timer_key,
     get_organization_ids,
+    get_response_time_histogram_totals,
 )
 from apps.metrics_exporter.tasks import start_calculate_and_cache_metrics, start_recalculation_for_new_metric
+from apps.slack.rate_scheduler import (
+    SLACK_RATE_SCHEDULER_WAIT_BUCKETS,
+    SLACK_RATE_SCHEDULER_WINDOW_SECONDS,
+    SlackAPIPriority,
+    get_current_window,
+    get_queue_depth_stat_name,
+    get_stats,
+    get_wait_bucket_stat_name,
+    get_wait_sum_stat_name,
+)
 from settings.base import (
     METRIC_ALERT_GROUPS_RESPONSE_TIME_NAME,
     METRIC_ALERT_GROUPS_TOTAL_NAME,
@@ -51,7 +74,7 @@ class ApplicationMetricsCollector:
     GetMetricFunc = typing.Callable[[set], typing.Tuple[Metric, set]]
 
     def __init__(self):
-        self._buckets = (60, 300, 600, 3600, "+Inf")
+        self._buckets = METRICS_RESPONSE_TIME_BUCKETS + ("+Inf",)
         self._stack_labels = [
             "org_id",
             "slug",
@@ -153,37 +176,31 @@ class ApplicationMetricsCollector:
         )
         for org_key, ag_response_time in org_ag_response_times.items():
             for _, integration_data in ag_response_time.items():
-                if "services" not in integration_data:
+                if "services" not in integration_data or not all(
+                    isinstance(histogram, dict) for histogram in integration_data["services"].values()
+                ):
                     logger.warning(f"Deleting stale metrics cache for {org_key}")
                     cache.delete(org_key)
                     break
                 labels_values: typing.List[str] = self._get_labels_from_integration_data(integration_data)
-                for service_name, response_time in integration_data["services"].items():
-                    if not response_time:
+                for service_name, response_time_histogram in integration_data["services"].items():
+                    totals = get_response_time_histogram_totals(response_time_histogram)
+                    if not totals["count"]:
                         continue
-                    buckets_values, sum_value = self._get_buckets_with_sum(response_time)
-                    buckets: list = sorted(list(buckets_values.items()), key=lambda x: float(x[0]))
+                    buckets = [
+                        (str(bucket), value) for bucket, value in zip(METRICS_RESPONSE_TIME_BUCKETS, totals["buckets"])
+                    ]
+                    buckets.append(("+Inf", totals["count"]))
                     alert_groups_response_time_seconds.add_metric(
                         labels_values + [service_name],
                         buckets=buckets,
-                        sum_value=sum_value,
+                        sum_value=totals["sum"],
                     )
             org_id_from_key = RE_ALERT_GROUPS_RESPONSE_TIME.match(org_key).groups()[0]
             processed_org_ids.add(int(org_id_from_key))
         missing_org_ids = org_ids - processed_org_ids
         return alert_groups_response_time_seconds, missing_org_ids
 
-    def _get_buckets_with_sum(self, values: typing.List[int]) -> typing.Tuple[typing.Dict[str, float], int]:
-        """Put values in correct buckets and count values sum"""
-        buckets_values = {str(key): 0 for key in self._buckets}
-        sum_value = 0
-        for value in values:
-            for bucket in self._buckets:
-                if value <= float(bucket):
-                    buckets_values[str(bucket)] += 1.0
-            sum_value += value
-        return buckets_values, sum_value
-
     def _get_labels_from_integration_data(
         self, integration_data: AlertGroupsTotalMetricsDict | AlertGroupsResponseTimeMetricsDict
     ) -> typing.List[str]:
@@ -234,4 +251,86 @@ class ApplicationMetricsCollector:
             start_calculate_and_cache_metrics.apply_async((recalculate_orgs,))
 
 
+class AuthTokenCacheMetricsCollector:
+    """
+    Collects hit/miss counters and validation latency of the verified auth token cache.
+    Stats are accumulated by every process and flushed to the cache periodically (see _VerifiedTokenCache).
+    """
+
+    def collect(self):
+        bucket_names = AUTH_TOKEN_VALIDATION_LATENCY_BUCKETS + ("+Inf",)
+        stat_names = []
+        for result in AUTH_TOKEN_CACHE_RESULTS:
+            stat_names.append(result)
+            stat_names.append(get_latency_sum_stat_name(result))
+            stat_names.extend(get_latency_bucket_stat_name(result, bucket) for bucket in bucket_names)
+        cached_stats = cache.get_many([get_stats_cache_key(name) for name in stat_names])
+        stats = {name: cached_stats.get(get_stats_cache_key(name), 0) for name in stat_names}
+
+        lookups = CounterMetricFamily(AUTH_TOKEN_CACHE_LOOKUPS, "Verified auth token cache lookups", labels=["result"])
+        validation_duration = HistogramMetricFamily(
+            AUTH_TOKEN_VALIDATION_DURATION, "Auth token validation duration (seconds)", labels=["result"]
+        )
+        for result in AUTH_TOKEN_CACHE_RESULTS:
+            lookups.add_metric([result], stats[result])
+            buckets = []
+            cumulative_count = 0
+            for bucket in bucket_names:
+                cumulative_count += stats[get_latency_bucket_stat_name(result, bucket)]
+                buckets.append((str(bucket), cumulative_count))
+            validation_duration.add_metric(
+                [result], buckets=buckets, sum_value=stats[get_latency_sum_stat_name(result)] / 1_000_000
+            )
+
+        yield lookups
+        yield validation_duration
+
+
+class SlackRateSchedulerMetricsCollector:
+    """
+    Collects number of Slack API calls deferred by the rate scheduler until the next windows and their wait time.
+    Stats are kept in the cache by every process (see SlackRateScheduler).
+    """
+
+    # calls are deferred by at most the Retry-After of a Slack rate limit error, which is usually below 5 minutes
+    QUEUED_WINDOWS = 300 // SLACK_RATE_SCHEDULER_WINDOW_SECONDS + 1
+
+    def collect(self):
+        current_window = get_current_window()
+        bucket_names = SLACK_RATE_SCHEDULER_WAIT_BUCKETS + ("+Inf",)
+        queue_stat_names = {
+            priority: [
+                get_queue_depth_stat_name(priority, current_window + i) for i in range(1, self.QUEUED_WINDOWS + 1)
+            ]
+            for priority in SlackAPIPriority
+        }
+        stat_names = []
+        for priority in SlackAPIPriority:
+            stat_names.extend(queue_stat_names[priority])
+            stat_names.append(get_wait_sum_stat_name(priority))
+            stat_names.extend(get_wait_bucket_stat_name(priority, bucket) for bucket in bucket_names)
+        stats = get_stats(stat_names)
+
+        queued = GaugeMetricFamily(
+            SLACK_API_CALLS_QUEUED, "Slack API calls deferred by the rate scheduler", labels=["priority"]
+        )
+        wait_time = HistogramMetricFamily(
+            SLACK_API_CALL_WAIT_TIME, "Wait time of Slack API calls deferred by the rate scheduler", labels=["priority"]
+        )
+        for priority in SlackAPIPriority:
+            label = priority.name.lower()
+            queued.add_metric([label], sum(stats[name] for name in queue_stat_names[priority]))
+            buckets = []
+            cumulative_count = 0
+            for bucket in bucket_names:
+                cumulative_count += stats[get_wait_bucket_stat_name(priority, bucket)]
+                buckets.append((str(bucket), cumulative_count))
+            wait_time.add_metric([label], buckets=buckets, sum_value=stats[get_wait_sum_stat_name(priority)])
+
+        yield queued
+        yield wait_time
+
+
 application_metrics_registry.register(ApplicationMetricsCollector())
+application_metrics_registry.register(AuthTokenCacheMetricsCollector())
+application_metrics_registry.register(SlackRateSchedulerMetricsCollector())
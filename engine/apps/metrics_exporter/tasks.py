@@ -1,13 +1,17 @@
+import datetime
+import itertools
 import typing
 
 from django.conf import settings
 from django.core.cache import cache
-from django.db.models import Count, Q
+from django.db.models import Count, F, Q, Sum, Value
+from django.db.models.functions import TruncDate
 
 from apps.alerts.constants import AlertGroupState
 from apps.metrics_exporter.constants import (
     METRICS_ORGANIZATIONS_IDS,
     METRICS_ORGANIZATIONS_IDS_CACHE_TIMEOUT,
+    METRICS_RESPONSE_TIME_BUCKETS,
     NO_SERVICE_VALUE,
     SERVICE_LABEL,
     AlertGroupsResponseTimeMetricsDict,
@@ -26,6 +30,7 @@ from apps.metrics_exporter.helpers import (
     get_organization_ids,
     get_organization_ids_from_db,
     get_response_time_period,
+    get_response_time_slot,
     is_allowed_to_start_metrics_calculation,
     metrics_update_user_cache,
 )
@@ -91,8 +96,9 @@ def calculate_and_cache_metrics(organization_id, force=False):
     if not organization:
         return
 
+    db = get_random_readonly_database_key_if_present_otherwise_default()
     integrations = (
-        AlertReceiveChannel.objects.using(get_random_readonly_database_key_if_present_otherwise_default())
+        AlertReceiveChannel.objects.using(db)
         .filter(~Q(integration=AlertReceiveChannel.INTEGRATION_MAINTENANCE) & Q(organization_id=organization_id))
         .select_related("team")
     )
@@ -114,80 +120,65 @@ def calculate_and_cache_metrics(organization_id, force=False):
     }
 
     for integration in integrations:
-        metric_alert_group_total_data = {
+        integration_data = {
             "integration_name": integration.emojized_verbal_name,
             "team_name": integration.team_name,
             "team_id": integration.team_id_or_no_team,
             "org_id": instance_org_id,
             "slug": instance_slug,
             "id": instance_id,
-            "services": {
-                NO_SERVICE_VALUE: get_default_states_dict(),
-            },
         }
-        # calculate states
-        for state, alert_group_filter in states.items():
-            # count alert groups with `service_name` label group by label value
-            alert_group_count_by_service = (
-                integration.alert_groups.filter(
-                    alert_group_filter,
-                    labels__organization=organization,
-                    labels__key_name=SERVICE_LABEL,
-                )
-                .values("labels__value_name")
-                .annotate(count=Count("id"))
-            )
-
-            for value in alert_group_count_by_service:
-                metric_alert_group_total_data["services"].setdefault(
-                    value["labels__value_name"],
-                    get_default_states_dict(),
-                )[state] += value["count"]
-            # count alert groups without `service_name` label
-            alert_groups_count_without_service = integration.alert_groups.filter(
-                alert_group_filter,
-                ~Q(labels__key_name=SERVICE_LABEL),
-            ).count()
-            metric_alert_group_total_data["services"][NO_SERVICE_VALUE][state] += alert_groups_count_without_service
-        metric_alert_group_total[integration.id] = metric_alert_group_total_data
-
-        # calculate response time metric
-        metric_response_time_data = {
-            "integration_name": integration.emojized_verbal_name,
-            "team_name": integration.team_name,
-            "team_id": integration.team_id_or_no_team,
-            "org_id": instance_org_id,
-            "slug": instance_slug,
-            "id": instance_id,
-            "services": {NO_SERVICE_VALUE: []},
+        metric_alert_group_total[integration.id] = integration_data | {
+            "services": {NO_SERVICE_VALUE: get_default_states_dict()}
+        }
+        metric_alert_group_response_time[integration.id] = integration_data | {"services": {NO_SERVICE_VALUE: {}}}
+
+    # Metrics for all integrations are calculated with a few grouped queries: alert groups with `service_name` label
+    # are grouped by (integration, label value), alert groups without `service_name` label are grouped by integration
+    alert_groups = AlertGroup.objects.using(db).filter(channel_id__in=list(metric_alert_group_total))
+    alert_groups_with_service = alert_groups.filter(labels__organization=organization, labels__key_name=SERVICE_LABEL)
+    alert_groups_without_service = alert_groups.filter(~Q(labels__key_name=SERVICE_LABEL))
+    state_counts = {state: Count("id", filter=alert_group_filter) for state, alert_group_filter in states.items()}
+
+    # calculate states
+    for row in alert_groups_with_service.values("channel_id", "labels__value_name").annotate(**state_counts):
+        services = metric_alert_group_total[row["channel_id"]]["services"]
+        service_states = services.setdefault(row["labels__value_name"], get_default_states_dict())
+        for state in states:
+            service_states[state] += row[state]
+
+    for row in alert_groups_without_service.values("channel_id").annotate(**state_counts):
+        service_states = metric_alert_group_total[row["channel_id"]]["services"][NO_SERVICE_VALUE]
+        for state in states:
+            service_states[state] += row[state]
+
+    # calculate response time metric, histogram buckets are counted by DB per (integration, service, day)
+    response_time_filter = Q(started_at__gte=response_time_period, response_time__isnull=False)
+    response_time_aggregates = {
+        "count": Count("id"),
+        "sum": Sum("response_time"),
+        **{
+            f"le_{bucket}": Count("id", filter=Q(response_time__lte=datetime.timedelta(seconds=bucket)))
+            for bucket in METRICS_RESPONSE_TIME_BUCKETS
+        },
+    }
+    response_time_rows = itertools.chain(
+        alert_groups_with_service.filter(response_time_filter)
+        .annotate(service_name=F("labels__value_name"), day=TruncDate("started_at"))
+        .values("channel_id", "service_name", "day")
+        .annotate(**response_time_aggregates),
+        alert_groups_without_service.filter(response_time_filter)
+        .annotate(service_name=Value(NO_SERVICE_VALUE), day=TruncDate("started_at"))
+        .values("channel_id", "service_name", "day")
+        .annotate(**response_time_aggregates),
+    )
+    for row in response_time_rows:
+        services = metric_alert_group_response_time[row["channel_id"]]["services"]
+        services.setdefault(row["service_name"], {})[get_response_time_slot(row["day"])] = {
+            "buckets": [row[f"le_{bucket}"] for bucket in METRICS_RESPONSE_TIME_BUCKETS],
+            "sum": row["sum"].total_seconds(),
+            "count": row["count"],
         }
-
-        # filter response time by services
-        response_time_by_service = integration.alert_groups.filter(
-            started_at__gte=response_time_period,
-            response_time__isnull=False,
-            labels__organization=organization,
-            labels__key_name=SERVICE_LABEL,
-        ).values_list("id", "labels__value_name", "response_time")
-        for _, service_name, response_time in response_time_by_service:
-            metric_response_time_data["services"].setdefault(service_name, [])
-            metric_response_time_data["services"][service_name].append(response_time.total_seconds())
-
-        no_service_response_time = (
-            integration.alert_groups.filter(
-                started_at__gte=response_time_period,
-                response_time__isnull=False,
-            )
-            .exclude(id__in=[i[0] for i in response_time_by_service])
-            .values_list("response_time", flat=True)
-        )
-
-        no_service_response_time_seconds = [
-            int(response_time.total_seconds()) for response_time in no_service_response_time
-        ]
-        metric_response_time_data["services"][NO_SERVICE_VALUE] = no_service_response_time_seconds
-
-        metric_alert_group_response_time[integration.id] = metric_response_time_data
 
     metric_alert_groups_total_key = get_metric_alert_groups_total_key(organization_id)
     metric_alert_groups_response_time_key = get_metric_alert_groups_response_time_key(organization_id)
@@ -261,7 +252,7 @@ def calculate_and_cache_user_was_notified_metric(organization_id):
 @shared_dedicated_queue_retry_task(
     autoretry_for=(Exception,), retry_backoff=True, max_retries=1 if settings.DEBUG else 10
 )
-def update_metrics_for_alert_group(alert_group_id, organization_id, previous_state, new_state):
+def update_metrics_for_alert_group(alert_group_id, organization_id, previous_state, new_state, changed_at=None):
     from apps.alerts.models import AlertGroup
 
     alert_group = AlertGroup.objects.get(pk=alert_group_id)
@@ -279,6 +270,7 @@ def update_metrics_for_alert_group(alert_group_id, organization_id, previous_sta
         response_time=updated_response_time,
         started_at=alert_group.started_at,
         service_name=service_name,
+        changed_at=changed_at,
     )
 
 
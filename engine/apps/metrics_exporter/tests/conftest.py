@@ -1,5 +1,6 @@
 import pytest
 from django.core.cache import cache
+from django.utils import timezone
 
 from apps.metrics_exporter.constants import (
     ALERT_GROUPS_RESPONSE_TIME,
@@ -8,9 +9,11 @@ from apps.metrics_exporter.constants import (
     USER_WAS_NOTIFIED_OF_ALERT_GROUPS,
 )
 from apps.metrics_exporter.helpers import (
+    add_response_time_to_histogram,
     get_metric_alert_groups_response_time_key,
     get_metric_alert_groups_total_key,
     get_metric_user_was_notified_of_alert_groups_key,
+    get_response_time_slot,
 )
 
 METRICS_TEST_INTEGRATION_NAME = "Test integration"
@@ -21,6 +24,14 @@ METRICS_TEST_USER_USERNAME = "Alex"
 METRICS_TEST_SERVICE_NAME = "test_service"
 
 
+def make_response_time_histogram(*response_times_seconds, started_at=None):
+    histogram = {}
+    slot = get_response_time_slot(started_at or timezone.now())
+    for response_time_seconds in response_times_seconds:
+        add_response_time_to_histogram(histogram, slot, response_time_seconds)
+    return histogram
+
+
 @pytest.fixture()
 def mock_cache_get_metrics_for_collector(monkeypatch):
     def _mock_cache_get(key, *args, **kwargs):
@@ -79,7 +90,10 @@ def mock_cache_get_metrics_for_collector(monkeypatch):
                     "org_id": 1,
                     "slug": "Test stack",
                     "id": 1,
-                    "services": {NO_SERVICE_VALUE: [2, 10, 200, 650], METRICS_TEST_SERVICE_NAME: [4, 12, 20]},
+                    "services": {
+                        NO_SERVICE_VALUE: make_response_time_histogram(2, 10, 200, 650),
+                        METRICS_TEST_SERVICE_NAME: make_response_time_histogram(4, 12, 20),
+                    },
                 },
                 2: {
                     "integration_name": "Empty integration",
@@ -90,7 +104,7 @@ def mock_cache_get_metrics_for_collector(monkeypatch):
                     "id": 2,
                     "services": {
                         # if there are no response times available, this integration will be ignored
-                        NO_SERVICE_VALUE: [],
+                        NO_SERVICE_VALUE: {},
                     },
                 },
             },
@@ -198,7 +212,7 @@ def make_metrics_cache_params(monkeypatch):
                         "slug": METRICS_TEST_INSTANCE_SLUG,
                         "id": METRICS_TEST_INSTANCE_ID,
                         "services": {
-                            NO_SERVICE_VALUE: [],
+                            NO_SERVICE_VALUE: {},
                         },
                     }
                 },
@@ -111,7 +111,7 @@ def test_calculate_and_cache_metrics_task(
             "org_id": organization.org_id,
             "slug": organization.stack_slug,
             "id": organization.stack_id,
-            "services": {NO_SERVICE_VALUE: [], "test": []},
+            "services": {NO_SERVICE_VALUE: {}, "test": {}},
         },
         alert_receive_channel_2.id: {
             "integration_name": alert_receive_channel_2.verbal_name,
@@ -120,7 +120,7 @@ def test_calculate_and_cache_metrics_task(
             "org_id": organization.org_id,
             "slug": organization.stack_slug,
             "id": organization.stack_id,
-            "services": {NO_SERVICE_VALUE: [], "test": []},
+            "services": {NO_SERVICE_VALUE: {}, "test": {}},
         },
     }
 
@@ -137,7 +137,8 @@ def test_calculate_and_cache_metrics_task(
         metric_alert_groups_response_time_values = args[1].args
         assert metric_alert_groups_response_time_values[0] == metric_alert_groups_response_time_key
         for integration_id, values in metric_alert_groups_response_time_values[1].items():
-            assert len(values["services"][NO_SERVICE_VALUE]) == METRICS_RESPONSE_TIME_LEN
+            histogram = values["services"][NO_SERVICE_VALUE]
+            assert sum(histogram_slot["count"] for histogram_slot in histogram.values()) == METRICS_RESPONSE_TIME_LEN
             # set response time to expected result because it is calculated on fly
             expected_result_metric_alert_groups_response_time[integration_id]["services"][NO_SERVICE_VALUE] = values[
                 "services"
@@ -148,6 +149,42 @@ def test_calculate_and_cache_metrics_task(
         assert metric_alert_groups_response_time_values[1] == expected_result_metric_alert_groups_response_time
 
 
+@patch("apps.alerts.models.alert_group.update_metrics_for_alert_group.apply_async")
+@pytest.mark.django_db
+def test_calculate_and_cache_metrics_task_number_of_queries(
+    mocked_update_state_cache,
+    make_organization,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert_group_label_association,
+    django_assert_num_queries,
+):
+    organization = make_organization()
+    for i in range(5):
+        alert_receive_channel = make_alert_receive_channel(organization)
+        alert_group = make_alert_group(alert_receive_channel)
+        alert_group.acknowledge()
+        alert_group_with_service = make_alert_group(alert_receive_channel)
+        make_alert_group_label_association(
+            organization, alert_group_with_service, key_name=SERVICE_LABEL, value_name=f"service-{i}"
+        )
+
+    # organization, integrations, 2 queries for states and 2 queries for response time, regardless of number of
+    # integrations and services
+    with patch("apps.metrics_exporter.tasks.cache.set") as mock_cache_set:
+        with django_assert_num_queries(6):
+            calculate_and_cache_metrics(organization.id)
+
+    metric_alert_group_total = mock_cache_set.call_args_list[0].args[1]
+    metric_alert_group_response_time = mock_cache_set.call_args_list[1].args[1]
+    for i, integration_data in enumerate(metric_alert_group_total.values()):
+        assert integration_data["services"][NO_SERVICE_VALUE]["acknowledged"] == 1
+        assert integration_data["services"][f"service-{i}"]["firing"] == 1
+    for integration_data in metric_alert_group_response_time.values():
+        (histogram_slot,) = integration_data["services"][NO_SERVICE_VALUE].values()
+        assert histogram_slot["count"] == 1
+
+
 @patch("apps.alerts.models.alert_group.update_metrics_for_alert_group.apply_async")
 @pytest.mark.django_db
 def test_calculate_and_cache_user_was_notified_metric_task(
@@ -6,15 +6,26 @@ from django.test import override_settings
 from prometheus_client import CollectorRegistry, generate_latest
 
 from apps.alerts.constants import AlertGroupState
+from apps.auth_token.models import ApiAuthToken
+from apps.auth_token.verified_token_cache import verified_token_cache
 from apps.metrics_exporter.constants import (
     ALERT_GROUPS_RESPONSE_TIME,
     ALERT_GROUPS_TOTAL,
+    AUTH_TOKEN_CACHE_LOOKUPS,
+    AUTH_TOKEN_VALIDATION_DURATION,
     NO_SERVICE_VALUE,
+    SLACK_API_CALL_WAIT_TIME,
+    SLACK_API_CALLS_QUEUED,
     USER_WAS_NOTIFIED_OF_ALERT_GROUPS,
 )
 from apps.metrics_exporter.helpers import get_metric_alert_groups_response_time_key, get_metric_alert_groups_total_key
-from apps.metrics_exporter.metrics_collectors import ApplicationMetricsCollector
+from apps.metrics_exporter.metrics_collectors import (
+    ApplicationMetricsCollector,
+    AuthTokenCacheMetricsCollector,
+    SlackRateSchedulerMetricsCollector,
+)
 from apps.metrics_exporter.tests.conftest import METRICS_TEST_SERVICE_NAME
+from apps.slack.rate_scheduler import slack_rate_scheduler
 from settings.base import (
     METRIC_ALERT_GROUPS_RESPONSE_TIME_NAME,
     METRIC_ALERT_GROUPS_TOTAL_NAME,
@@ -152,3 +163,48 @@ def test_application_metrics_collector_with_old_metrics_without_services(
     # Since there is no recalculation timer for test org in cache, start_calculate_and_cache_metrics must be called
     assert mocked_start_calculate_and_cache_metrics.called
     test_metrics_registry.unregister(collector)
+
+
+@pytest.mark.django_db
+def test_auth_token_cache_metrics_collector(make_organization_and_user, make_public_api_token):
+    organization, user = make_organization_and_user()
+    _, token_string = make_public_api_token(user, organization)
+    for _ in range(3):
+        verified_token_cache.validate_token_string(ApiAuthToken, token_string)
+    verified_token_cache.flush_stats()
+
+    test_metrics_registry = CollectorRegistry()
+    test_metrics_registry.register(AuthTokenCacheMetricsCollector())
+    metrics = {metric.name: metric for metric in test_metrics_registry.collect()}
+
+    lookups = {sample.labels["result"]: sample.value for sample in metrics[AUTH_TOKEN_CACHE_LOOKUPS].samples}
+    assert lookups == {"hit": 2, "miss": 1}
+    validation_counts = {
+        sample.labels["result"]: sample.value
+        for sample in metrics[AUTH_TOKEN_VALIDATION_DURATION].samples
+        if sample.name.endswith("_count")
+    }
+    assert validation_counts == {"hit": 2, "miss": 1}
+
+
+@patch("apps.slack.rate_scheduler.time")
+def test_slack_rate_scheduler_metrics_collector(mock_time):
+    # keep all calls within the same rate window
+    mock_time.time.return_value = 1_700_000_000.0
+    # chat.update calls can use 30 out of 50 calls per minute, alert posts are not limited by updates
+    for _ in range(32):
+        slack_rate_scheduler.acquire(1, "chat.update")
+    slack_rate_scheduler.acquire(1, "chat.postMessage", channel="C1")
+
+    test_metrics_registry = CollectorRegistry()
+    test_metrics_registry.register(SlackRateSchedulerMetricsCollector())
+    metrics = {metric.name: metric for metric in test_metrics_registry.collect()}
+
+    queued = {sample.labels["priority"]: sample.value for sample in metrics[SLACK_API_CALLS_QUEUED].samples}
+    assert queued == {"low": 2, "normal": 0, "high": 0}
+    wait_counts = {
+        sample.labels["priority"]: sample.value
+        for sample in metrics[SLACK_API_CALL_WAIT_TIME].samples
+        if sample.name.endswith("_count")
+    }
+    assert wait_counts == {"low": 2, "normal": 0, "high": 0}
@@ -1,8 +1,10 @@
+import datetime
 from unittest.mock import patch
 
 import pytest
 from django.core.cache import cache
 from django.test import override_settings
+from django.utils import timezone
 
 from apps.alerts.signals import alert_group_created_signal
 from apps.alerts.tasks import notify_user_task
@@ -13,6 +15,8 @@ from apps.metrics_exporter.helpers import (
     get_metric_alert_groups_response_time_key,
     get_metric_alert_groups_total_key,
     get_metric_user_was_notified_of_alert_groups_key,
+    get_response_time_histogram_totals,
+    merge_response_time_histograms,
     metrics_add_integrations_to_cache,
     metrics_bulk_update_team_label_cache,
 )
@@ -24,6 +28,7 @@ from apps.metrics_exporter.tests.conftest import (
     METRICS_TEST_ORG_ID,
     METRICS_TEST_SERVICE_NAME,
     METRICS_TEST_USER_USERNAME,
+    make_response_time_histogram,
 )
 
 
@@ -213,7 +218,7 @@ def test_update_metric_alert_groups_response_time_cache_on_action(
             "org_id": organization.org_id,
             "slug": organization.stack_slug,
             "id": organization.stack_id,
-            "services": {NO_SERVICE_VALUE: []},
+            "services": {NO_SERVICE_VALUE: {}},
         }
     }
 
@@ -228,8 +233,8 @@ def test_update_metric_alert_groups_response_time_cache_on_action(
                 expected_result_metric_alert_groups_response_time[alert_receive_channel.id]["services"][
                     service_name
                 ] = response_time_values
-                # response time values len always will be 1 here since cache is mocked and refreshed on every call
-                assert len(response_time_values) == 1
+                # response time values count always will be 1 here since cache is mocked and refreshed on every call
+                assert sum(histogram_slot["count"] for histogram_slot in response_time_values.values()) == 1
                 assert called_arg.args[1] == expected_result_metric_alert_groups_response_time
                 return idx + 1
         raise AssertionError
@@ -277,7 +282,7 @@ def test_update_metric_alert_groups_response_time_cache_on_action(
         arg_idx = get_called_arg_index_and_compare_results()
 
         # create alert group with service label and check metric cache is updated properly
-        expected_result_metric_alert_groups_response_time[alert_receive_channel.id]["services"][NO_SERVICE_VALUE] = []
+        expected_result_metric_alert_groups_response_time[alert_receive_channel.id]["services"][NO_SERVICE_VALUE] = {}
 
         alert_group_with_service = make_alert_group(alert_receive_channel)
         make_alert(alert_group=alert_group_with_service, raw_request_data={})
@@ -364,7 +369,7 @@ def test_update_metrics_cache_on_update_integration(
                 "org_id": organization.org_id,
                 "slug": organization.stack_slug,
                 "id": organization.stack_id,
-                "services": {NO_SERVICE_VALUE: []},
+                "services": {NO_SERVICE_VALUE: {}},
             }
         }
 
@@ -481,7 +486,7 @@ def test_update_metrics_cache_on_update_team(
             "org_id": organization.org_id,
             "slug": organization.stack_slug,
             "id": organization.stack_id,
-            "services": {NO_SERVICE_VALUE: []},
+            "services": {NO_SERVICE_VALUE: {}},
         }
     }
 
@@ -714,7 +719,7 @@ def test_metrics_add_integrations_to_cache(make_organization, make_alert_receive
 
     def _expected_alert_groups_response_time(alert_receive_channel, response_time=None):
         if response_time is None:
-            response_time = []
+            response_time = {}
 
         return {
             "integration_name": alert_receive_channel.emojized_verbal_name,
@@ -729,13 +734,18 @@ def test_metrics_add_integrations_to_cache(make_organization, make_alert_receive
         }
 
     # clear cache, add some data
+    response_time_histogram = make_response_time_histogram(12)
     cache.set(
         get_metric_alert_groups_total_key(organization.id),
         {alert_receive_channel2.id: _expected_alert_groups_total(alert_receive_channel2, firing=42)},
     )
     cache.set(
         get_metric_alert_groups_response_time_key(organization.id),
-        {alert_receive_channel2.id: _expected_alert_groups_response_time(alert_receive_channel2, response_time=[12])},
+        {
+            alert_receive_channel2.id: _expected_alert_groups_response_time(
+                alert_receive_channel2, response_time=response_time_histogram
+            )
+        },
     )
 
     # add integrations to cache
@@ -750,5 +760,29 @@ def test_metrics_add_integrations_to_cache(make_organization, make_alert_receive
     # check alert groups response time
     assert cache.get(get_metric_alert_groups_response_time_key(organization.id)) == {
         alert_receive_channel1.id: _expected_alert_groups_response_time(alert_receive_channel1),
-        alert_receive_channel2.id: _expected_alert_groups_response_time(alert_receive_channel2, response_time=[12]),
+        alert_receive_channel2.id: _expected_alert_groups_response_time(
+            alert_receive_channel2, response_time=response_time_histogram
+        ),
+    }
+
+
+def test_response_time_histogram_sliding_window():
+    now = timezone.now()
+    histogram = make_response_time_histogram(30, 400, started_at=now - datetime.timedelta(days=1))
+    expired_histogram = make_response_time_histogram(30, started_at=now - datetime.timedelta(days=10))
+
+    # expired slot is kept until the histogram is updated, but is not counted
+    assert get_response_time_histogram_totals(histogram | expired_histogram) == {
+        "buckets": [1, 1, 2, 2],
+        "sum": 430,
+        "count": 2,
+    }
+
+    merge_response_time_histograms(histogram, make_response_time_histogram(4000))
+    merge_response_time_histograms(histogram, expired_histogram)
+    assert len(histogram) == 2
+    assert get_response_time_histogram_totals(histogram) == {
+        "buckets": [1, 1, 2, 2],
+        "sum": 4430,
+        "count": 3,
     }
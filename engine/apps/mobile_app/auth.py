@@ -5,6 +5,7 @@ from rest_framework import exceptions
 from rest_framework.authentication import BaseAuthentication, get_authorization_header
 
 from apps.auth_token.exceptions import InvalidToken
+from apps.auth_token.verified_token_cache import verified_token_cache
 from apps.user_management.models import User
 
 from .models import MobileAppAuthToken, MobileAppVerificationToken
@@ -39,7 +40,7 @@ class MobileAppAuthTokenAuthentication(BaseAuthentication):
 
     def authenticate_credentials(self, token_string: str) -> Tuple[Optional[User], Optional[MobileAppAuthToken]]:
         try:
-            auth_token = self.model.validate_token_string(token_string)
+            auth_token = verified_token_cache.validate_token_string(self.model, token_string)
         except InvalidToken:
             return None, None
 
@@ -251,5 +251,13 @@ def conditionally_send_going_oncall_push_notifications_for_schedule(schedule_pk)
 
 @shared_dedicated_queue_retry_task()
 def conditionally_send_going_oncall_push_notifications_for_all_schedules() -> None:
-    for schedule in OnCallSchedule.objects.filter(organization__deleted_at__isnull=True):
-        conditionally_send_going_oncall_push_notifications_for_schedule.apply_async((schedule.pk,))
+    from apps.schedules.shift_boundary_timer import get_armed_schedule_pks
+
+    schedule_pks = list(
+        OnCallSchedule.objects.filter(organization__deleted_at__isnull=True).values_list("pk", flat=True)
+    )
+    # schedules with an armed shift boundary timer are notified about at the exact time by the timer
+    armed_schedule_pks = get_armed_schedule_pks(schedule_pks)
+    for schedule_pk in schedule_pks:
+        if schedule_pk not in armed_schedule_pks:
+            conditionally_send_going_oncall_push_notifications_for_schedule.apply_async((schedule_pk,))
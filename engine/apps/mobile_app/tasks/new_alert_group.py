@@ -5,6 +5,7 @@ import typing
 from celery.utils.log import get_task_logger
 from firebase_admin.messaging import APNSPayload, Aps, ApsAlert, CriticalSound, Message
 
+from apps.alerts.incident_appearance.templaters import alert_rendering_pass
 from apps.alerts.models import AlertGroup
 from apps.mobile_app.alert_rendering import get_push_notification_subtitle, get_push_notification_title
 from apps.mobile_app.types import FCMMessageData, MessageType, Platform
@@ -26,8 +27,14 @@ def _get_fcm_message(alert_group: AlertGroup, user: User, device_to_notify: "FCM
 
     thread_id = f"{alert_group.channel.organization.public_primary_key}:{alert_group.public_primary_key}"
 
-    alert_title = get_push_notification_title(alert_group, critical)
-    alert_subtitle = get_push_notification_subtitle(alert_group)
+    # title and subtitle are rendered by separate templaters, share rendered web templates between them
+    with alert_rendering_pass() as rendering_pass:
+        alert_title = get_push_notification_title(alert_group, critical)
+        alert_subtitle = get_push_notification_subtitle(alert_group)
+    logger.debug(
+        f"Alert group {alert_group.pk} push notification rendering pass: renders={rendering_pass.renders} "
+        f"renders_saved={rendering_pass.renders_saved}"
+    )
 
     mobile_app_user_settings, _ = MobileAppUserSettings.objects.get_or_create(user=user)
 
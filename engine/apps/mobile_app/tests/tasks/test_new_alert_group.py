@@ -1,8 +1,10 @@
+import re
 from unittest.mock import patch
 
 import pytest
 
 from apps.base.models import UserNotificationPolicy, UserNotificationPolicyLogRecord
+from apps.mobile_app.backend import MobileAppBackend
 from apps.mobile_app.models import FCMDevice, MobileAppUserSettings
 from apps.mobile_app.tasks.new_alert_group import _get_fcm_message, notify_user_about_new_alert_group
 
@@ -217,3 +219,35 @@ def test_fcm_message_user_settings_critical_override_dnd_disabled(
     apns_sound = message.apns.payload.aps.sound
     assert apns_sound.critical is False
     assert message.apns.payload.aps.custom_data["interruption-level"] == "time-sensitive"
+
+
+@patch(
+    "apps.base.messaging._messaging_backends", return_value={"MOBILE_APP": MobileAppBackend(notification_channel_id=5)}
+)
+@pytest.mark.django_db
+def test_fcm_message_shares_rendering(
+    _mock_messaging_backends,
+    make_organization_and_user,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert,
+    caplog,
+):
+    organization, user = make_organization_and_user()
+    device = FCMDevice.objects.create(user=user, registration_id="test_device_id")
+
+    alert_receive_channel = make_alert_receive_channel(
+        organization=organization,
+        web_title_template="web: {{ payload.title }}",
+        messaging_backends_templates={"MOBILE_APP": {"title": "{{ web_title }}", "message": None}},
+    )
+    alert_group = make_alert_group(alert_receive_channel)
+    make_alert(alert_group=alert_group, raw_request_data={"title": "title"})
+
+    message = _get_fcm_message(alert_group, user, device, critical=False)
+
+    assert message.data["title"] == "web: title"
+    # title and subtitle are rendered by separate templaters, web templates are rendered once for both
+    rendering_pass_log = next(r.message for r in caplog.records if "push notification rendering pass" in r.message)
+    renders, renders_saved = map(int, re.search(r"renders=(\d+) renders_saved=(\d+)", rendering_pass_log).groups())
+    assert renders_saved > renders
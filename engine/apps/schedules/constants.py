@@ -29,6 +29,18 @@ EXPORT_WINDOW_DAYS_BEFORE = 15
 
 SCHEDULE_ONCALL_CACHE_KEY_PREFIX = "schedule_oncall_users_"
 SCHEDULE_ONCALL_CACHE_TTL = 15 * 60  # 15 minutes in seconds
+SCHEDULE_FINAL_EVENTS_INDEX_CACHE_KEY_PREFIX = "schedule_final_events_index_"
+# final schedules are refreshed daily, keep the index a bit longer in case the refresh is delayed
+SCHEDULE_FINAL_EVENTS_INDEX_CACHE_TTL = 2 * 24 * 60 * 60  # 2 days in seconds
+ORGANIZATION_ONCALL_NOW_CACHE_KEY_PREFIX = "organization_oncall_now_"
+ORGANIZATION_ONCALL_NOW_CACHE_TTL = 24 * 60 * 60  # 1 day in seconds
 SCHEDULE_CHECK_NEXT_DAYS = 30
+SCHEDULE_SHIFT_BOUNDARY_TIMER_CACHE_KEY_PREFIX = "schedule_shift_boundary_timer_"
+# timers further away are re-armed on the way, so ETA tasks don't wait in the broker for too long. Tasks are acked
+# late, so the delay is kept well below the Redis broker visibility timeout (1 hour by default), otherwise ETA tasks
+# are redelivered and run twice
+SCHEDULE_SHIFT_BOUNDARY_TIMER_MAX_DELAY = 30 * 60  # 30 minutes in seconds
+# timers not fired this long after their ETA are considered lost, so schedules are polled again
+SCHEDULE_SHIFT_BOUNDARY_TIMER_GRACE_PERIOD = 10 * 60  # 10 minutes in seconds
 
 PREFETCHED_SHIFT_SWAPS = "prefetched_shift_swaps"
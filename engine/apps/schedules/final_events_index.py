@@ -0,0 +1,231 @@
+import bisect
+import datetime
+import hashlib
+import typing
+
+from django.core.cache import cache
+
+from apps.schedules.constants import SCHEDULE_FINAL_EVENTS_INDEX_CACHE_KEY_PREFIX, SCHEDULE_FINAL_EVENTS_INDEX_CACHE_TTL
+from common.cache import ensure_cache_key_allocates_to_the_same_hash_slot
+
+if typing.TYPE_CHECKING:
+    from apps.schedules.models import OnCallSchedule
+    from apps.schedules.models.on_call_schedule import ScheduleEvents
+
+# (user public primary key, user email)
+IndexedUser = typing.Tuple[str, str]
+
+
+class IndexedFinalEvent(typing.NamedTuple):
+    start: datetime.datetime
+    end: datetime.datetime
+    users: typing.Tuple[IndexedUser, ...]
+    priority_level: int
+
+
+def _get_ical_fingerprint(*ical_files: typing.Optional[str]) -> str:
+    fingerprint = hashlib.sha1()
+    for ical_file in ical_files:
+        fingerprint.update(repr(ical_file).encode("utf-8"))
+    return fingerprint.hexdigest()
+
+
+def get_schedule_ical_fingerprint(schedule: "OnCallSchedule") -> str:
+    """
+    Return a hash of the iCal files the final schedule is calculated from.
+    """
+    return _get_ical_fingerprint(schedule.cached_ical_file_primary, schedule.cached_ical_file_overrides)
+
+
+class ScheduleFinalEventsIndex:
+    """
+    Compact interval index of resolved final schedule shifts, sorted by start.
+
+    Lookups are binary searches over start timestamps and a running max of end timestamps, so they work even if
+    intervals overlap. Events without users (gaps and empty shifts) are not indexed.
+    """
+
+    def __init__(
+        self,
+        fingerprint: str,
+        window: typing.Tuple[float, float],
+        starts: typing.List[float],
+        ends: typing.List[float],
+        users: typing.List[IndexedUser],
+        event_users: typing.List[typing.Tuple[int, ...]],
+        priority_levels: typing.List[int],
+    ) -> None:
+        self.fingerprint = fingerprint
+        self.window = window
+        self._starts = starts
+        self._ends = ends
+        self._users = users
+        self._event_users = event_users
+        self._priority_levels = priority_levels
+        self._max_ends: typing.List[float] = []
+        for end in ends:
+            self._max_ends.append(max(end, self._max_ends[-1]) if self._max_ends else end)
+
+    @classmethod
+    def from_events(
+        cls,
+        fingerprint: str,
+        events: "ScheduleEvents",
+        datetime_start: datetime.datetime,
+        datetime_end: datetime.datetime,
+    ) -> "ScheduleFinalEventsIndex":
+        starts: typing.List[float] = []
+        ends: typing.List[float] = []
+        users: typing.List[IndexedUser] = []
+        user_positions: typing.Dict[IndexedUser, int] = {}
+        event_users: typing.List[typing.Tuple[int, ...]] = []
+        priority_levels: typing.List[int] = []
+
+        for event in sorted(events, key=lambda e: e["start"]):
+            if not event["users"]:
+                continue
+            positions = []
+            for event_user in event["users"]:
+                user = (event_user["pk"], event_user["email"])
+                if user not in user_positions:
+                    user_positions[user] = len(users)
+                    users.append(user)
+                positions.append(user_positions[user])
+            starts.append(event["start"].timestamp())
+            ends.append(event["end"].timestamp())
+            event_users.append(tuple(positions))
+            priority_levels.append(event["priority_level"] or 0)
+
+        return cls(
+            fingerprint,
+            (datetime_start.timestamp(), datetime_end.timestamp()),
+            starts,
+            ends,
+            users,
+            event_users,
+            priority_levels,
+        )
+
+    @classmethod
+    def from_dict(cls, data: typing.Dict[str, typing.Any]) -> "ScheduleFinalEventsIndex":
+        return cls(**data)
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "window": self.window,
+            "starts": self._starts,
+            "ends": self._ends,
+            "users": self._users,
+            "event_users": self._event_users,
+            "priority_levels": self._priority_levels,
+        }
+
+    def covers(self, datetime_start: datetime.datetime, datetime_end: datetime.datetime) -> bool:
+        return self.window[0] <= datetime_start.timestamp() and datetime_end.timestamp() <= self.window[1]
+
+    def events_between(
+        self, datetime_start: datetime.datetime, datetime_end: datetime.datetime
+    ) -> typing.List[IndexedFinalEvent]:
+        """
+        Return events overlapping the given period, or events ongoing at the given moment if start equals end.
+        """
+        start, end = datetime_start.timestamp(), datetime_end.timestamp()
+        # skip events which ended before the period start
+        lo = bisect.bisect_right(self._max_ends, start)
+        # include events starting at the moment, but not those starting at the end of a period
+        hi = bisect.bisect_right(self._starts, end) if start == end else bisect.bisect_left(self._starts, end)
+
+        return [
+            IndexedFinalEvent(
+                start=datetime.datetime.fromtimestamp(self._starts[i], tz=datetime.timezone.utc),
+                end=datetime.datetime.fromtimestamp(self._ends[i], tz=datetime.timezone.utc),
+                users=tuple(self._users[position] for position in self._event_users[i]),
+                priority_level=self._priority_levels[i],
+            )
+            for i in range(lo, hi)
+            if self._ends[i] > start
+        ]
+
+    def next_change_after(self, dt: datetime.datetime) -> datetime.datetime:
+        """
+        Return the closest moment after the given one when on-call users change (an indexed event starts or ends),
+        or the end of the indexed window if there are no changes until then.
+        """
+        timestamp = dt.timestamp()
+        next_start = bisect.bisect_right(self._starts, timestamp)
+        changes = [self.window[1]]
+        if next_start < len(self._starts):
+            changes.append(self._starts[next_start])
+        # ends of events ongoing at the moment
+        lo = bisect.bisect_right(self._max_ends, timestamp)
+        changes.extend(self._ends[i] for i in range(lo, next_start) if self._ends[i] > timestamp)
+        return datetime.datetime.fromtimestamp(min(changes), tz=datetime.timezone.utc)
+
+    def starts_between(
+        self, datetime_start: datetime.datetime, datetime_end: datetime.datetime
+    ) -> typing.List[datetime.datetime]:
+        """
+        Return distinct start moments of events starting after the given start and not later than the given end.
+        """
+        lo = bisect.bisect_right(self._starts, datetime_start.timestamp())
+        hi = bisect.bisect_right(self._starts, datetime_end.timestamp())
+        return [
+            datetime.datetime.fromtimestamp(start, tz=datetime.timezone.utc)
+            for start in sorted(set(self._starts[lo:hi]))
+        ]
+
+    def user_events_between(
+        self, user_pk: str, datetime_start: datetime.datetime, datetime_end: datetime.datetime
+    ) -> typing.List[IndexedFinalEvent]:
+        return [
+            event
+            for event in self.events_between(datetime_start, datetime_end)
+            if any(pk == user_pk for pk, _ in event.users)
+        ]
+
+
+def _get_cache_key(schedule_pk: int) -> str:
+    return ensure_cache_key_allocates_to_the_same_hash_slot(
+        f"{SCHEDULE_FINAL_EVENTS_INDEX_CACHE_KEY_PREFIX}{schedule_pk}", SCHEDULE_FINAL_EVENTS_INDEX_CACHE_KEY_PREFIX
+    )
+
+
+def update_final_events_index(
+    schedule: "OnCallSchedule",
+    events: "ScheduleEvents",
+    datetime_start: datetime.datetime,
+    datetime_end: datetime.datetime,
+) -> None:
+    index = ScheduleFinalEventsIndex.from_events(
+        get_schedule_ical_fingerprint(schedule), events, datetime_start, datetime_end
+    )
+    cache.set(_get_cache_key(schedule.pk), index.to_dict(), timeout=SCHEDULE_FINAL_EVENTS_INDEX_CACHE_TTL)
+
+
+def get_final_events_index(schedule: "OnCallSchedule") -> typing.Optional[ScheduleFinalEventsIndex]:
+    """
+    Return index of the schedule, if it was built from the current iCal files of the schedule.
+    """
+    data = cache.get(_get_cache_key(schedule.pk))
+    if data is None or data["fingerprint"] != get_schedule_ical_fingerprint(schedule):
+        return None
+    return ScheduleFinalEventsIndex.from_dict(data)
+
+
+def refresh_final_events_index_fingerprint(schedule: "OnCallSchedule") -> None:
+    """
+    Keep using the index after iCal files were refreshed without changes to their events (e.g. only DTSTAMP changed).
+    Must be called right after OnCallSchedule.refresh_ical_file, which keeps previous iCal files in prev_ical_file_*.
+    """
+    cache_key = _get_cache_key(schedule.pk)
+    data = cache.get(cache_key)
+    previous_fingerprint = _get_ical_fingerprint(schedule.prev_ical_file_primary, schedule.prev_ical_file_overrides)
+    if data is None or data["fingerprint"] != previous_fingerprint:
+        return
+    data["fingerprint"] = get_schedule_ical_fingerprint(schedule)
+    cache.set(cache_key, data, timeout=SCHEDULE_FINAL_EVENTS_INDEX_CACHE_TTL)
+
+
+def drop_final_events_index(schedule_pk: int) -> None:
+    cache.delete(_get_cache_key(schedule_pk))
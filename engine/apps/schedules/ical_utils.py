@@ -4,13 +4,14 @@ import datetime
 import logging
 import re
 import typing
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 from typing import TYPE_CHECKING
 
 import pytz
 import requests
 from django.core.cache import cache
 from django.db.models import Q
+from django.db.models.functions import Lower
 from icalendar import Calendar
 from icalendar import Event as IcalEvent
 
@@ -36,7 +37,10 @@ from apps.schedules.constants import (
     SCHEDULE_ONCALL_CACHE_KEY_PREFIX,
     SCHEDULE_ONCALL_CACHE_TTL,
 )
+from apps.schedules.final_events_index import get_final_events_index
 from apps.schedules.ical_events import ical_events
+from apps.schedules.oncall_now_index import set_schedule_oncall_now
+from apps.schedules.parsed_calendar_cache import parsed_calendar_cache
 from common.cache import ensure_cache_key_allocates_to_the_same_hash_slot
 from common.timezones import is_valid_timezone
 from common.utils import timed_lru_cache
@@ -85,7 +89,7 @@ def users_in_ical(
     organization: "Organization",
 ) -> typing.List["User"]:
     """
-    This method returns a list of `User` objects, filtered by users whose username, or case-insensitive e-mail,
+    This method returns a list of `User` objects, filtered by users whose case-insensitive username or e-mail
     is present in `usernames_from_ical`.
 
     Additionally, it filters the users by the organization they belong to and checks if they have the required
@@ -100,12 +104,16 @@ def users_in_ical(
     """
     required_permission = RBACPermission.Permissions.NOTIFICATIONS_READ
 
-    emails_from_ical = [username.lower() for username in usernames_from_ical]
+    # usernames are matched case-insensitively regardless of the DB collation, same as e-mails
+    lowercase_usernames_from_ical = [username.lower() for username in usernames_from_ical]
 
     # NOTE: doing a select_related for organization here, since we will be accessing u.organization for each user
     # in the required_permission.user_has_permission calls below
     users_found_in_ical = (
-        organization.users.filter((Q(username__in=usernames_from_ical) | Q(email__lower__in=emails_from_ical)))
+        organization.users.alias(lowercase_username=Lower("username"))
+        .filter(
+            Q(lowercase_username__in=lowercase_usernames_from_ical) | Q(email__lower__in=lowercase_usernames_from_ical)
+        )
         .distinct()
         .select_related("organization")
     )
@@ -153,7 +161,7 @@ def list_of_oncall_shifts_from_ical(
     calendars: typing.Tuple[typing.Optional[Calendar], ...]
 
     if from_cached_final:
-        calendars = (Calendar.from_ical(schedule.cached_ical_final_schedule),)
+        calendars = (parsed_calendar_cache.get_calendar(schedule.pk, "final", schedule.cached_ical_final_schedule),)
     else:
         calendars = schedule.get_icalendars()
 
@@ -220,21 +228,18 @@ def get_shifts_dict(
     with_empty_shifts: bool = False,
 ):
     events = ical_events.get_events_from_ical_between(calendar, datetime_start, datetime_end)
+    # ignore cancelled events
+    events = [event for event in events if event.get(ICAL_STATUS) != ICAL_STATUS_CANCELLED]
+    events_users = get_users_from_ical_events(events, schedule.organization)
     result_datetime = []
     result_date = []
-    for event in events:
-        status = event.get(ICAL_STATUS)
-        if status == ICAL_STATUS_CANCELLED:
-            # ignore cancelled events
-            continue
+    for event, (users, missing_users) in zip(events, events_users):
         sequence = event.get(ICAL_SEQUENCE)
         recurrence_id = event.get(ICAL_RECURRENCE_ID)
         if recurrence_id:
             recurrence_id = recurrence_id.dt.isoformat()
         priority = parse_priority_from_string(event.get(ICAL_SUMMARY, "[L0]"))
         pk, source = parse_event_uid(event.get(ICAL_UID), sequence=sequence, recurrence_id=recurrence_id)
-        users = get_users_from_ical_event(event, schedule.organization)
-        missing_users = get_missing_users_from_ical_event(event, schedule.organization)
         event_calendar_type = calendar_type
         if calendar_type == CALENDAR_TYPE_FINAL:
             event_calendar_type = (
@@ -317,8 +322,8 @@ def list_of_empty_shifts_in_schedule(
             # Keep hashes of checked events to include only first recurrent event into result
             checked_events = set()
             empty_shifts_per_calendar = []
-            for event in events:
-                users = get_users_from_ical_event(event, schedule.organization)
+            events_users = get_users_from_ical_events(events, schedule.organization)
+            for event, (users, _) in zip(events, events_users):
                 if len(users) == 0:
                     summary = event.get(ICAL_SUMMARY, "")
                     description = event.get(ICAL_DESCRIPTION, "")
@@ -377,11 +382,18 @@ def list_users_to_notify_from_ical_for_period(
     end_datetime: datetime.datetime,
     from_cached_final: bool = False,
 ) -> typing.List["User"]:
+    usernames: typing.List[str] = []
+    index = get_final_events_index(schedule)
+    if index is not None and index.covers(start_datetime, end_datetime):
+        # use final shifts resolved on final schedule refresh, instead of expanding and resolving iCal events
+        for indexed_event in index.events_between(start_datetime, end_datetime):
+            usernames += [email for _, email in indexed_event.users]
+        return memoized_users_in_ical(tuple(usernames), schedule.organization)
+
     if from_cached_final and schedule.cached_ical_final_schedule:
         events = schedule.filter_events(start_datetime, end_datetime, from_cached_final=True)
     else:
         events = schedule.final_events(start_datetime, end_datetime)
-    usernames: typing.List[str] = []
     for event in events:
         usernames += [u["email"] for u in event.get("users", [])]
 
@@ -415,13 +427,15 @@ def _generate_cache_key_for_schedule_oncall_users(schedule: "OnCallSchedule") ->
 
 
 def update_cached_oncall_users_for_schedule(schedule: "OnCallSchedule"):
-    oncall_users = get_oncall_users_for_multiple_schedules([schedule])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    oncall_users = get_oncall_users_for_multiple_schedules([schedule], events_datetime=now)
     users = oncall_users.get(schedule, [])
     cache.set(
         _generate_cache_key_for_schedule_oncall_users(schedule),
         [user.public_primary_key for user in users],
         timeout=SCHEDULE_ONCALL_CACHE_TTL,
     )
+    set_schedule_oncall_now(schedule, users, now)
 
 
 def get_cached_oncall_users_for_multiple_schedules(schedules: typing.List["OnCallSchedule"]) -> SchedulesOnCallUsers:
@@ -614,9 +628,9 @@ def get_usernames_from_ical_event(event):
 def get_missing_users_from_ical_event(event, organization: "Organization"):
     all_usernames, _ = get_usernames_from_ical_event(event)
     users = list(get_users_from_ical_event(event, organization))
-    found_usernames = [u.username for u in users]
+    found_usernames = [u.username.lower() for u in users]
     found_emails = [u.email.lower() for u in users]
-    return [u for u in all_usernames if u != "" and u not in found_usernames and u.lower() not in found_emails]
+    return [u for u in all_usernames if u != "" and u.lower() not in found_usernames and u.lower() not in found_emails]
 
 
 def get_users_from_ical_event(event, organization: "Organization") -> typing.List["User"]:
@@ -627,6 +641,42 @@ def get_users_from_ical_event(event, organization: "Organization") -> typing.Lis
     return users
 
 
+def get_users_from_ical_events(
+    events: IcalEvents, organization: "Organization"
+) -> typing.List[typing.Tuple[typing.List["User"], typing.List[str]]]:
+    """
+    Same as get_users_from_ical_event and get_missing_users_from_ical_event called for every event, but users of all
+    events are fetched at once, instead of running a users query for every distinct set of event usernames.
+    Return a list of (users, missing usernames) tuples, in the same order as events.
+    """
+    events_usernames = [get_usernames_from_ical_event(event)[0] for event in events]
+    all_usernames = sorted({username for usernames in events_usernames for username in usernames})
+    users = memoized_users_in_ical(tuple(all_usernames), organization) if all_usernames else []
+
+    # usernames and emails are matched case-insensitively, same as users_in_ical does
+    users_by_username: typing.Dict[str, typing.Set[int]] = defaultdict(set)
+    users_by_email: typing.Dict[str, typing.Set[int]] = defaultdict(set)
+    for position, user in enumerate(users):
+        users_by_username[user.username.lower()].add(position)
+        users_by_email[user.email.lower()].add(position)
+
+    result = []
+    for usernames in events_usernames:
+        positions: typing.Set[int] = set()
+        missing_usernames = []
+        for username in usernames:
+            folded_username = username.lower()
+            username_positions = users_by_username.get(folded_username, set()) | users_by_email.get(
+                folded_username, set()
+            )
+            positions |= username_positions
+            if username != "" and not username_positions:
+                missing_usernames.append(username)
+        # keep users in the same order as users_in_ical returns them
+        result.append(([users[position] for position in sorted(positions)], missing_usernames))
+    return result
+
+
 def is_icals_equal_line_by_line(first, second):
     first = first.split("\n")
     second = second.split("\n")
@@ -35,6 +35,7 @@ from apps.schedules.constants import (
     PREFETCHED_SHIFT_SWAPS,
     SCHEDULE_CHECK_NEXT_DAYS,
 )
+from apps.schedules.final_events_index import get_final_events_index, update_final_events_index
 from apps.schedules.ical_utils import (
     EmptyShifts,
     create_base_icalendar,
@@ -44,6 +45,8 @@ from apps.schedules.ical_utils import (
     list_of_oncall_shifts_from_ical,
 )
 from apps.schedules.models import CustomOnCallShift
+from apps.schedules.oncall_now_index import update_schedule_oncall_now
+from apps.schedules.parsed_calendar_cache import parsed_calendar_cache
 from apps.user_management.models import User
 from common.database import NON_POLYMORPHIC_CASCADE, NON_POLYMORPHIC_SET_NULL
 from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
@@ -275,13 +278,18 @@ class OnCallSchedule(PolymorphicModel):
         """Returns list of calendars. Primary calendar should always be the first"""
         # if self._ical_file_(primary|overrides) is None -> no cache, will trigger a refresh
         # if self._ical_file_(primary|overrides) == "" -> cached value for an empty schedule
+        # calendars are shared with other callers via parsed_calendar_cache, so they must not be modified
         if self._ical_file_primary:
-            calendar_primary: icalendar.Calendar = icalendar.Calendar.from_ical(self._ical_file_primary)
+            calendar_primary: icalendar.Calendar = parsed_calendar_cache.get_calendar(
+                self.pk, "primary", self._ical_file_primary
+            )
         else:
             calendar_primary = None
 
         if self._ical_file_overrides:
-            calendar_overrides: icalendar.Calendar = icalendar.Calendar.from_ical(self._ical_file_overrides)
+            calendar_overrides: icalendar.Calendar = parsed_calendar_cache.get_calendar(
+                self.pk, "overrides", self._ical_file_overrides
+            )
         else:
             calendar_overrides = None
 
@@ -553,6 +561,9 @@ class OnCallSchedule(PolymorphicModel):
         ical_data = calendar.to_ical().decode()
         self.cached_ical_final_schedule = ical_data
         self.save(update_fields=["cached_ical_final_schedule"])
+        update_final_events_index(self, events, datetime_start, datetime_end)
+        # on-call users stay the same until the next shift boundary, which is known from the index now
+        update_schedule_oncall_now(self)
 
     def shifts_for_user(
         self,
@@ -580,6 +591,15 @@ class OnCallSchedule(PolymorphicModel):
             # no final schedule info available
             return passed_shifts, current_shifts, upcoming_shifts
 
+        index = get_final_events_index(self)
+        if (
+            index is not None
+            and index.covers(datetime_start, datetime_end)
+            and not index.user_events_between(user.public_primary_key, datetime_start, datetime_end)
+        ):
+            # user has no shifts in the period, avoid parsing the final schedule
+            return passed_shifts, current_shifts, upcoming_shifts
+
         events = self.filter_events(
             datetime_start, datetime_end, all_day_datetime=True, from_cached_final=True, include_shift_info=True
         )
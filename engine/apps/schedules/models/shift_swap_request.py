@@ -10,6 +10,7 @@ from django.dispatch import receiver
 from django.utils import timezone
 
 from apps.schedules import exceptions
+from apps.schedules.final_events_index import drop_final_events_index
 from apps.schedules.tasks import refresh_ical_final_schedule
 from common.insight_log import EntityEvent, write_resource_insight_log
 from common.public_primary_keys import generate_public_primary_key, increase_public_primary_key_length
@@ -37,7 +38,10 @@ def generate_public_primary_key_for_shift_swap_request() -> str:
 
 class ShiftSwapRequestQueryset(models.QuerySet):
     def delete(self):
+        schedule_pks = set(self.values_list("schedule_id", flat=True))
         self.update(deleted_at=timezone.now())
+        for schedule_pk in schedule_pks:
+            drop_final_events_index(schedule_pk)
 
 
 class ShiftSwapRequestManager(models.Manager):
@@ -195,6 +199,7 @@ class ShiftSwapRequest(models.Model):
 
     def hard_delete(self):
         super().delete()
+        drop_final_events_index(self.schedule_id)
         # make sure final schedule ical representation is updated
         refresh_ical_final_schedule.apply_async((self.schedule.pk,))
 
@@ -268,6 +273,9 @@ def listen_for_shiftswaprequest_model_save(
 ) -> None:
     from apps.schedules.tasks.shift_swaps import create_shift_swap_request_message
 
+    # swaps change final shifts, index is rebuilt once the final schedule is refreshed
+    drop_final_events_index(instance.schedule_id)
+
     if created:
         write_resource_insight_log(instance=instance, author=instance.beneficiary, event=EntityEvent.CREATED)
         create_shift_swap_request_message.apply_async((instance.pk,))
@@ -0,0 +1,113 @@
+import datetime
+import typing
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.schedules.constants import (
+    ORGANIZATION_ONCALL_NOW_CACHE_KEY_PREFIX,
+    ORGANIZATION_ONCALL_NOW_CACHE_TTL,
+    SCHEDULE_ONCALL_CACHE_TTL,
+)
+from apps.schedules.final_events_index import get_final_events_index
+from common.cache import ensure_cache_key_allocates_to_the_same_hash_slot
+
+if typing.TYPE_CHECKING:
+    from apps.schedules.models import OnCallSchedule
+    from apps.user_management.models import Organization, User
+
+# (pks of users on-call now in a schedule, timestamp until which the users are valid)
+OnCallNowEntry = typing.Tuple[typing.List[int], float]
+
+
+class OrganizationOnCallNow:
+    """
+    Users currently on-call in any of the organization schedules, along with the schedules they are on-call in.
+    """
+
+    def __init__(self, users_by_schedule: typing.Dict[int, typing.List[int]]) -> None:
+        self.schedule_ids_by_user: typing.Dict[int, typing.List[int]] = defaultdict(list)
+        for schedule_pk, user_pks in users_by_schedule.items():
+            for user_pk in user_pks:
+                self.schedule_ids_by_user[user_pk].append(schedule_pk)
+
+    @property
+    def user_ids(self) -> typing.Set[int]:
+        return set(self.schedule_ids_by_user)
+
+    def is_oncall(self, user: "User") -> bool:
+        return user.pk in self.schedule_ids_by_user
+
+
+def _get_cache_key(organization_id: int, schedule_pk: int) -> str:
+    # entries are kept per schedule, so concurrent updates of different schedules don't overwrite each other
+    prefix = f"{ORGANIZATION_ONCALL_NOW_CACHE_KEY_PREFIX}{organization_id}"
+    return ensure_cache_key_allocates_to_the_same_hash_slot(f"{prefix}_{schedule_pk}", prefix)
+
+
+def _get_valid_until(schedule: "OnCallSchedule", now: datetime.datetime) -> float:
+    # without the final events index the next shift boundary is unknown, so users are recalculated periodically
+    valid_until = now + datetime.timedelta(seconds=SCHEDULE_ONCALL_CACHE_TTL)
+    index = get_final_events_index(schedule)
+    if index is not None and index.covers(now, now):
+        valid_until = min(valid_until, index.next_change_after(now))
+    return valid_until.timestamp()
+
+
+def _get_schedule_entry(schedule: "OnCallSchedule", now: datetime.datetime) -> OnCallNowEntry:
+    from apps.schedules.ical_utils import list_users_to_notify_from_ical
+
+    users = list_users_to_notify_from_ical(schedule, events_datetime=now)
+    return [user.pk for user in users], _get_valid_until(schedule, now)
+
+
+def set_schedule_oncall_now(
+    schedule: "OnCallSchedule", users: typing.List["User"], now: typing.Optional[datetime.datetime] = None
+) -> None:
+    """
+    Update the organization index with users on-call now in the schedule (e.g. calculated on schedule iCal refresh).
+    """
+    now = now or timezone.now()
+    entry: OnCallNowEntry = ([user.pk for user in users], _get_valid_until(schedule, now))
+    cache.set(_get_cache_key(schedule.organization_id, schedule.pk), entry, timeout=ORGANIZATION_ONCALL_NOW_CACHE_TTL)
+
+
+def update_schedule_oncall_now(schedule: "OnCallSchedule") -> None:
+    from apps.schedules.ical_utils import list_users_to_notify_from_ical
+
+    now = timezone.now()
+    set_schedule_oncall_now(schedule, list_users_to_notify_from_ical(schedule, events_datetime=now), now)
+
+
+def get_organization_oncall_now(organization: "Organization") -> OrganizationOnCallNow:
+    """
+    Return users on-call now in the organization schedules.
+
+    Users are kept in the cache per schedule until the next shift boundary of the schedule (taken from the final events
+    index, see apps.schedules.final_events_index) or at most for SCHEDULE_ONCALL_CACHE_TTL. They are updated when
+    schedule iCal files refresh, and recalculated here only for schedules which passed a shift boundary (or are new).
+    """
+    from apps.schedules.models import OnCallSchedule
+
+    now = timezone.now()
+    cache_keys = {
+        _get_cache_key(organization.pk, schedule_pk): schedule_pk
+        for schedule_pk in organization.oncall_schedules.values_list("pk", flat=True)
+    }
+    cached_entries: typing.Dict[str, OnCallNowEntry] = cache.get_many(list(cache_keys)) if cache_keys else {}
+    entries = {cache_keys[cache_key]: entry for cache_key, entry in cached_entries.items()}
+
+    stale_schedule_pks = [pk for pk in cache_keys.values() if pk not in entries or entries[pk][1] <= now.timestamp()]
+    if stale_schedule_pks:
+        stale_entries = {
+            schedule.pk: _get_schedule_entry(schedule, now)
+            for schedule in OnCallSchedule.objects.filter(pk__in=stale_schedule_pks)
+        }
+        cache.set_many(
+            {_get_cache_key(organization.pk, schedule_pk): entry for schedule_pk, entry in stale_entries.items()},
+            timeout=ORGANIZATION_ONCALL_NOW_CACHE_TTL,
+        )
+        entries.update(stale_entries)
+
+    return OrganizationOnCallNow({schedule_pk: user_pks for schedule_pk, (user_pks, _) in entries.items()})
@@ -0,0 +1,105 @@
+import hashlib
+import threading
+import typing
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import icalendar
+from django.conf import settings
+
+ParsedCalendarCacheKey = typing.Tuple[int, str]
+
+
+@dataclass
+class ParsedCalendarCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    size_bytes: int = 0
+
+
+class ParsedCalendarCache:
+    """
+    Process-local LRU cache of parsed iCal calendars.
+
+    Calendars are keyed by schedule and calendar kind (primary, overrides, final) and validated against a hash of
+    the iCal text, so a calendar is parsed once per process until the schedule iCal changes. A single entry is kept
+    per schedule and kind, so stale versions are replaced instead of piling up. The cache is bounded both by number
+    of entries and by the total length of cached iCal texts (used as a proxy for the memory held by the calendars).
+
+    Returned calendars are shared between callers, so they must be treated as read-only.
+    """
+
+    def __init__(self, max_size: int, max_bytes: int) -> None:
+        self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._calendars: OrderedDict[ParsedCalendarCacheKey, typing.Tuple[str, icalendar.Calendar, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _get_hash(ical: str | bytes) -> str:
+        if isinstance(ical, str):
+            ical = ical.encode("utf-8")
+        return hashlib.sha256(ical).hexdigest()
+
+    def get_calendar(self, schedule_pk: int, kind: str, ical: str | bytes) -> icalendar.Calendar:
+        key = (schedule_pk, kind)
+        ical_hash = self._get_hash(ical)
+        with self._lock:
+            cached = self._calendars.get(key)
+            if cached is not None and cached[0] == ical_hash:
+                self._calendars.move_to_end(key)
+                self._hits += 1
+                return cached[1]
+            self._misses += 1
+
+        # parse outside of the lock, parsing is the expensive part
+        calendar = icalendar.Calendar.from_ical(ical)
+
+        ical_size = len(ical)
+        if self._max_size <= 0 or ical_size > self._max_bytes:
+            return calendar
+
+        with self._lock:
+            replaced = self._calendars.pop(key, None)
+            if replaced is not None:
+                self._size_bytes -= replaced[2]
+            self._calendars[key] = (ical_hash, calendar, ical_size)
+            self._size_bytes += ical_size
+            self._evict()
+        return calendar
+
+    def _evict(self) -> None:
+        while len(self._calendars) > self._max_size or self._size_bytes > self._max_bytes:
+            _, (_, _, ical_size) = self._calendars.popitem(last=False)
+            self._size_bytes -= ical_size
+            self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._calendars.clear()
+            self._size_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> ParsedCalendarCacheStats:
+        with self._lock:
+            return ParsedCalendarCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._calendars),
+                size_bytes=self._size_bytes,
+            )
+
+
+parsed_calendar_cache = ParsedCalendarCache(
+    max_size=settings.ICAL_PARSED_CALENDAR_CACHE_MAX_SIZE,
+    max_bytes=settings.ICAL_PARSED_CALENDAR_CACHE_MAX_BYTES,
+)
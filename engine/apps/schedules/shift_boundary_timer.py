@@ -0,0 +1,121 @@
+import datetime
+import typing
+
+from celery import uuid as celery_uuid
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.schedules.constants import (
+    SCHEDULE_SHIFT_BOUNDARY_TIMER_CACHE_KEY_PREFIX,
+    SCHEDULE_SHIFT_BOUNDARY_TIMER_GRACE_PERIOD,
+    SCHEDULE_SHIFT_BOUNDARY_TIMER_MAX_DELAY,
+)
+from apps.schedules.final_events_index import ScheduleFinalEventsIndex, get_final_events_index
+from common.cache import ensure_cache_key_allocates_to_the_same_hash_slot
+
+if typing.TYPE_CHECKING:
+    from apps.schedules.models import OnCallSchedule
+
+# on-call users change: shift notifications are sent and Slack user groups are updated
+SHIFT_BOUNDARY = "shift_boundary"
+# a shift starts in one of the going on-call notification timings: going on-call push notifications are sent
+GOING_ONCALL = "going_oncall"
+
+
+class ShiftBoundaryTimer(typing.TypedDict):
+    task_id: str
+    # ETA timestamp
+    eta: float
+    kinds: typing.List[str]
+
+
+def _get_cache_key(schedule_pk: int) -> str:
+    return ensure_cache_key_allocates_to_the_same_hash_slot(
+        f"{SCHEDULE_SHIFT_BOUNDARY_TIMER_CACHE_KEY_PREFIX}{schedule_pk}", SCHEDULE_SHIFT_BOUNDARY_TIMER_CACHE_KEY_PREFIX
+    )
+
+
+def get_next_timeline_point(
+    index: ScheduleFinalEventsIndex, now: datetime.datetime
+) -> typing.Tuple[datetime.datetime, typing.List[str]]:
+    """
+    Return the closest moment after now when something has to be done for the schedule, along with what has to be
+    done then. Points further than SCHEDULE_SHIFT_BOUNDARY_TIMER_MAX_DELAY are not considered, the end of that delay
+    is returned with no kinds instead, so the timer is just re-armed then.
+    """
+    from apps.mobile_app.models import MobileAppUserSettings
+
+    window_end = datetime.datetime.fromtimestamp(index.window[1], tz=datetime.timezone.utc)
+    horizon = min(now + datetime.timedelta(seconds=SCHEDULE_SHIFT_BOUNDARY_TIMER_MAX_DELAY), window_end)
+
+    points: typing.Dict[datetime.datetime, typing.Set[str]] = {}
+    next_change = index.next_change_after(now)
+    if next_change <= horizon and next_change < window_end:
+        points.setdefault(next_change, set()).add(SHIFT_BOUNDARY)
+
+    timings = [
+        datetime.timedelta(seconds=timing) for timing in MobileAppUserSettings.ALL_NOTIFICATION_TIMING_CHOICES_SECONDS
+    ]
+    for start in index.starts_between(now, horizon + max(timings)):
+        for timing in timings:
+            point = start - timing
+            if now < point <= horizon:
+                points.setdefault(point, set()).add(GOING_ONCALL)
+
+    if not points:
+        return horizon, []
+    eta = min(points)
+    return eta, sorted(points[eta])
+
+
+def arm_schedule_shift_boundary_timer(
+    schedule: "OnCallSchedule", now: typing.Optional[datetime.datetime] = None
+) -> None:
+    """
+    Schedule a task running at the next timeline point of the schedule (see get_next_timeline_point), replacing the
+    previously armed one. The timer is derived from the final events index, so it has to be re-armed every time the
+    index is updated.
+
+    Schedules without an up-to-date index are disarmed, so they are handled by the periodic tasks polling schedules.
+    """
+    from apps.schedules.tasks import run_shift_boundary_timer
+
+    now = now or timezone.now()
+    index = get_final_events_index(schedule)
+    if index is None or not index.covers(now, now):
+        disarm_schedule_shift_boundary_timer(schedule.pk)
+        return
+
+    eta, kinds = get_next_timeline_point(index, now)
+    cache_key = _get_cache_key(schedule.pk)
+    timer: typing.Optional[ShiftBoundaryTimer] = cache.get(cache_key)
+    if timer and timer["eta"] == eta.timestamp() and timer["kinds"] == kinds:
+        # the same timer is already armed
+        return
+
+    task_id = celery_uuid()
+    timer = {"task_id": task_id, "eta": eta.timestamp(), "kinds": kinds}
+    timeout = (eta - now).total_seconds() + SCHEDULE_SHIFT_BOUNDARY_TIMER_GRACE_PERIOD
+    cache.set(cache_key, timer, timeout=timeout)
+    run_shift_boundary_timer.apply_async((schedule.pk,), eta=eta, task_id=task_id)
+
+
+def get_schedule_shift_boundary_timer(schedule_pk: int) -> typing.Optional[ShiftBoundaryTimer]:
+    return cache.get(_get_cache_key(schedule_pk))
+
+
+def get_armed_schedule_pks(schedule_pks: typing.Iterable[int]) -> typing.Set[int]:
+    """
+    Return pks of the given schedules with an armed timer. Timers not fired for
+    SCHEDULE_SHIFT_BOUNDARY_TIMER_GRACE_PERIOD after their ETA expire, so their schedules are polled again.
+    """
+    cache_keys = {_get_cache_key(schedule_pk): schedule_pk for schedule_pk in schedule_pks}
+    if not cache_keys:
+        return set()
+    timers = cache.get_many(list(cache_keys))
+    return {cache_keys[cache_key] for cache_key in timers}
+
+
+def disarm_schedule_shift_boundary_timer(schedule_pk: int) -> None:
+    # the task is not revoked, it is a no-op as its id doesn't match the armed one anymore
+    cache.delete(_get_cache_key(schedule_pk))
@@ -16,3 +16,4 @@ from .refresh_ical_files import (  # noqa: F401
     start_refresh_ical_files,
     start_refresh_ical_final_schedules,
 )
+from .shift_boundary_timer import run_shift_boundary_timer  # noqa: F401
@@ -1,13 +1,15 @@
 from celery.utils.log import get_task_logger
 
 from apps.alerts.tasks import notify_ical_schedule_shift  # type: ignore[no-redef]
+from apps.schedules.final_events_index import refresh_final_events_index_fingerprint
 from apps.schedules.ical_utils import is_icals_equal, update_cached_oncall_users_for_schedule
+from apps.schedules.shift_boundary_timer import arm_schedule_shift_boundary_timer, get_armed_schedule_pks
 from apps.schedules.tasks import (
     check_gaps_and_empty_shifts_in_schedule,
     notify_about_empty_shifts_in_schedule_task,
     notify_about_gaps_in_schedule_task,
 )
-from apps.slack.tasks import start_update_slack_user_group_for_schedules
+from apps.slack.tasks import start_update_slack_user_group_for_schedules, update_slack_user_group_for_schedules
 from common.custom_celery_tasks import shared_dedicated_queue_retry_task
 
 task_logger = get_task_logger(__name__)
@@ -51,8 +53,6 @@ def refresh_ical_file(schedule_pk):
         return
 
     schedule.refresh_ical_file()
-    if schedule.slack_channel is not None:
-        notify_ical_schedule_shift.apply_async((schedule.pk,))
 
     run_task_primary = False
     if schedule.cached_ical_file_primary:
@@ -85,6 +85,22 @@ def refresh_ical_file(schedule_pk):
             task_logger.info(f"run_task_overrides {schedule_pk} {run_task_primary} icals not equal")
     run_task = run_task_primary or run_task_overrides
 
+    if run_task:
+        # final schedule (and its events index) is calculated from iCal files, so it has to be refreshed as well,
+        # the shift boundary timer is re-armed once the index is updated
+        refresh_ical_final_schedule.apply_async((schedule_pk,))
+    else:
+        refresh_final_events_index_fingerprint(schedule)
+        # re-arm timers lost on the way (or disarm the schedule if its index is not up-to-date)
+        arm_schedule_shift_boundary_timer(schedule)
+
+    # shift changes of unchanged schedules with an armed timer are handled by the timer at the exact time
+    polled = run_task or schedule.pk not in get_armed_schedule_pks([schedule.pk])
+    if schedule.slack_channel_id is not None and polled:
+        notify_ical_schedule_shift.apply_async((schedule.pk,))
+    if schedule.user_group_id is not None and run_task:
+        update_slack_user_group_for_schedules.delay(user_group_pk=schedule.user_group_id)
+
     # update cached schedule on-call users
     update_cached_oncall_users_for_schedule(schedule)
 
@@ -109,3 +125,4 @@ def refresh_ical_final_schedule(schedule_pk):
         return
 
     schedule.refresh_ical_final_schedule()
+    arm_schedule_shift_boundary_timer(schedule)
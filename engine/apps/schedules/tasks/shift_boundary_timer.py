@@ -0,0 +1,51 @@
+import datetime
+
+from celery.utils.log import get_task_logger
+from django.utils import timezone
+
+from apps.alerts.tasks import notify_ical_schedule_shift  # type: ignore[no-redef]
+from apps.schedules.shift_boundary_timer import (
+    GOING_ONCALL,
+    SHIFT_BOUNDARY,
+    arm_schedule_shift_boundary_timer,
+    get_schedule_shift_boundary_timer,
+)
+from apps.slack.tasks import update_slack_user_group_for_schedules
+from common.custom_celery_tasks import shared_dedicated_queue_retry_task
+
+task_logger = get_task_logger(__name__)
+
+
+@shared_dedicated_queue_retry_task()
+def run_shift_boundary_timer(schedule_pk):
+    """
+    Run what is due at the armed timeline point of the schedule and arm the timer for the next point.
+    """
+    from apps.mobile_app.tasks.going_oncall_notification import (
+        conditionally_send_going_oncall_push_notifications_for_schedule,
+    )
+    from apps.schedules.models import OnCallSchedule
+
+    timer = get_schedule_shift_boundary_timer(schedule_pk)
+    if not timer or timer["task_id"] != run_shift_boundary_timer.request.id:
+        task_logger.info(f"Shift boundary timer for schedule {schedule_pk} was re-armed or disarmed, skipping")
+        return
+
+    try:
+        schedule = OnCallSchedule.objects.get(pk=schedule_pk, organization__deleted_at__isnull=True)
+    except OnCallSchedule.DoesNotExist:
+        task_logger.info(f"Tried to run shift boundary timer for non-existing schedule {schedule_pk}")
+        return
+
+    task_logger.info(f"Run shift boundary timer for schedule {schedule_pk}: {timer['kinds']}")
+    if SHIFT_BOUNDARY in timer["kinds"]:
+        if schedule.slack_channel_id is not None:
+            notify_ical_schedule_shift.apply_async((schedule.pk,))
+        if schedule.user_group_id is not None:
+            update_slack_user_group_for_schedules.delay(user_group_pk=schedule.user_group_id)
+    if GOING_ONCALL in timer["kinds"]:
+        conditionally_send_going_oncall_push_notifications_for_schedule.apply_async((schedule.pk,))
+
+    # the task may run slightly before its ETA, so make sure the same point is not picked up again
+    eta = datetime.datetime.fromtimestamp(timer["eta"], tz=datetime.timezone.utc)
+    arm_schedule_shift_boundary_timer(schedule, now=max(timezone.now(), eta))
@@ -0,0 +1,155 @@
+import datetime
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from apps.schedules.final_events_index import (
+    ScheduleFinalEventsIndex,
+    get_final_events_index,
+    refresh_final_events_index_fingerprint,
+)
+from apps.schedules.ical_utils import list_users_to_notify_from_ical
+from apps.schedules.models import CustomOnCallShift, OnCallSchedule, OnCallScheduleWeb
+
+
+def _make_event(start, end, users, priority_level=0):
+    return {
+        "start": start,
+        "end": end,
+        "users": [{"pk": pk, "email": f"{pk}@example.com"} for pk in users],
+        "priority_level": priority_level,
+    }
+
+
+def test_final_events_index_lookups():
+    start = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+    hour = datetime.timedelta(hours=1)
+    events = [
+        _make_event(start + hour, start + 2 * hour, ["U2"]),
+        _make_event(start, start + hour, ["U1"]),
+        # gaps and empty shifts are not indexed
+        _make_event(start + 2 * hour, start + 3 * hour, []),
+        # overlapping long event
+        _make_event(start, start + 4 * hour, ["U3", "U1"], priority_level=2),
+    ]
+    index = ScheduleFinalEventsIndex.from_events("fingerprint", events, start, start + 24 * hour)
+    index = ScheduleFinalEventsIndex.from_dict(index.to_dict())
+
+    def users_at(dt_start, dt_end=None):
+        return [[pk for pk, _ in event.users] for event in index.events_between(dt_start, dt_end or dt_start)]
+
+    # ongoing events at a moment include events starting at it, but not ending at it
+    assert users_at(start) == [["U1"], ["U3", "U1"]]
+    assert users_at(start + hour) == [["U3", "U1"], ["U2"]]
+    assert users_at(start + 3 * hour) == [["U3", "U1"]]
+    assert users_at(start + 5 * hour) == []
+    # events overlapping a period
+    assert users_at(start + 30 * datetime.timedelta(minutes=1), start + hour) == [["U1"], ["U3", "U1"]]
+    assert index.events_between(start, start)[1].priority_level == 2
+
+    assert [e.start for e in index.user_events_between("U1", start, start + 24 * hour)] == [start, start]
+    assert index.user_events_between("U2", start, start + hour) == []
+
+    # closest start or end of an event after the moment, or the window end
+    assert index.next_change_after(start) == start + hour
+    assert index.next_change_after(start + 2 * hour) == start + 4 * hour
+    assert index.next_change_after(start + 5 * hour) == start + 24 * hour
+
+    # distinct starts after the moment
+    assert index.starts_between(start - hour, start + hour) == [start, start + hour]
+    assert index.starts_between(start, start + 24 * hour) == [start + hour]
+
+    assert index.covers(start, start + 24 * hour)
+    assert not index.covers(start - hour, start)
+
+
+@pytest.mark.django_db
+def test_final_events_index_used_for_oncall_users(
+    make_organization, make_user_for_organization, make_schedule, make_on_call_shift
+):
+    organization = make_organization()
+    user_1 = make_user_for_organization(organization)
+    user_2 = make_user_for_organization(organization)
+
+    today = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    schedule = make_schedule(organization, schedule_class=OnCallScheduleWeb)
+    on_call_shift = make_on_call_shift(
+        organization=organization,
+        shift_type=CustomOnCallShift.TYPE_ROLLING_USERS_EVENT,
+        start=today,
+        rotation_start=today,
+        duration=datetime.timedelta(hours=12),
+        priority_level=1,
+        frequency=CustomOnCallShift.FREQUENCY_DAILY,
+        schedule=schedule,
+    )
+    on_call_shift.add_rolling_users([[user_1]])
+    schedule.refresh_ical_file()
+
+    events_datetime = today + datetime.timedelta(hours=3)
+    expected_users = list_users_to_notify_from_ical(schedule, events_datetime)
+    assert expected_users == [user_1]
+
+    schedule.refresh_ical_final_schedule()
+    assert get_final_events_index(schedule) is not None
+    with patch.object(OnCallSchedule, "final_events") as mock_final_events:
+        assert list_users_to_notify_from_ical(schedule, events_datetime) == expected_users
+        assert list_users_to_notify_from_ical(schedule, today + datetime.timedelta(hours=13)) == []
+        # user has no shifts in the period, final schedule is not parsed
+        with patch.object(OnCallSchedule, "filter_events") as mock_filter_events:
+            assert schedule.shifts_for_user(user_2, today, days=1) == ([], [], [])
+        mock_filter_events.assert_not_called()
+    mock_final_events.assert_not_called()
+
+    # index is not used once iCal files change, until the final schedule is refreshed
+    override = make_on_call_shift(
+        organization=organization,
+        shift_type=CustomOnCallShift.TYPE_OVERRIDE,
+        start=today + datetime.timedelta(hours=2),
+        rotation_start=today + datetime.timedelta(hours=2),
+        duration=datetime.timedelta(hours=2),
+        schedule=schedule,
+    )
+    override.add_rolling_users([[user_2]])
+    schedule.refresh_ical_file()
+    schedule = OnCallScheduleWeb.objects.get(pk=schedule.pk)
+    assert get_final_events_index(schedule) is None
+    assert list_users_to_notify_from_ical(schedule, events_datetime) == [user_2]
+
+    schedule.refresh_ical_final_schedule()
+    assert get_final_events_index(schedule) is not None
+    assert list_users_to_notify_from_ical(schedule, events_datetime) == [user_2]
+
+
+@pytest.mark.django_db
+def test_final_events_index_dropped_on_swap(
+    make_organization, make_user_for_organization, make_schedule, make_shift_swap_request
+):
+    organization = make_organization()
+    user_1 = make_user_for_organization(organization)
+    user_2 = make_user_for_organization(organization)
+    schedule = make_schedule(organization, schedule_class=OnCallScheduleWeb)
+    schedule.refresh_ical_final_schedule()
+    assert get_final_events_index(schedule) is not None
+
+    tomorrow = timezone.now() + datetime.timedelta(days=1)
+    make_shift_swap_request(
+        schedule, user_1, benefactor=user_2, swap_start=tomorrow, swap_end=tomorrow + datetime.timedelta(hours=1)
+    )
+    assert get_final_events_index(schedule) is None
+
+
+@pytest.mark.django_db
+def test_final_events_index_fingerprint_refresh(make_organization, make_schedule):
+    organization = make_organization()
+    schedule = make_schedule(organization, schedule_class=OnCallScheduleWeb)
+    schedule.refresh_ical_final_schedule()
+
+    # iCal files were refreshed without changes
+    schedule.prev_ical_file_primary = schedule.cached_ical_file_primary
+    schedule.prev_ical_file_overrides = schedule.cached_ical_file_overrides
+    schedule.cached_ical_file_primary = "refreshed"
+    assert get_final_events_index(schedule) is None
+    refresh_final_events_index_fingerprint(schedule)
+    assert get_final_events_index(schedule) is not None
@@ -13,7 +13,10 @@ from apps.api.permissions import GrafanaAPIPermissions, LegacyAccessControlRole,
 from apps.schedules.ical_utils import (
     get_cached_oncall_users_for_multiple_schedules,
     get_icalendar_tz_or_utc,
+    get_missing_users_from_ical_event,
     get_oncall_users_for_multiple_schedules,
+    get_users_from_ical_event,
+    get_users_from_ical_events,
     is_icals_equal,
     list_of_oncall_shifts_from_ical,
     list_users_to_notify_from_ical,
@@ -92,6 +95,47 @@ def test_users_in_ical_email_case_insensitive(make_organization_and_user, make_u
     assert set(result) == {user}
 
 
+@pytest.mark.django_db
+def test_get_users_from_ical_events(make_organization_and_user, make_user_for_organization, django_assert_num_queries):
+    organization, user = make_organization_and_user()
+    other_user = make_user_for_organization(organization, username="foo", email="TestingUser@test.com")
+    viewer = make_user_for_organization(organization, role=LegacyAccessControlRole.VIEWER)
+
+    events = []
+    for summary in (user.username, "testinguser@test.com", "missing", viewer.username, "[L1] "):
+        event = icalendar.Event()
+        event.add("summary", summary)
+        events.append(event)
+
+    with django_assert_num_queries(1):
+        result = get_users_from_ical_events(events, organization)
+
+    assert result == [
+        ([user], []),
+        ([other_user], []),
+        ([], ["missing"]),
+        # users without permission to receive notifications are missing
+        ([], [viewer.username]),
+        ([], []),
+    ]
+    for event, (users, missing_users) in zip(events, result):
+        assert users == get_users_from_ical_event(event, organization)
+        assert missing_users == get_missing_users_from_ical_event(event, organization)
+
+
+@pytest.mark.django_db
+def test_get_users_from_ical_events_username_case_insensitive(make_organization_and_user, make_user_for_organization):
+    organization, _ = make_organization_and_user()
+    user = make_user_for_organization(organization, username="foo")
+    event = icalendar.Event()
+    event.add("summary", "FOO")
+
+    assert users_in_ical(["FOO"], organization) == [user]
+    assert get_users_from_ical_event(event, organization) == [user]
+    assert get_missing_users_from_ical_event(event, organization) == []
+    assert get_users_from_ical_events([event], organization) == [([user], [])]
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "role,included",
@@ -0,0 +1,73 @@
+import datetime
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from apps.schedules.models import CustomOnCallShift, OnCallScheduleWeb
+from apps.schedules.oncall_now_index import get_organization_oncall_now, set_schedule_oncall_now
+
+
+@pytest.mark.django_db
+def test_organization_oncall_now(
+    make_organization, make_user_for_organization, make_schedule, make_on_call_shift, django_assert_num_queries
+):
+    organization = make_organization()
+    user_1 = make_user_for_organization(organization)
+    user_2 = make_user_for_organization(organization)
+
+    now = timezone.now()
+    shift_start = now.replace(minute=0, second=0, microsecond=0) - datetime.timedelta(hours=1)
+    shift_end = shift_start + datetime.timedelta(hours=3)
+    schedules = []
+    for user in (user_1, user_2):
+        schedule = make_schedule(organization, schedule_class=OnCallScheduleWeb)
+        on_call_shift = make_on_call_shift(
+            organization=organization,
+            shift_type=CustomOnCallShift.TYPE_ROLLING_USERS_EVENT,
+            start=shift_start,
+            rotation_start=shift_start,
+            duration=shift_end - shift_start,
+            priority_level=1,
+            frequency=CustomOnCallShift.FREQUENCY_DAILY,
+            schedule=schedule,
+        )
+        on_call_shift.add_rolling_users([[user]])
+        schedule.refresh_ical_file()
+        schedules.append(schedule)
+    # users of the first schedule are updated on final schedule refresh, the second schedule is calculated on demand
+    schedules[0].refresh_ical_final_schedule()
+
+    oncall_now = get_organization_oncall_now(organization)
+    assert oncall_now.user_ids == {user_1.pk, user_2.pk}
+    assert oncall_now.schedule_ids_by_user[user_1.pk] == [schedules[0].pk]
+    assert oncall_now.is_oncall(user_2)
+
+    # on-call users are cached, only schedule ids are fetched
+    with django_assert_num_queries(1):
+        assert get_organization_oncall_now(organization).user_ids == {user_1.pk, user_2.pk}
+
+    # users are recalculated once the shift boundary is passed
+    with patch("apps.schedules.oncall_now_index.timezone.now", return_value=shift_end + datetime.timedelta(minutes=1)):
+        assert get_organization_oncall_now(organization).user_ids == set()
+
+    # deleted schedules are dropped
+    schedules[1].delete()
+    assert get_organization_oncall_now(organization).user_ids == set()
+
+
+@pytest.mark.django_db
+def test_set_schedule_oncall_now_keeps_other_schedules(
+    make_organization, make_user_for_organization, make_schedule, django_assert_num_queries
+):
+    organization = make_organization()
+    users = [make_user_for_organization(organization) for _ in range(2)]
+    schedules = [make_schedule(organization, schedule_class=OnCallScheduleWeb) for _ in range(2)]
+
+    # schedules of an organization are refreshed concurrently, updating one of them doesn't drop the others
+    for schedule, user in zip(schedules, users):
+        set_schedule_oncall_now(schedule, [user])
+
+    with django_assert_num_queries(1):
+        oncall_now = get_organization_oncall_now(organization)
+    assert oncall_now.schedule_ids_by_user == {users[0].pk: [schedules[0].pk], users[1].pk: [schedules[1].pk]}
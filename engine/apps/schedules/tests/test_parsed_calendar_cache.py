@@ -0,0 +1,106 @@
+import textwrap
+from unittest.mock import patch
+
+import icalendar
+import pytest
+
+from apps.schedules.models import OnCallScheduleICal
+from apps.schedules.parsed_calendar_cache import ParsedCalendarCache
+
+ICAL_TEMPLATE = textwrap.dedent(
+    """
+    BEGIN:VCALENDAR
+    VERSION:2.0
+    BEGIN:VEVENT
+    UID:{uid}
+    SUMMARY:user
+    DTSTART:20230101T000000Z
+    DTEND:20230101T120000Z
+    END:VEVENT
+    END:VCALENDAR
+    """
+).strip()
+
+
+def _get_ical(uid: str) -> str:
+    return ICAL_TEMPLATE.format(uid=uid)
+
+
+def test_parsed_calendar_cache_hit_and_miss():
+    cache = ParsedCalendarCache(max_size=10, max_bytes=10000)
+    ical = _get_ical("a")
+
+    calendar = cache.get_calendar(1, "primary", ical)
+    assert cache.get_calendar(1, "primary", ical) is calendar
+    assert [c["UID"] for c in calendar.walk("VEVENT")] == ["a"]
+
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size == 1
+    assert stats.size_bytes == len(ical)
+
+
+def test_parsed_calendar_cache_replaces_changed_ical():
+    cache = ParsedCalendarCache(max_size=10, max_bytes=10000)
+
+    first = cache.get_calendar(1, "primary", _get_ical("a"))
+    second = cache.get_calendar(1, "primary", _get_ical("b"))
+    assert second is not first
+    assert [c["UID"] for c in second.walk("VEVENT")] == ["b"]
+
+    # previous version of the calendar is replaced, not kept next to the new one
+    stats = cache.stats()
+    assert stats.size == 1
+    assert stats.size_bytes == len(_get_ical("b"))
+    assert stats.evictions == 0
+
+
+def test_parsed_calendar_cache_limits():
+    ical = _get_ical("a")
+
+    cache = ParsedCalendarCache(max_size=2, max_bytes=10000)
+    first = cache.get_calendar(1, "primary", ical)
+    cache.get_calendar(2, "primary", ical)
+    # touch the first calendar so the second one is the least recently used
+    cache.get_calendar(1, "primary", ical)
+    cache.get_calendar(3, "primary", ical)
+    assert cache.stats().evictions == 1
+    assert cache.get_calendar(1, "primary", ical) is first
+
+    cache = ParsedCalendarCache(max_size=10, max_bytes=len(ical) * 2)
+    for schedule_pk in range(3):
+        cache.get_calendar(schedule_pk, "primary", ical)
+    stats = cache.stats()
+    assert stats.size == 2
+    assert stats.size_bytes <= len(ical) * 2
+
+    # calendars larger than the memory limit are parsed but never cached
+    cache = ParsedCalendarCache(max_size=10, max_bytes=len(ical) - 1)
+    assert cache.get_calendar(1, "primary", ical) is not None
+    assert cache.stats().size == 0
+
+
+@pytest.mark.django_db
+def test_get_icalendars_parses_ical_once(make_organization, make_schedule):
+    organization = make_organization()
+    schedule = make_schedule(
+        organization,
+        schedule_class=OnCallScheduleICal,
+        cached_ical_file_primary=_get_ical("primary"),
+        cached_ical_file_overrides=_get_ical("overrides"),
+    )
+
+    with patch.object(icalendar.Calendar, "from_ical", wraps=icalendar.Calendar.from_ical) as mock_from_ical:
+        for _ in range(3):
+            primary, overrides = schedule.get_icalendars()
+    assert mock_from_ical.call_count == 2
+    assert [c["UID"] for c in primary.walk("VEVENT")] == ["primary"]
+    assert [c["UID"] for c in overrides.walk("VEVENT")] == ["overrides"]
+
+    # calendar is parsed again once the ical changes
+    schedule.cached_ical_file_primary = _get_ical("updated")
+    schedule.save(update_fields=["cached_ical_file_primary"])
+    schedule = OnCallScheduleICal.objects.get(pk=schedule.pk)
+    primary, _ = schedule.get_icalendars()
+    assert [c["UID"] for c in primary.walk("VEVENT")] == ["updated"]
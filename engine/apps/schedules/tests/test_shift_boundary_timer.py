@@ -0,0 +1,187 @@
+import datetime
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from apps.mobile_app.tasks.going_oncall_notification import (
+    conditionally_send_going_oncall_push_notifications_for_all_schedules,
+    conditionally_send_going_oncall_push_notifications_for_schedule,
+)
+from apps.schedules.final_events_index import ScheduleFinalEventsIndex, drop_final_events_index
+from apps.schedules.models import CustomOnCallShift, OnCallScheduleWeb
+from apps.schedules.shift_boundary_timer import (
+    GOING_ONCALL,
+    SHIFT_BOUNDARY,
+    arm_schedule_shift_boundary_timer,
+    get_armed_schedule_pks,
+    get_next_timeline_point,
+    get_schedule_shift_boundary_timer,
+)
+from apps.schedules.tasks import run_shift_boundary_timer
+from apps.slack.tasks import start_update_slack_user_group_for_schedules, update_slack_user_group_for_schedules
+
+
+def test_get_next_timeline_point():
+    start = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+    hour = datetime.timedelta(hours=1)
+    minute = datetime.timedelta(minutes=1)
+    events = [
+        {"start": start + 3 * hour, "end": start + 5 * hour + 45 * minute, "users": [{"pk": "U1", "email": ""}]},
+        {"start": start + 6 * hour, "end": start + 7 * hour, "users": [{"pk": "U2", "email": ""}]},
+    ]
+    for event in events:
+        event["priority_level"] = 0
+    index = ScheduleFinalEventsIndex.from_events("fingerprint", events, start, start + 8 * hour)
+
+    # nothing to do within the max delay, the timer is just re-armed
+    assert get_next_timeline_point(index, start) == (start + 30 * minute, [])
+    # going on-call notification an hour before the shift start
+    assert get_next_timeline_point(index, start + hour + 30 * minute) == (start + 2 * hour, [GOING_ONCALL])
+    # and 15 minutes before the shift start
+    assert get_next_timeline_point(index, start + 2 * hour + 30 * minute) == (
+        start + 2 * hour + 45 * minute,
+        [GOING_ONCALL],
+    )
+    assert get_next_timeline_point(index, start + 2 * hour + 45 * minute) == (start + 3 * hour, [SHIFT_BOUNDARY])
+    # shift end coincides with the going on-call notification for the next shift
+    assert get_next_timeline_point(index, start + 5 * hour + 30 * minute) == (
+        start + 5 * hour + 45 * minute,
+        [GOING_ONCALL, SHIFT_BOUNDARY],
+    )
+    # no timeline points after the end of the indexed window
+    assert get_next_timeline_point(index, start + 7 * hour + 30 * minute) == (start + 8 * hour, [])
+
+
+@pytest.fixture
+def make_schedule_with_shift(make_organization, make_user_for_organization, make_schedule, make_on_call_shift):
+    def _make_schedule_with_shift(shift_start, organization=None, **schedule_kwargs):
+        organization = organization or make_organization()
+        user = make_user_for_organization(organization)
+        schedule = make_schedule(organization, schedule_class=OnCallScheduleWeb, **schedule_kwargs)
+        on_call_shift = make_on_call_shift(
+            organization=organization,
+            shift_type=CustomOnCallShift.TYPE_ROLLING_USERS_EVENT,
+            start=shift_start,
+            rotation_start=shift_start,
+            duration=datetime.timedelta(hours=2),
+            priority_level=1,
+            frequency=CustomOnCallShift.FREQUENCY_DAILY,
+            schedule=schedule,
+        )
+        on_call_shift.add_rolling_users([[user]])
+        schedule.refresh_ical_file()
+        schedule.refresh_ical_final_schedule()
+        return schedule
+
+    return _make_schedule_with_shift
+
+
+@pytest.mark.django_db
+def test_arm_schedule_shift_boundary_timer(make_schedule_with_shift):
+    now = timezone.now().replace(second=0, microsecond=0)
+    shift_start = now + datetime.timedelta(minutes=10)
+    schedule = make_schedule_with_shift(shift_start)
+
+    with patch.object(run_shift_boundary_timer, "apply_async") as mock_apply_async:
+        arm_schedule_shift_boundary_timer(schedule, now=now)
+        # the same timer is not armed twice
+        arm_schedule_shift_boundary_timer(schedule, now=now)
+
+    timer = get_schedule_shift_boundary_timer(schedule.pk)
+    # the shift starts, and the next day shift starts in a day
+    assert timer["kinds"] == [GOING_ONCALL, SHIFT_BOUNDARY]
+    mock_apply_async.assert_called_once_with((schedule.pk,), eta=shift_start, task_id=timer["task_id"])
+    assert get_armed_schedule_pks([schedule.pk, schedule.pk + 1]) == {schedule.pk}
+
+    # schedules without an up-to-date index are disarmed, so they are polled
+    drop_final_events_index(schedule.pk)
+    with patch.object(run_shift_boundary_timer, "apply_async") as mock_apply_async:
+        arm_schedule_shift_boundary_timer(schedule, now=now)
+    mock_apply_async.assert_not_called()
+    assert get_armed_schedule_pks([schedule.pk]) == set()
+
+
+@pytest.mark.django_db
+def test_run_shift_boundary_timer(
+    make_organization_with_slack_team_identity, make_slack_channel, make_slack_user_group, make_schedule_with_shift
+):
+    organization, slack_team_identity = make_organization_with_slack_team_identity()
+    now = timezone.now().replace(second=0, microsecond=0)
+    schedule = make_schedule_with_shift(
+        now + datetime.timedelta(minutes=10),
+        organization=organization,
+        slack_channel=make_slack_channel(slack_team_identity),
+        user_group=make_slack_user_group(slack_team_identity),
+    )
+    with patch.object(run_shift_boundary_timer, "apply_async"):
+        arm_schedule_shift_boundary_timer(schedule, now=now)
+    task_id = get_schedule_shift_boundary_timer(schedule.pk)["task_id"]
+
+    with patch("apps.schedules.tasks.shift_boundary_timer.notify_ical_schedule_shift") as mock_notify_shift:
+        with patch.object(update_slack_user_group_for_schedules, "delay") as mock_update_user_group:
+            with patch.object(
+                conditionally_send_going_oncall_push_notifications_for_schedule, "apply_async"
+            ) as mock_push:
+                with patch.object(run_shift_boundary_timer, "apply_async") as mock_apply_async:
+                    # superseded timers are no-op
+                    run_shift_boundary_timer.apply((schedule.pk,), task_id="superseded")
+                    mock_notify_shift.apply_async.assert_not_called()
+                    mock_apply_async.assert_not_called()
+
+                    run_shift_boundary_timer.apply((schedule.pk,), task_id=task_id)
+
+    mock_notify_shift.apply_async.assert_called_once_with((schedule.pk,))
+    mock_update_user_group.assert_called_once_with(user_group_pk=schedule.user_group_id)
+    mock_push.assert_called_once_with((schedule.pk,))
+    # the timer is re-armed for the next point
+    timer = get_schedule_shift_boundary_timer(schedule.pk)
+    assert timer["task_id"] != task_id
+    assert timer["eta"] > (now + datetime.timedelta(minutes=10)).timestamp()
+    mock_apply_async.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_run_shift_boundary_timer_going_oncall(make_schedule_with_shift):
+    now = timezone.now().replace(second=0, microsecond=0)
+    schedule = make_schedule_with_shift(now + datetime.timedelta(minutes=30))
+    with patch.object(run_shift_boundary_timer, "apply_async"):
+        arm_schedule_shift_boundary_timer(schedule, now=now)
+    timer = get_schedule_shift_boundary_timer(schedule.pk)
+    assert timer["kinds"] == [GOING_ONCALL]
+
+    with patch("apps.schedules.tasks.shift_boundary_timer.notify_ical_schedule_shift") as mock_notify_shift:
+        with patch.object(conditionally_send_going_oncall_push_notifications_for_schedule, "apply_async") as mock_push:
+            with patch.object(run_shift_boundary_timer, "apply_async"):
+                run_shift_boundary_timer.apply((schedule.pk,), task_id=timer["task_id"])
+
+    mock_push.assert_called_once_with((schedule.pk,))
+    mock_notify_shift.apply_async.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_polling_skips_armed_schedules(
+    make_organization_with_slack_team_identity, make_slack_user_group, make_schedule_with_shift
+):
+    organization, slack_team_identity = make_organization_with_slack_team_identity()
+    user_group = make_slack_user_group(slack_team_identity)
+    now = timezone.now()
+    armed_schedule = make_schedule_with_shift(now, organization=organization, user_group=user_group)
+    schedule = make_schedule_with_shift(now, organization=organization)
+    with patch.object(run_shift_boundary_timer, "apply_async"):
+        arm_schedule_shift_boundary_timer(armed_schedule)
+
+    with patch.object(conditionally_send_going_oncall_push_notifications_for_schedule, "apply_async") as mock_push:
+        conditionally_send_going_oncall_push_notifications_for_all_schedules()
+    mock_push.assert_called_once_with((schedule.pk,))
+
+    # user groups are polled unless all their schedules are armed
+    with patch.object(update_slack_user_group_for_schedules, "delay") as mock_update_user_group:
+        start_update_slack_user_group_for_schedules()
+    mock_update_user_group.assert_not_called()
+
+    schedule.user_group = user_group
+    schedule.save(update_fields=["user_group"])
+    with patch.object(update_slack_user_group_for_schedules, "delay") as mock_update_user_group:
+        start_update_slack_user_group_for_schedules()
+    mock_update_user_group.assert_called_once_with(user_group_pk=user_group.pk)
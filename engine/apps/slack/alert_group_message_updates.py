@@ -0,0 +1,114 @@
+import logging
+import typing
+
+from celery import uuid as celery_uuid
+from django.core.cache import cache
+
+from apps.slack.tasks import flush_alert_group_slack_message_updates
+from common.cache import ensure_cache_key_allocates_to_the_same_hash_slot
+
+if typing.TYPE_CHECKING:
+    from apps.slack.models import SlackMessage
+
+logger = logging.getLogger(__name__)
+
+ALERT_GROUP_MESSAGE_UPDATES_CACHE_KEY_PREFIX = "slack_alert_group_message_updates"
+# queued updates are kept for a while after the flush is due, in case the flush task is delayed
+ALERT_GROUP_MESSAGE_UPDATES_CACHE_TIMEOUT_MARGIN = 10 * 60
+# added to the queue size when the flush takes queued messages, so messages can't be queued to the flush anymore
+CLOSED_QUEUE_SIZE = 1 << 32
+
+
+def _get_cache_key(name: str) -> str:
+    return ensure_cache_key_allocates_to_the_same_hash_slot(
+        f"{ALERT_GROUP_MESSAGE_UPDATES_CACHE_KEY_PREFIX}_{name}", ALERT_GROUP_MESSAGE_UPDATES_CACHE_KEY_PREFIX
+    )
+
+
+def _get_team_flush_cache_key(slack_team_identity_pk: int) -> str:
+    return _get_cache_key(f"team_{slack_team_identity_pk}")
+
+
+def _get_flush_size_cache_key(flush_id: str) -> str:
+    return _get_cache_key(f"{flush_id}_size")
+
+
+def _get_flush_item_cache_key(flush_id: str, position: int) -> str:
+    return _get_cache_key(f"{flush_id}_{position}")
+
+
+def _get_or_schedule_flush(slack_team_identity_pk: int, countdown: int) -> str:
+    team_flush_cache_key = _get_team_flush_cache_key(slack_team_identity_pk)
+    flush_id = celery_uuid()
+    if cache.add(team_flush_cache_key, flush_id, timeout=countdown + ALERT_GROUP_MESSAGE_UPDATES_CACHE_TIMEOUT_MARGIN):
+        logger.info(
+            f"scheduling alert group message updates flush {flush_id} for slack team identity "
+            f"{slack_team_identity_pk} in {countdown} seconds"
+        )
+        flush_alert_group_slack_message_updates.apply_async(
+            (slack_team_identity_pk, flush_id), countdown=countdown, task_id=flush_id
+        )
+        return flush_id
+
+    scheduled_flush_id = cache.get(team_flush_cache_key)
+    if scheduled_flush_id is None:
+        # the flush has just started, start a new one
+        return _get_or_schedule_flush(slack_team_identity_pk, countdown)
+    return scheduled_flush_id
+
+
+def queue_alert_group_message_update(slack_message: "SlackMessage", countdown: int) -> str:
+    """
+    Queue the alert group message update to the next flush of its Slack team, scheduling the flush in countdown
+    seconds if there is none yet. Updates of all alert groups in the Slack team queued in the meantime are done by
+    the same flush task (see flush_alert_group_slack_message_updates).
+
+    The flush ID is set as the active update task ID of the message, so following debounced updates of the message are
+    coalesced into the flush. Return the flush ID.
+    """
+    flush_id = _get_or_schedule_flush(slack_message._slack_team_identity_id, countdown)
+    timeout = countdown + ALERT_GROUP_MESSAGE_UPDATES_CACHE_TIMEOUT_MARGIN
+
+    slack_message.set_active_update_task_id(flush_id, countdown)
+
+    # queued messages are stored under sequential keys, so they can be added concurrently without losing any
+    size_cache_key = _get_flush_size_cache_key(flush_id)
+    cache.add(size_cache_key, 0, timeout=timeout)
+    try:
+        position = cache.incr(size_cache_key)
+    except ValueError:
+        # the flush expired in between, start a new one
+        return queue_alert_group_message_update(slack_message, countdown)
+    if position > CLOSED_QUEUE_SIZE:
+        # the flush has already taken queued messages, queue to the next one
+        return queue_alert_group_message_update(slack_message, countdown)
+
+    cache.set(_get_flush_item_cache_key(flush_id, position), str(slack_message.pk), timeout=timeout)
+    if cache.get(size_cache_key, CLOSED_QUEUE_SIZE) >= CLOSED_QUEUE_SIZE:
+        # the flush took queued messages in between, possibly without this one, queue to the next one as well
+        # (the flush skips the message then, as its active update task ID is changed)
+        return queue_alert_group_message_update(slack_message, countdown)
+    return flush_id
+
+
+def pop_queued_slack_message_pks(slack_team_identity_pk: int, flush_id: str) -> typing.List[str]:
+    """
+    Return primary keys of slack messages queued to the flush, new updates are queued to the next flush from now on.
+    """
+    team_flush_cache_key = _get_team_flush_cache_key(slack_team_identity_pk)
+    if cache.get(team_flush_cache_key) == flush_id:
+        cache.delete(team_flush_cache_key)
+
+    # close the queue atomically with taking its size, messages queued concurrently are requeued by their producers
+    # (see queue_alert_group_message_update). The size is kept until it expires, so the queue can't be recreated.
+    size_cache_key = _get_flush_size_cache_key(flush_id)
+    cache.add(size_cache_key, 0, timeout=ALERT_GROUP_MESSAGE_UPDATES_CACHE_TIMEOUT_MARGIN)
+    try:
+        size = cache.incr(size_cache_key, CLOSED_QUEUE_SIZE) - CLOSED_QUEUE_SIZE
+    except ValueError:
+        # the queue was evicted in between
+        return []
+    item_cache_keys = [_get_flush_item_cache_key(flush_id, position) for position in range(1, size + 1)]
+    queued = cache.get_many(item_cache_keys)
+    cache.delete_many(item_cache_keys)
+    return list(dict.fromkeys(queued[key] for key in item_cache_keys if key in queued))
@@ -1,4 +1,5 @@
 import logging
+import time
 import typing
 from typing import Optional, Tuple
 
@@ -9,7 +10,15 @@ from slack_sdk.http_retry import HttpRequest, HttpResponse, RetryHandler, RetryS
 from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 from slack_sdk.web import SlackResponse, WebClient
 
-from apps.slack.errors import SlackAPIRatelimitError, SlackAPIServerError, SlackAPITokenError, get_error_class
+from apps.slack.constants import SLACK_RATE_LIMIT_DELAY
+from apps.slack.errors import (
+    SlackAPIRatelimitError,
+    SlackAPIRateSchedulerThrottledError,
+    SlackAPIServerError,
+    SlackAPITokenError,
+    get_error_class,
+)
+from apps.slack.rate_scheduler import SlackAPIPriority, slack_rate_scheduler
 
 if typing.TYPE_CHECKING:
     from apps.slack.models import SlackTeamIdentity
@@ -50,8 +59,16 @@ server_error_retry_handler = SlackServerErrorRetryHandler(max_retry_count=2)
 
 class SlackClient(WebClient):
     def __init__(
-        self, slack_team_identity: "SlackTeamIdentity", enable_ratelimit_retry=False, timeout: int = 30
+        self,
+        slack_team_identity: "SlackTeamIdentity",
+        enable_ratelimit_retry=False,
+        timeout: int = 30,
+        priority: Optional[SlackAPIPriority] = None,
     ) -> None:
+        """
+        `priority` overrides priority of the calls in the Slack team rate budget, which is based on the API method
+        by default (see apps.slack.rate_scheduler)
+        """
         retry_handlers = default_retry_handlers() + [server_error_retry_handler]
         if enable_ratelimit_retry:
             retry_handlers += [rate_limit_handler]
@@ -62,6 +79,8 @@ class SlackClient(WebClient):
             retry_handlers=retry_handlers,
         )
         self.slack_team_identity = slack_team_identity
+        self.priority = priority
+        self.enable_ratelimit_retry = enable_ratelimit_retry
 
     def paginated_api_call(self, method: str, paginated_key: str, **kwargs):
         """
@@ -122,7 +141,27 @@ class SlackClient(WebClient):
         return cumulative_response, cursor, rate_limited
 
     def api_call(self, *args, **kwargs) -> SlackResponse:
-        """Wrap Slack SDK api_call with more granular error handling and logging"""
+        """Wrap Slack SDK api_call with rate scheduling, more granular error handling and logging"""
+
+        api_method = kwargs["api_method"] if "api_method" in kwargs else args[0]
+        channel = self._get_channel(kwargs)
+        wait = slack_rate_scheduler.acquire(self.slack_team_identity.pk, api_method, channel, self.priority)
+        # wait for the budget the same way rate_limit_handler waits on HTTP 429 when rate limit retries are enabled
+        retry_count = 0
+        while wait and self.enable_ratelimit_retry and retry_count < rate_limit_handler.max_retry_count:
+            logger.info(
+                f"Slack API call waits for rate scheduler, slack_team_identity={self.slack_team_identity.pk} "
+                f"api_method={api_method} channel={channel} wait={wait}"
+            )
+            time.sleep(wait)
+            retry_count += 1
+            wait = slack_rate_scheduler.acquire(self.slack_team_identity.pk, api_method, channel, self.priority)
+        if wait:
+            logger.info(
+                f"Slack API call deferred by rate scheduler, slack_team_identity={self.slack_team_identity.pk} "
+                f"api_method={api_method} channel={channel} retry_after={wait}"
+            )
+            raise SlackAPIRateSchedulerThrottledError(wait)
 
         try:
             response = super().api_call(*args, **kwargs)
@@ -149,9 +188,25 @@ class SlackClient(WebClient):
             else:
                 self._unmark_token_revoked()
 
+            # let other processes know the budget is spent
+            if error_class is SlackAPIRatelimitError:
+                slack_rate_scheduler.block(
+                    self.slack_team_identity.pk,
+                    api_method,
+                    channel,
+                    int(e.response.headers.get("Retry-After", SLACK_RATE_LIMIT_DELAY)),
+                )
+
             # raise the narrowed down error class
             raise error_class(e.response) from e
 
+    @staticmethod
+    def _get_channel(kwargs: dict) -> Optional[str]:
+        for params in (kwargs.get("json"), kwargs.get("data"), kwargs.get("params")):
+            if isinstance(params, dict) and params.get("channel"):
+                return params["channel"]
+        return None
+
     def _mark_token_revoked(self) -> None:
         if not self.slack_team_identity.detected_token_revoked:
             self.slack_team_identity.detected_token_revoked = timezone.now()
@@ -44,6 +44,21 @@ class SlackAPIRatelimitError(SlackAPIError):
         self.retry_after = int(response.headers.get("Retry-After", SLACK_RATE_LIMIT_DELAY))
 
 
+class SlackAPIRateSchedulerThrottledError(SlackAPIRatelimitError):
+    """
+    Raised instead of calling Slack API when the call doesn't fit into the rate budget of the Slack team.
+    See apps.slack.rate_scheduler for more details.
+    """
+
+    errors = ()
+
+    def __init__(self, retry_after: int):
+        SlackAPIError.__init__(
+            self, {"status": 429, "headers": {"Retry-After": retry_after}, "body": "throttled by rate scheduler"}
+        )
+        self.retry_after = retry_after
+
+
 class SlackAPIPlanUpgradeRequiredError(SlackAPIError):
     errors = ("plan_upgrade_required",)
 
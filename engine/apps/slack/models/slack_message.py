@@ -8,6 +8,7 @@ from django.core.cache import cache
 from django.db import models
 from django.utils import timezone
 
+from apps.slack.alert_group_message_updates import queue_alert_group_message_update
 from apps.slack.client import SlackClient
 from apps.slack.constants import BLOCK_SECTION_TEXT_MAX_SIZE
 from apps.slack.errors import (
@@ -35,6 +36,7 @@ class SlackMessage(models.Model):
     channel: "SlackChannel"
 
     ALERT_GROUP_UPDATE_DEBOUNCE_INTERVAL_SECONDS = 45
+    CONTENT_HASH_CACHE_TIMEOUT = 24 * 60 * 60
 
     id = models.CharField(primary_key=True, default=uuid.uuid4, editable=False, max_length=36)
     slack_id = models.CharField(max_length=100)
@@ -252,19 +254,35 @@ class SlackMessage(models.Model):
     def get_active_update_task_id(self) -> typing.Optional[str]:
         return cache.get(self._get_update_message_cache_key(), default=None)
 
-    def set_active_update_task_id(self, task_id: str) -> None:
+    def set_active_update_task_id(self, task_id: str, countdown: int = 0) -> None:
         """
-        NOTE: we store the task ID in the cache for twice the debounce interval to ensure that the task ID is
-        EVENTUALLY removed. The background task which updates the message will remove the task ID from the cache, but
-        this is a safety measure in case the task fails to run or complete. The task ID would be removed from the cache
-        which would then allow the message to be updated again in a subsequent call to this method.
+        NOTE: we store the task ID in the cache for twice the debounce interval (on top of the task countdown) to
+        ensure that the task ID is EVENTUALLY removed. The background task which updates the message will remove the
+        task ID from the cache, but this is a safety measure in case the task fails to run or complete. The task ID
+        would be removed from the cache which would then allow the message to be updated again in a subsequent call to
+        this method.
         """
         cache.set(
             self._get_update_message_cache_key(),
             task_id,
-            timeout=self.ALERT_GROUP_UPDATE_DEBOUNCE_INTERVAL_SECONDS * 2,
+            timeout=countdown + self.ALERT_GROUP_UPDATE_DEBOUNCE_INTERVAL_SECONDS * 2,
         )
 
+    def _get_content_hash_cache_key(self) -> str:
+        return f"slack_message_content_hash_{self.pk}"
+
+    def get_content_hash(self) -> typing.Optional[str]:
+        """
+        Hash of the alert group message content last sent to Slack, used to skip updates which wouldn't change it.
+        """
+        return cache.get(self._get_content_hash_cache_key())
+
+    def set_content_hash(self, content_hash: typing.Optional[str]) -> None:
+        if content_hash is None:
+            cache.delete(self._get_content_hash_cache_key())
+        else:
+            cache.set(self._get_content_hash_cache_key(), content_hash, timeout=self.CONTENT_HASH_CACHE_TIMEOUT)
+
     def mark_active_update_task_as_complete(self) -> None:
         self.last_updated = timezone.now()
         self.save(update_fields=["last_updated"])
@@ -284,7 +302,8 @@ class SlackMessage(models.Model):
         duplicate scheduling.
         - Calculates the time since the last update (`last_updated` field) and determines the remaining time needed
         to respect the debounce interval.
-        - Schedules the `update_alert_group_slack_message` task with the calculated countdown.
+        - Schedules the `update_alert_group_slack_message` task with the calculated countdown, or queues the update
+        to the `flush_alert_group_slack_message_updates` task of the Slack team when debouncing.
         - Stores the task ID in the cache to prevent multiple tasks from being scheduled.
 
         debounce: bool - this is intended to be used when we want to debounce updates to the message. Examples:
@@ -320,6 +339,11 @@ class SlackMessage(models.Model):
             f"(debounce interval: {self.ALERT_GROUP_UPDATE_DEBOUNCE_INTERVAL_SECONDS})"
         )
 
+        if debounce and self._slack_team_identity_id is not None:
+            # debounced updates of all alert groups in the Slack team are batched into a single flush task
+            queue_alert_group_message_update(self, countdown)
+            return
+
         task_id = celery_uuid()
 
         # NOTE: we need to persist the task ID in the cache before scheduling the task to prevent
@@ -329,3 +353,14 @@ class SlackMessage(models.Model):
         # (see update_alert_group_slack_message task for more details)
         self.set_active_update_task_id(task_id)
         update_alert_group_slack_message.apply_async((self.pk,), countdown=countdown, task_id=task_id)
+
+    def defer_alert_groups_message_update(self, countdown: int) -> None:
+        """
+        Reschedule the update task when the Slack team is out of its rate budget (see apps.slack.rate_scheduler).
+        The rescheduled task stays the active update task, so updates requested in the meantime are coalesced into it.
+        """
+        logger.info(f"deferring message update for alert_group {self.alert_group.pk} by {countdown} seconds")
+
+        task_id = celery_uuid()
+        self.set_active_update_task_id(task_id, countdown)
+        update_alert_group_slack_message.apply_async((self.pk,), countdown=countdown, task_id=task_id)
@@ -0,0 +1,216 @@
+import enum
+import math
+import random
+import time
+import typing
+
+from django.conf import settings
+from django.core.cache import cache
+
+from common.cache import ensure_cache_key_allocates_to_the_same_hash_slot
+
+SLACK_RATE_SCHEDULER_CACHE_KEY_PREFIX = "slack_rate_scheduler"
+# budgets are per minute, same as Slack rate limit tiers (https://api.slack.com/apis/rate-limits)
+SLACK_RATE_SCHEDULER_WINDOW_SECONDS = 60
+# upper bounds of the deferred call wait time histogram, in seconds
+SLACK_RATE_SCHEDULER_WAIT_BUCKETS = (1, 5, 10, 30, 60, 120, 300)
+
+
+class SlackAPIPriority(enum.IntEnum):
+    # updates of existing messages, which are coalesced while deferred
+    LOW = 0
+    NORMAL = 1
+    # new alert group messages and thread posts
+    HIGH = 2
+
+
+class SlackAPITier(enum.Enum):
+    TIER_1 = "tier_1"
+    TIER_2 = "tier_2"
+    TIER_3 = "tier_3"
+    TIER_4 = "tier_4"
+    # chat.postMessage allows about one message per second per channel
+    POST_MESSAGE = "post_message"
+
+
+# calls per minute
+SLACK_API_TIER_RATES = {
+    SlackAPITier.TIER_1: 1,
+    SlackAPITier.TIER_2: 20,
+    SlackAPITier.TIER_3: 50,
+    SlackAPITier.TIER_4: 100,
+    SlackAPITier.POST_MESSAGE: 60,
+}
+
+# methods not listed here are scheduled as TIER_3
+SLACK_API_METHOD_TIERS = {
+    "chat.postMessage": SlackAPITier.POST_MESSAGE,
+    "chat.update": SlackAPITier.TIER_3,
+    "chat.delete": SlackAPITier.TIER_3,
+    "chat.postEphemeral": SlackAPITier.TIER_4,
+    "chat.getPermalink": SlackAPITier.TIER_4,
+    "conversations.list": SlackAPITier.TIER_2,
+    "conversations.info": SlackAPITier.TIER_3,
+    "conversations.members": SlackAPITier.TIER_4,
+    "reactions.add": SlackAPITier.TIER_3,
+    "users.list": SlackAPITier.TIER_2,
+    "users.info": SlackAPITier.TIER_4,
+    "users.profile.get": SlackAPITier.TIER_4,
+    "usergroups.list": SlackAPITier.TIER_2,
+    "usergroups.users.list": SlackAPITier.TIER_2,
+    "usergroups.users.update": SlackAPITier.TIER_2,
+    "views.open": SlackAPITier.TIER_4,
+    "views.push": SlackAPITier.TIER_4,
+    "views.update": SlackAPITier.TIER_4,
+}
+
+SLACK_API_METHOD_PRIORITIES = {
+    "chat.postMessage": SlackAPIPriority.HIGH,
+    "chat.update": SlackAPIPriority.LOW,
+}
+
+
+def get_api_method_tier(api_method: str) -> SlackAPITier:
+    return SLACK_API_METHOD_TIERS.get(api_method, SlackAPITier.TIER_3)
+
+
+def get_api_method_priority(api_method: str) -> SlackAPIPriority:
+    return SLACK_API_METHOD_PRIORITIES.get(api_method, SlackAPIPriority.NORMAL)
+
+
+def _get_cache_key(name: str) -> str:
+    return ensure_cache_key_allocates_to_the_same_hash_slot(
+        f"{SLACK_RATE_SCHEDULER_CACHE_KEY_PREFIX}_{name}", SLACK_RATE_SCHEDULER_CACHE_KEY_PREFIX
+    )
+
+
+def get_queue_depth_stat_name(priority: SlackAPIPriority, window: int) -> str:
+    return f"queued_{priority.name.lower()}_{window}"
+
+
+def get_wait_bucket_stat_name(priority: SlackAPIPriority, bucket: typing.Union[int, str]) -> str:
+    return f"wait_{priority.name.lower()}_le_{bucket}"
+
+
+def get_wait_sum_stat_name(priority: SlackAPIPriority) -> str:
+    return f"wait_{priority.name.lower()}_sum"
+
+
+def get_stats(names: typing.List[str]) -> typing.Dict[str, int]:
+    cached_stats = cache.get_many([_get_cache_key(f"stats_{name}") for name in names])
+    return {name: cached_stats.get(_get_cache_key(f"stats_{name}"), 0) for name in names}
+
+
+def get_current_window() -> int:
+    return int(time.time() // SLACK_RATE_SCHEDULER_WINDOW_SECONDS)
+
+
+class SlackRateScheduler:
+    """
+    Distributed per-minute budget of Slack API calls per Slack team and API method (and per channel for
+    chat.postMessage), shared by all processes through the cache. The budget is the rate of the method tier.
+
+    Calls are admitted until the budget share of their priority is spent: updates of existing messages can only use
+    SLACK_RATE_SCHEDULER_LOW_PRIORITY_SHARE of the budget and other calls except alert posts
+    SLACK_RATE_SCHEDULER_NORMAL_PRIORITY_SHARE, so the rest of the budget is always left for new alert group messages.
+    Calls over the budget are not sent, the caller is told how long to wait instead, so it can defer the call to the
+    next window (see SlackClient.api_call). Buckets are blocked for Retry-After seconds when Slack responds with HTTP
+    429, so other processes don't keep hitting the limit.
+
+    Number of calls deferred to the next window and their wait time are kept in the cache for
+    SlackRateSchedulerMetricsCollector.
+    """
+
+    def __init__(self, enabled: bool, low_priority_share: float, normal_priority_share: float) -> None:
+        self.enabled = enabled
+        self._priority_shares = {
+            SlackAPIPriority.LOW: low_priority_share,
+            SlackAPIPriority.NORMAL: normal_priority_share,
+            SlackAPIPriority.HIGH: 1.0,
+        }
+
+    @staticmethod
+    def _get_bucket(slack_team_id: int, api_method: str, channel: typing.Optional[str]) -> str:
+        # Slack enforces rate limits per method per team, the tier only defines the rate
+        if get_api_method_tier(api_method) == SlackAPITier.POST_MESSAGE and channel:
+            return f"{slack_team_id}_{api_method}_{channel}"
+        return f"{slack_team_id}_{api_method}"
+
+    def acquire(
+        self,
+        slack_team_id: int,
+        api_method: str,
+        channel: typing.Optional[str] = None,
+        priority: typing.Optional[SlackAPIPriority] = None,
+    ) -> int:
+        """
+        Take a call from the budget. Return 0 if the call can be sent now, otherwise number of seconds to wait.
+        """
+        if not self.enabled:
+            return 0
+
+        priority = get_api_method_priority(api_method) if priority is None else priority
+        bucket = self._get_bucket(slack_team_id, api_method, channel)
+        now = time.time()
+
+        blocked_until = cache.get(_get_cache_key(f"blocked_{bucket}"))
+        if blocked_until is not None and blocked_until > now:
+            return self._defer(priority, blocked_until - now)
+
+        window = int(now // SLACK_RATE_SCHEDULER_WINDOW_SECONDS)
+        window_key = _get_cache_key(f"calls_{bucket}_{window}")
+        cache.add(window_key, 0, timeout=SLACK_RATE_SCHEDULER_WINDOW_SECONDS * 2)
+        try:
+            calls = cache.incr(window_key)
+        except ValueError:
+            # the key was evicted in between, let the call through
+            return 0
+
+        rate = SLACK_API_TIER_RATES[get_api_method_tier(api_method)]
+        if calls <= max(math.floor(rate * self._priority_shares[priority]), 1):
+            return 0
+
+        # give the call back, so it doesn't take from the budget of higher priority calls
+        try:
+            cache.decr(window_key)
+        except ValueError:
+            pass
+        return self._defer(priority, (window + 1) * SLACK_RATE_SCHEDULER_WINDOW_SECONDS - now)
+
+    def block(self, slack_team_id: int, api_method: str, channel: typing.Optional[str], retry_after: int) -> None:
+        """
+        Stop admitting calls to the bucket for retry_after seconds, after Slack responded with HTTP 429.
+        """
+        if not self.enabled:
+            return
+        bucket = self._get_bucket(slack_team_id, api_method, channel)
+        cache.set(_get_cache_key(f"blocked_{bucket}"), time.time() + retry_after, timeout=retry_after)
+
+    @staticmethod
+    def _defer(priority: SlackAPIPriority, wait: float) -> int:
+        # spread deferred calls over the beginning of the next window
+        wait = math.ceil(wait + random.uniform(0, SLACK_RATE_SCHEDULER_WINDOW_SECONDS / 10))
+        window = int((time.time() + wait) // SLACK_RATE_SCHEDULER_WINDOW_SECONDS)
+        bucket = next((b for b in SLACK_RATE_SCHEDULER_WAIT_BUCKETS if wait <= b), "+Inf")
+
+        for name, value, timeout in (
+            (get_queue_depth_stat_name(priority, window), 1, wait + SLACK_RATE_SCHEDULER_WINDOW_SECONDS),
+            (get_wait_bucket_stat_name(priority, bucket), 1, None),
+            (get_wait_sum_stat_name(priority), wait, None),
+        ):
+            cache_key = _get_cache_key(f"stats_{name}")
+            cache.add(cache_key, 0, timeout=timeout)
+            try:
+                cache.incr(cache_key, value)
+            except ValueError:
+                # the key was evicted in between, the sample is lost
+                pass
+
+        return wait
+
+
+slack_rate_scheduler = SlackRateScheduler(
+    enabled=settings.SLACK_RATE_SCHEDULER_ENABLED,
+    low_priority_share=settings.SLACK_RATE_SCHEDULER_LOW_PRIORITY_SHARE,
+    normal_priority_share=settings.SLACK_RATE_SCHEDULER_NORMAL_PRIORITY_SHARE,
+)
@@ -92,6 +92,8 @@ class UpdateAppearanceStep(scenario_step.ScenarioStep):
             attachments=alert_group.render_slack_attachments(),
             blocks=alert_group.render_slack_blocks(),
         )
+        # the message was updated outside of update_alert_group_slack_message
+        slack_message.set_content_hash(None)
 
 
 STEPS_ROUTING: ScenarioRoute.RoutingSteps = [
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import logging
 import random
 import typing
@@ -20,6 +22,7 @@ from apps.slack.errors import (
     SlackAPIMessageNotFoundError,
     SlackAPIPlanUpgradeRequiredError,
     SlackAPIRatelimitError,
+    SlackAPIRateSchedulerThrottledError,
     SlackAPITokenError,
     SlackAPIUsergroupNotFoundError,
 )
@@ -27,6 +30,9 @@ from apps.slack.utils import get_populate_slack_channel_task_id_key, post_messag
 from common.custom_celery_tasks import shared_dedicated_queue_retry_task
 from common.utils import batch_queryset
 
+if typing.TYPE_CHECKING:
+    from apps.slack.models import SlackMessage
+
 logger = get_task_logger(__name__)
 logger.setLevel(logging.DEBUG)
 
@@ -39,7 +45,9 @@ def update_alert_group_slack_message(slack_message_pk: int) -> None:
     This function is intended to be executed as a Celery task. It performs the following:
     - Compares the current task ID with the task ID stored in the cache.
       - If they do not match, it means a newer task has been scheduled, so the current task exits to prevent duplicated updates.
-    - Does the actual update of the Slack message.
+    - Does the actual update of the Slack message, unless the rendered message didn't change since the last update.
+    - If the Slack team is out of its rate budget, reschedules itself for when the budget allows the update
+    (see `SlackMessage.defer_alert_groups_message_update`).
     - Upon successful completion, clears the task ID from the cache to allow future updates (also note that
     the task ID is set in the cache with a timeout, so it will be automatically cleared after a certain period, even
     if this task fails to clear it. See `SlackMessage.update_alert_groups_message` for more details).
@@ -69,6 +77,70 @@ def update_alert_group_slack_message(slack_message_pk: int) -> None:
         )
         return
 
+    try:
+        _update_alert_group_slack_message(slack_message)
+    except SlackAPIRateSchedulerThrottledError as e:
+        # the Slack team is out of its rate budget, retry once there is room for the update instead of dropping it
+        slack_message.defer_alert_groups_message_update(e.retry_after)
+
+
+@shared_dedicated_queue_retry_task(autoretry_for=(Exception,), retry_backoff=True)
+def flush_alert_group_slack_message_updates(slack_team_identity_pk: int, flush_id: str) -> None:
+    """
+    Background task to update Slack messages of alert groups queued by debounced
+    `SlackMessage.update_alert_groups_message` calls in the Slack team (see apps.slack.alert_group_message_updates).
+
+    Bursts of updates to many alert groups (e.g. during alert storms) are coalesced into a single task per Slack team,
+    messages with a newer update scheduled in the meantime are skipped. Once the Slack team is out of its rate budget,
+    the remaining messages are queued to a new flush scheduled for when the budget allows the updates.
+    """
+    from apps.slack.alert_group_message_updates import pop_queued_slack_message_pks, queue_alert_group_message_update
+    from apps.slack.models import SlackMessage
+
+    slack_message_pks = pop_queued_slack_message_pks(slack_team_identity_pk, flush_id)
+    logger.info(
+        f"flush_alert_group_slack_message_updates {flush_id} for slack team identity {slack_team_identity_pk} "
+        f"started with {len(slack_message_pks)} queued messages"
+    )
+
+    slack_messages = SlackMessage.objects.filter(pk__in=slack_message_pks).select_related(
+        "alert_group__channel", "channel", "_slack_team_identity"
+    )
+    positions = {pk: position for position, pk in enumerate(slack_message_pks)}
+    retry_after = None
+    for slack_message in sorted(slack_messages, key=lambda m: positions[str(m.pk)]):
+        if slack_message.get_active_update_task_id() != flush_id:
+            logger.info(f"skipping SlackMessage {slack_message.pk} as a newer update is scheduled for it")
+            continue
+
+        if retry_after is not None:
+            queue_alert_group_message_update(slack_message, retry_after)
+            continue
+
+        try:
+            _update_alert_group_slack_message(slack_message)
+        except SlackAPIRateSchedulerThrottledError as e:
+            retry_after = e.retry_after
+            queue_alert_group_message_update(slack_message, retry_after)
+        except SlackAPIRatelimitError as e:
+            # maintenance integrations are retried separately, see _update_alert_group_slack_message
+            slack_message.defer_alert_groups_message_update(e.retry_after)
+        except Exception:
+            logger.exception(f"Failed to update SlackMessage {slack_message.pk}, retrying it separately")
+            slack_message.update_alert_groups_message(debounce=False)
+
+
+def _get_content_hash(attachments: typing.Any, blocks: typing.Any) -> str:
+    content = json.dumps({"attachments": attachments, "blocks": blocks}, sort_keys=True, default=str)
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def _update_alert_group_slack_message(slack_message: "SlackMessage") -> None:
+    """
+    Update the Slack message of the alert group, unless the rendered message is the same as the last one sent.
+    Raises SlackAPIRateSchedulerThrottledError if the Slack team is out of its rate budget.
+    """
+    slack_message_pk = slack_message.pk
     alert_group = slack_message.alert_group
     if not alert_group:
         logger.warning(
@@ -94,17 +166,28 @@ def update_alert_group_slack_message(slack_message_pk: int) -> None:
         )
         return
 
+    attachments = alert_group.render_slack_attachments()
+    blocks = alert_group.render_slack_blocks()
+    content_hash = _get_content_hash(attachments, blocks)
+    if content_hash == slack_message.get_content_hash():
+        logger.info(f"Message has not changed for alert_group {alert_group_pk}, skipping the update")
+        slack_message.mark_active_update_task_as_complete()
+        return
+
     slack_client = SlackClient(slack_message.slack_team_identity)
 
     try:
         slack_client.chat_update(
             channel=slack_message.channel.slack_id,
             ts=slack_message.slack_id,
-            attachments=alert_group.render_slack_attachments(),
-            blocks=alert_group.render_slack_blocks(),
+            attachments=attachments,
+            blocks=blocks,
         )
+        slack_message.set_content_hash(content_hash)
 
         logger.info(f"Message has been updated for alert_group {alert_group_pk}")
+    except SlackAPIRateSchedulerThrottledError:
+        raise
     except SlackAPIRatelimitError as e:
         if not alert_receive_channel.is_maintenace_integration:
             if not alert_receive_channel_is_rate_limited:
@@ -448,18 +531,25 @@ def populate_slack_usergroups_for_team(slack_team_identity_id):
 
 @shared_dedicated_queue_retry_task()
 def start_update_slack_user_group_for_schedules():
+    from apps.schedules.shift_boundary_timer import get_armed_schedule_pks
     from apps.slack.models import SlackUserGroup
 
-    user_group_pks = (
-        SlackUserGroup.objects.filter(
-            oncall_schedules__isnull=False,  # has oncall schedules connected
-            oncall_schedules__organization__deleted_at__isnull=True,  # organization is not deleted
-        )
-        .distinct()
-        .values_list("pk", flat=True)
+    user_group_schedule_pks = SlackUserGroup.objects.filter(
+        oncall_schedules__isnull=False,  # has oncall schedules connected
+        oncall_schedules__organization__deleted_at__isnull=True,  # organization is not deleted
+    ).values_list("pk", "oncall_schedules")
+
+    schedule_pks_by_user_group: typing.Dict[int, typing.Set[int]] = {}
+    for user_group_pk, schedule_pk in user_group_schedule_pks:
+        schedule_pks_by_user_group.setdefault(user_group_pk, set()).add(schedule_pk)
+    armed_schedule_pks = get_armed_schedule_pks(
+        {schedule_pk for schedule_pks in schedule_pks_by_user_group.values() for schedule_pk in schedule_pks}
     )
 
-    for user_group_pk in user_group_pks:
+    for user_group_pk, schedule_pks in schedule_pks_by_user_group.items():
+        # user groups are updated by shift boundary timers of their schedules at the exact time
+        if schedule_pks <= armed_schedule_pks:
+            continue
         update_slack_user_group_for_schedules.delay(user_group_pk=user_group_pk)
 
 
@@ -4,6 +4,12 @@ import pytest
 from rest_framework import status
 from slack_sdk.web import SlackResponse
 
+from apps.slack.client import SlackClient
+from apps.slack.tests.fake_slack_server import FakeSlackServer
+
+# SlackClient.api_call as it is before engine.conftest.mock_slack_api_call mocks it
+SLACK_API_CALL = SlackClient.api_call
+
 
 def build_slack_response(
     data: dict[str, typing.Any],
@@ -30,3 +36,26 @@ def get_slack_team_and_slack_user(make_organization_and_user_with_slack_identiti
         return slack_team_identity, slack_user_identity
 
     return _make_slack_team_and_slack_user
+
+
+@pytest.fixture
+def fake_slack_server():
+    """
+    Local fake Slack server, SlackClient instances are pointed to it (undoing the global mock_slack_api_call only).
+    """
+    server = FakeSlackServer().start()
+
+    original_init = SlackClient.__init__
+
+    def init_with_fake_server(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        self.base_url = server.url
+
+    # patches of other fixtures are kept, only these are reverted when the server is stopped
+    with pytest.MonkeyPatch.context() as slack_monkeypatch:
+        slack_monkeypatch.setattr(SlackClient, "api_call", SLACK_API_CALL)
+        slack_monkeypatch.setattr(SlackClient, "__init__", init_with_fake_server)
+        try:
+            yield server
+        finally:
+            server.stop()
@@ -0,0 +1,84 @@
+import json
+import threading
+import time
+import typing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl
+
+
+class FakeSlackServer:
+    """
+    Local HTTP server mimicking Slack Web API, to test Slack API calls end to end.
+
+    Every method returns {"ok": true} along with some common fields (e.g. "ts" for chat.postMessage). Calls over
+    `rate_limits[method]` per minute are answered with HTTP 429 and Retry-After header, same as Slack does.
+    """
+
+    def __init__(self, rate_limits: typing.Optional[typing.Dict[str, int]] = None, retry_after: int = 30) -> None:
+        self.rate_limits = rate_limits or {}
+        self.retry_after = retry_after
+        # (api method, request params) of calls answered with HTTP 200
+        self.calls: typing.List[typing.Tuple[str, typing.Dict[str, typing.Any]]] = []
+        self.ratelimited_calls: typing.List[typing.Tuple[str, typing.Dict[str, typing.Any]]] = []
+        self._call_times: typing.Dict[str, typing.List[float]] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/"
+
+    def start(self) -> "FakeSlackServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def calls_to(self, api_method: str) -> typing.List[typing.Dict[str, typing.Any]]:
+        return [params for method, params in self.calls if method == api_method]
+
+    def _handle(self, api_method: str, params: typing.Dict[str, typing.Any]) -> typing.Tuple[int, dict]:
+        now = time.monotonic()
+        with self._lock:
+            call_times = [t for t in self._call_times.get(api_method, []) if now - t < 60]
+            if api_method in self.rate_limits and len(call_times) >= self.rate_limits[api_method]:
+                self.ratelimited_calls.append((api_method, params))
+                return 429, {"ok": False, "error": "ratelimited"}
+            self._call_times[api_method] = call_times + [now]
+            self.calls.append((api_method, params))
+
+        return 200, {
+            "ok": True,
+            "channel": params.get("channel", "C0000000000"),
+            "ts": f"{time.time():.6f}",
+        }
+
+    def _make_handler(self) -> typing.Type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8")
+                if self.headers.get("Content-Type", "").startswith("application/json"):
+                    params = json.loads(body or "{}")
+                else:
+                    params = dict(parse_qsl(body))
+                status, data = server._handle(self.path.rsplit("/", 1)[-1], params)
+
+                response = json.dumps(data).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(response)))
+                if status == 429:
+                    self.send_header("Retry-After", str(server.retry_after))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, *args, **kwargs) -> None:
+                pass
+
+        return Handler
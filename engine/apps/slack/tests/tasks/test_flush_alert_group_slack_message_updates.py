@@ -0,0 +1,138 @@
+from unittest.mock import patch
+
+import pytest
+
+from apps.slack.alert_group_message_updates import (
+    _get_flush_item_cache_key,
+    _get_or_schedule_flush,
+    pop_queued_slack_message_pks,
+    queue_alert_group_message_update,
+)
+from apps.slack.errors import SlackAPIRateSchedulerThrottledError
+from apps.slack.tasks import flush_alert_group_slack_message_updates
+
+
+@pytest.fixture
+def make_slack_messages(
+    make_organization_with_slack_team_identity,
+    make_alert_receive_channel,
+    make_alert_group,
+    make_alert,
+    make_slack_channel,
+    make_slack_message,
+):
+    def _make_slack_messages(count):
+        organization, slack_team_identity = make_organization_with_slack_team_identity()
+        alert_receive_channel = make_alert_receive_channel(organization)
+        slack_channel = make_slack_channel(slack_team_identity)
+        slack_messages = []
+        for _ in range(count):
+            alert_group = make_alert_group(alert_receive_channel)
+            make_alert(alert_group=alert_group, raw_request_data={})
+            slack_messages.append(make_slack_message(slack_channel, alert_group=alert_group))
+        return slack_team_identity, slack_messages
+
+    return _make_slack_messages
+
+
+@patch("apps.slack.tasks.SlackClient.chat_update")
+@patch("apps.slack.alert_group_message_updates.flush_alert_group_slack_message_updates.apply_async")
+@pytest.mark.django_db
+def test_flush_coalesces_alert_group_updates(mock_apply_async, mock_chat_update, make_slack_messages):
+    slack_team_identity, slack_messages = make_slack_messages(3)
+
+    for slack_message in slack_messages + slack_messages:
+        slack_message.update_alert_groups_message(debounce=True)
+
+    # a single flush is scheduled for the Slack team
+    mock_apply_async.assert_called_once()
+    flush_id = mock_apply_async.call_args.kwargs["task_id"]
+    assert mock_apply_async.call_args.args == ((slack_team_identity.pk, flush_id),)
+
+    # a newer update is scheduled for the last message, so it is skipped by the flush
+    with patch("apps.slack.models.slack_message.update_alert_group_slack_message"):
+        slack_messages[2].update_alert_groups_message(debounce=False)
+
+    flush_alert_group_slack_message_updates.apply((slack_team_identity.pk, flush_id))
+
+    assert [call.kwargs["ts"] for call in mock_chat_update.call_args_list] == [m.slack_id for m in slack_messages[:2]]
+    for slack_message in slack_messages[:2]:
+        slack_message.refresh_from_db()
+        assert slack_message.get_active_update_task_id() is None
+        assert slack_message.last_updated is not None
+
+    # new updates are queued to the next flush
+    slack_messages[0].update_alert_groups_message(debounce=True)
+    assert mock_apply_async.call_count == 2
+    assert mock_apply_async.call_args.kwargs["task_id"] != flush_id
+
+
+@patch("apps.slack.tasks.SlackClient.chat_update")
+@patch("apps.slack.alert_group_message_updates.flush_alert_group_slack_message_updates.apply_async")
+@pytest.mark.django_db
+def test_flush_requeues_updates_when_throttled(mock_apply_async, mock_chat_update, make_slack_messages):
+    slack_team_identity, slack_messages = make_slack_messages(3)
+    for slack_message in slack_messages:
+        slack_message.update_alert_groups_message(debounce=True)
+    flush_id = mock_apply_async.call_args.kwargs["task_id"]
+
+    mock_chat_update.side_effect = [None, SlackAPIRateSchedulerThrottledError(30)]
+    flush_alert_group_slack_message_updates.apply((slack_team_identity.pk, flush_id))
+
+    # remaining messages are queued to a new flush once the Slack team is out of its rate budget
+    assert mock_chat_update.call_count == 2
+    assert mock_apply_async.call_count == 2
+    assert mock_apply_async.call_args.kwargs["countdown"] == 30
+    next_flush_id = mock_apply_async.call_args.kwargs["task_id"]
+    assert [m.get_active_update_task_id() for m in slack_messages] == [None, next_flush_id, next_flush_id]
+
+    mock_chat_update.side_effect = None
+    flush_alert_group_slack_message_updates.apply((slack_team_identity.pk, next_flush_id))
+    assert mock_chat_update.call_count == 4
+    assert [m.get_active_update_task_id() for m in slack_messages] == [None, None, None]
+
+
+@patch("apps.slack.alert_group_message_updates.flush_alert_group_slack_message_updates.apply_async")
+@pytest.mark.django_db
+def test_updates_queued_concurrently_with_flush_are_requeued(mock_apply_async, make_slack_messages):
+    slack_team_identity, slack_messages = make_slack_messages(2)
+    flush_id = queue_alert_group_message_update(slack_messages[0], 10)
+
+    flush_ids = [flush_id]
+
+    def _get_stale_flush(*args):
+        # the producer fetched the flush before it started
+        return flush_ids.pop() if flush_ids else _get_or_schedule_flush(*args)
+
+    assert pop_queued_slack_message_pks(slack_team_identity.pk, flush_id) == [str(slack_messages[0].pk)]
+    with patch("apps.slack.alert_group_message_updates._get_or_schedule_flush", side_effect=_get_stale_flush):
+        next_flush_id = queue_alert_group_message_update(slack_messages[1], 10)
+
+    assert next_flush_id != flush_id
+    assert slack_messages[1].get_active_update_task_id() == next_flush_id
+    assert pop_queued_slack_message_pks(slack_team_identity.pk, next_flush_id) == [str(slack_messages[1].pk)]
+
+
+@patch("apps.slack.alert_group_message_updates.flush_alert_group_slack_message_updates.apply_async")
+@pytest.mark.django_db
+def test_updates_stored_after_flush_took_queue_are_requeued(mock_apply_async, make_slack_messages):
+    slack_team_identity, slack_messages = make_slack_messages(2)
+    flush_id = queue_alert_group_message_update(slack_messages[0], 10)
+    popped = []
+
+    def _flush_before_storing(*args):
+        # the flush takes queued messages after the producer took its position, but before it stored the message
+        patcher.stop()
+        popped.extend(pop_queued_slack_message_pks(slack_team_identity.pk, flush_id))
+        return _get_flush_item_cache_key(*args)
+
+    patcher = patch(
+        "apps.slack.alert_group_message_updates._get_flush_item_cache_key", side_effect=_flush_before_storing
+    )
+    patcher.start()
+    next_flush_id = queue_alert_group_message_update(slack_messages[1], 10)
+
+    assert popped == [str(slack_messages[0].pk)]
+    assert next_flush_id != flush_id
+    assert slack_messages[1].get_active_update_task_id() == next_flush_id
+    assert pop_queued_slack_message_pks(slack_team_identity.pk, next_flush_id) == [str(slack_messages[1].pk)]
@@ -10,6 +10,7 @@ from apps.slack.errors import (
     SlackAPIChannelNotFoundError,
     SlackAPIMessageNotFoundError,
     SlackAPIRatelimitError,
+    SlackAPIRateSchedulerThrottledError,
     SlackAPITokenError,
 )
 from apps.slack.tasks import update_alert_group_slack_message
@@ -201,6 +202,42 @@ class TestUpdateAlertGroupSlackMessageTask:
         assert slack_message.get_active_update_task_id() is None
         assert slack_message.last_updated is not None
 
+    @patch("apps.slack.tasks.SlackClient.chat_update")
+    @pytest.mark.django_db
+    def test_update_alert_group_slack_message_content_not_changed(
+        self,
+        mock_chat_update,
+        make_organization_with_slack_team_identity,
+        make_alert_receive_channel,
+        make_slack_channel,
+        make_slack_message,
+        make_alert_group,
+        make_alert,
+    ):
+        """
+        Test that the Slack message is not updated if the rendered message didn't change since the last update.
+        """
+        organization, slack_team_identity = make_organization_with_slack_team_identity()
+        alert_receive_channel = make_alert_receive_channel(organization)
+        alert_group = make_alert_group(alert_receive_channel)
+        make_alert(alert_group=alert_group, raw_request_data={})
+        slack_channel = make_slack_channel(slack_team_identity)
+        slack_message = make_slack_message(slack_channel, alert_group=alert_group)
+
+        for _ in range(2):
+            slack_message.set_active_update_task_id("task-id")
+            update_alert_group_slack_message.apply((slack_message.pk,), task_id="task-id")
+
+        mock_chat_update.assert_called_once()
+        slack_message.refresh_from_db()
+        assert slack_message.get_active_update_task_id() is None
+
+        # the message changes
+        AlertGroup.objects.filter(pk=alert_group.pk).update(acknowledged=True)
+        slack_message.set_active_update_task_id("task-id")
+        update_alert_group_slack_message.apply((slack_message.pk,), task_id="task-id")
+        assert mock_chat_update.call_count == 2
+
     @patch("apps.slack.tasks.SlackClient.chat_update")
     @patch("apps.alerts.models.AlertReceiveChannel.start_send_rate_limit_message_task")
     @pytest.mark.django_db
@@ -242,6 +279,49 @@ class TestUpdateAlertGroupSlackMessageTask:
         # Assert that start_send_rate_limit_message_task was called
         mock_start_send_rate_limit_message_task.assert_called_with("Updating", slack_api_ratelimit_error.retry_after)
 
+    @patch("apps.slack.tasks.SlackClient.chat_update")
+    @patch("apps.slack.models.slack_message.update_alert_group_slack_message.apply_async")
+    @patch("apps.alerts.models.AlertReceiveChannel.start_send_rate_limit_message_task")
+    @pytest.mark.django_db
+    def test_update_alert_group_slack_message_throttled_by_rate_scheduler(
+        self,
+        mock_start_send_rate_limit_message_task,
+        mock_apply_async,
+        mock_chat_update,
+        make_organization_with_slack_team_identity,
+        make_alert_receive_channel,
+        make_slack_channel,
+        make_slack_message,
+        make_alert_group,
+        make_alert,
+    ):
+        """
+        Test that the update is deferred, without marking the integration as rate-limited, when the Slack team is out
+        of its rate budget.
+        """
+        organization, slack_team_identity = make_organization_with_slack_team_identity()
+        alert_receive_channel = make_alert_receive_channel(organization)
+        alert_group = make_alert_group(alert_receive_channel)
+        make_alert(alert_group=alert_group, raw_request_data={})
+        slack_channel = make_slack_channel(slack_team_identity)
+
+        slack_message = make_slack_message(slack_channel, alert_group=alert_group)
+        slack_message.set_active_update_task_id("task-id")
+
+        mock_chat_update.side_effect = SlackAPIRateSchedulerThrottledError(42)
+
+        update_alert_group_slack_message.apply((slack_message.pk,), task_id="task-id")
+
+        mock_start_send_rate_limit_message_task.assert_not_called()
+
+        # the update is rescheduled as the new active update task, so following updates are coalesced into it
+        mock_apply_async.assert_called_once()
+        assert mock_apply_async.call_args.args == ((str(slack_message.pk),),)
+        assert mock_apply_async.call_args.kwargs["countdown"] == 42
+        slack_message.refresh_from_db()
+        assert slack_message.get_active_update_task_id() == mock_apply_async.call_args.kwargs["task_id"]
+        assert slack_message.last_updated is None
+
     @patch("apps.slack.tasks.SlackClient.chat_update")
     @patch("apps.alerts.models.AlertReceiveChannel.start_send_rate_limit_message_task")
     @pytest.mark.django_db
@@ -0,0 +1,118 @@
+from unittest.mock import patch
+
+import pytest
+
+from apps.slack.client import SlackClient
+from apps.slack.errors import SlackAPIRatelimitError, SlackAPIRateSchedulerThrottledError
+from apps.slack.rate_scheduler import (
+    SLACK_RATE_SCHEDULER_WINDOW_SECONDS,
+    SlackAPIPriority,
+    get_queue_depth_stat_name,
+    get_stats,
+    get_wait_bucket_stat_name,
+    slack_rate_scheduler,
+)
+
+NOW = 1_700_000_000.0
+
+
+@pytest.fixture
+def frozen_time():
+    # keep all calls within the same rate window
+    with patch("apps.slack.rate_scheduler.time") as mock_time:
+        mock_time.time.return_value = NOW
+        yield mock_time
+
+
+def test_rate_scheduler_priorities(frozen_time):
+    # chat.update is a tier 3 method (50 calls per minute)
+    low_priority = [slack_rate_scheduler.acquire(1, "chat.update") for _ in range(31)]
+    assert low_priority[:30] == [0] * 30
+    assert low_priority[30] > 0
+
+    # part of the budget is left for higher priority calls, denied calls don't take from it
+    normal_priority = [
+        slack_rate_scheduler.acquire(1, "chat.update", priority=SlackAPIPriority.NORMAL) for _ in range(11)
+    ]
+    assert normal_priority[:10] == [0] * 10
+    assert normal_priority[10] > 0
+    high_priority = [slack_rate_scheduler.acquire(1, "chat.update", priority=SlackAPIPriority.HIGH) for _ in range(11)]
+    assert high_priority[:10] == [0] * 10
+    assert high_priority[10] > 0
+
+    # other teams and methods have their own budget, even methods of the same tier
+    assert slack_rate_scheduler.acquire(2, "chat.update") == 0
+    assert slack_rate_scheduler.acquire(1, "conversations.list") == 0
+    assert slack_rate_scheduler.acquire(1, "chat.delete") == 0
+    assert slack_rate_scheduler.acquire(1, "unlisted.method") == 0
+
+    # calls are deferred to the next window
+    assert SLACK_RATE_SCHEDULER_WINDOW_SECONDS - NOW % SLACK_RATE_SCHEDULER_WINDOW_SECONDS <= low_priority[30]
+    frozen_time.time.return_value = NOW + SLACK_RATE_SCHEDULER_WINDOW_SECONDS
+    assert slack_rate_scheduler.acquire(1, "chat.update") == 0
+
+
+def test_rate_scheduler_post_message_per_channel(frozen_time):
+    for _ in range(60):
+        assert slack_rate_scheduler.acquire(1, "chat.postMessage", channel="C1") == 0
+    assert slack_rate_scheduler.acquire(1, "chat.postMessage", channel="C1") > 0
+    assert slack_rate_scheduler.acquire(1, "chat.postMessage", channel="C2") == 0
+
+
+def test_rate_scheduler_stats(frozen_time):
+    for _ in range(31):
+        wait = slack_rate_scheduler.acquire(1, "chat.update")
+
+    window = int((NOW + wait) // SLACK_RATE_SCHEDULER_WINDOW_SECONDS)
+    queue_depth_stat = get_queue_depth_stat_name(SlackAPIPriority.LOW, window)
+    wait_stat = get_wait_bucket_stat_name(SlackAPIPriority.LOW, 60)
+    assert get_stats([queue_depth_stat, wait_stat]) == {queue_depth_stat: 1, wait_stat: 1}
+
+
+@patch.object(slack_rate_scheduler, "enabled", False)
+def test_rate_scheduler_disabled(frozen_time):
+    for _ in range(100):
+        assert slack_rate_scheduler.acquire(1, "chat.update") == 0
+
+
+@pytest.mark.django_db
+def test_slack_client_burst_is_scheduled(frozen_time, fake_slack_server, make_organization_with_slack_team_identity):
+    _, slack_team_identity = make_organization_with_slack_team_identity()
+    client = SlackClient(slack_team_identity)
+
+    throttled = 0
+    for _ in range(40):
+        try:
+            client.chat_update(channel="C1", ts="1.0", text="update")
+        except SlackAPIRateSchedulerThrottledError:
+            throttled += 1
+
+    # updates over their share of the budget are deferred before reaching Slack
+    assert len(fake_slack_server.calls_to("chat.update")) == 30
+    assert throttled == 10
+    assert fake_slack_server.ratelimited_calls == []
+
+    # alert posts are not affected
+    client.chat_postMessage(channel="C1", text="alert")
+    assert len(fake_slack_server.calls_to("chat.postMessage")) == 1
+
+
+@pytest.mark.django_db
+def test_slack_client_blocks_bucket_on_ratelimit(
+    frozen_time, fake_slack_server, make_organization_with_slack_team_identity
+):
+    _, slack_team_identity = make_organization_with_slack_team_identity()
+    fake_slack_server.rate_limits = {"chat.update": 1}
+    client = SlackClient(slack_team_identity)
+
+    client.chat_update(channel="C1", ts="1.0", text="update")
+    with pytest.raises(SlackAPIRatelimitError) as exc_info:
+        client.chat_update(channel="C1", ts="1.0", text="update")
+    assert not isinstance(exc_info.value, SlackAPIRateSchedulerThrottledError)
+
+    # other processes don't call Slack until Retry-After passes
+    with pytest.raises(SlackAPIRateSchedulerThrottledError) as exc_info:
+        SlackClient(slack_team_identity).chat_update(channel="C1", ts="1.0", text="update")
+    assert exc_info.value.retry_after >= fake_slack_server.retry_after
+    assert len(fake_slack_server.calls_to("chat.update")) == 1
+    assert len(fake_slack_server.ratelimited_calls) == 1
@@ -195,12 +195,12 @@ class TestSlackMessageUpdateAlertGroupsMessage:
         # Ensure task ID in the cache remains unchanged
         assert slack_message.get_active_update_task_id() == task_id
 
-    @patch("apps.slack.models.slack_message.celery_uuid")
-    @patch("apps.slack.models.slack_message.update_alert_group_slack_message")
+    @patch("apps.slack.alert_group_message_updates.celery_uuid")
+    @patch("apps.slack.alert_group_message_updates.flush_alert_group_slack_message_updates")
     @pytest.mark.django_db
     def test_update_alert_groups_message_last_updated_none(
         self,
-        mock_update_alert_group_slack_message,
+        mock_flush_alert_group_slack_message_updates,
         mock_celery_uuid,
         make_organization_with_slack_team_identity,
         make_alert_receive_channel,
@@ -225,9 +225,9 @@ class TestSlackMessageUpdateAlertGroupsMessage:
 
         slack_message.update_alert_groups_message(debounce=True)
 
-        # Verify that apply_async was called with correct countdown
-        mock_update_alert_group_slack_message.apply_async.assert_called_once_with(
-            (slack_message.pk,),
+        # Verify that the Slack team flush was scheduled with correct countdown
+        mock_flush_alert_group_slack_message_updates.apply_async.assert_called_once_with(
+            (slack_team_identity.pk, task_id),
             countdown=SlackMessage.ALERT_GROUP_UPDATE_DEBOUNCE_INTERVAL_SECONDS,
             task_id=task_id,
         )
@@ -235,12 +235,12 @@ class TestSlackMessageUpdateAlertGroupsMessage:
         # Verify task ID is set in the cache
         assert slack_message.get_active_update_task_id() == task_id
 
-    @patch("apps.slack.models.slack_message.celery_uuid")
-    @patch("apps.slack.models.slack_message.update_alert_group_slack_message")
+    @patch("apps.slack.alert_group_message_updates.celery_uuid")
+    @patch("apps.slack.alert_group_message_updates.flush_alert_group_slack_message_updates")
     @pytest.mark.django_db
     def test_update_alert_groups_message_schedules_task_correctly(
         self,
-        mock_update_alert_group_slack_message,
+        mock_flush_alert_group_slack_message_updates,
         mock_celery_uuid,
         make_organization_with_slack_team_identity,
         make_alert_receive_channel,
@@ -269,9 +269,9 @@ class TestSlackMessageUpdateAlertGroupsMessage:
 
         slack_message.update_alert_groups_message(debounce=True)
 
-        # Verify that apply_async was called with correct countdown
-        mock_update_alert_group_slack_message.apply_async.assert_called_once_with(
-            (slack_message.pk,),
+        # Verify that the Slack team flush was scheduled with correct countdown
+        mock_flush_alert_group_slack_message_updates.apply_async.assert_called_once_with(
+            (slack_team_identity.pk, task_id),
             countdown=35,
             task_id=task_id,
         )
@@ -280,12 +280,12 @@ class TestSlackMessageUpdateAlertGroupsMessage:
         slack_message.refresh_from_db()
         assert slack_message.get_active_update_task_id() == task_id
 
-    @patch("apps.slack.models.slack_message.celery_uuid")
-    @patch("apps.slack.models.slack_message.update_alert_group_slack_message")
+    @patch("apps.slack.alert_group_message_updates.celery_uuid")
+    @patch("apps.slack.alert_group_message_updates.flush_alert_group_slack_message_updates")
     @pytest.mark.django_db
     def test_update_alert_groups_message_handles_minimum_countdown(
         self,
-        mock_update_alert_group_slack_message,
+        mock_flush_alert_group_slack_message_updates,
         mock_celery_uuid,
         make_organization_with_slack_team_identity,
         make_alert_receive_channel,
@@ -315,9 +315,9 @@ class TestSlackMessageUpdateAlertGroupsMessage:
 
         slack_message.update_alert_groups_message(debounce=True)
 
-        # Verify that apply_async was called with correct countdown
-        mock_update_alert_group_slack_message.apply_async.assert_called_once_with(
-            (slack_message.pk,),
+        # Verify that the Slack team flush was scheduled with correct countdown
+        mock_flush_alert_group_slack_message_updates.apply_async.assert_called_once_with(
+            (slack_team_identity.pk, task_id),
             # Since the time since last update exceeds the debounce interval, countdown should be 10
             countdown=10,
             task_id=task_id,
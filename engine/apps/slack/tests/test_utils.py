@@ -8,6 +8,7 @@ from apps.slack.errors import (
     SlackAPIChannelNotFoundError,
     SlackAPIError,
     SlackAPIInvalidAuthError,
+    SlackAPIRateSchedulerThrottledError,
     SlackAPITokenError,
 )
 from apps.slack.utils import post_message_to_channel
@@ -32,3 +33,32 @@ def test_post_message_to_channel(error, raise_exception):
         else:
             post_message_to_channel(organization, "test", "test")
         mock_chat_postMessage.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_post_message_to_channel_waits_for_rate_scheduler(
+    fake_slack_server, make_organization_with_slack_team_identity
+):
+    organization, _ = make_organization_with_slack_team_identity()
+
+    with patch("apps.slack.client.slack_rate_scheduler.acquire", side_effect=[30, 0]):
+        with patch("apps.slack.client.time.sleep") as mock_sleep:
+            post_message_to_channel(organization, "C1", "test")
+
+    mock_sleep.assert_called_once_with(30)
+    assert len(fake_slack_server.calls_to("chat.postMessage")) == 1
+
+
+@pytest.mark.django_db
+def test_post_message_to_channel_rate_scheduler_wait_is_bounded(
+    fake_slack_server, make_organization_with_slack_team_identity
+):
+    organization, _ = make_organization_with_slack_team_identity()
+
+    with patch("apps.slack.client.slack_rate_scheduler.acquire", return_value=30):
+        with patch("apps.slack.client.time.sleep") as mock_sleep:
+            with pytest.raises(SlackAPIRateSchedulerThrottledError):
+                post_message_to_channel(organization, "C1", "test")
+
+    mock_sleep.assert_called_once_with(30)
+    assert fake_slack_server.calls_to("chat.postMessage") == []
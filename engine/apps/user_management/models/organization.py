@@ -1,3 +1,4 @@
+import copy
 import logging
 import typing
 import uuid
@@ -10,6 +11,7 @@ from django.utils import timezone
 from mirage import fields as mirage_fields
 
 from apps.alerts.models import MaintainableObject
+from apps.auth_token.verified_token_cache import invalidate_verified_tokens
 from apps.chatops_proxy.utils import (
     register_oncall_tenant_with_async_fallback,
     unlink_slack_team,
@@ -70,8 +72,10 @@ class OrganizationQuerySet(models.QuerySet):
         return instance
 
     def delete(self):
+        organization_ids = list(self.values_list("pk", flat=True))
         # Be careful with deleting via queryset - it doesn't delete chatops-proxy connectors.
         self.update(deleted_at=timezone.now())
+        invalidate_verified_tokens(organization_ids)
 
     def hard_delete(self):
         super().delete()
@@ -247,12 +251,33 @@ class Organization(MaintainableObject):
 
     direct_paging_prefer_important_policy = models.BooleanField(default=False, null=True)
 
+    # tokens are verified and cached along with their organizations, which are then used by authenticated requests,
+    # so cached tokens are dropped when any organization field changes, except sync timestamps updated periodically
+    TOKEN_CACHE_IGNORED_FIELDS = ("last_time_synced", "gcom_token_org_last_time_synced")
+
     class Meta:
         unique_together = ("stack_id", "org_id")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.subscription_strategy = self._get_subscription_strategy()
+        self._token_cache_field_values = self._get_token_cache_field_values()
+
+    def _get_token_cache_field_values(self) -> dict:
+        # deferred fields are left out, so they are not loaded from DB
+        return {
+            field.attname: copy.deepcopy(self.__dict__[field.attname])
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__ and field.attname not in self.TOKEN_CACHE_IGNORED_FIELDS
+        }
+
+    def save(self, *args, **kwargs):
+        created = self._state.adding
+        super().save(*args, **kwargs)
+        token_cache_field_values = self._get_token_cache_field_values()
+        if not created and token_cache_field_values != self._token_cache_field_values:
+            invalidate_verified_tokens([self.pk])
+        self._token_cache_field_values = token_cache_field_values
 
     def delete(self):
         if settings.FEATURE_MULTIREGION_ENABLED:
@@ -22,6 +22,7 @@ from apps.api.permissions import (
     convert_oncall_permission_to_irm,
     user_is_authorized,
 )
+from apps.auth_token.verified_token_cache import invalidate_verified_tokens
 from apps.google import utils as google_utils
 from apps.google.models import GoogleOAuth2User
 from apps.schedules.tasks import drop_cached_ical_for_custom_events_for_organization
@@ -115,8 +116,11 @@ class UserQuerySet(models.QuerySet):
         )
 
     def delete(self):
+        organization_ids = list(self.values_list("organization_id", flat=True).distinct())
         # is_active = None is used to be able to have multiple deleted users with the same user_id
-        return super().update(is_active=None)
+        result = super().update(is_active=None)
+        invalidate_verified_tokens(organization_ids)
+        return result
 
     def hard_delete(self):
         return super().delete()
@@ -202,6 +206,13 @@ class User(models.Model):
     def __str__(self):
         return f"{self.pk}: {self.username}"
 
+    def save(self, *args, **kwargs):
+        created = self._state.adding
+        super().save(*args, **kwargs)
+        if not created:
+            # tokens are verified and cached along with their users
+            invalidate_verified_tokens([self.organization_id])
+
     @property
     def is_admin(self) -> bool:
         return user_is_authorized(self, [RBACPermission.Permissions.ADMIN])
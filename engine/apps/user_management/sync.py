@@ -9,6 +9,7 @@ from django.utils import timezone
 from apps.alerts.models import AlertReceiveChannel
 from apps.api.permissions import LegacyAccessControlRole
 from apps.auth_token.exceptions import InvalidToken
+from apps.auth_token.verified_token_cache import invalidate_verified_tokens
 from apps.grafana_plugin.helpers.client import GcomAPIClient, GCOMInstanceInfo, GrafanaAPIClient
 from apps.grafana_plugin.sync_data import SyncData, SyncPermission, SyncSettings, SyncTeam, SyncUser
 from apps.metrics_exporter.helpers import metrics_bulk_update_team_label_cache
@@ -379,6 +380,9 @@ def _sync_users_data(organization: Organization, sync_users: list[SyncUser], del
         user_ids_to_delete = existing_user_ids - {user.id for user in sync_users}
         organization.users.filter(user_id__in=user_ids_to_delete).delete()
 
+    # bulk_create doesn't send post_save, drop tokens verified along with the previous user data
+    invalidate_verified_tokens([organization.pk])
+
 
 def _sync_teams_data(organization: Organization, sync_teams: list[SyncTeam] | None):
     if sync_teams is None:
@@ -3,18 +3,19 @@ import logging
 import typing
 from json import JSONDecodeError
 
-import requests
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.core.validators import MinLengthValidator
 from django.db import models
 from django.db.models import F
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 from mirage import fields as mirage_fields
 from requests.auth import HTTPBasicAuth
 
+from apps.webhooks.transport import webhook_session_pool
+from apps.webhooks.trigger_index import invalidate_webhook_trigger_index
 from apps.webhooks.utils import (
     InvalidWebhookData,
     InvalidWebhookHeaders,
@@ -53,14 +54,10 @@ def generate_public_primary_key_for_webhook():
     return new_public_primary_key
 
 
-class WebhookSession(requests.Session):
-    def send(self, request, **kwargs):
-        parse_url(request.url)  # validate URL on every redirect
-        return super().send(request, **kwargs)
-
-
 class WebhookQueryset(models.QuerySet):
     def delete(self):
+        for organization_id in set(self.values_list("organization_id", flat=True)):
+            invalidate_webhook_trigger_index(organization_id)
         self.update(deleted_at=timezone.now(), name=F("name") + "_deleted_" + F("public_primary_key"))
 
 
@@ -288,10 +285,8 @@ class Webhook(models.Model):
         if self.http_method not in ("GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"):
             raise ValueError(f"Unsupported http method: {self.http_method}")
 
-        with WebhookSession() as session:
-            response = session.request(
-                self.http_method, url, timeout=settings.OUTGOING_WEBHOOK_TIMEOUT, **request_kwargs
-            )
+        session = webhook_session_pool.get_session(url)
+        response = session.request(self.http_method, url, timeout=settings.OUTGOING_WEBHOOK_TIMEOUT, **request_kwargs)
 
         return response
 
@@ -368,6 +363,19 @@ def webhook_response_post_save(sender, instance, created, *args, **kwargs):
         source_alert_receive_channel.config.on_webhook_response_created(instance, source_alert_receive_channel)
 
 
+@receiver(post_save, sender=Webhook)
+@receiver(post_delete, sender=Webhook)
+def webhook_post_save_or_delete(sender, instance, *args, **kwargs):
+    invalidate_webhook_trigger_index(instance.organization_id)
+
+
+@receiver(m2m_changed, sender=Webhook.filtered_integrations.through)
+def webhook_filtered_integrations_changed(sender, instance, action, *args, **kwargs):
+    if action.startswith("post_"):
+        # instance is an integration when the relation is changed from the integration side
+        invalidate_webhook_trigger_index(instance.organization_id)
+
+
 class PersonalNotificationWebhook(models.Model):
     user = models.OneToOneField(
         "user_management.User",
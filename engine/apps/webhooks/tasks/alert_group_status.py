@@ -5,6 +5,7 @@ from django.conf import settings
 
 from apps.alerts.models import AlertGroup, AlertGroupLogRecord
 from apps.webhooks.models import Webhook
+from apps.webhooks.trigger_index import get_webhooks_to_trigger
 from common.custom_celery_tasks import shared_dedicated_queue_retry_task
 
 from .trigger_webhook import send_webhook_event
@@ -36,14 +37,9 @@ def alert_group_created(self, alert_group_id, is_backsync=False):
 
     trigger_type = Webhook.TRIGGER_ALERT_GROUP_CREATED
     organization_id = alert_group.channel.organization_id
-    webhooks = Webhook.objects.filter(trigger_type=trigger_type, organization_id=organization_id)
-
-    if is_backsync:
-        # only consider non-connected integration webhooks for backsync events
-        webhooks = webhooks.filter(is_from_connected_integration=False)
 
     # check if there are any webhooks before going on
-    if not webhooks:
+    if not get_webhooks_to_trigger(organization_id, trigger_type, alert_group.channel_id, is_backsync=is_backsync):
         return
 
     send_webhook_event.apply_async(
@@ -66,16 +62,9 @@ def alert_group_status_change(self, action_type, alert_group_id, user_id, is_bac
         return
 
     organization_id = alert_group.channel.organization_id
-    webhooks = Webhook.objects.filter(
-        trigger_type=trigger_type, organization_id=organization_id
-    ) | Webhook.objects.filter(trigger_type=Webhook.TRIGGER_STATUS_CHANGE, organization_id=organization_id)
-
-    if is_backsync:
-        # only consider non-connected integration webhooks for backsync events
-        webhooks = webhooks.filter(is_from_connected_integration=False)
 
     # check if there are any webhooks before going on
-    if not webhooks:
+    if not get_webhooks_to_trigger(organization_id, trigger_type, alert_group.channel_id, is_backsync=is_backsync):
         return
 
     send_webhook_event.apply_async(
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 import typing
@@ -7,6 +8,7 @@ from json import JSONDecodeError
 import requests
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Prefetch
 from django.utils import timezone
 
@@ -16,17 +18,20 @@ from apps.user_management.models import User
 from apps.webhooks.models import Webhook, WebhookResponse
 from apps.webhooks.models.webhook import WEBHOOK_FIELD_PLACEHOLDER
 from apps.webhooks.presets.preset_options import WebhookPresetOptions
+from apps.webhooks.trigger_index import get_webhooks_to_trigger
 from apps.webhooks.utils import (
     InvalidWebhookData,
     InvalidWebhookHeaders,
     InvalidWebhookTrigger,
     InvalidWebhookUrl,
-    serialize_event,
+    serialize_alert_group_event,
+    serialize_webhook_event,
 )
 from common.custom_celery_tasks import shared_dedicated_queue_retry_task
 from settings.base import WEBHOOK_RESPONSE_LIMIT
 
 NOT_FROM_SELECTED_INTEGRATION = "Alert group was not from a selected integration"
+WEBHOOK_EVENT_DATA_CACHE_KEY_PREFIX = "webhook_event_data"
 
 logger = get_task_logger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -65,37 +70,45 @@ class WebhookRequestStatus(typing.TypedDict):
     autoretry_for=(Exception,), retry_backoff=True, max_retries=1 if settings.DEBUG else None
 )
 def send_webhook_event(trigger_type, alert_group_id, organization_id=None, user_id=None, is_backsync=False):
-    from apps.webhooks.models import Webhook
-
-    webhooks_qs = Webhook.objects.filter(
-        trigger_type=trigger_type,
-        organization_id=organization_id,
-    ).exclude(is_webhook_enabled=False)
-    # include status change triggered webhooks if needed
-    if trigger_type in Webhook.STATUS_CHANGE_TRIGGERS:
-        webhooks_qs |= Webhook.objects.filter(
-            trigger_type=Webhook.TRIGGER_STATUS_CHANGE,
-            organization_id=organization_id,
-        ).exclude(is_webhook_enabled=False)
+    integration_id = AlertGroup.objects.filter(pk=alert_group_id).values_list("channel_id", flat=True).first()
+    if integration_id is None:
+        return
 
-    if is_backsync:
-        webhooks_qs = webhooks_qs.filter(is_from_connected_integration=False)
+    webhook_ids = get_webhooks_to_trigger(organization_id, trigger_type, integration_id, is_backsync=is_backsync)
+    kwargs = {"trigger_type": trigger_type}
+    if len(webhook_ids) > 1:
+        # event data not specific to a webhook is serialized once and shared by all the triggered webhooks
+        alert_group = _get_alert_group(alert_group_id)
+        if alert_group is None:
+            return
+        user = User.objects.filter(pk=user_id).first() if user_id is not None else None
+        kwargs["event_data_key"] = _cache_event_data(alert_group, user, trigger_type)
 
-    for webhook in webhooks_qs:
-        execute_webhook.apply_async((webhook.pk, alert_group_id, user_id, None), kwargs={"trigger_type": trigger_type})
+    for webhook_id in webhook_ids:
+        execute_webhook.apply_async((webhook_id, alert_group_id, user_id, None), kwargs=kwargs)
 
 
 def _isoformat_date(date_value: datetime) -> typing.Optional[str]:
     return date_value.isoformat() if date_value else None
 
 
-def _build_payload(
-    webhook: Webhook, alert_group: AlertGroup, user: User, trigger_type: int | None
-) -> typing.Dict[str, typing.Any]:
-    payload_trigger_type = webhook.trigger_type
-    if payload_trigger_type == Webhook.TRIGGER_STATUS_CHANGE and trigger_type is not None:
-        # use original trigger type when generating the payload if status change is set
-        payload_trigger_type = trigger_type
+def _get_alert_group(alert_group_id: int) -> typing.Optional[AlertGroup]:
+    personal_log_records = UserNotificationPolicyLogRecord.objects.filter(
+        alert_group_id=alert_group_id,
+        author__isnull=False,
+        type=UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_SUCCESS,
+    ).select_related("author")
+    return (
+        AlertGroup.objects.prefetch_related(
+            Prefetch("personal_log_records", queryset=personal_log_records, to_attr="sent_notifications")
+        )
+        .select_related("channel")
+        .filter(pk=alert_group_id)
+        .first()
+    )
+
+
+def _build_event(alert_group: AlertGroup, user: User, payload_trigger_type: int) -> typing.Dict[str, typing.Any]:
     event = {
         "type": TRIGGER_TYPE_TO_LABEL[payload_trigger_type],
     }
@@ -116,6 +129,42 @@ def _build_payload(
         user_context_data = user.personal_webhook.context_data if user.personal_webhook else {}
         event["user"] = user_context_data
 
+    return event
+
+
+def _cache_event_data(alert_group: AlertGroup, user: User, trigger_type: int) -> str:
+    """
+    Serialize the event data shared by the webhooks triggered by an event and cache it, return the cache key.
+    The key is derived from the serialized data, so repeated events with the same data share the cache entry.
+    """
+    event = _build_event(alert_group, user, trigger_type)
+    event_data = json.dumps(serialize_alert_group_event(event, alert_group, user))
+    cache_key = f"{WEBHOOK_EVENT_DATA_CACHE_KEY_PREFIX}_{hashlib.sha1(event_data.encode()).hexdigest()}"
+    cache.set(cache_key, event_data, timeout=settings.WEBHOOK_EVENT_DATA_CACHE_TIMEOUT)
+    return cache_key
+
+
+def _get_cached_event_data(cache_key: typing.Optional[str]) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    event_data = cache.get(cache_key) if cache_key else None
+    # a new copy for every webhook, as webhook specific data is added to it
+    return json.loads(event_data) if event_data else None
+
+
+def _build_payload(
+    webhook: Webhook,
+    alert_group: AlertGroup,
+    user: User,
+    trigger_type: int | None,
+    event_data: typing.Optional[typing.Dict[str, typing.Any]] = None,
+) -> typing.Dict[str, typing.Any]:
+    if event_data is None:
+        payload_trigger_type = webhook.trigger_type
+        if payload_trigger_type == Webhook.TRIGGER_STATUS_CHANGE and trigger_type is not None:
+            # use original trigger type when generating the payload if status change is set
+            payload_trigger_type = trigger_type
+        event = _build_event(alert_group, user, payload_trigger_type)
+        event_data = serialize_alert_group_event(event, alert_group, user)
+
     # include latest response data per webhook in the event input data
     # exclude past responses from webhook being executed
     responses_data = {}
@@ -132,7 +181,7 @@ def _build_payload(
                 response_data = r.content
             responses_data[r.webhook.public_primary_key] = response_data
 
-    return serialize_event(event, alert_group, user, webhook, responses_data)
+    return serialize_webhook_event(event_data, alert_group, webhook, responses_data)
 
 
 def mask_authorization_header(
@@ -227,7 +276,15 @@ def make_request(
 @shared_dedicated_queue_retry_task(
     autoretry_for=(Exception,), retry_backoff=True, max_retries=1 if settings.DEBUG else EXECUTE_WEBHOOK_RETRIES
 )
-def execute_webhook(webhook_pk, alert_group_id, user_id, escalation_policy_id, trigger_type=None, manual_retry_num=0):
+def execute_webhook(
+    webhook_pk,
+    alert_group_id,
+    user_id,
+    escalation_policy_id,
+    trigger_type=None,
+    manual_retry_num=0,
+    event_data_key=None,
+):
     from apps.webhooks.models import Webhook
 
     try:
@@ -236,27 +293,17 @@ def execute_webhook(webhook_pk, alert_group_id, user_id, escalation_policy_id, t
         logger.warning(f"Webhook {webhook_pk} does not exist")
         return
 
-    try:
-        personal_log_records = UserNotificationPolicyLogRecord.objects.filter(
-            alert_group_id=alert_group_id,
-            author__isnull=False,
-            type=UserNotificationPolicyLogRecord.TYPE_PERSONAL_NOTIFICATION_SUCCESS,
-        ).select_related("author")
-        alert_group = (
-            AlertGroup.objects.prefetch_related(
-                Prefetch("personal_log_records", queryset=personal_log_records, to_attr="sent_notifications")
-            )
-            .select_related("channel")
-            .get(pk=alert_group_id)
-        )
-    except AlertGroup.DoesNotExist:
+    alert_group = _get_alert_group(alert_group_id)
+    if alert_group is None:
         return
 
     user = None
     if user_id is not None:
         user = User.objects.filter(pk=user_id).first()
 
-    data = _build_payload(webhook, alert_group, user, trigger_type)
+    # event data is rebuilt if it's not shared by the event fan-out or it's no longer cached
+    event_data = _get_cached_event_data(event_data_key)
+    data = _build_payload(webhook, alert_group, user, trigger_type, event_data)
     triggered, status, error, exception = make_request(webhook, alert_group, data)
 
     # create response entry only if webhook was triggered
@@ -315,7 +362,7 @@ def execute_webhook(webhook_pk, alert_group_id, user_id, escalation_policy_id, t
             logger.warning(f"Manually retrying execute_webhook for {msg_details} manual_retry_num={retry_num}")
             execute_webhook.apply_async(
                 (webhook_pk, alert_group_id, user_id, escalation_policy_id),
-                kwargs={"trigger_type": trigger_type, "manual_retry_num": retry_num},
+                kwargs={"trigger_type": trigger_type, "manual_retry_num": retry_num, "event_data_key": event_data_key},
                 countdown=10,
             )
         else:
@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+import pytest
+import responses
+from django.conf import settings
+
+from apps.webhooks.transport import _WebhookSessionPool
+from apps.webhooks.utils import InvalidWebhookUrl, parse_url, webhook_host_cache
+
+
+def test_webhook_session_pool_reuses_sessions_per_host():
+    pool = _WebhookSessionPool(max_hosts=2, max_connections_per_host=4, idle_timeout=60)
+
+    session = pool.get_session("https://tickets.example.com/api/issues")
+    assert pool.get_session("https://tickets.example.com/api/issues/1?status=resolved") is session
+    other_session = pool.get_session("http://tickets.example.com/api/issues")
+    assert other_session is not session
+
+    # least recently used hosts are closed over max_hosts
+    with patch.object(session, "close") as mock_close:
+        assert pool.get_session("https://tickets.example.com:8443/api/issues") not in (session, other_session)
+    mock_close.assert_called_once_with()
+    assert pool.get_session("https://tickets.example.com/api/issues") is not session
+
+
+def test_webhook_session_pool_closes_idle_sessions():
+    pool = _WebhookSessionPool(max_hosts=10, max_connections_per_host=4, idle_timeout=60)
+
+    with patch("apps.webhooks.transport.time.monotonic", return_value=100):
+        session = pool.get_session("https://tickets.example.com")
+    with patch("apps.webhooks.transport.time.monotonic", return_value=170), patch.object(
+        session, "close"
+    ) as mock_close:
+        assert pool.get_session("https://tickets.example.com") is not session
+    mock_close.assert_called_once_with()
+
+
+@pytest.mark.django_db
+@responses.activate
+@patch("apps.webhooks.utils.socket.gethostbyname", return_value="8.8.8.8")
+def test_webhook_session_doesnt_keep_cookies(_mock_gethostbyname):
+    responses.add(
+        responses.GET, "https://tickets.example.com/", headers={"Set-Cookie": "session=secret; Path=/"}, status=200
+    )
+    pool = _WebhookSessionPool(max_hosts=10, max_connections_per_host=4, idle_timeout=60)
+    session = pool.get_session("https://tickets.example.com")
+
+    # sessions are shared by webhooks of all organizations
+    session.get("https://tickets.example.com/")
+    assert len(session.cookies) == 0
+
+
+@pytest.mark.django_db
+def test_parse_url_caches_host_verdicts():
+    if settings.DANGEROUS_WEBHOOKS_ENABLED:
+        pytest.skip("Dangerous webhooks are enabled")
+
+    with patch("apps.webhooks.utils.socket.gethostbyname", return_value="8.8.8.8") as mock_gethostbyname:
+        parse_url("https://tickets.example.com/api/issues")
+        parse_url("https://tickets.example.com/api/issues/1")
+    mock_gethostbyname.assert_called_once_with("tickets.example.com")
+
+    with patch("apps.webhooks.utils.socket.gethostbyname", return_value="10.0.0.1") as mock_gethostbyname:
+        for _ in range(2):
+            with pytest.raises(InvalidWebhookUrl):
+                parse_url("https://internal.example.com")
+    mock_gethostbyname.assert_called_once_with("internal.example.com")
+
+    # verdicts expire
+    with patch.object(webhook_host_cache, "_ttl", 0), patch(
+        "apps.webhooks.utils.socket.gethostbyname", return_value="10.0.0.1"
+    ):
+        with pytest.raises(InvalidWebhookUrl):
+            parse_url("https://tickets.example.com/api/issues")
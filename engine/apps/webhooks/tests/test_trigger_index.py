@@ -0,0 +1,103 @@
+from unittest.mock import patch
+
+import pytest
+
+from apps.webhooks.models import Webhook
+from apps.webhooks.tasks import send_webhook_event
+from apps.webhooks.trigger_index import get_webhooks_to_trigger
+
+
+@pytest.mark.django_db
+def test_get_webhooks_to_trigger(make_organization, make_alert_receive_channel, make_custom_webhook):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    other_alert_receive_channel = make_alert_receive_channel(organization)
+
+    webhook = make_custom_webhook(organization=organization, trigger_type=Webhook.TRIGGER_RESOLVE)
+    status_change_webhook = make_custom_webhook(organization=organization, trigger_type=Webhook.TRIGGER_STATUS_CHANGE)
+    filtered_webhook = make_custom_webhook(organization=organization, trigger_type=Webhook.TRIGGER_RESOLVE)
+    filtered_webhook.filtered_integrations.add(alert_receive_channel)
+    connected_webhook = make_custom_webhook(
+        organization=organization, trigger_type=Webhook.TRIGGER_RESOLVE, is_from_connected_integration=True
+    )
+    make_custom_webhook(organization=organization, trigger_type=Webhook.TRIGGER_RESOLVE, is_webhook_enabled=False)
+    make_custom_webhook(organization=organization, trigger_type=Webhook.TRIGGER_ACKNOWLEDGE)
+    make_custom_webhook(organization=make_organization(), trigger_type=Webhook.TRIGGER_RESOLVE)
+
+    def _get_webhooks_to_trigger(integration, trigger_type=Webhook.TRIGGER_RESOLVE, **kwargs):
+        return set(get_webhooks_to_trigger(organization.id, trigger_type, integration.id, **kwargs))
+
+    assert _get_webhooks_to_trigger(alert_receive_channel) == {
+        webhook.id,
+        status_change_webhook.id,
+        filtered_webhook.id,
+        connected_webhook.id,
+    }
+    # webhooks filtered by other integrations are pruned
+    assert _get_webhooks_to_trigger(other_alert_receive_channel) == {
+        webhook.id,
+        status_change_webhook.id,
+        connected_webhook.id,
+    }
+    assert _get_webhooks_to_trigger(other_alert_receive_channel, is_backsync=True) == {
+        webhook.id,
+        status_change_webhook.id,
+    }
+    # status change webhooks are triggered by status change triggers only
+    assert _get_webhooks_to_trigger(alert_receive_channel, trigger_type=Webhook.TRIGGER_MANUAL) == set()
+
+
+@pytest.mark.django_db
+def test_get_webhooks_to_trigger_invalidated(
+    make_organization, make_alert_receive_channel, make_custom_webhook, django_assert_num_queries
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    other_alert_receive_channel = make_alert_receive_channel(organization)
+    webhook = make_custom_webhook(organization=organization, trigger_type=Webhook.TRIGGER_RESOLVE)
+
+    def _get_webhooks_to_trigger(integration=alert_receive_channel):
+        return get_webhooks_to_trigger(organization.id, Webhook.TRIGGER_RESOLVE, integration.id)
+
+    assert _get_webhooks_to_trigger() == [webhook.id]
+    # the index is cached
+    with django_assert_num_queries(0):
+        assert _get_webhooks_to_trigger() == [webhook.id]
+
+    webhook.filtered_integrations.add(other_alert_receive_channel)
+    assert _get_webhooks_to_trigger() == []
+    # changes from the integration side invalidate the index too
+    alert_receive_channel.webhooks.add(webhook)
+    assert _get_webhooks_to_trigger() == [webhook.id]
+    webhook.filtered_integrations.clear()
+
+    webhook.is_webhook_enabled = False
+    webhook.save()
+    assert _get_webhooks_to_trigger() == []
+
+    webhook.is_webhook_enabled = True
+    webhook.save()
+    assert _get_webhooks_to_trigger() == [webhook.id]
+    Webhook.objects.filter(pk=webhook.pk).delete()
+    assert _get_webhooks_to_trigger() == []
+
+
+@pytest.mark.django_db
+def test_send_webhook_event_prunes_filtered_webhooks(
+    make_organization, make_alert_receive_channel, make_alert_group, make_custom_webhook
+):
+    organization = make_organization()
+    alert_receive_channel = make_alert_receive_channel(organization)
+    other_alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_alert_group(alert_receive_channel)
+    webhook = make_custom_webhook(organization=organization, trigger_type=Webhook.TRIGGER_ALERT_GROUP_CREATED)
+    other_webhook = make_custom_webhook(organization=organization, trigger_type=Webhook.TRIGGER_ALERT_GROUP_CREATED)
+    other_webhook.filtered_integrations.add(other_alert_receive_channel)
+
+    with patch("apps.webhooks.tasks.trigger_webhook.execute_webhook.apply_async") as mock_execute:
+        send_webhook_event(Webhook.TRIGGER_ALERT_GROUP_CREATED, alert_group.pk, organization_id=organization.pk)
+
+    # no task is enqueued for the webhook filtered by another integration
+    mock_execute.assert_called_once_with(
+        (webhook.pk, alert_group.pk, None, None), kwargs={"trigger_type": Webhook.TRIGGER_ALERT_GROUP_CREATED}
+    )
@@ -1,6 +1,6 @@
 import json
 from datetime import timedelta
-from unittest.mock import call, patch
+from unittest.mock import ANY, call, patch
 
 import pytest
 import requests
@@ -11,9 +11,11 @@ from apps.alerts.models import AlertGroupExternalID, AlertGroupLogRecord, Escala
 from apps.base.models import UserNotificationPolicyLogRecord
 from apps.public_api.serializers import AlertGroupSerializer
 from apps.webhooks.models import Webhook
-from apps.webhooks.models.webhook import WEBHOOK_FIELD_PLACEHOLDER, WebhookSession
+from apps.webhooks.models.webhook import WEBHOOK_FIELD_PLACEHOLDER
 from apps.webhooks.tasks import execute_webhook, send_webhook_event
 from apps.webhooks.tasks.trigger_webhook import NOT_FROM_SELECTED_INTEGRATION
+from apps.webhooks.transport import WebhookSession
+from apps.webhooks.utils import serialize_alert_group_event
 from settings.base import WEBHOOK_RESPONSE_LIMIT
 
 TIMEOUT = 4
@@ -102,15 +104,84 @@ def test_send_webhook_event_status_change(
             send_webhook_event(trigger_type, alert_group.pk, organization_id=organization.pk)
         # execute is called for the trigger type itself and the status change trigger too (with the original type passed)
         assert mock_execute.call_count == 2
-        mock_execute.assert_any_call(
-            (webhooks[trigger_type].pk, alert_group.pk, None, None), kwargs={"trigger_type": trigger_type}
-        )
+        # both share the serialized event data
+        expected_kwargs = {"trigger_type": trigger_type, "event_data_key": ANY}
+        mock_execute.assert_any_call((webhooks[trigger_type].pk, alert_group.pk, None, None), kwargs=expected_kwargs)
         status_change_trigger_type = Webhook.TRIGGER_STATUS_CHANGE
         mock_execute.assert_any_call(
-            (webhooks[status_change_trigger_type].pk, alert_group.pk, None, None), kwargs={"trigger_type": trigger_type}
+            (webhooks[status_change_trigger_type].pk, alert_group.pk, None, None), kwargs=expected_kwargs
         )
 
 
+@pytest.mark.django_db
+def test_send_webhook_event_shares_event_data(
+    make_organization, make_user_for_organization, make_alert_receive_channel, make_alert_group, make_custom_webhook
+):
+    organization = make_organization()
+    user = make_user_for_organization(organization)
+    alert_receive_channel = make_alert_receive_channel(organization)
+    alert_group = make_alert_group(
+        alert_receive_channel, acknowledged_at=timezone.now(), acknowledged=True, acknowledged_by=user.pk
+    )
+    webhooks = [
+        make_custom_webhook(
+            organization=organization,
+            url="https://example.com/{{ alert_group_id }}/",
+            http_method="POST",
+            trigger_type=trigger_type,
+            forward_all=True,
+        )
+        for trigger_type in (Webhook.TRIGGER_ACKNOWLEDGE, Webhook.TRIGGER_STATUS_CHANGE)
+    ]
+
+    def _execute_webhook(args, kwargs):
+        execute_webhook(*args, **kwargs)
+
+    mock_response = MockResponse()
+    with patch("apps.webhooks.utils.socket.gethostbyname", return_value="8.8.8.8"):
+        with patch("apps.webhooks.transport.WebhookSession.request", return_value=mock_response):
+            with patch(
+                "apps.webhooks.tasks.trigger_webhook.serialize_alert_group_event",
+                wraps=serialize_alert_group_event,
+            ) as mock_serialize:
+                with patch(
+                    "apps.webhooks.tasks.trigger_webhook.execute_webhook.apply_async", side_effect=_execute_webhook
+                ):
+                    send_webhook_event(
+                        Webhook.TRIGGER_ACKNOWLEDGE, alert_group.pk, organization_id=organization.pk, user_id=user.pk
+                    )
+
+    # event data is serialized once for all the webhooks
+    assert mock_serialize.call_count == 1
+    first_event_data, second_event_data = [
+        json.loads(webhook.responses.get().event_data) for webhook in sorted(webhooks, key=lambda w: w.pk)
+    ]
+    for event_data in (first_event_data, second_event_data):
+        assert event_data["event"]["type"] == "acknowledge"
+        assert event_data["user"]["id"] == user.public_primary_key
+        assert event_data["alert_group"]["id"] == alert_group.public_primary_key
+    # webhook specific data is added for each webhook
+    assert "responses" not in first_event_data
+    assert second_event_data["responses"] == {webhooks[0].public_primary_key: mock_response.content}
+
+    # event data is serialized again if it's no longer cached
+    with patch("apps.webhooks.utils.socket.gethostbyname", return_value="8.8.8.8"):
+        with patch("apps.webhooks.transport.WebhookSession.request", return_value=mock_response):
+            with patch(
+                "apps.webhooks.tasks.trigger_webhook.serialize_alert_group_event",
+                wraps=serialize_alert_group_event,
+            ) as mock_serialize:
+                execute_webhook(
+                    webhooks[0].pk,
+                    alert_group.pk,
+                    user.pk,
+                    None,
+                    trigger_type=Webhook.TRIGGER_ACKNOWLEDGE,
+                    event_data_key="webhook_event_data_expired",
+                )
+    assert mock_serialize.call_count == 1
+
+
 @pytest.mark.django_db
 def test_execute_webhook_disabled(
     make_organization, make_team, make_alert_receive_channel, make_alert_group, make_custom_webhook
@@ -142,7 +213,7 @@ def test_execute_webhook_integration_filter_not_matching(
     )
     webhook.filtered_integrations.add(other_alert_receive_channel)
 
-    with patch("apps.webhooks.models.webhook.WebhookSession.request") as mock_request:
+    with patch("apps.webhooks.transport.WebhookSession.request") as mock_request:
         execute_webhook(webhook.pk, alert_group.pk, None, None)
 
     assert not mock_request.called
@@ -167,7 +238,7 @@ def test_execute_webhook_integration_filter_matching(
     )
     webhook.filtered_integrations.add(alert_receive_channel)
 
-    with patch("apps.webhooks.models.webhook.WebhookSession.request") as mock_request:
+    with patch("apps.webhooks.transport.WebhookSession.request") as mock_request:
         execute_webhook(webhook.pk, alert_group.pk, None, None)
 
     assert not mock_request.called
@@ -235,9 +306,7 @@ def test_execute_webhook_ok(
     responses.add(responses.POST, templated_url, json={"response": 200}, status=200)
 
     with patch("apps.webhooks.utils.socket.gethostbyname", return_value="8.8.8.8"):
-        with patch(
-            "apps.webhooks.models.webhook.WebhookSession.request", wraps=WebhookSession().request
-        ) as mock_request:
+        with patch("apps.webhooks.transport.WebhookSession.request", wraps=WebhookSession().request) as mock_request:
             execute_webhook(webhook.pk, alert_group.pk, user.pk, None)
 
     mock_request.assert_called_once_with(
@@ -314,7 +383,7 @@ def test_execute_webhook_via_escalation_ok(
     mock_response = MockResponse()
     with patch("apps.webhooks.utils.socket.gethostbyname") as mock_gethostbyname:
         mock_gethostbyname.return_value = "8.8.8.8"
-        with patch("apps.webhooks.models.webhook.WebhookSession.request", return_value=mock_response) as mock_request:
+        with patch("apps.webhooks.transport.WebhookSession.request", return_value=mock_response) as mock_request:
             execute_webhook(webhook.pk, alert_group.pk, user.pk, escalation_policy.pk)
 
     assert mock_request.called
@@ -381,7 +450,7 @@ def test_execute_webhook_ok_forward_all(
     mock_response = MockResponse()
     with patch("apps.webhooks.utils.socket.gethostbyname") as mock_gethostbyname:
         mock_gethostbyname.return_value = "8.8.8.8"
-        with patch("apps.webhooks.models.webhook.WebhookSession.request", return_value=mock_response) as mock_request:
+        with patch("apps.webhooks.transport.WebhookSession.request", return_value=mock_response) as mock_request:
             execute_webhook(webhook.pk, alert_group.pk, user.pk, None, trigger_type=Webhook.TRIGGER_ACKNOWLEDGE)
 
     assert mock_request.called
@@ -489,7 +558,7 @@ def test_execute_webhook_ok_forward_all_resolved(
     mock_response = MockResponse()
     with patch("apps.webhooks.utils.socket.gethostbyname") as mock_gethostbyname:
         mock_gethostbyname.return_value = "8.8.8.8"
-        with patch("apps.webhooks.models.webhook.WebhookSession.request", return_value=mock_response) as mock_request:
+        with patch("apps.webhooks.transport.WebhookSession.request", return_value=mock_response) as mock_request:
             execute_webhook(webhook.pk, alert_group.pk, user.pk, None, trigger_type=Webhook.TRIGGER_RESOLVE)
 
     assert mock_request.called
@@ -614,7 +683,7 @@ def test_execute_webhook_using_responses_data(
     mock_response = MockResponse()
     with patch("apps.webhooks.utils.socket.gethostbyname") as mock_gethostbyname:
         mock_gethostbyname.return_value = "8.8.8.8"
-        with patch("apps.webhooks.models.webhook.WebhookSession.request", return_value=mock_response) as mock_request:
+        with patch("apps.webhooks.transport.WebhookSession.request", return_value=mock_response) as mock_request:
             execute_webhook(webhook.pk, alert_group.pk, user.pk, None)
 
     assert mock_request.called
@@ -650,7 +719,7 @@ def test_execute_webhook_trigger_false(
         trigger_template="{{ integration_id == 'the-integration' }}",
     )
 
-    with patch("apps.webhooks.models.webhook.WebhookSession.request") as mock_request:
+    with patch("apps.webhooks.transport.WebhookSession.request") as mock_request:
         execute_webhook(webhook.pk, alert_group.pk, None, None)
 
     assert not mock_request.called
@@ -713,7 +782,7 @@ def test_execute_webhook_errors(
     with patch("apps.webhooks.utils.socket.gethostbyname") as mock_gethostbyname:
         # make it a valid URL when resolving name
         mock_gethostbyname.return_value = "8.8.8.8"
-        with patch("apps.webhooks.models.webhook.WebhookSession.request") as mock_request:
+        with patch("apps.webhooks.transport.WebhookSession.request") as mock_request:
             execute_webhook(webhook.pk, alert_group.pk, None, None)
 
     assert not mock_request.called
@@ -739,7 +808,7 @@ def test_execute_webhook_errors(
 
 
 @patch(
-    "apps.webhooks.models.webhook.WebhookSession.request",
+    "apps.webhooks.transport.WebhookSession.request",
     side_effect=requests.exceptions.SSLError("SSL error - foo bar"),
 )
 @patch("apps.webhooks.utils.socket.gethostbyname", return_value="8.8.8.8")  # make it a valid URL when resolving name
@@ -811,7 +880,7 @@ def test_response_content_limit(
     mock_response = MockResponse(content="A" * content_length)
     with patch("apps.webhooks.utils.socket.gethostbyname") as mock_gethostbyname:
         mock_gethostbyname.return_value = "8.8.8.8"
-        with patch("apps.webhooks.models.webhook.WebhookSession.request", return_value=mock_response) as mock_request:
+        with patch("apps.webhooks.transport.WebhookSession.request", return_value=mock_response) as mock_request:
             execute_webhook(webhook.pk, alert_group.pk, user.pk, None)
 
     assert mock_request.called
@@ -830,7 +899,7 @@ def test_response_content_limit(
 
 
 @patch("apps.webhooks.tasks.trigger_webhook.execute_webhook", wraps=execute_webhook)
-@patch("apps.webhooks.models.webhook.WebhookSession.request")
+@patch("apps.webhooks.transport.WebhookSession.request")
 @patch("apps.webhooks.utils.socket.gethostbyname", return_value="8.8.8.8")
 @pytest.mark.django_db
 @pytest.mark.parametrize("exception", [requests.exceptions.ConnectTimeout, requests.exceptions.ReadTimeout])
@@ -868,7 +937,7 @@ def test_manually_retried_exceptions(
 
     mock_request.assert_called_once_with("POST", "https://test/", timeout=TIMEOUT, headers={})
     spy_execute_webhook.apply_async.assert_called_once_with(
-        execute_webhook_args, kwargs={"trigger_type": None, "manual_retry_num": 1}, countdown=10
+        execute_webhook_args, kwargs={"trigger_type": None, "manual_retry_num": 1, "event_data_key": None}, countdown=10
     )
 
     mock_request.reset_mock()
@@ -884,7 +953,7 @@ def test_manually_retried_exceptions(
     spy_execute_webhook.apply_async.assert_not_called()
 
 
-@patch("apps.webhooks.models.webhook.WebhookSession.request", return_value=MockResponse())
+@patch("apps.webhooks.transport.WebhookSession.request", return_value=MockResponse())
 @patch("apps.webhooks.utils.socket.gethostbyname", return_value="8.8.8.8")
 @pytest.mark.django_db
 def test_execute_webhook_integration_config(
@@ -978,7 +1047,7 @@ def test_execute_webhook_via_personal_notification(
     mock_response = MockResponse()
     with patch("apps.webhooks.utils.socket.gethostbyname") as mock_gethostbyname:
         mock_gethostbyname.return_value = "8.8.8.8"
-        with patch("apps.webhooks.models.webhook.WebhookSession.request", return_value=mock_response) as mock_request:
+        with patch("apps.webhooks.transport.WebhookSession.request", return_value=mock_response) as mock_request:
             execute_webhook(webhook.pk, alert_group.pk, user.pk, None)
 
     assert mock_request.called
@@ -229,7 +229,7 @@ def test_check_trigger_template_ok(make_organization, make_custom_webhook):
 def test_make_request(make_organization, make_custom_webhook):
     organization = make_organization()
 
-    with patch("apps.webhooks.models.webhook.WebhookSession.request") as mock_request:
+    with patch("apps.webhooks.transport.WebhookSession.request") as mock_request:
         for method in ("GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"):
             webhook = make_custom_webhook(organization=organization, http_method=method)
             webhook.make_request("url", {"foo": "bar"})
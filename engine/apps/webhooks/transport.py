@@ -0,0 +1,93 @@
+import http.cookiejar
+import threading
+import time
+import typing
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from apps.webhooks.utils import parse_url
+
+
+class WebhookSession(requests.Session):
+    def __init__(self) -> None:
+        super().__init__()
+        # sessions are shared by webhooks of all organizations sent to the same host, so cookies set by responses
+        # must not be kept
+        self.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+    def send(self, request, **kwargs):
+        parse_url(request.url)  # validate URL on every redirect
+        return super().send(request, **kwargs)
+
+
+class _WebhookSessionPool:
+    """
+    Per-process pool of webhook sessions by destination host (scheme and port included), so keep-alive connections
+    are reused by consecutive webhooks sent to the same host instead of opening a new connection (and TLS session)
+    for every request.
+
+    Each session keeps up to max_connections_per_host connections. Sessions not used for idle_timeout seconds are
+    closed, along with their connections, and least recently used sessions are closed when there are more than
+    max_hosts of them.
+    """
+
+    def __init__(self, max_hosts: int, max_connections_per_host: int, idle_timeout: int) -> None:
+        self._max_hosts = max_hosts
+        self._max_connections_per_host = max_connections_per_host
+        self._idle_timeout = idle_timeout
+        # host -> (session, last used at)
+        self._sessions: OrderedDict[str, typing.Tuple[WebhookSession, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_session(self, url: str) -> WebhookSession:
+        parsed_url = urlparse(url)
+        host = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        now = time.monotonic()
+        with self._lock:
+            expired_sessions = self._pop_expired_sessions(now)
+            session, _ = self._sessions.pop(host, (None, None))
+            if session is None:
+                session = self._make_session()
+            self._sessions[host] = (session, now)
+            while len(self._sessions) > self._max_hosts:
+                _, (evicted_session, _) = self._sessions.popitem(last=False)
+                expired_sessions.append(evicted_session)
+
+        for expired_session in expired_sessions:
+            expired_session.close()
+        return session
+
+    def _pop_expired_sessions(self, now: float) -> typing.List[WebhookSession]:
+        # must be called with the lock held, sessions are ordered by last use
+        expired_sessions = []
+        while self._sessions:
+            host, (session, used_at) = next(iter(self._sessions.items()))
+            if now - used_at < self._idle_timeout:
+                break
+            del self._sessions[host]
+            expired_sessions.append(session)
+        return expired_sessions
+
+    def _make_session(self) -> WebhookSession:
+        session = WebhookSession()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._max_connections_per_host)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def clear(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, OrderedDict()
+        for session, _ in sessions.values():
+            session.close()
+
+
+webhook_session_pool = _WebhookSessionPool(
+    max_hosts=settings.OUTGOING_WEBHOOK_POOL_MAX_HOSTS,
+    max_connections_per_host=settings.OUTGOING_WEBHOOK_POOL_MAX_CONNECTIONS_PER_HOST,
+    idle_timeout=settings.OUTGOING_WEBHOOK_POOL_IDLE_TIMEOUT,
+)
@@ -0,0 +1,90 @@
+import typing
+
+from django.conf import settings
+from django.core.cache import cache
+
+WEBHOOK_TRIGGER_INDEX_CACHE_KEY_PREFIX = "webhook_trigger_index"
+
+
+class WebhookTriggerIndex(typing.TypedDict):
+    # trigger type -> ids of the enabled webhooks with the trigger type
+    trigger_types: typing.Dict[int, typing.List[int]]
+    # integration id -> ids of the enabled webhooks filtered by the integration
+    integrations: typing.Dict[int, typing.List[int]]
+    # ids of the enabled webhooks filtered by any integration
+    filtered: typing.Set[int]
+    # ids of the enabled webhooks from connected integrations
+    from_connected_integration: typing.Set[int]
+
+
+def _get_cache_key(organization_id: int) -> str:
+    return f"{WEBHOOK_TRIGGER_INDEX_CACHE_KEY_PREFIX}_{organization_id}"
+
+
+def _build_webhook_trigger_index(organization_id: int) -> WebhookTriggerIndex:
+    from apps.webhooks.models import Webhook
+
+    index: WebhookTriggerIndex = {
+        "trigger_types": {},
+        "integrations": {},
+        "filtered": set(),
+        "from_connected_integration": set(),
+    }
+    webhooks = (
+        Webhook.objects.filter(organization_id=organization_id)
+        .exclude(is_webhook_enabled=False)
+        .values_list("id", "trigger_type", "is_from_connected_integration")
+    )
+    for webhook_id, trigger_type, is_from_connected_integration in webhooks:
+        index["trigger_types"].setdefault(trigger_type, []).append(webhook_id)
+        if is_from_connected_integration:
+            index["from_connected_integration"].add(webhook_id)
+
+    filtered_integrations = Webhook.filtered_integrations.through.objects.filter(
+        webhook__organization_id=organization_id, webhook__deleted_at=None
+    ).values_list("webhook_id", "alertreceivechannel_id")
+    for webhook_id, integration_id in filtered_integrations:
+        index["integrations"].setdefault(integration_id, []).append(webhook_id)
+        index["filtered"].add(webhook_id)
+
+    return index
+
+
+def get_webhook_trigger_index(organization_id: int) -> WebhookTriggerIndex:
+    cache_key = _get_cache_key(organization_id)
+    index = cache.get(cache_key)
+    if index is None:
+        index = _build_webhook_trigger_index(organization_id)
+        cache.set(cache_key, index, timeout=settings.WEBHOOK_TRIGGER_INDEX_CACHE_TIMEOUT)
+    return index
+
+
+def invalidate_webhook_trigger_index(organization_id: int) -> None:
+    cache.delete(_get_cache_key(organization_id))
+
+
+def get_webhooks_to_trigger(
+    organization_id: int, trigger_type: int, integration_id: int, is_backsync: bool = False
+) -> typing.List[int]:
+    """
+    Return ids of the enabled webhooks of the organization triggered by an event of the integration, status change
+    webhooks included. Webhooks filtered by other integrations are left out, so their tasks are never enqueued.
+
+    The index is cached per organization and invalidated when webhooks or their integration filters change.
+    """
+    from apps.webhooks.models import Webhook
+
+    index = get_webhook_trigger_index(organization_id)
+    trigger_types = [trigger_type]
+    if trigger_type in Webhook.STATUS_CHANGE_TRIGGERS:
+        trigger_types.append(Webhook.TRIGGER_STATUS_CHANGE)
+
+    integration_webhook_ids = set(index["integrations"].get(integration_id, []))
+    return [
+        webhook_id
+        for t in trigger_types
+        for webhook_id in index["trigger_types"].get(t, [])
+        if (webhook_id not in index["filtered"] or webhook_id in integration_webhook_ids)
+        # only consider non-connected integration webhooks for backsync events
+        and not (is_backsync and webhook_id in index["from_connected_integration"])
+    ]
@@ -2,6 +2,10 @@ import ipaddress
 import json
 import re
 import socket
+import threading
+import time
+import typing
+from collections import OrderedDict
 from urllib.parse import urlparse
 
 from django.conf import settings
@@ -43,16 +47,73 @@ def parse_url(url):
 
     if not live_settings.DANGEROUS_WEBHOOKS_ENABLED:
         # Get the ip address of the webhook url and check if it belongs to the private network
-        try:
-            webhook_url_ip_address = socket.gethostbyname(parsed_url.hostname)
-        except socket.gaierror:
-            raise InvalidWebhookUrl("Cannot resolve name in url")
-        if ipaddress.ip_address(socket.gethostbyname(webhook_url_ip_address)).is_private:
-            raise InvalidWebhookUrl("This url is not supported for outgoing webhooks")
+        webhook_host_cache.check(parsed_url.hostname)
 
     return parsed_url
 
 
+class _WebhookHostCache:
+    """
+    Per-process LRU cache of webhook host names checked by parse_url, keeping whether the host resolves to a private
+    IP address. Webhooks are often sent to the same few hosts, which would otherwise be resolved on every request and
+    redirect. Entries expire after ttl seconds, so DNS changes are picked up. Hosts which can't be resolved are not
+    cached.
+    """
+
+    def __init__(self, max_size: int, ttl: int) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        # host name -> (is private, cached at)
+        self._entries: OrderedDict[str, typing.Tuple[bool, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check(self, hostname: str) -> None:
+        """
+        Raise InvalidWebhookUrl if the host can't be resolved or resolves to a private IP address.
+        """
+        is_private = self._get(hostname)
+        if is_private is None:
+            try:
+                webhook_url_ip_address = socket.gethostbyname(hostname)
+            except socket.gaierror:
+                raise InvalidWebhookUrl("Cannot resolve name in url")
+            is_private = ipaddress.ip_address(webhook_url_ip_address).is_private
+            self._set(hostname, is_private)
+
+        if is_private:
+            raise InvalidWebhookUrl("This url is not supported for outgoing webhooks")
+
+    def _get(self, hostname: str) -> typing.Optional[bool]:
+        with self._lock:
+            entry = self._entries.get(hostname)
+            if entry is None:
+                return None
+            is_private, cached_at = entry
+            if time.monotonic() - cached_at >= self._ttl:
+                del self._entries[hostname]
+                return None
+            self._entries.move_to_end(hostname)
+            return is_private
+
+    def _set(self, hostname: str, is_private: bool) -> None:
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._entries[hostname] = (is_private, time.monotonic())
+            self._entries.move_to_end(hostname)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+webhook_host_cache = _WebhookHostCache(
+    max_size=settings.OUTGOING_WEBHOOK_HOST_CACHE_MAX_SIZE, ttl=settings.OUTGOING_WEBHOOK_HOST_CACHE_TTL
+)
+
+
 def apply_jinja_template_for_json(template, payload):
     escaped_payload = escape_payload(payload)
     return apply_jinja_template(template, **escaped_payload)
@@ -153,8 +214,11 @@ def _extract_users_from_escalation_snapshot(escalation_snapshot):
     return list({u["id"]: u for u in users if u}.values())
 
 
-def serialize_event(event, alert_group, user, webhook, responses=None):
-    from apps.alerts.models import AlertGroupExternalID
+def serialize_alert_group_event(event, alert_group, user):
+    """
+    Serialize the event data which doesn't depend on the webhook, so it can be shared by all the webhooks triggered
+    by the same event. See serialize_webhook_event for the webhook specific data.
+    """
     from apps.public_api.serializers import AlertGroupSerializer
 
     alert_payload = alert_group.alerts.first()
@@ -182,16 +246,28 @@ def serialize_event(event, alert_group, user, webhook, responses=None):
         "alert_group_acknowledged_by": _serialize_event_user(alert_group.acknowledged_by_user),
         "alert_group_resolved_by": _serialize_event_user(alert_group.resolved_by_user),
     }
-    if responses:
-        data["responses"] = responses
 
     # Enrich webhook data with labels payloads if labels feature is enabled
     # TODO: once feature flag will be removed this code should go to the 'data' dict declaration
     if is_labels_feature_enabled(alert_group.channel.organization):
-        data["webhook"] = {"id": webhook.public_primary_key, "name": webhook.name, "labels": get_labels_dict(webhook)}
         data["integration"]["labels"] = get_labels_dict(alert_group.channel)
         data["alert_group"]["labels"] = get_alert_group_labels_dict(alert_group)
 
+    return data
+
+
+def serialize_webhook_event(data, alert_group, webhook, responses=None):
+    """
+    Add the webhook specific fields to the event data from serialize_alert_group_event (data is updated in place).
+    """
+    from apps.alerts.models import AlertGroupExternalID
+
+    if responses:
+        data["responses"] = responses
+
+    if is_labels_feature_enabled(alert_group.channel.organization):
+        data["webhook"] = {"id": webhook.public_primary_key, "name": webhook.name, "labels": get_labels_dict(webhook)}
+
     # Add additional webhook data if the integration has it
     source_alert_receive_channel = webhook.get_source_alert_receive_channel()
     if source_alert_receive_channel and hasattr(source_alert_receive_channel.config, "additional_webhook_data"):
@@ -205,3 +281,8 @@ def serialize_event(event, alert_group, user, webhook, responses=None):
         data["external_id"] = external_id.value if external_id else None
 
     return data
+
+
+def serialize_event(event, alert_group, user, webhook, responses=None):
+    data = serialize_alert_group_event(event, alert_group, user)
+    return serialize_webhook_event(data, alert_group, webhook, responses)
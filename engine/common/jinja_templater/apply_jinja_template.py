@@ -5,7 +5,7 @@ from django.conf import settings
 from jinja2 import TemplateAssertionError, TemplateSyntaxError, UndefinedError
 from jinja2.exceptions import SecurityError
 
-from .jinja_template_env import jinja_template_env
+from .compiled_template_cache import compiled_template_cache
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +36,7 @@ def apply_jinja_template(
         )
 
     try:
-        compiled_template = jinja_template_env.from_string(template)
+        compiled_template = compiled_template_cache.get_template(template)
         result = compiled_template.render(payload=payload, **kwargs)
     except SecurityError as e:
         logger.warning(f"SecurityError process template={template} payload={payload}")
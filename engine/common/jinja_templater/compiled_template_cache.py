@@ -0,0 +1,100 @@
+import hashlib
+import threading
+import typing
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from django.conf import settings
+from jinja2 import Environment, Template
+
+from .jinja_template_env import jinja_template_env
+
+
+@dataclass
+class CompiledTemplateCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    size_bytes: int = 0
+
+
+class CompiledTemplateCache:
+    """
+    Process-local LRU cache of compiled jinja templates.
+
+    Templates are keyed by a hash of their source, so the same template string shared by many integrations/routes
+    is compiled once per process. The cache is bounded both by number of entries and by the total length of cached
+    template sources (used as a proxy for the memory held by the compiled templates).
+    Templates which fail to compile are not cached, so errors are raised on every call, same as without the cache.
+    """
+
+    def __init__(self, env: Environment, max_size: int, max_bytes: int) -> None:
+        self._env = env
+        self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._templates: OrderedDict[str, typing.Tuple[Template, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _get_key(template: str) -> str:
+        return hashlib.sha256(template.encode("utf-8")).hexdigest()
+
+    def get_template(self, template: str) -> Template:
+        key = self._get_key(template)
+        with self._lock:
+            cached = self._templates.get(key)
+            if cached is not None:
+                self._templates.move_to_end(key)
+                self._hits += 1
+                return cached[0]
+            self._misses += 1
+
+        # compile outside of the lock, compilation is the expensive part
+        compiled_template = self._env.from_string(template)
+
+        template_size = len(template)
+        if self._max_size <= 0 or template_size > self._max_bytes:
+            return compiled_template
+
+        with self._lock:
+            if key not in self._templates:
+                self._templates[key] = (compiled_template, template_size)
+                self._size_bytes += template_size
+                self._evict()
+        return compiled_template
+
+    def _evict(self) -> None:
+        while len(self._templates) > self._max_size or self._size_bytes > self._max_bytes:
+            _, (_, template_size) = self._templates.popitem(last=False)
+            self._size_bytes -= template_size
+            self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+            self._size_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> CompiledTemplateCacheStats:
+        with self._lock:
+            return CompiledTemplateCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._templates),
+                size_bytes=self._size_bytes,
+            )
+
+
+compiled_template_cache = CompiledTemplateCache(
+    jinja_template_env,
+    max_size=settings.JINJA_COMPILED_TEMPLATE_CACHE_MAX_SIZE,
+    max_bytes=settings.JINJA_COMPILED_TEMPLATE_CACHE_MAX_BYTES,
+)
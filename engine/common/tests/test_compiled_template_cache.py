@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+import pytest
+
+from common.jinja_templater import apply_jinja_template, compiled_template_cache, jinja_template_env
+from common.jinja_templater.apply_jinja_template import JinjaTemplateError
+from common.jinja_templater.compiled_template_cache import CompiledTemplateCache
+
+
+def test_compiled_template_cache_hit_and_miss():
+    cache = CompiledTemplateCache(jinja_template_env, max_size=10, max_bytes=1000)
+
+    template = cache.get_template("{{ payload.name }}")
+    assert cache.get_template("{{ payload.name }}") is template
+    assert template.render(payload={"name": "test"}) == "test"
+
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.evictions == 0
+    assert stats.size == 1
+    assert stats.size_bytes == len("{{ payload.name }}")
+
+
+def test_compiled_template_cache_evicts_least_recently_used():
+    cache = CompiledTemplateCache(jinja_template_env, max_size=2, max_bytes=1000)
+
+    first = cache.get_template("{{ 1 }}")
+    cache.get_template("{{ 2 }}")
+    # touch the first template so the second one is the least recently used
+    cache.get_template("{{ 1 }}")
+    cache.get_template("{{ 3 }}")
+
+    stats = cache.stats()
+    assert stats.size == 2
+    assert stats.evictions == 1
+    assert cache.get_template("{{ 1 }}") is first
+    assert cache.stats().hits == 2
+
+
+def test_compiled_template_cache_memory_limit():
+    cache = CompiledTemplateCache(jinja_template_env, max_size=10, max_bytes=20)
+
+    cache.get_template("{{ payload.a }}")
+    cache.get_template("{{ payload.b }}")
+    stats = cache.stats()
+    assert stats.size == 1
+    assert stats.evictions == 1
+    assert stats.size_bytes <= 20
+
+    # templates larger than the memory limit are compiled but never cached
+    template = cache.get_template("{{ payload.long_attribute_name }}")
+    assert template.render(payload={"long_attribute_name": "x"}) == "x"
+    assert cache.stats().size == 1
+
+
+def test_compiled_template_cache_does_not_cache_errors():
+    cache = CompiledTemplateCache(jinja_template_env, max_size=10, max_bytes=1000)
+
+    for _ in range(2):
+        with pytest.raises(Exception):
+            cache.get_template("{{ payload.name")
+
+    stats = cache.stats()
+    assert stats.size == 0
+    assert stats.misses == 2
+
+
+def test_apply_jinja_template_compiles_template_once():
+    compiled_template_cache.clear()
+
+    with patch.object(jinja_template_env, "from_string", wraps=jinja_template_env.from_string) as mock_from_string:
+        for name in ("a", "b", "c"):
+            assert apply_jinja_template("{{ payload.name }}", {"name": name}) == name
+
+    mock_from_string.assert_called_once_with("{{ payload.name }}")
+
+
+def test_apply_jinja_template_syntax_error_with_cache():
+    compiled_template_cache.clear()
+
+    for _ in range(2):
+        with pytest.raises(JinjaTemplateError):
+            apply_jinja_template("{{ payload.name", {"name": "test"})
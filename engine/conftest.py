@@ -9,12 +9,15 @@ from importlib import import_module, reload
 
 import pytest
 from celery import Task
+from django.db import connection
 from django.db.models.signals import post_save
 from django.urls import clear_url_caches
 from django.utils import timezone
 from pytest_factoryboy import register
 from telegram import Bot
 
+from apps.alerts.alert_group_search import SQLITE_SEARCH_TABLE
+from apps.alerts.channel_filter_router import channel_filter_router_cache
 from apps.alerts.models import (
     Alert,
     AlertGroupLogRecord,
@@ -57,6 +60,7 @@ from apps.auth_token.models import (
     ServiceAccountToken,
     SlackAuthToken,
 )
+from apps.auth_token.verified_token_cache import verified_token_cache
 from apps.base.models.user_notification_policy_log_record import (
     UserNotificationPolicyLogRecord,
     listen_for_usernotificationpolicylogrecord_model_save,
@@ -70,6 +74,7 @@ from apps.email.tests.factories import EmailMessageFactory
 from apps.google import constants as google_constants
 from apps.google.tests.factories import GoogleOAuth2UserFactory
 from apps.heartbeat.tests.factories import IntegrationHeartBeatFactory
+from apps.integrations.mixins.alert_channel_defining_mixin import alert_receive_channel_local_cache
 from apps.labels.tests.factories import (
     AlertGroupAssociatedLabelFactory,
     AlertReceiveChannelAssociatedLabelFactory,
@@ -83,6 +88,7 @@ from apps.phone_notifications.tests.factories import PhoneCallRecordFactory, SMS
 from apps.phone_notifications.tests.mock_phone_provider import MockPhoneProvider
 from apps.schedules.ical_utils import memoized_users_in_ical
 from apps.schedules.models import OnCallScheduleWeb
+from apps.schedules.parsed_calendar_cache import parsed_calendar_cache
 from apps.schedules.tests.factories import (
     CustomOnCallShiftFactory,
     OnCallScheduleCalendarFactory,
@@ -125,7 +131,9 @@ from apps.webhooks.tests.test_webhook_presets import (
     TestAdvancedWebhookPreset,
     TestWebhookPreset,
 )
+from apps.webhooks.utils import webhook_host_cache
 from common.constants.plugin_ids import PluginID
+from common.jinja_templater import compiled_template_cache
 
 register(OrganizationFactory)
 register(UserFactory)
@@ -167,6 +175,16 @@ register(UserNotificationBundleFactory)
 IS_RBAC_ENABLED = os.getenv("ONCALL_TESTING_RBAC_ENABLED", "True") == "True"
 
 
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker):
+    # the alert group search table is created by alerts migration 0076, test databases are created without migrations
+    if connection.vendor == "sqlite":
+        with django_db_blocker.unblock(), connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_SEARCH_TABLE} USING fts5(web_title_cache, tokenize='trigram')"
+            )
+
+
 @pytest.fixture(autouse=True)
 def isolated_cache(settings):
     """
@@ -231,6 +249,42 @@ def clear_ical_users_cache():
     memoized_users_in_ical.cache_clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_alert_receive_channel_local_cache():
+    # clear integrations cached per process (persisting between tests)
+    alert_receive_channel_local_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_channel_filter_router_cache():
+    # clear integration routers compiled per process (persisting between tests)
+    channel_filter_router_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_compiled_template_cache():
+    # clear jinja templates compiled per process (persisting between tests)
+    compiled_template_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_parsed_calendar_cache():
+    # clear schedule calendars parsed per process (persisting between tests)
+    parsed_calendar_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_verified_token_cache():
+    # clear auth tokens verified per process (persisting between tests)
+    verified_token_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_webhook_host_cache():
+    # clear webhook hosts resolved per process (persisting between tests)
+    webhook_host_cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def mock_is_labels_feature_enabled(settings):
     settings.FEATURE_LABELS_ENABLED_FOR_ALL = True
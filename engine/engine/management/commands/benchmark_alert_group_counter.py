@@ -0,0 +1,95 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.db import connection
+
+from apps.alerts.models import AlertGroupCounter
+from apps.alerts.models.alert_group_counter import ConcurrentUpdateError
+from apps.user_management.models import Organization
+
+
+class Command(BaseCommand):
+    """
+    Compare retry rates of AlertGroupCounter allocation strategies under concurrent load.
+    Every worker thread allocates values in a loop, retrying on ConcurrentUpdateError (same as create_alert task does).
+    Values are checked to be unique after each run.
+
+    Note that it uses the counter of the given organization, so it leaves gaps in its inside_organization_number's.
+    It's meant to be run against a dev environment with the same DB and cache backends as production.
+
+    Usage example:
+    `python manage.py benchmark_alert_group_counter --organization_id 1 --workers 16 --allocations 100`
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--organization_id", type=int, required=True, help="Organization to allocate values for.")
+        parser.add_argument("--workers", type=int, default=8, help="Number of concurrent worker threads.")
+        parser.add_argument("--allocations", type=int, default=100, help="Number of values allocated by each worker.")
+        parser.add_argument(
+            "--block_size",
+            type=int,
+            default=settings.ALERT_GROUP_COUNTER_BLOCK_SIZE or 100,
+            help="Block size used by the sequence strategy.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            organization = Organization.objects.get(pk=options["organization_id"])
+        except Organization.DoesNotExist:
+            raise CommandError(f"Organization {options['organization_id']} does not exist")
+
+        strategies = {
+            "optimistic": lambda: AlertGroupCounter.objects.get_value_optimistic(organization),
+            "sequence": lambda: AlertGroupCounter.objects.get_value_from_sequence(organization, options["block_size"]),
+        }
+        for name, allocate in strategies.items():
+            self._run(name, allocate, options["workers"], options["allocations"])
+
+    def _run(self, name, allocate, workers, allocations):
+        values = []
+        retries = []
+        errors = []
+        lock = threading.Lock()
+        barrier = threading.Barrier(workers)
+
+        def worker():
+            worker_values = []
+            worker_retries = 0
+            barrier.wait()
+            try:
+                while len(worker_values) < allocations:
+                    try:
+                        worker_values.append(allocate() + 1)
+                    except ConcurrentUpdateError:
+                        worker_retries += 1
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+                return
+            finally:
+                connection.close()
+            with lock:
+                values.extend(worker_values)
+                retries.append(worker_retries)
+
+        threads = [threading.Thread(target=worker) for _ in range(workers)]
+        started_at = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        duration = time.perf_counter() - started_at
+
+        if errors:
+            raise CommandError(f"strategy={name} failed: {errors[0]!r}")
+
+        total_retries = sum(retries)
+        attempts = len(values) + total_retries
+        self.stdout.write(
+            f"strategy={name} workers={workers} allocations={len(values)} retries={total_retries} "
+            f"retry_rate={total_retries / attempts if attempts else 0:.4f} duration={duration:.3f}s "
+            f"allocations_per_second={len(values) / duration if duration else 0:.1f} "
+            f"unique={len(set(values)) == len(values)}"
+        )
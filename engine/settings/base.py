@@ -75,8 +75,14 @@ FEATURE_LABELS_ENABLED_PER_ORG = getenv_list("FEATURE_LABELS_ENABLED_PER_ORG", d
 FEATURE_ALERT_GROUP_SEARCH_ENABLED = getenv_boolean("FEATURE_ALERT_GROUP_SEARCH_ENABLED", default=True)
 FEATURE_ALERT_GROUP_SEARCH_CUTOFF_DAYS = getenv_integer("FEATURE_ALERT_GROUP_SEARCH_CUTOFF_DAYS", default=None)
 FEATURE_NOTIFICATION_BUNDLE_ENABLED = getenv_boolean("FEATURE_NOTIFICATION_BUNDLE_ENABLED", default=True)
+# compiled user notification policies, see apps.base.notification_plan
+USER_NOTIFICATION_PLAN_CACHE_TIMEOUT = getenv_integer("USER_NOTIFICATION_PLAN_CACHE_TIMEOUT", default=60 * 60)
 FEATURE_DECLARE_INCIDENT_STEP_ENABLED = getenv_boolean("FEATURE_DECLARE_INCIDENT_STEP_ENABLED", default=False)
 FEATURE_SERVICE_DEPENDENCIES_ENABLED = getenv_boolean("FEATURE_SERVICE_DEPENDENCIES_ENABLED", default=False)
+# Create alerts from the whole Alertmanager/Grafana Alerting payload in one task instead of one task per alert
+FEATURE_ALERTMANAGER_BATCH_INGESTION_ENABLED = getenv_boolean(
+    "FEATURE_ALERTMANAGER_BATCH_INGESTION_ENABLED", default=False
+)
 
 TWILIO_API_KEY_SID = os.environ.get("TWILIO_API_KEY_SID")
 TWILIO_API_KEY_SECRET = os.environ.get("TWILIO_API_KEY_SECRET")
@@ -99,6 +105,19 @@ GRAFANA_CLOUD_ONCALL_TOKEN = os.environ.get("GRAFANA_CLOUD_ONCALL_TOKEN", None)
 DANGEROUS_WEBHOOKS_ENABLED = getenv_boolean("DANGEROUS_WEBHOOKS_ENABLED", default=False)
 OUTGOING_WEBHOOK_TIMEOUT = getenv_integer("OUTGOING_WEBHOOK_TIMEOUT", default=4)
 WEBHOOK_RESPONSE_LIMIT = 50000
+# keep-alive connections to webhook hosts are reused by each worker process, see apps.webhooks.transport
+OUTGOING_WEBHOOK_POOL_MAX_HOSTS = getenv_integer("OUTGOING_WEBHOOK_POOL_MAX_HOSTS", default=100)
+OUTGOING_WEBHOOK_POOL_MAX_CONNECTIONS_PER_HOST = getenv_integer(
+    "OUTGOING_WEBHOOK_POOL_MAX_CONNECTIONS_PER_HOST", default=4
+)
+OUTGOING_WEBHOOK_POOL_IDLE_TIMEOUT = getenv_integer("OUTGOING_WEBHOOK_POOL_IDLE_TIMEOUT", default=60)
+# resolved webhook host names and whether they are allowed, see apps.webhooks.utils.parse_url
+OUTGOING_WEBHOOK_HOST_CACHE_MAX_SIZE = getenv_integer("OUTGOING_WEBHOOK_HOST_CACHE_MAX_SIZE", default=1000)
+OUTGOING_WEBHOOK_HOST_CACHE_TTL = getenv_integer("OUTGOING_WEBHOOK_HOST_CACHE_TTL", default=60)
+# event data shared by the webhooks triggered by the same event, see apps.webhooks.tasks.trigger_webhook
+WEBHOOK_EVENT_DATA_CACHE_TIMEOUT = getenv_integer("WEBHOOK_EVENT_DATA_CACHE_TIMEOUT", default=60 * 30)
+# webhooks by trigger type and integration filter per organization, see apps.webhooks.trigger_index
+WEBHOOK_TRIGGER_INDEX_CACHE_TIMEOUT = getenv_integer("WEBHOOK_TRIGGER_INDEX_CACHE_TIMEOUT", default=60 * 10)
 
 # Multiregion settings
 ONCALL_GATEWAY_URL = os.environ.get("ONCALL_GATEWAY_URL", "")
@@ -214,6 +233,24 @@ ALERT_GROUPS_DISABLE_PREFER_ORDERING_INDEX = DATABASE_TYPE == DatabaseTypes.MYSQ
     "ALERT_GROUPS_DISABLE_PREFER_ORDERING_INDEX", default=False
 )
 
+# Backend searching alert groups by title, see apps.alerts.alert_group_search
+ALERT_GROUP_SEARCH_BACKEND = os.getenv(
+    "ALERT_GROUP_SEARCH_BACKEND",
+    {
+        DatabaseTypes.MYSQL: "apps.alerts.alert_group_search.MySQLSearchBackend",
+        DatabaseTypes.POSTGRESQL: "apps.alerts.alert_group_search.PostgreSQLSearchBackend",
+        DatabaseTypes.SQLITE3: "apps.alerts.alert_group_search.SQLiteSearchBackend",
+    }[DATABASE_TYPE],
+)
+
+# Alert group stats, see apps.alerts.alert_group_stats
+# how long per-day alert group counters are kept up to date incrementally before they are counted again by DB
+ALERT_GROUP_STATS_COUNTERS_CACHE_TIMEOUT = getenv_integer("ALERT_GROUP_STATS_COUNTERS_CACHE_TIMEOUT", default=60 * 60)
+# longer ranges are counted by DB
+ALERT_GROUP_STATS_COUNTERS_MAX_DAYS = getenv_integer("ALERT_GROUP_STATS_COUNTERS_MAX_DAYS", default=92)
+# how long stats responses are cached for the same filters
+ALERT_GROUP_STATS_CACHE_TIMEOUT = getenv_integer("ALERT_GROUP_STATS_CACHE_TIMEOUT", default=30)
+
 # Redis
 REDIS_USERNAME = os.getenv("REDIS_USERNAME", "")
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
@@ -862,6 +899,33 @@ GRAFANA_INCIDENT_STATIC_API_KEY = os.environ.get("GRAFANA_INCIDENT_STATIC_API_KE
 JINJA_TEMPLATE_MAX_LENGTH = getenv_integer("JINJA_TEMPLATE_MAX_LENGTH", 50000)
 JINJA_RESULT_TITLE_MAX_LENGTH = getenv_integer("JINJA_RESULT_TITLE_MAX_LENGTH", 500)
 JINJA_RESULT_MAX_LENGTH = getenv_integer("JINJA_RESULT_MAX_LENGTH", 50000)
+# Per-process cache of compiled jinja templates, bounded by number of templates and total template source length
+JINJA_COMPILED_TEMPLATE_CACHE_MAX_SIZE = getenv_integer("JINJA_COMPILED_TEMPLATE_CACHE_MAX_SIZE", 2048)
+JINJA_COMPILED_TEMPLATE_CACHE_MAX_BYTES = getenv_integer("JINJA_COMPILED_TEMPLATE_CACHE_MAX_BYTES", 16 * 1024 * 1024)
+# Max number of integrations with precompiled routes kept in memory per process
+CHANNEL_FILTER_ROUTER_CACHE_MAX_SIZE = getenv_integer("CHANNEL_FILTER_ROUTER_CACHE_MAX_SIZE", 1000)
+CHANNEL_FILTER_ROUTER_CACHE_TTL = getenv_integer("CHANNEL_FILTER_ROUTER_CACHE_TTL", 60)
+# inside_organization_number's are taken from a cache sequence and reserved in DB in blocks of this size.
+# Set to 0 to take them from DB using optimistic locking instead.
+ALERT_GROUP_COUNTER_BLOCK_SIZE = getenv_integer("ALERT_GROUP_COUNTER_BLOCK_SIZE", 100)
+# Per-process cache of integrations resolved by token in the integration endpoints
+ALERT_RECEIVE_CHANNEL_LOCAL_CACHE_MAX_SIZE = getenv_integer("ALERT_RECEIVE_CHANNEL_LOCAL_CACHE_MAX_SIZE", 10000)
+ALERT_RECEIVE_CHANNEL_LOCAL_CACHE_TTL = getenv_integer("ALERT_RECEIVE_CHANNEL_LOCAL_CACHE_TTL", 30)
+ALERT_RECEIVE_CHANNEL_LOCAL_CACHE_VERSION_CHECK_INTERVAL = getenv_float(
+    "ALERT_RECEIVE_CHANNEL_LOCAL_CACHE_VERSION_CHECK_INTERVAL", 1.0
+)
+# Per-process cache of parsed schedule calendars, bounded by number of calendars and total iCal text length
+ICAL_PARSED_CALENDAR_CACHE_MAX_SIZE = getenv_integer("ICAL_PARSED_CALENDAR_CACHE_MAX_SIZE", 1000)
+ICAL_PARSED_CALENDAR_CACHE_MAX_BYTES = getenv_integer("ICAL_PARSED_CALENDAR_CACHE_MAX_BYTES", 32 * 1024 * 1024)
+# Per-process cache of auth tokens verified by token string (public API, plugin, mobile app and export tokens)
+AUTH_TOKEN_CACHE_MAX_SIZE = getenv_integer("AUTH_TOKEN_CACHE_MAX_SIZE", 10000)
+AUTH_TOKEN_CACHE_TTL = getenv_integer("AUTH_TOKEN_CACHE_TTL", 30)
+AUTH_TOKEN_CACHE_VERSION_CHECK_INTERVAL = getenv_float("AUTH_TOKEN_CACHE_VERSION_CHECK_INTERVAL", 1.0)
+AUTH_TOKEN_CACHE_STATS_FLUSH_INTERVAL = getenv_float("AUTH_TOKEN_CACHE_STATS_FLUSH_INTERVAL", 10.0)
+# Per-minute budget of Slack API calls per Slack team and method tier, parts of it are reserved for alert posts
+SLACK_RATE_SCHEDULER_ENABLED = getenv_boolean("SLACK_RATE_SCHEDULER_ENABLED", True)
+SLACK_RATE_SCHEDULER_LOW_PRIORITY_SHARE = getenv_float("SLACK_RATE_SCHEDULER_LOW_PRIORITY_SHARE", 0.6)
+SLACK_RATE_SCHEDULER_NORMAL_PRIORITY_SHARE = getenv_float("SLACK_RATE_SCHEDULER_NORMAL_PRIORITY_SHARE", 0.8)
 
 # Log inbound/outbound calls as slow=1 if they exceed threshold
 SLOW_THRESHOLD_SECONDS = getenv_float("SLOW_THRESHOLD_SECONDS", 2.0)
@@ -55,6 +55,7 @@ CELERY_TASK_ROUTES = {
     "apps.schedules.tasks.notify_about_empty_shifts_in_schedule.schedule_notify_about_empty_shifts_in_schedule": {
         "queue": "default"
     },
+    "apps.schedules.tasks.shift_boundary_timer.run_shift_boundary_timer": {"queue": "default"},
     "apps.schedules.tasks.shift_swaps.slack_messages.create_shift_swap_request_message": {"queue": "default"},
     "apps.schedules.tasks.shift_swaps.slack_messages.update_shift_swap_request_message": {"queue": "default"},
     "apps.schedules.tasks.shift_swaps.notify_when_taken.notify_beneficiary_about_taken_shift_swap_request": {
@@ -120,6 +121,7 @@ CELERY_TASK_ROUTES = {
     "apps.google.tasks.sync_out_of_office_calendar_events_for_user": {"queue": "critical"},
     "apps.integrations.tasks.create_alert": {"queue": "critical"},
     "apps.integrations.tasks.create_alertmanager_alerts": {"queue": "critical"},
+    "apps.integrations.tasks.create_alertmanager_alerts_batch": {"queue": "critical"},
     "apps.integrations.tasks.start_notify_about_integration_ratelimit": {"queue": "critical"},
     "apps.mobile_app.tasks.new_alert_group.notify_user_about_new_alert_group": {"queue": "critical"},
     "apps.mobile_app.tasks.going_oncall_notification.conditionally_send_going_oncall_push_notifications_for_schedule": {
@@ -160,6 +162,7 @@ CELERY_TASK_ROUTES = {
     "apps.slack.tasks.clean_slack_channel_leftovers": {"queue": "slack"},
     "apps.slack.tasks.check_slack_message_exists_before_post_message_to_thread": {"queue": "slack"},
     "apps.slack.tasks.clean_slack_integration_leftovers": {"queue": "slack"},
+    "apps.slack.tasks.flush_alert_group_slack_message_updates": {"queue": "slack"},
     "apps.slack.tasks.populate_slack_channels": {"queue": "slack"},
     "apps.slack.tasks.populate_slack_channels_for_team": {"queue": "slack"},
     "apps.slack.tasks.populate_slack_user_identities": {"queue": "slack"},